@@ -0,0 +1,516 @@
+import gzip
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from . import seasons
+from datetime import date, datetime
+from urllib.parse import parse_qs, urlparse
+
+
+# The default maximum size of the on-disk cache in bytes. Pages are stored
+# compressed, so 1 GB holds several thousand boxscore and player pages.
+DEFAULT_MAX_SIZE = 1024 ** 3
+DEFAULT_DIRECTORY = os.path.join(os.path.expanduser('~'), '.cache',
+                                 'sportsipy')
+# Setting this environment variable to a directory enables the cache the first
+# time a page is requested, unless ``enable_cache`` or ``disable_cache`` was
+# already called.
+CACHE_DIRECTORY_ENV = 'SPORTSIPY_CACHE_DIR'
+CACHE_EXTENSION = '.html.gz'
+# The default number of seconds a page which can still change, such as the
+# current season's standings, schedules, or rosters, is served from the cache
+# before it is downloaded again.
+DEFAULT_TTL = 60 * 60
+# Maps every sports-reference site to the league key used in
+# seasons.SEASON_START_MONTH. Sites are matched against the host and path of a
+# URL, so the college sites which share a host are differentiated by path.
+LEAGUE_SITES = [
+    ('baseball-reference.com/', 'mlb'),
+    ('basketball-reference.com/', 'nba'),
+    ('sports-reference.com/cbb/', 'ncaab'),
+    ('sports-reference.com/cfb/', 'ncaaf'),
+    ('pro-football-reference.com/', 'nfl'),
+    ('hockey-reference.com/', 'nhl')
+]
+BOXSCORE_DATE_REGEX = re.compile(r'/(?:boxscores|boxes)/(?:[A-Z]+/[A-Z]+)?'
+                                 r'(\d{4})-?(\d{2})-?(\d{2})')
+SEASON_YEAR_REGEX = re.compile(r'(?<![0-9a-z])((?:18|19|20)\d{2})(?![0-9])')
+
+_cache = None
+_configured = False
+_cache_lock = threading.Lock()
+
+
+def _find_league(url):
+    """
+    Determine which league a sports-reference URL belongs to.
+
+    Parameters
+    ----------
+    url : string
+        A ``string`` of the URL to classify.
+
+    Returns
+    -------
+    string
+        Returns a ``string`` of the league key as found in
+        ``seasons.SEASON_START_MONTH``, or None if the URL doesn't belong to
+        one of the sports-reference league sites.
+    """
+    parsed = urlparse(url)
+    location = parsed.netloc + parsed.path
+    for site, league in LEAGUE_SITES:
+        if site in location:
+            return league
+    return None
+
+
+def _find_page_date(url):
+    """
+    Find the date of the game or games listed on a boxscore page.
+
+    Both individual boxscores (such as '/boxscores/201710310LAL.html' or
+    '/cbb/boxscores/2018-01-08-21-bucknell.html') and the daily boxscore index
+    pages (such as '/boxscores/?month=1&day=8&year=2018') embed the date of
+    the games they contain.
+
+    Parameters
+    ----------
+    url : string
+        A ``string`` of the URL to parse.
+
+    Returns
+    -------
+    datetime.date
+        Returns a ``date`` of the games on the page, or None if the URL isn't
+        a boxscore page or doesn't contain a valid date.
+    """
+    parsed = urlparse(url)
+    try:
+        match = BOXSCORE_DATE_REGEX.search(parsed.path)
+        if match:
+            return date(*[int(x) for x in match.groups()])
+        if '/boxscores/' not in parsed.path:
+            return None
+        query = parse_qs(parsed.query)
+        return date(int(query['year'][0]),
+                    int(query['month'][0]),
+                    int(query['day'][0]))
+    except (KeyError, ValueError):
+        return None
+
+
+def _find_season_year(url):
+    """
+    Find the season a page belongs to.
+
+    Season pages, schedules, and rosters embed the season's year in the URL,
+    such as '/leagues/NBA_2018.html' or '/teams/DET/2018_games.html'.
+
+    Parameters
+    ----------
+    url : string
+        A ``string`` of the URL to parse.
+
+    Returns
+    -------
+    int
+        Returns an ``int`` of the season's year, or None if the URL doesn't
+        contain a year.
+    """
+    match = SEASON_YEAR_REGEX.search(urlparse(url).path)
+    if match:
+        return int(match.group(1))
+    return None
+
+
+class SeasonPolicy:
+    """
+    Determine how long a cached page remains valid.
+
+    Pages from completed games and seasons never change, so they are treated
+    as immutable and never downloaded again once cached. Specifically, a
+    boxscore for a game which was played before today, or any page for a
+    season strictly older than the league's current season, never expires.
+    The current season is determined with ``seasons._find_year_for_season``
+    which is driven by the ``SEASON_START_MONTH`` table. Every other page,
+    such as the current season's standings, schedules, rosters, and player
+    pages, expires after a short time to live.
+
+    Parameters
+    ----------
+    ttl : int or float (optional)
+        The number of seconds a page which can still change is considered
+        fresh.
+    today : function (optional)
+        A function which returns a ``datetime`` of the current day. Defaults
+        to ``datetime.now``.
+    """
+    def __init__(self, ttl=DEFAULT_TTL, today=datetime.now):
+        self.ttl = ttl
+        self.today = today
+
+    def is_immutable(self, url):
+        """
+        Determine if a page can no longer change.
+
+        Parameters
+        ----------
+        url : string
+            A ``string`` of the URL to check.
+
+        Returns
+        -------
+        boolean
+            Returns True if the page belongs to a completed game or season.
+        """
+        league = _find_league(url)
+        if not league:
+            return False
+        page_date = _find_page_date(url)
+        if page_date:
+            today = self.today()
+            return page_date < date(today.year, today.month, today.day)
+        year = _find_season_year(url)
+        if year:
+            return year < seasons._find_year_for_season(league, self.today())
+        return False
+
+    def is_fresh(self, url, stored_time):
+        """
+        Determine if a cached page can still be used.
+
+        Parameters
+        ----------
+        url : string
+            A ``string`` of the URL of the cached page.
+        stored_time : float
+            A ``float`` of the POSIX timestamp the page was cached at.
+
+        Returns
+        -------
+        boolean
+            Returns True if the cached page should be used instead of being
+            downloaded again.
+        """
+        if self.is_immutable(url):
+            return True
+        return time.time() - stored_time < self.ttl
+
+
+class ResponseCache:
+    """
+    A persistent, size-capped cache of downloaded pages.
+
+    Every page is stored compressed in a single file named after a hash of its
+    URL. Whenever the total size of all cached pages exceeds the maximum size,
+    the least recently used pages are evicted until the cache fits again. The
+    time a page was stored is kept as the file's modification time, while the
+    time it was last read is kept as the file's access time. Cached pages are
+    only returned while they are fresh according to the cache's policy.
+
+    Parameters
+    ----------
+    directory : string
+        The directory to store cached pages in. The directory is created if it
+        doesn't already exist.
+    max_size : int (optional)
+        The maximum size of the cache in bytes.
+    policy : SeasonPolicy (optional)
+        The policy which determines how long each cached page remains valid.
+        Defaults to a ``SeasonPolicy`` with the default time to live.
+    """
+    def __init__(self, directory, max_size=DEFAULT_MAX_SIZE, policy=None):
+        self._directory = directory
+        self._max_size = max_size
+        self._policy = policy or SeasonPolicy()
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._size = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._load_entries()
+
+    def _load_entries(self):
+        """
+        Index all of the pages which are already stored on disk.
+
+        Builds an in-memory index of every cached file's size and last access
+        time so eviction doesn't need to walk the directory on every write.
+        """
+        for filename in os.listdir(self._directory):
+            if not filename.endswith(CACHE_EXTENSION):
+                continue
+            try:
+                stat = os.stat(os.path.join(self._directory, filename))
+            except OSError:
+                continue
+            self._entries[filename] = [stat.st_size, stat.st_atime]
+            self._size += stat.st_size
+
+    def _filename(self, url):
+        return hashlib.sha1(url.encode('utf8')).hexdigest() + CACHE_EXTENSION
+
+    def _path(self, filename):
+        return os.path.join(self._directory, filename)
+
+    @property
+    def directory(self):
+        """
+        Returns a ``string`` of the directory the pages are stored in.
+        """
+        return self._directory
+
+    @property
+    def max_size(self):
+        """
+        Returns an ``int`` of the maximum size of the cache in bytes.
+        """
+        return self._max_size
+
+    @property
+    def policy(self):
+        """
+        Returns the ``SeasonPolicy`` used to determine if a page is fresh.
+        """
+        return self._policy
+
+    @property
+    def size(self):
+        """
+        Returns an ``int`` of the total size of all cached pages in bytes.
+        """
+        return self._size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, url):
+        return self._filename(url) in self._entries
+
+    def stored_time(self, url):
+        """
+        Find when the requested URL was stored in the cache.
+
+        Parameters
+        ----------
+        url : string
+            A ``string`` of the URL to look up.
+
+        Returns
+        -------
+        float
+            Returns a ``float`` of the POSIX timestamp the page was stored at,
+            or None if the page isn't cached.
+        """
+        try:
+            return os.stat(self._path(self._filename(url))).st_mtime
+        except OSError:
+            return None
+
+    def get(self, url):
+        """
+        Retrieve a page from the cache.
+
+        Parameters
+        ----------
+        url : string
+            A ``string`` of the URL to look up.
+
+        Returns
+        -------
+        string
+            Returns a ``string`` of the cached page contents, or None if the
+            page isn't cached or has expired.
+        """
+        filename = self._filename(url)
+        path = self._path(filename)
+        try:
+            if not self._policy.is_fresh(url, os.stat(path).st_mtime):
+                return None
+            with gzip.open(path, 'rt', encoding='utf8') as filehandle:
+                contents = filehandle.read()
+            now = time.time()
+            os.utime(path, (now, os.stat(path).st_mtime))
+        except (OSError, EOFError):
+            self._forget(filename)
+            return None
+        with self._lock:
+            if filename in self._entries:
+                self._entries[filename][1] = now
+        return contents
+
+    def set(self, url, contents):
+        """
+        Store a page in the cache.
+
+        The page is written to a temporary file first and then moved into
+        place so concurrent readers never see a partially written page. Least
+        recently used pages are evicted afterwards if the cache has grown
+        beyond its maximum size.
+
+        Parameters
+        ----------
+        url : string
+            A ``string`` of the URL the page was downloaded from.
+        contents : string
+            A ``string`` of the page contents.
+        """
+        filename = self._filename(url)
+        handle, temp_path = tempfile.mkstemp(dir=self._directory,
+                                             suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as filehandle:
+                filehandle.write(gzip.compress(contents.encode('utf8')))
+            os.replace(temp_path, self._path(filename))
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return
+        size = os.stat(self._path(filename)).st_size
+        with self._lock:
+            if filename in self._entries:
+                self._size -= self._entries[filename][0]
+            self._entries[filename] = [size, time.time()]
+            self._size += size
+        self._evict()
+
+    def _forget(self, filename):
+        with self._lock:
+            entry = self._entries.pop(filename, None)
+            if entry:
+                self._size -= entry[0]
+
+    def _evict(self):
+        """
+        Remove the least recently used pages until the cache fits.
+        """
+        with self._lock:
+            if self._size <= self._max_size:
+                return
+            entries = sorted(self._entries.items(), key=lambda x: x[1][1])
+            for filename, (size, _) in entries:
+                if self._size <= self._max_size:
+                    break
+                try:
+                    os.remove(self._path(filename))
+                except OSError:
+                    pass
+                del self._entries[filename]
+                self._size -= size
+
+    def delete(self, url):
+        """
+        Remove a single page from the cache.
+
+        Parameters
+        ----------
+        url : string
+            A ``string`` of the URL to remove.
+        """
+        filename = self._filename(url)
+        try:
+            os.remove(self._path(filename))
+        except OSError:
+            pass
+        self._forget(filename)
+
+    def clear(self):
+        """
+        Remove every page from the cache.
+        """
+        with self._lock:
+            for filename in self._entries:
+                try:
+                    os.remove(self._path(filename))
+                except OSError:
+                    pass
+            self._entries = {}
+            self._size = 0
+
+
+def enable_cache(directory=None, max_size=DEFAULT_MAX_SIZE, ttl=DEFAULT_TTL):
+    """
+    Store every downloaded page in a persistent on-disk cache.
+
+    Once enabled, any page which has already been downloaded is read from disk
+    instead of being requested from the website again. This applies to every
+    class in the package, such as ``Teams``, ``Schedule``, ``Boxscore``, and
+    ``Player``.
+
+    Parameters
+    ----------
+    directory : string (optional)
+        The directory to store cached pages in. Defaults to the value of the
+        ``SPORTSIPY_CACHE_DIR`` environment variable if set, otherwise
+        '~/.cache/sportsipy'.
+    max_size : int (optional)
+        The maximum size of the cache in bytes. The least recently used pages
+        are evicted once the limit is exceeded.
+    ttl : int or float (optional)
+        The number of seconds pages which can still change, such as the
+        current season's standings, schedules, and rosters, are served from
+        the cache before being downloaded again. Pages from completed games
+        and seasons never expire.
+
+    Returns
+    -------
+    ResponseCache
+        The newly enabled cache.
+    """
+    global _cache
+    global _configured
+
+    if not directory:
+        directory = os.environ.get(CACHE_DIRECTORY_ENV, DEFAULT_DIRECTORY)
+    with _cache_lock:
+        _cache = ResponseCache(directory, max_size, SeasonPolicy(ttl))
+        _configured = True
+    return _cache
+
+
+def disable_cache():
+    """
+    Stop reading and storing pages in the on-disk cache.
+
+    Pages which have already been cached are left on disk and will be used
+    again if the cache is re-enabled with the same directory.
+    """
+    global _cache
+    global _configured
+
+    with _cache_lock:
+        _cache = None
+        _configured = True
+
+
+def get_cache():
+    """
+    Return the active response cache.
+
+    If neither ``enable_cache`` nor ``disable_cache`` has been called, the
+    cache is enabled in the directory named by the ``SPORTSIPY_CACHE_DIR``
+    environment variable the first time this is called, provided it is set.
+
+    Returns
+    -------
+    ResponseCache
+        The active ``ResponseCache``, or None if caching is disabled.
+    """
+    global _cache
+    global _configured
+
+    if _configured:
+        return _cache
+    with _cache_lock:
+        if not _configured:
+            directory = os.environ.get(CACHE_DIRECTORY_ENV)
+            if directory:
+                _cache = ResponseCache(directory)
+            _configured = True
+        return _cache
@@ -0,0 +1,307 @@
+import asyncio
+import multiprocessing
+import threading
+from . import fetch, parsing, utils
+from concurrent.futures import (as_completed,
+                                ProcessPoolExecutor,
+                                ThreadPoolExecutor)
+from urllib.error import HTTPError
+
+
+def _run_concurrently(func, items, workers=None, progress=None):
+    """
+    Call a function for every item, optionally using multiple threads.
+
+    Downloading and parsing pages for many players or games is dominated by
+    network latency, so the work can be spread across a bounded pool of
+    threads. Results are returned in the same order as the items regardless of
+    the order in which they complete. Every download still goes through the
+    shared session in ``sportsipy.fetch``, so the per-host connection limit
+    bounds how many requests are in flight at once.
+
+    Parameters
+    ----------
+    func : function
+        The function to call with each item as its only argument.
+    items : list
+        A ``list`` of the items to process.
+    workers : int (optional)
+        The maximum number of threads to use. If unset or less than 2, every
+        item is processed serially in the calling thread.
+    progress : function (optional)
+        A function which is called with the number of completed items and the
+        total number of items every time an item finishes processing.
+
+    Returns
+    -------
+    list
+        A ``list`` of the results of calling the function for each item, in
+        the same order as the items.
+    """
+    items = list(items)
+    tracker = _ProgressTracker(progress, len(items))
+    if not workers or workers < 2 or len(items) < 2:
+        results = []
+        for item in items:
+            results.append(func(item))
+            tracker.update()
+        return results
+
+    # Worker threads parse with the engine selected in the calling thread.
+    engine = parsing.get_engine()
+
+    def run(item):
+        with parsing.using_engine(engine):
+            result = func(item)
+        tracker.update()
+        return result
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as executor:
+        return list(executor.map(run, items))
+
+
+def _run_in_processes(func, items, processes, progress=None):
+    """
+    Call a function for every item using a pool of processes.
+
+    Parsing a page is CPU-bound, so once pages have been downloaded, parsing
+    can be spread across multiple processes to sidestep the global
+    interpreter lock. Both the function and the items need to be picklable.
+    The processes are started fresh rather than forked, so they don't share
+    any settings or state with this process, and the items need to carry
+    everything the function requires.
+
+    Parameters
+    ----------
+    func : function
+        A module-level function to call with each item as its only argument.
+    items : list
+        A ``list`` of the items to process.
+    processes : int
+        The maximum number of processes to use.
+    progress : function (optional)
+        A function which is called with the number of completed items and the
+        total number of items every time an item finishes processing.
+
+    Returns
+    -------
+    list
+        A ``list`` of the results of calling the function for each item, in
+        the same order as the items.
+    """
+    items = list(items)
+    tracker = _ProgressTracker(progress, len(items))
+    results = [None] * len(items)
+    if not items:
+        return results
+    # Forking a process which has been downloading pages on other threads
+    # can copy locks while they are held, so processes are spawned instead.
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=min(processes, len(items)),
+                             mp_context=context) as executor:
+        futures = {executor.submit(func, item): index
+                   for index, item in enumerate(items)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            tracker.update()
+    return results
+
+
+class _ProgressTracker:
+    """
+    Count completed items and report them to a progress callback.
+
+    Parameters
+    ----------
+    callback : function
+        A function which accepts the number of completed items and the total
+        number of items. If None, progress is not reported.
+    total : int
+        The total number of items being processed.
+    """
+    def __init__(self, callback, total):
+        self._callback = callback
+        self._total = total
+        self._completed = 0
+        self._lock = threading.Lock()
+
+    def update(self):
+        """
+        Mark an item as completed and report the new count to the callback.
+        """
+        if not self._callback:
+            return
+        with self._lock:
+            self._completed += 1
+            self._callback(self._completed, self._total)
+
+
+def _download_boxscore(item):
+    """
+    Download the boxscore page for a game so it can be parsed elsewhere.
+
+    Parameters
+    ----------
+    item : tuple
+        A ``tuple`` of the Game instance and the URL of its boxscore, or None
+        if the game doesn't have a boxscore.
+
+    Returns
+    -------
+    tuple
+        A ``tuple`` of the Game instance, the URL of its boxscore, and a
+        ``string`` of the page contents, or None if the page couldn't be
+        downloaded.
+    """
+    game, url = item
+    if not url:
+        return game, url, None
+    try:
+        return game, url, fetch._fetch(url)
+    except HTTPError:
+        return game, url, None
+
+
+def _parse_downloaded_boxscore(item):
+    """
+    Build the extended DataFrame row for a game from its downloaded boxscore.
+
+    The game's boxscore is parsed from the downloaded page with the given
+    parser engine, so nothing is downloaded again and no settings are read
+    from the process this runs in.
+
+    Parameters
+    ----------
+    item : tuple
+        A ``tuple`` of the Game instance, the URL of its boxscore, a
+        ``string`` of the page contents as returned by ``_download_boxscore``,
+        and a ``string`` of the name of the parser engine to use.
+
+    Returns
+    -------
+    tuple
+        A ``tuple`` of the index and fields of the game's extended DataFrame
+        row, or None if it has none.
+    """
+    game, url, contents, engine = item
+    # Without a page, either the game has no boxscore or the boxscore couldn't
+    # be downloaded, which leaves the game without an extended row.
+    if contents is None:
+        return None
+    with parsing.using_engine(engine):
+        return game._dataframe_extended_row(contents)
+
+
+def _extended_rows(games, boxscore_url, workers=None, processes=None,
+                   progress=None):
+    """
+    Build the extended DataFrame row for every game in a schedule.
+
+    Each game's extended row requires downloading and parsing its
+    boxscore. By default, each game is handled serially. Setting ``workers``
+    downloads and parses boxscores on a pool of threads, and additionally
+    setting ``processes`` downloads every boxscore on the thread pool first
+    before parsing them on a pool of processes.
+
+    Parameters
+    ----------
+    games : list
+        A ``list`` of Game instances to build rows for.
+    boxscore_url : string
+        A ``string`` of the league's boxscore URL format which accepts a
+        game's boxscore URI.
+    workers : int (optional)
+        The maximum number of threads to use to download boxscores.
+    processes : int (optional)
+        The maximum number of processes to use to parse boxscores.
+    progress : function (optional)
+        A function which is called with the number of completed games and the
+        total number of games every time a game finishes processing.
+
+    Returns
+    -------
+    list
+        A ``list`` of the index and fields of each game's extended row, or
+        None for games without one, in the same order as the games.
+    """
+    if not processes or processes < 2:
+        return _run_concurrently(
+            lambda game: utils._frame_row(game, 'dataframe_extended'), games,
+            workers, progress)
+    items = [(game, boxscore_url % game._boxscore if game._boxscore else None)
+             for game in games]
+    engine = parsing.get_engine().name
+    pages = [page + (engine,) for page in
+             _run_concurrently(_download_boxscore, items, workers)]
+    return _run_in_processes(_parse_downloaded_boxscore, pages, processes,
+                             progress)
+
+
+async def _pull_pages_async(get_page, urls, concurrency=None):
+    """
+    Download several pages concurrently from within an event loop.
+
+    Each page is downloaded by calling the blocking ``get_page`` function on
+    the event loop's default executor, with a semaphore bounding how many
+    downloads are in flight at once so a long range of pages doesn't flood the
+    website with requests.
+
+    Parameters
+    ----------
+    get_page : function
+        The function to call with each URL which downloads and returns the
+        page.
+    urls : list
+        A ``list`` of the URLs to download.
+    concurrency : int (optional)
+        The maximum number of pages to download at once. Defaults to the
+        maximum number of connections the shared session keeps open to a
+        single host.
+
+    Returns
+    -------
+    list
+        A ``list`` of the downloaded pages in the same order as the URLs.
+    """
+    if not concurrency:
+        concurrency = fetch._settings['pool_maxsize']
+    semaphore = asyncio.Semaphore(concurrency)
+    # Called from within a coroutine, this is the running loop. It is used
+    # instead of ``get_running_loop`` to keep supporting Python 3.6.
+    loop = asyncio.get_event_loop()
+
+    async def pull(url):
+        async with semaphore:
+            return await loop.run_in_executor(None, get_page, url)
+
+    return await asyncio.gather(*[pull(url) for url in urls])
+
+
+async def _fetch_boxscores(boxscores, pages, concurrency=None):
+    """
+    Download every page concurrently and add the games it lists.
+
+    Parameters
+    ----------
+    boxscores : Boxscores instance
+        A new ``Boxscores`` instance of any league to add the games to.
+    pages : list
+        A ``list`` of tuples of the key to store each page's games under and
+        the URL of the page.
+    concurrency : int (optional)
+        The maximum number of pages to download at once. Defaults to the
+        maximum number of connections kept open to a single host.
+
+    Returns
+    -------
+    Boxscores instance
+        The passed ``Boxscores`` instance containing every game, keyed in the
+        same order as the pages.
+    """
+    boxscores._boxscores = {}
+    contents = await _pull_pages_async(boxscores._get_requested_page,
+                                       [url for _, url in pages],
+                                       concurrency)
+    for (timestamp, _), page in zip(pages, contents):
+        utils._add_boxscore_games(boxscores, timestamp, page)
+    return boxscores
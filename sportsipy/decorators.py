@@ -1,6 +1,54 @@
 from functools import wraps
 
 
+def _convert_item(instance, name, values, index, convert, default=None,
+                  field=None):
+    """
+    Convert a parsed value from a list, keeping the result in the list.
+
+    Player stats are parsed into a list holding the value for every season,
+    such as '_points'. The first time a season's value is read, it is replaced
+    in the list by its converted value, so later reads return it directly
+    instead of cleaning it up and converting it again. The list is only
+    updated if it is the property's own field, named after the property with a
+    leading underscore, so values read by any other property never change.
+
+    Parameters
+    ----------
+    instance : object
+        The object the property was read from.
+    name : string
+        A ``string`` of the name of the property, such as 'points'.
+    values : list
+        The ``list`` holding the parsed value.
+    index : int
+        An ``int`` of the position of the parsed value in ``values``.
+    convert : function
+        The function which converts the parsed value to its type, such as
+        ``int``.
+    default : object (optional)
+        The value to return if the parsed value can't be converted.
+    field : list (optional)
+        The value of the property's field, if ``values`` is nested inside of
+        it instead of being the field itself.
+
+    Returns
+    -------
+    object
+        The converted value, or ``default`` if it can't be converted.
+    """
+    try:
+        typed = convert(values[index])
+    except (TypeError, ValueError):
+        return default
+    if field is None:
+        field = values
+    if type(values) is list and \
+       getattr(instance, '_' + name, None) is field:
+        values[index] = typed
+    return typed
+
+
 def int_property_decorator(func):
     @property
     @wraps(func)
@@ -37,3 +85,30 @@ def float_property_decorator(func):
             # on their use-case.
             return None
     return wrapper
+
+
+def cached_property_decorator(field):
+    """
+    Create a property whose value is only computed once.
+
+    The value is stored in the given field the first time it is computed, such
+    as a game's datetime being parsed from its date string, and returned from
+    there afterwards. Values of None are computed again on every read.
+
+    Parameters
+    ----------
+    field : string
+        The name of the attribute the value is stored in, such as
+        '_datetime'.
+    """
+    def decorator(func):
+        @property
+        @wraps(func)
+        def wrapper(self):
+            value = getattr(self, field)
+            if value is None:
+                value = func(self)
+                setattr(self, field, value)
+            return value
+        return wrapper
+    return decorator
@@ -4,14 +4,17 @@ from .constants import ROSTER_SCHEME, SQUAD_URL
 from ..decorators import float_property_decorator, int_property_decorator
 from .fb_utils import _lookup_team
 from .league_ids import LEAGUE_IDS
-from pyquery import PyQuery as pq
+from sportsipy.records import _fields, _Record, _SlotRecord
 from sportsipy.utils import (_get_stats_table,
+                             _keyed,
+                             _lookup_key,
                              _parse_field,
-                             _remove_html_comment_tags)
+                             _pull_page,
+                             _expand_html_comments)
 from urllib.error import HTTPError
 
 
-class SquadPlayer:
+class SquadPlayer(_SlotRecord):
     """
     Get player information and stats.
 
@@ -29,6 +32,75 @@ class SquadPlayer:
         A ``string`` representation of the player's unique 8-digit ID as shown
         on fbref.com.
     """
+    __slots__ = ('_name', '_player_id', '_nationality', '_position', '_age',
+                 '_matches_played', '_starts', '_minutes', '_goals',
+                 '_assists', '_penalty_kicks', '_penalty_kick_attempts',
+                 '_yellow_cards', '_red_cards', '_goals_per_90',
+                 '_assists_per_90', '_goals_and_assists_per_90',
+                 '_goals_non_penalty_per_90',
+                 '_goals_and_assists_non_penalty_per_90', '_expected_goals',
+                 '_expected_goals_non_penalty', '_expected_assists',
+                 '_expected_goals_per_90', '_expected_assists_per_90',
+                 '_expected_goals_and_assists_per_90',
+                 '_expected_goals_non_penalty_per_90',
+                 '_expected_goals_and_assists_non_penalty_per_90',
+                 '_own_goals', '_goals_against', '_own_goals_against',
+                 '_goals_against_per_90', '_shots_on_target_against', '_saves',
+                 '_save_percentage', '_wins', '_draws', '_losses',
+                 '_clean_sheets', '_clean_sheet_percentage',
+                 '_penalty_kicks_attempted', '_penalty_kicks_allowed',
+                 '_penalty_kicks_saved', '_penalty_kicks_missed',
+                 '_free_kick_goals_against', '_corner_kick_goals_against',
+                 '_post_shot_expected_goals',
+                 '_post_shot_expected_goals_per_shot',
+                 '_post_shot_expected_goals_minus_allowed',
+                 '_post_shot_expected_goals_minus_allowed_per_90',
+                 '_launches_completed', '_launches_attempted',
+                 '_launch_completion_percentage', '_keeper_passes_attempted',
+                 '_throws_attempted', '_launch_percentage',
+                 '_average_keeper_pass_length', '_goal_kicks_attempted',
+                 '_goal_kick_launch_percentage', '_average_goal_kick_length',
+                 '_opponent_cross_attempts', '_opponent_cross_stops',
+                 '_opponent_cross_stop_percentage',
+                 '_keeper_actions_outside_penalty_area',
+                 '_keeper_actions_outside_penalty_area_per_90',
+                 '_average_keeper_action_outside_penalty_distance', '_shots',
+                 '_shots_on_target', '_free_kick_shots',
+                 '_shots_on_target_percentage', '_shots_per_90',
+                 '_shots_on_target_per_90', '_goals_per_shot',
+                 '_goals_per_shot_on_target',
+                 '_expected_goals_non_penalty_per_shot',
+                 '_goals_minus_expected',
+                 '_non_penalty_minus_expected_non_penalty',
+                 '_assists_minus_expected', '_key_passes', '_passes_completed',
+                 '_passes_attempted', '_pass_completion',
+                 '_short_passes_completed', '_short_passes_attempted',
+                 '_short_pass_completion', '_medium_passes_completed',
+                 '_medium_passes_attempted', '_medium_pass_completion',
+                 '_long_passes_completed', '_long_passes_attempted',
+                 '_long_pass_completion', '_left_foot_passes',
+                 '_right_foot_passes', '_free_kick_passes', '_through_balls',
+                 '_corner_kicks', '_throw_ins', '_final_third_passes',
+                 '_penalty_area_passes', '_penalty_area_crosses',
+                 '_minutes_per_match', '_minutes_played_percentage',
+                 '_nineties_played', '_minutes_per_start', '_subs',
+                 '_minutes_per_sub', '_unused_sub', '_points_per_match',
+                 '_goals_scored_on_pitch', '_goals_against_on_pitch',
+                 '_goal_difference_on_pitch',
+                 '_goal_difference_on_pitch_per_90',
+                 '_net_difference_on_pitch_per_90', '_expected_goals_on_pitch',
+                 '_expected_goals_against_on_pitch',
+                 '_expected_goal_difference',
+                 '_expected_goal_difference_per_90',
+                 '_net_expected_goal_difference_per_90', '_soft_reds',
+                 '_fouls_committed', '_fouls_drawn', '_offsides', '_crosses',
+                 '_tackles_won', '_interceptions', '_penalty_kicks_won',
+                 '_penalty_kicks_conceded', '_successful_dribbles',
+                 '_attempted_dribbles', '_dribble_success_rate',
+                 '_players_dribbled_past', '_nutmegs', '_dribblers_tackled',
+                 '_dribblers_contested', '_tackle_percentage',
+                 '_times_dribbled_past')
+
     def __init__(self, player_data, player_id):
         self._name = None
         self._player_id = player_id
@@ -234,7 +306,7 @@ class SquadPlayer:
         player_id : string
             A ``string`` of the player's unique 8-digit ID.
         """
-        for field in self.__dict__:
+        for field in _fields(self):
             # The short field truncates the leading '_' in the attribute name.
             short_field = str(field)[1:]
             if short_field == 'player_id':
@@ -1469,7 +1541,7 @@ class SquadPlayer:
         return self._times_dribbled_past
 
 
-class Roster:
+class Roster(_Record):
     """
     Get stats for all players on a roster.
 
@@ -1522,14 +1594,18 @@ class Roster:
             If the requested player cannot be matched with a player in the
             squad.
         """
-        for player_instance in self._players:
-            if not player_instance.name or not player_instance.player_id:
-                continue  # pragma: no cover
-            if player.lower() == player_instance.player_id.lower():
-                return player_instance
-            if player.lower().strip() == player_instance.name.lower().strip():
-                return player_instance
-        raise ValueError('No player found with the requested name or ID')
+        players = _keyed(self, self._players, 'player_id', 'name')
+        player_instance = players.get(_lookup_key(player))
+        if player_instance is None and player != player.strip():
+            # Names, unlike IDs, are matched ignoring surrounding whitespace.
+            player_instance = players.get(_lookup_key(player.strip()))
+            if player_instance is not None and \
+               _lookup_key(player_instance.name.strip()) != \
+               _lookup_key(player.strip()):
+                player_instance = None
+        if player_instance is None:
+            raise ValueError('No player found with the requested name or ID')
+        return player_instance
 
     def __str__(self):
         """
@@ -1642,8 +1718,8 @@ class Roster:
         """
         if not doc:
             try:
-                doc = pq(SQUAD_URL % self._squad_id)
-                doc = pq(_remove_html_comment_tags(doc))
+                doc = _pull_page(SQUAD_URL % self._squad_id)
+                doc = _expand_html_comments(doc)
             except HTTPError:
                 return None
         stats_table = []
@@ -1686,3 +1762,5 @@ class Roster:
         for player_id, player_data in player_data_dict.items():
             player = SquadPlayer(player_data['data'], player_id)
             self._players.append(player)
+        # Index every player up front so looking one up is a single access.
+        _keyed(self, self._players, 'player_id', 'name')
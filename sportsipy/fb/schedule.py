@@ -1,11 +1,11 @@
-import pandas as pd
 import re
 from .constants import SCHEDULE_SCHEME, SQUAD_URL
 from datetime import datetime
-from ..decorators import float_property_decorator, int_property_decorator
+from ..decorators import (cached_property_decorator,
+                          float_property_decorator,
+                          int_property_decorator)
 from .fb_utils import _lookup_team
-from pyquery import PyQuery as pq
-from sportsipy import utils
+from sportsipy import records, utils
 from sportsipy.constants import (AWAY,
                                  DRAW,
                                  HOME,
@@ -15,7 +15,7 @@ from sportsipy.constants import (AWAY,
 from urllib.error import HTTPError
 
 
-class Game:
+class Game(records._SlotRecord):
     """
     A representation of a matchup between two teams.
 
@@ -26,8 +26,19 @@ class Game:
     ----------
     game_data : string
         The row containing the specified game information.
+    lazy : boolean (optional)
+        Set to True to only parse each field the first time it is read instead
+        of parsing every field as soon as the game is created. Defaults to
+        False.
     """
-    def __init__(self, game_data):
+    __slots__ = ('_competition', '_matchweek', '_day', '_date', '_time',
+                 '_datetime', '_venue', '_result', '_goals_for',
+                 '_goals_against', '_opponent', '_opponent_id',
+                 '_expected_goals', '_expected_goals_against', '_attendance',
+                 '_captain', '_captain_id', '_formation', '_referee',
+                 '_match_report', '_notes', '_pending_fields')
+
+    def __init__(self, game_data, lazy=False):
         self._competition = None
         self._matchweek = None
         self._day = None
@@ -50,7 +61,7 @@ class Game:
         self._match_report = None
         self._notes = None
 
-        self._parse_game_data(game_data)
+        self._parse_game_data(game_data, lazy)
 
     def __str__(self):
         """
@@ -64,6 +75,12 @@ class Game:
         """
         return self.__str__()
 
+    def __getattr__(self, name):
+        """
+        Parse a field the first time it is read if parsing lazily.
+        """
+        return utils._parse_pending_field(self, name)
+
     def _parse_opponent_id(self, game_data):
         """
         Parse the opponent's squad ID.
@@ -148,7 +165,34 @@ class Game:
             match_report_id = None
         return match_report_id
 
-    def _parse_game_data(self, game_data):
+    def _parse_game_field(self, field, row):
+        """
+        Parse the value of a single attribute.
+
+        Parameters
+        ----------
+        field : string
+            The name of the attribute to parse, such as '_date'.
+        row : _RowIndex
+            An index of the row containing the information specific to a
+            game.
+
+        Returns
+        -------
+        string
+            The value of the attribute according to the parsing scheme.
+        """
+        # Remove the leading '_' from the name
+        short_name = str(field)[1:]
+        if short_name == 'opponent_id':
+            return self._parse_opponent_id(row.html)
+        if short_name == 'captain_id':
+            return self._parse_captain_id(row.html)
+        if short_name == 'match_report':
+            return self._parse_match_report(row.html)
+        return utils._parse_field(SCHEDULE_SCHEME, row, short_name)
+
+    def _parse_game_data(self, game_data, lazy=False):
         """
         Parse a value for every attribute.
 
@@ -165,32 +209,25 @@ class Game:
         ----------
         game_data : string
             A ``string`` containing all of the rows of stats for a given game.
+        lazy : boolean (optional)
+            Set to True to only parse each field the first time it is read.
         """
-        for field in self.__dict__:
-            # Remove the leading '_' from the name
-            short_name = str(field)[1:]
-            if short_name == 'datetime':
-                continue
-            if short_name == 'opponent_id':
-                value = self._parse_opponent_id(game_data)
-                setattr(self, field, value)
-                continue
-            if short_name == 'captain_id':
-                value = self._parse_captain_id(game_data)
-                setattr(self, field, value)
-                continue
-            if short_name == 'match_report':
-                value = self._parse_match_report(game_data)
-                setattr(self, field, value)
-                continue
-            value = utils._parse_field(SCHEDULE_SCHEME, game_data, short_name)
-            setattr(self, field, value)
+        row = utils._RowIndex(game_data)
+        fields = [field for field in records._fields(self)
+                  if field != '_datetime']
+        utils._parse_fields(self, fields, self._parse_game_field, row,
+                            lazy=lazy)
 
-    @property
-    def dataframe(self):
+    def _dataframe_row(self):
         """
-        Returns a pandas ``DataFrame`` containing all other class properties
-        and values. The index for the DataFrame is the match report ID.
+        Gather the values of every field included in the DataFrame.
+
+        Returns
+        -------
+        tuple
+            A ``tuple`` of the row's index and a ``dictionary`` of every
+            field's value keyed by column name, or None if the game has no
+            data.
         """
         if self._goals_for is None and self._goals_against is None:
             return None
@@ -219,7 +256,15 @@ class Game:
             'match_report': self.match_report,
             'notes': self.notes
         }
-        return pd.DataFrame([fields_to_include], index=[self.match_report])
+        return self.match_report, fields_to_include
+
+    @property
+    def dataframe(self):
+        """
+        Returns a pandas ``DataFrame`` containing all other class properties
+        and values. The index for the DataFrame is the match report ID.
+        """
+        return utils._build_dataframe([self._dataframe_row()])
 
     @property
     def competition(self):
@@ -260,7 +305,7 @@ class Game:
         """
         return self._time
 
-    @property
+    @cached_property_decorator('_datetime')
     def datetime(self):
         """
         Returns a ``datetime`` object representing the date and time the match
@@ -464,7 +509,7 @@ class Game:
         return self._notes
 
 
-class Schedule:
+class Schedule(records._Record):
     """
     An object of the given team's schedule.
 
@@ -480,10 +525,14 @@ class Schedule:
         If passed to the class instantiation, this will be used to pull all
         information instead of making another request to the website. If the
         document is not provided, it will be pulled during a later step.
+    lazy : boolean (optional)
+        Set to True to only parse each game's fields the first time they are
+        read instead of parsing every field as soon as the schedule is
+        created. Defaults to False.
     """
-    def __init__(self, team_id, doc=None):
+    def __init__(self, team_id, doc=None, lazy=False):
         self._games = []
-        self._pull_schedule(team_id, doc)
+        self._pull_schedule(team_id, doc, lazy)
 
     def __getitem__(self, index):
         """
@@ -535,14 +584,11 @@ class Schedule:
             If the requested date cannot be matched with a game in the
             schedule.
         """
-        for game in self._games:
-            if not game.datetime:
-                continue  # pragma: no cover
-            if game.datetime.year == date.year and \
-               game.datetime.month == date.month and \
-               game.datetime.day == date.day:
-                return game
-        raise ValueError('No games found for requested date')
+        games = utils._dated(self, self._games)
+        try:
+            return games[(date.year, date.month, date.day)][0]
+        except KeyError:
+            raise ValueError('No games found for requested date')
 
     def __str__(self):
         """
@@ -570,7 +616,7 @@ class Schedule:
         """
         return len(self._games)
 
-    def _add_games_to_schedule(self, schedule):
+    def _add_games_to_schedule(self, schedule, lazy=False):
         """
         Add game information to the list of games.
 
@@ -581,14 +627,17 @@ class Schedule:
         ----------
         schedule : PyQuery object
             A PyQuery object pertaining to a team's schedule table.
+        lazy : boolean (optional)
+            Set to True to only parse each game's fields the first time they
+            are read.
         """
         for item in schedule:
             if 'class="thead"' in str(item):
                 continue  # pragma: no cover
-            game = Game(item)
+            game = Game(item, lazy=lazy)
             self._games.append(game)
 
-    def _pull_schedule(self, team_id, doc):
+    def _pull_schedule(self, team_id, doc, lazy=False):
         """
         Download and create objects for the team's schedule.
 
@@ -609,11 +658,14 @@ class Schedule:
             If passed to the class instantiation, this will be used to pull all
             information instead of making another request to the website. If
             the document is not provided, this value will be None.
+        lazy : boolean (optional)
+            Set to True to only parse each game's fields the first time they
+            are read.
         """
         if not doc:
             squad_id = _lookup_team(team_id)
             try:
-                doc = pq(SQUAD_URL % squad_id)
+                doc = utils._pull_page(SQUAD_URL % squad_id)
             except HTTPError:
                 return
         schedule = utils._get_stats_table(doc, 'table#matchlogs_all')
@@ -621,4 +673,4 @@ class Schedule:
         if not schedule:
             utils._no_data_found()
             return
-        self._add_games_to_schedule(schedule)
+        self._add_games_to_schedule(schedule, lazy=lazy)
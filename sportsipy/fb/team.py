@@ -7,10 +7,10 @@ from .roster import Roster
 from .schedule import Schedule
 from .squad_ids import SQUAD_IDS
 from urllib.error import HTTPError
-from .. import utils
+from .. import records, utils
 
 
-class Team:
+class Team(records._Record):
     """
     The high-level stats and information for a single professional team.
 
@@ -34,8 +34,16 @@ class Team:
         Optionally specify the filename of a local file to use to pull data
         instead of downloading from sports-reference.com. This file should be
         of the Squad page for the designated year.
+    compact : boolean (optional)
+        Set to True to release the squad page once the team's header has been
+        parsed. The page is downloaded again if the roster or schedule is
+        requested afterwards. Defaults to False.
     """
-    def __init__(self, team_id, squad_page=None):
+    # The squad page is downloaded again if the roster or schedule is
+    # requested after the team is unpickled.
+    _transient_fields = ('_doc',)
+
+    def __init__(self, team_id, squad_page=None, compact=False):
         self._squad_id = None
         self._name = None
         self._season = None
@@ -66,7 +74,7 @@ class Team:
         self._away_points = None
 
         self._squad_id = _lookup_team(team_id)
-        self._pull_team_page(squad_page)
+        self._pull_team_page(squad_page, compact)
 
     def __str__(self):
         """
@@ -292,7 +300,7 @@ class Team:
             elif 'gender' in line.lower():
                 self._gender = line.replace('Gender: ', '')
 
-    def _pull_team_page(self, squad_page=None):
+    def _pull_team_page(self, squad_page=None, compact=False):
         """
         Pull the team page and parse results.
 
@@ -306,6 +314,8 @@ class Team:
             Optionally specify the filename of a local file to use to pull data
             instead of downloading from sports-reference.com. This file should
             be of the Squad page for the designated year.
+        compact : boolean (optional)
+            Set to True to release the squad page once it has been parsed.
         """
         try:
             doc = utils._pull_page(SQUAD_URL % self.squad_id, squad_page)
@@ -314,6 +324,7 @@ class Team:
         self._doc = doc
         self._parse_name(doc)
         self._parse_header(doc)
+        utils._release(self, '_doc', compact=compact)
 
     @property
     def squad_id(self):
@@ -0,0 +1,442 @@
+import re
+import requests
+import threading
+import time
+from . import cache, ratelimit
+from requests.adapters import HTTPAdapter
+from urllib.error import HTTPError
+from urllib.parse import urljoin
+
+
+# The number of seconds to wait for the server to respond before giving up on
+# a request.
+DEFAULT_TIMEOUT = 60
+# The number of distinct hosts to keep connection pools open for. Every league
+# lives on its own sports-reference domain, plus fbref.com for football.
+DEFAULT_POOL_CONNECTIONS = 8
+# The maximum number of keep-alive connections held open to a single host.
+DEFAULT_POOL_MAXSIZE = 4
+DEFAULT_HEADERS = {
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive'
+}
+
+# The number of seconds a page downloaded while probing for its existence is
+# held in memory waiting to be parsed before it is discarded.
+KEPT_PAGE_TTL = 60
+# The maximum number of redirects followed when checking whether a page exists.
+MAX_REDIRECTS = 5
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+# Status codes returned by servers which don't support HEAD requests for a
+# page, requiring the page to be downloaded instead.
+HEAD_REFUSED_CODES = (405, 501)
+# The number of times a request is retried after the website throttles it.
+MAX_RETRIES = 3
+# Matches the character set declared by a page's <meta> tag, such as
+# '<meta charset="utf-8">', which is used when the response headers don't
+# declare one.
+META_CHARSET = re.compile(br'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+# The number of bytes at the start of a page searched for a <meta> charset.
+META_CHARSET_BYTES = 4096
+
+_session = None
+_session_lock = threading.Lock()
+_kept_pages = {}
+_kept_pages_lock = threading.Lock()
+_settings = {
+    'timeout': DEFAULT_TIMEOUT,
+    'pool_connections': DEFAULT_POOL_CONNECTIONS,
+    'pool_maxsize': DEFAULT_POOL_MAXSIZE
+}
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter which applies a default timeout to every request.
+
+    ``requests`` has no notion of a session-wide timeout, so the default is
+    injected into every request sent through the adapter unless the caller
+    explicitly specified one.
+    """
+    def __init__(self, *args, **kwargs):
+        self.timeout = kwargs.pop('timeout', DEFAULT_TIMEOUT)
+        super(_TimeoutHTTPAdapter, self).__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super(_TimeoutHTTPAdapter, self).send(request, **kwargs)
+
+
+def _detect_encoding(response, *args, **kwargs):
+    """
+    Decode pages without a declared character set the way a browser would.
+
+    ``requests`` decodes every text response which doesn't declare a charset
+    in its Content-Type header as ISO-8859-1, garbling any accented names on
+    UTF-8 pages. Instead, the charset declared by the page's <meta> tag is
+    used, falling back to the encoding detected from the page contents.
+
+    Parameters
+    ----------
+    response : requests.Response
+        The response returned by the server.
+
+    Returns
+    -------
+    requests.Response
+        The same response with its encoding set.
+    """
+    content_type = response.headers.get('Content-Type', '')
+    if 'charset' in content_type.lower() or not response.content:
+        return response
+    match = META_CHARSET.search(response.content[:META_CHARSET_BYTES])
+    if match:
+        response.encoding = match.group(1).decode('ascii')
+    else:
+        response.encoding = response.apparent_encoding
+    return response
+
+
+def _create_session():
+    """
+    Create a new pooled session with the current transport settings.
+
+    Returns
+    -------
+    requests.Session
+        A ``Session`` with keep-alive connection pools mounted for both HTTP
+        and HTTPS, compressed transfers negotiated by default, and pages
+        decoded with the charset they declare.
+    """
+    session = requests.Session()
+    adapter = _TimeoutHTTPAdapter(
+        pool_connections=_settings['pool_connections'],
+        pool_maxsize=_settings['pool_maxsize'],
+        pool_block=True,
+        timeout=_settings['timeout'])
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    session.hooks['response'].append(_detect_encoding)
+    return session
+
+
+def get_session():
+    """
+    Return the shared session used for every page download.
+
+    The session is created on first use and reused for the lifetime of the
+    process so connections to each sports-reference host are kept alive
+    between requests instead of performing a new TCP and TLS handshake for
+    every page.
+
+    Returns
+    -------
+    requests.Session
+        The process-wide ``Session`` instance.
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _create_session()
+    return _session
+
+
+def configure(timeout=None, pool_connections=None, pool_maxsize=None):
+    """
+    Change the settings of the shared transport.
+
+    Any settings that are not specified keep their current value. The shared
+    session is rebuilt with the new settings the next time a page is
+    requested.
+
+    Parameters
+    ----------
+    timeout : int or float (optional)
+        The number of seconds to wait for a response before giving up.
+    pool_connections : int (optional)
+        The number of hosts to keep connection pools open for.
+    pool_maxsize : int (optional)
+        The maximum number of concurrent connections to any single host.
+        Requests beyond this limit wait for a connection to be freed.
+    """
+    global _session
+
+    with _session_lock:
+        if timeout is not None:
+            _settings['timeout'] = timeout
+        if pool_connections is not None:
+            _settings['pool_connections'] = pool_connections
+        if pool_maxsize is not None:
+            _settings['pool_maxsize'] = pool_maxsize
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+class FetchResult:
+    """
+    The outcome of requesting a page.
+
+    Checking whether a page exists only requires its status code, but when the
+    full page had to be downloaded to find out, the contents are kept with the
+    result so they can be parsed without downloading the page again.
+
+    Parameters
+    ----------
+    url : string
+        A ``string`` of the requested URL.
+    status_code : int
+        An ``int`` of the final HTTP status code after following redirects.
+    contents : string (optional)
+        A ``string`` of the page contents if the page was downloaded.
+    """
+    def __init__(self, url, status_code, contents=None):
+        self.url = url
+        self.status_code = status_code
+        self.contents = contents
+        self.time = time.time()
+
+    @property
+    def exists(self):
+        """
+        Returns a ``boolean`` which evaluates to True when the page exists.
+        """
+        return self.status_code < 400
+
+    @property
+    def ok(self):
+        """
+        Returns a ``boolean`` which evaluates to True when the page was
+        returned successfully and can be parsed.
+        """
+        return 200 <= self.status_code < 300
+
+
+def _send(request, url):
+    """
+    Send a request while respecting the process-wide rate limiter.
+
+    Every request waits for the rate limiter to allow it before being sent.
+    If the website throttles the request, the limiter backs off the host and
+    the request is retried up to ``MAX_RETRIES`` times.
+
+    Parameters
+    ----------
+    request : function
+        The session method used to send the request, such as ``get``.
+    url : string
+        A ``string`` of the URL to request.
+
+    Returns
+    -------
+    requests.Response
+        The response from the server. If the website is still throttling
+        requests after every retry, the last response is returned.
+    """
+    limiter = ratelimit.get_rate_limiter()
+    for _ in range(MAX_RETRIES):
+        limiter.acquire(url)
+        response = request(url)
+        if not limiter.report(url, response):
+            return response
+    limiter.acquire(url)
+    response = request(url)
+    limiter.report(url, response)
+    return response
+
+
+def _head(url):
+    """
+    Issue a HEAD request for the given URL through the shared session.
+
+    Redirects are followed with further HEAD requests, up to
+    ``MAX_REDIRECTS`` times, so the status code of the final page is returned
+    without downloading any page bodies.
+
+    Parameters
+    ----------
+    url : string
+        A ``string`` of the URL to request.
+
+    Returns
+    -------
+    requests.Response
+        The response from the server.
+    """
+    response = _send(get_session().head, url)
+    for _ in range(MAX_REDIRECTS):
+        if response.status_code not in REDIRECT_CODES:
+            break
+        location = response.headers.get('Location')
+        if not location:
+            break
+        url = urljoin(url, location)
+        response = _send(get_session().head, url)
+    return response
+
+
+def _get(url):
+    """
+    Issue a GET request for the given URL through the shared session.
+
+    Parameters
+    ----------
+    url : string
+        A ``string`` of the URL to request.
+
+    Returns
+    -------
+    requests.Response
+        The response from the server.
+    """
+    return _send(get_session().get, url)
+
+
+def _probe(url, download=False):
+    """
+    Determine whether a page exists while transferring it at most once.
+
+    Pages in the on-disk response cache are known to exist without contacting
+    the website. Otherwise, a HEAD request is used unless the server refuses
+    it or the redirect chain can't be resolved, in which case the page is
+    downloaded with a GET request and its contents are included in the
+    result.
+
+    Parameters
+    ----------
+    url : string
+        A ``string`` of the URL to check.
+    download : boolean (optional)
+        Download the full page instead of only requesting its headers.
+
+    Returns
+    -------
+    FetchResult
+        The outcome of the request, including the page contents if the page
+        was downloaded.
+    """
+    response_cache = cache.get_cache()
+    if response_cache is not None:
+        stored_time = response_cache.stored_time(url)
+        if stored_time and response_cache.policy.is_fresh(url, stored_time):
+            return FetchResult(url, 200)
+    if not download:
+        response = _head(url)
+        if response.status_code not in REDIRECT_CODES + HEAD_REFUSED_CODES:
+            return FetchResult(url, response.status_code)
+    response = _get(url)
+    result = FetchResult(url, response.status_code, response.text)
+    if result.ok and response_cache is not None:
+        response_cache.set(url, result.contents)
+    return result
+
+
+def _keep_page(result):
+    """
+    Hold a downloaded page in memory until it is requested.
+
+    Pages which are downloaded only to determine whether they exist would
+    otherwise be downloaded a second time once they are actually parsed.
+    Instead, the result is held for a short time and its contents are returned
+    by the next call to ``_fetch`` for the same URL.
+
+    Parameters
+    ----------
+    result : FetchResult
+        The result of successfully downloading a page.
+    """
+    now = time.time()
+    with _kept_pages_lock:
+        for kept_url, kept in list(_kept_pages.items()):
+            if now - kept.time > KEPT_PAGE_TTL:
+                del _kept_pages[kept_url]
+        _kept_pages[result.url] = result
+
+
+def _take_kept_page(url):
+    """
+    Remove and return a page held in memory by ``_keep_page``.
+
+    Parameters
+    ----------
+    url : string
+        A ``string`` of the URL to look up.
+
+    Returns
+    -------
+    string
+        Returns a ``string`` of the page contents if the page is being held
+        and hasn't expired, otherwise None.
+    """
+    with _kept_pages_lock:
+        kept = _kept_pages.pop(url, None)
+    if kept and time.time() - kept.time <= KEPT_PAGE_TTL:
+        return kept.contents
+    return None
+
+
+def _is_kept_page(url):
+    """
+    Determine if a page is being held in memory by ``_keep_page``.
+
+    Parameters
+    ----------
+    url : string
+        A ``string`` of the URL to look up.
+
+    Returns
+    -------
+    boolean
+        Returns True if the page is held and hasn't expired.
+    """
+    with _kept_pages_lock:
+        kept = _kept_pages.get(url)
+    return bool(kept) and time.time() - kept.time <= KEPT_PAGE_TTL
+
+
+def _fetch(url):
+    """
+    Download the requested page and return its contents.
+
+    Pages which were recently downloaded while checking whether they exist are
+    returned without being downloaded again. If the on-disk response cache is
+    enabled, previously downloaded pages are read from the cache instead of
+    the website, and every successful download is stored in the cache for
+    later use.
+
+    Parameters
+    ----------
+    url : string
+        A ``string`` of the URL to download.
+
+    Returns
+    -------
+    string
+        The decoded body of the requested page.
+
+    Raises
+    ------
+    HTTPError
+        Raises an ``HTTPError`` if the server responds with anything other
+        than a successful status code, matching the behavior of downloading a
+        page directly with PyQuery.
+    """
+    contents = _take_kept_page(url)
+    if contents is not None:
+        return contents
+    response_cache = cache.get_cache()
+    if response_cache is not None:
+        contents = response_cache.get(url)
+        if contents is not None:
+            return contents
+    response = _get(url)
+    if not 200 <= response.status_code < 300:
+        raise HTTPError(url, response.status_code,
+                        'HTTP Error %s' % response.status_code, None, None)
+    if response_cache is not None:
+        response_cache.set(url, response.text)
+    return response.text
@@ -1,9 +1,9 @@
 import pandas as pd
 import re
-from datetime import timedelta
 from pyquery import PyQuery as pq
 from urllib.error import HTTPError
-from .. import utils
+from .. import parsing, records, utils
+from ..concurrency import _fetch_boxscores
 from ..constants import AWAY, HOME
 from ..decorators import float_property_decorator, int_property_decorator
 from .constants import (BOXSCORE_ELEMENT_INDEX,
@@ -49,11 +49,23 @@ class BoxscorePlayer(AbstractPlayer):
     player_name : string
         A string representing the player's first and last name, such as 'Jose
         Altuve'.
-    player_data : string
-        A string representation of the player's HTML data from the Boxscore
-        page. If the player appears in multiple tables, all of their
-        information will appear in one single string concatenated together.
+    player_data : list
+        A list of the row elements containing the player's data from the
+        Boxscore page. If the player appears in multiple tables, the rows from
+        every table are included.
     """
+    __slots__ = ('_index', '_average_leverage_index', '_base_out_runs_added',
+                 '_earned_runs_against', '_innings_pitched', '_pitches_thrown',
+                 '_strikes', '_home_runs_thrown', '_strikes_thrown',
+                 '_strikes_contact', '_strikes_swinging', '_strikes_looking',
+                 '_grounded_balls', '_fly_balls', '_line_drives',
+                 '_unknown_bat_types', '_game_score', '_inherited_runners',
+                 '_inherited_score', '_win_probability_added_pitcher',
+                 '_average_leverage_index_pitcher', '_base_out_runs_saved',
+                 '_win_probability_added',
+                 '_win_probability_for_offensive_player',
+                 '_win_probability_subtracted')
+
     def __init__(self, player_id, player_name, player_data):
         self._index = 0
         self._player_id = player_id
@@ -329,7 +341,7 @@ class BoxscorePlayer(AbstractPlayer):
         return self._win_probability_for_offensive_player
 
 
-class Boxscore:
+class Boxscore(records._SlotRecord):
     """
     Detailed information about the final statistics for a game.
 
@@ -342,8 +354,60 @@ class Boxscore:
     uri : string
         The relative link to the boxscore HTML page, such as
         'BOS/BOS201806070'.
+    lazy : boolean (optional)
+        Set to True to only parse each field the first time it is read instead
+        of parsing every field as soon as the boxscore is created. Defaults to
+        False.
+    compact : boolean (optional)
+        Set to False to keep references into the boxscore page, such as each
+        team's name tag, instead of copying out only the elements which are
+        kept, which lets the page be released once the boxscore has been
+        parsed. Defaults to True.
+    page : string (optional)
+        The contents of the boxscore page if it has already been downloaded,
+        in which case the page isn't downloaded again.
     """
-    def __init__(self, uri):
+    __slots__ = ('_uri', '_date', '_time', '_attendance', '_venue',
+                 '_time_of_day', '_duration', '_away_name', '_home_name',
+                 '_summary', '_winner', '_winning_name', '_winning_abbr',
+                 '_losing_name', '_losing_abbr', '_away_at_bats', '_away_runs',
+                 '_away_hits', '_away_rbi', '_away_earned_runs',
+                 '_away_bases_on_balls', '_away_strikeouts',
+                 '_away_plate_appearances', '_away_batting_average',
+                 '_away_on_base_percentage', '_away_slugging_percentage',
+                 '_away_on_base_plus', '_away_pitches', '_away_strikes',
+                 '_away_win_probability_for_offensive_player',
+                 '_away_average_leverage_index', '_away_win_probability_added',
+                 '_away_win_probability_subtracted',
+                 '_away_base_out_runs_added', '_away_putouts', '_away_assists',
+                 '_away_innings_pitched', '_away_home_runs',
+                 '_away_strikes_by_contact', '_away_strikes_swinging',
+                 '_away_strikes_looking', '_away_grounded_balls',
+                 '_away_fly_balls', '_away_line_drives',
+                 '_away_unknown_bat_type', '_away_game_score',
+                 '_away_inherited_runners', '_away_inherited_score',
+                 '_away_win_probability_by_pitcher',
+                 '_away_base_out_runs_saved', '_home_at_bats', '_home_runs',
+                 '_home_hits', '_home_rbi', '_home_earned_runs',
+                 '_home_bases_on_balls', '_home_strikeouts',
+                 '_home_plate_appearances', '_home_batting_average',
+                 '_home_on_base_percentage', '_home_slugging_percentage',
+                 '_home_on_base_plus', '_home_pitches', '_home_strikes',
+                 '_home_win_probability_for_offensive_player',
+                 '_home_average_leverage_index', '_home_win_probability_added',
+                 '_home_win_probability_subtracted',
+                 '_home_base_out_runs_added', '_home_putouts', '_home_assists',
+                 '_home_innings_pitched', '_home_home_runs',
+                 '_home_strikes_by_contact', '_home_strikes_swinging',
+                 '_home_strikes_looking', '_home_grounded_balls',
+                 '_home_fly_balls', '_home_line_drives',
+                 '_home_unknown_bat_type', '_home_game_score',
+                 '_home_inherited_runners', '_home_inherited_score',
+                 '_home_win_probability_by_pitcher',
+                 '_home_base_out_runs_saved', '_away_players', '_home_players',
+                 '_pending_fields')
+
+    def __init__(self, uri, lazy=False, compact=True, page=None):
         self._uri = uri
         self._date = None
         self._time = None
@@ -431,7 +495,7 @@ class Boxscore:
         self._home_win_probability_by_pitcher = None
         self._home_base_out_runs_saved = None
 
-        self._parse_game_data(uri)
+        self._parse_game_data(uri, lazy, compact, page=page)
 
     def __str__(self):
         """
@@ -446,7 +510,13 @@ class Boxscore:
         """
         return self.__str__()
 
-    def _retrieve_html_page(self, uri):
+    def __getattr__(self, name):
+        """
+        Parse a field the first time it is read if parsing lazily.
+        """
+        return utils._parse_pending_field(self, name)
+
+    def _retrieve_html_page(self, uri, page=None):
         """
         Download the requested HTML page.
 
@@ -459,6 +529,9 @@ class Boxscore:
         uri : string
             The relative link to the boxscore HTML page, such as
             'BOS/BOS201806070'.
+        page : string (optional)
+            The contents of the boxscore page if it has already been
+            downloaded.
 
         Returns
         -------
@@ -466,12 +539,14 @@ class Boxscore:
             The requested page is returned as a queriable PyQuery object with
             the comment tags removed.
         """
+        if page is not None:
+            return utils._expand_html_comments(pq(page))
         url = BOXSCORE_URL % uri
         try:
-            url_data = pq(url)
+            url_data = utils._pull_page(url)
         except HTTPError:
             return None
-        return pq(utils._remove_html_comment_tags(url_data))
+        return utils._expand_html_comments(url_data)
 
     def _parse_game_date_and_location(self, boxscore):
         """
@@ -562,7 +637,7 @@ class Boxscore:
                     summary[team[ind]].append(None)
         return summary
 
-    def _parse_name(self, field, boxscore):
+    def _parse_name(self, field, boxscore, compact=True):
         """
         Retrieve the team's complete name tag.
 
@@ -576,6 +651,8 @@ class Boxscore:
             The name of the attribute to parse
         boxscore : PyQuery object
             A PyQuery object containing all of the HTML data from the boxscore.
+        compact : boolean (optional)
+            Set to False to keep references into the boxscore page.
 
         Returns
         -------
@@ -583,7 +660,7 @@ class Boxscore:
             The complete text for the requested tag.
         """
         scheme = BOXSCORE_SCHEME[field]
-        return boxscore(scheme)
+        return utils._detach(boxscore(scheme), compact)
 
     def _find_boxscore_tables(self, boxscore):
         """
@@ -606,7 +683,7 @@ class Boxscore:
         """
         tables = []
 
-        for table in boxscore('table').items():
+        for table in parsing.get_engine().find(boxscore, 'table').items():
             try:
                 if 'pitching' in table.attr['id'] or \
                    'batting' in table.attr['id']:
@@ -663,9 +740,9 @@ class Boxscore:
 
         Since each player generally has a couple of rows worth of stats (one
         for basic stats and another for advanced stats) on the boxscore page,
-        both rows should be combined into a single string object to easily
-        query all fields from a single object instead of determining which row
-        to pull metrics from.
+        both rows should be combined into a single list of row elements to
+        easily query all fields from a single object instead of determining
+        which row to pull metrics from.
 
         Parameters
         ----------
@@ -696,11 +773,11 @@ class Boxscore:
                 continue
             name = self._find_player_name(row)
             try:
-                player_dict[player_id]['data'] += str(row).strip()
+                player_dict[player_id]['data'] += row
             except KeyError:
                 player_dict[player_id] = {
                     'name': name,
-                    'data': str(row).strip(),
+                    'data': list(row),
                     'team': home_or_away
                 }
         return player_dict
@@ -719,8 +796,8 @@ class Boxscore:
             A dictionary containing information for every player on the
             boxscores page. Each key is a string containing the player's ID
             and each value is a dictionary with the player's full name, a
-            string representation of their HTML stats, and a string constant
-            denoting which team they play for as the values.
+            list of the row elements containing their stats, and a string
+            constant denoting which team they play for as the values.
 
         Returns
         -------
@@ -779,7 +856,41 @@ class Boxscore:
         away_players, home_players = self._instantiate_players(player_dict)
         return away_players, home_players
 
-    def _parse_game_data(self, uri):
+    def _parse_boxscore_field(self, field, boxscore_index, compact=True):
+        """
+        Parse the value of a single attribute.
+
+        Parameters
+        ----------
+        field : string
+            The name of the attribute to parse, such as '_away_points'.
+        boxscore_index : _RowIndex
+            An index of every cell on the boxscore page.
+        compact : boolean (optional)
+            Set to False to keep references into the boxscore page.
+
+        Returns
+        -------
+        string
+            The value of the attribute according to the parsing scheme.
+        """
+        boxscore = boxscore_index.html
+        # Remove the '_' from the name
+        short_field = str(field)[1:]
+        if short_field == 'away_name' or \
+           short_field == 'home_name':
+            return self._parse_name(short_field, boxscore, compact)
+        if short_field == 'summary':
+            return self._parse_summary(boxscore)
+        index = 0
+        if short_field in BOXSCORE_ELEMENT_INDEX.keys():
+            index = BOXSCORE_ELEMENT_INDEX[short_field]
+        return utils._parse_field(BOXSCORE_SCHEME,
+                                  boxscore_index,
+                                  short_field,
+                                  index)
+
+    def _parse_game_data(self, uri, lazy=False, compact=True, page=None):
         """
         Parses a value for every attribute.
 
@@ -796,56 +907,46 @@ class Boxscore:
         uri : string
             The relative link to the boxscore HTML page, such as
             'BOS/BOS201806070'.
-        """
-        boxscore = self._retrieve_html_page(uri)
+        lazy : boolean (optional)
+            Set to True to only parse each field the first time it is read.
+        compact : boolean (optional)
+            Set to False to keep references into the boxscore page.
+        page : string (optional)
+            The contents of the boxscore page if it has already been
+            downloaded.
+        """
+        boxscore = self._retrieve_html_page(uri, page)
         # If the boxscore is None, the game likely hasn't been played yet and
         # no information can be gathered. As there is nothing to grab, the
         # class instance should just be empty.
         if not boxscore:
             return
 
-        for field in self.__dict__:
-            # Remove the '_' from the name
-            short_field = str(field)[1:]
-            if short_field == 'winner' or \
-               short_field == 'winning_name' or \
-               short_field == 'winning_abbr' or \
-               short_field == 'losing_name' or \
-               short_field == 'losing_abbr' or \
-               short_field == 'uri' or \
-               short_field == 'date' or \
-               short_field == 'time' or \
-               short_field == 'venue' or \
-               short_field == 'attendance' or \
-               short_field == 'time_of_day' or \
-               short_field == 'duration':
-                continue
-            if short_field == 'away_name' or \
-               short_field == 'home_name':
-                value = self._parse_name(short_field, boxscore)
-                setattr(self, field, value)
-                continue
-            if short_field == 'summary':
-                value = self._parse_summary(boxscore)
-                setattr(self, field, value)
-                continue
-            index = 0
-            if short_field in BOXSCORE_ELEMENT_INDEX.keys():
-                index = BOXSCORE_ELEMENT_INDEX[short_field]
-            value = utils._parse_field(BOXSCORE_SCHEME,
-                                       boxscore,
-                                       short_field,
-                                       index)
-            setattr(self, field, value)
+        # Every cell on the page is indexed by its data-stat attribute once so
+        # the fields don't each search the entire page.
+        boxscore_index = utils._RowIndex(boxscore)
+        skipped_fields = ['winner', 'winning_name', 'winning_abbr',
+                          'losing_name', 'losing_abbr', 'uri', 'date', 'time',
+                          'venue', 'attendance', 'time_of_day', 'duration']
+        fields = [field for field in records._fields(self)
+                  if str(field)[1:] not in skipped_fields]
+        utils._parse_fields(self, fields, self._parse_boxscore_field,
+                            boxscore_index, compact, lazy=lazy)
         self._parse_game_date_and_location(boxscore)
-        self._away_players, self._home_players = self._find_players(boxscore)
+        utils._parse_fields(self, ['_away_players', '_home_players'],
+                            self._find_players, boxscore, together=True,
+                            lazy=lazy)
 
-    @property
-    def dataframe(self):
+    def _dataframe_row(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the string URI that is used to
-        instantiate the class, such as 'BOS201806070'.
+        Gather the values of every field included in the DataFrame.
+
+        Returns
+        -------
+        tuple
+            A ``tuple`` of the row's index and a ``dictionary`` of every
+            field's value keyed by column name, or None if the boxscore has no
+            data.
         """
         if self._away_runs is None and self._home_runs is None:
             return None
@@ -938,7 +1039,16 @@ class Boxscore:
             self.home_win_probability_by_pitcher,
             'home_base_out_runs_saved': self.home_base_out_runs_saved
         }
-        return pd.DataFrame([fields_to_include], index=[self._uri])
+        return self._uri, fields_to_include
+
+    @property
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the string URI that is used to
+        instantiate the class, such as 'BOS201806070'.
+        """
+        return utils._build_dataframe([self._dataframe_row()])
 
     @property
     def away_players(self):
@@ -1693,6 +1803,37 @@ class Boxscores:
         """
         return self._boxscores
 
+    @classmethod
+    async def fetch(cls, date, end_date=None, concurrency=None):
+        """
+        Search for MLB games without blocking the event loop.
+
+        Behaves the same as creating a new instance of the class, except the
+        page for every day in the range is downloaded concurrently, which is
+        much faster when searching a large range of days.
+
+        Parameters
+        ----------
+        date : datetime object
+            The date to search for any matches. The month, day, and year are
+            required for the search, but time is not factored into the search.
+        end_date : datetime object (optional)
+            Optionally specify an end date to iterate until. If left empty, or
+            if 'end_date' is prior to 'date', only the games from the day
+            specified in the 'date' parameter will be saved.
+        concurrency : int (optional)
+            The maximum number of pages to download at once. Defaults to the
+            maximum number of connections kept open to a single host.
+
+        Returns
+        -------
+        Boxscores instance
+            A ``Boxscores`` instance containing every game in the range.
+        """
+        boxscores = cls.__new__(cls)
+        pages = utils._boxscore_days(date, end_date, boxscores._create_url)
+        return await _fetch_boxscores(boxscores, pages, concurrency)
+
     def _create_url(self, date):
         """
         Build the URL based on the passed datetime object.
@@ -1732,7 +1873,7 @@ class Boxscores:
             A PyQuery object containing the HTML contents of the requested
             page.
         """
-        return pq(url)
+        return utils._pull_page(url)
 
     def _get_boxscore_uri(self, url):
         """
@@ -1976,17 +2117,5 @@ class Boxscores:
             the games from the day specified in the 'date' parameter will be
             saved.
         """
-        # Set the end date to the start date if the end date is before the
-        # start date.
-        if not end_date or date > end_date:
-            end_date = date
-        date_step = date
-        while date_step <= end_date:
-            url = self._create_url(date_step)
-            page = self._get_requested_page(url)
-            games = page('table[class="teams"]').items()
-            boxscores = self._extract_game_info(games)
-            timestamp = '%s-%s-%s' % (date_step.month, date_step.day,
-                                      date_step.year)
-            self._boxscores[timestamp] = boxscores
-            date_step += timedelta(days=1)
+        pages = utils._boxscore_days(date, end_date, self._create_url)
+        utils._find_boxscore_games(self, pages)
@@ -41,7 +41,8 @@ def _add_stats_data(teams_list, team_data_dict):
     return team_data_dict
 
 
-def _retrieve_all_teams(year, standings_file=None, teams_file=None):
+def _retrieve_all_teams(year, standings_file=None, teams_file=None,
+                        stream=False):
     """
     Find and create Team instances for all teams in the given season.
 
@@ -58,6 +59,9 @@ def _retrieve_all_teams(year, standings_file=None, teams_file=None):
         Link with filename to the local standings page.
     teams_file : string (optional)
         Link with filename to the local teams page.
+    stream : boolean (optional)
+        Set to True to stream the stats tables out of each page instead of
+        parsing the pages in full.
 
     Returns
     -------
@@ -69,17 +73,14 @@ def _retrieve_all_teams(year, standings_file=None, teams_file=None):
     team_data_dict = {}
 
     if not year:
-        year = utils._find_year_for_season('mlb')
-        # If stats for the requested season do not exist yet (as is the case
-        # right before a new season begins), attempt to pull the previous
-        # year's stats. If it exists, use the previous year instead.
-        if not utils._url_exists(STANDINGS_URL % year) and \
-           utils._url_exists(STANDINGS_URL % str(int(year) - 1)):
-            year = str(int(year) - 1)
-    doc = utils._pull_page(STANDINGS_URL % year, standings_file)
+        # If stats for the requested season do not exist yet (as is the
+        # case right before a new season begins), the previous year's
+        # stats are used instead.
+        year = utils._find_default_season('mlb', lambda x: STANDINGS_URL % x)
+    doc = utils._pull_table_page(STANDINGS_URL % year, standings_file, stream)
     div_prefix = 'div#all_expanded_standings_overall'
     standings = utils._get_stats_table(doc, div_prefix)
-    doc = utils._pull_page(TEAM_STATS_URL % year, teams_file)
+    doc = utils._pull_table_page(TEAM_STATS_URL % year, teams_file, stream)
     div_prefix = 'div#all_teams_standard_%s'
     batting_stats = utils._get_stats_table(doc, div_prefix % 'batting')
     pitching_stats = utils._get_stats_table(doc, div_prefix % 'pitching')
@@ -4,7 +4,8 @@ from functools import wraps
 from lxml.etree import ParserError, XMLSyntaxError
 from pyquery import PyQuery as pq
 from urllib.error import HTTPError
-from .. import utils
+from .. import records, utils
+from ..decorators import _convert_item
 from .constants import (BOXSCORE_SCHEME,
                         NATIONALITY,
                         PLAYER_ELEMENT_INDEX,
@@ -25,6 +26,14 @@ def _cleanup(prop):
         return ''
 
 
+def _to_int(prop):
+    return int(_cleanup(prop))
+
+
+def _to_float(prop):
+    return float(_cleanup(prop))
+
+
 def _int_property_decorator(func):
     @property
     @wraps(func)
@@ -35,11 +44,14 @@ def _int_property_decorator(func):
         if func.__name__ in PLAYER_ELEMENT_INDEX.keys():
             element_ind = PLAYER_ELEMENT_INDEX[func.__name__]
         try:
-            value = _cleanup(prop[index][element_ind])
-            return int(value)
-        except (ValueError, TypeError, IndexError):
+            value = prop[index][element_ind]
+        except (TypeError, IndexError):
             # If there is no value, default to None
             return None
+        if type(value) is int:
+            return value
+        return _convert_item(args[0], func.__name__, prop[index],
+                             element_ind, _to_int, field=prop)
     return wrapper
 
 
@@ -53,15 +65,18 @@ def _float_property_decorator(func):
         if func.__name__ in PLAYER_ELEMENT_INDEX.keys():
             element_ind = PLAYER_ELEMENT_INDEX[func.__name__]
         try:
-            value = _cleanup(prop[index][element_ind])
-            return float(value)
-        except (ValueError, TypeError, IndexError):
+            value = prop[index][element_ind]
+        except (TypeError, IndexError):
             # If there is no value, default to None
             return None
+        if type(value) is float:
+            return value
+        return _convert_item(args[0], func.__name__, prop[index],
+                             element_ind, _to_float, field=prop)
     return wrapper
 
 
-class AbstractPlayer:
+class AbstractPlayer(records._SlotRecord):
     """
     Get player information and stats for all seasons.
 
@@ -86,6 +101,15 @@ class AbstractPlayer:
         'NN' is a number starting at '01' for the first time that player ID has
         been used and increments by 1 for every successive player.
     """
+    __slots__ = ('_player_id', '_name', '_plate_appearances', '_at_bats',
+                 '_runs', '_hits', '_runs_batted_in', '_bases_on_balls',
+                 '_times_struck_out', '_batting_average',
+                 '_on_base_percentage', '_slugging_percentage',
+                 '_on_base_plus_slugging_percentage', '_putouts', '_assists',
+                 '_hits_allowed', '_runs_allowed', '_earned_runs_allowed',
+                 '_home_runs_allowed', '_bases_on_balls_given', '_strikeouts',
+                 '_batters_faced')
+
     def __init__(self, player_id, player_name, player_data):
         self._player_id = player_id
         self._name = player_name
@@ -122,9 +146,8 @@ class AbstractPlayer:
 
         Parameters
         ----------
-        stats : PyQuery object
-            A PyQuery object containing all stats in HTML format for a
-            particular player.
+        stats : _RowIndex
+            An index of all stats in HTML format for a particular player.
         field : string
             A string of the field to parse from the HTML.
 
@@ -135,7 +158,7 @@ class AbstractPlayer:
             could be found, returns None.
         """
         scheme = PLAYER_SCHEME[field]
-        items = [i.text() for i in stats(scheme).items()]
+        items = list(stats.texts(scheme))
         # Stats can be added and removed on a yearly basis. If no stats are
         # found, return None and have that be the value.
         if len(items) == 0:
@@ -151,15 +174,23 @@ class AbstractPlayer:
 
         Parameters
         ----------
-        player_data : dictionary or string
+        player_data : dictionary or list
             If this class is inherited from the ``Player`` class, player_data
             will be a dictionary where each key is a string representing the
-            season and each value contains the HTML data as a string. If this
-            class is inherited from the ``BoxscorePlayer`` class, player_data
-            will be a string representing the player's game statistics in HTML
-            format.
-        """
-        for field in self.__dict__:
+            season and each value contains a list of the row elements with the
+            player's stats. If this class is inherited from the
+            ``BoxscorePlayer`` class, player_data will be a list of the row
+            elements with the player's game statistics.
+        """
+        # Parse the HTML for every season once up front instead of once for
+        # every field.
+        if type(player_data) == dict:
+            seasons = [utils._RowIndex(pq(data['data']),
+                                       combined=True)
+                       for data in player_data.values()]
+        else:
+            seasons = [utils._RowIndex(pq(player_data), combined=True)]
+        for field in records._fields(self):
             short_field = str(field)[1:]
             if short_field == 'player_id' or \
                short_field == 'index' or \
@@ -172,16 +203,8 @@ class AbstractPlayer:
                short_field == 'birth_date' or \
                short_field == 'contract':
                 continue
-            field_stats = []
-            if type(player_data) == dict:
-                for year, data in player_data.items():
-                    stats = pq(data['data'])
-                    value = self._parse_value(stats, short_field)
-                    field_stats.append(value)
-            else:
-                stats = pq(player_data)
-                value = self._parse_value(stats, short_field)
-                field_stats.append(value)
+            field_stats = [self._parse_value(stats, short_field)
+                           for stats in seasons]
             setattr(self, field, field_stats)
 
     @property
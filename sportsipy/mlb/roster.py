@@ -4,12 +4,14 @@ from functools import wraps
 from lxml.etree import ParserError, XMLSyntaxError
 from pyquery import PyQuery as pq
 from urllib.error import HTTPError
-from .. import utils
+from .. import concurrency, records, utils
+from ..decorators import _convert_item
 from .constants import (NATIONALITY,
                         PLAYER_ELEMENT_INDEX,
                         PLAYER_SCHEME,
                         PLAYER_URL,
-                        ROSTER_URL)
+                        ROSTER_URL,
+                        STANDINGS_URL)
 from .player import AbstractPlayer
 
 
@@ -25,6 +27,14 @@ def _cleanup(prop):
         return ''
 
 
+def _to_int(prop):
+    return int(_cleanup(prop))
+
+
+def _to_float(prop):
+    return float(_cleanup(prop))
+
+
 def _int_property_decorator(func):
     @property
     @wraps(func)
@@ -35,11 +45,14 @@ def _int_property_decorator(func):
         if func.__name__ in PLAYER_ELEMENT_INDEX.keys():
             element_ind = PLAYER_ELEMENT_INDEX[func.__name__]
         try:
-            value = _cleanup(prop[index][element_ind])
-            return int(value)
-        except (ValueError, TypeError, IndexError):
+            value = prop[index][element_ind]
+        except (TypeError, IndexError):
             # If there is no value, default to None
             return None
+        if type(value) is int:
+            return value
+        return _convert_item(args[0], func.__name__, prop[index],
+                             element_ind, _to_int, field=prop)
     return wrapper
 
 
@@ -51,11 +64,14 @@ def _float_property_decorator(func):
         prop = func(*args)
         element_ind = 0
         try:
-            value = _cleanup(prop[index][element_ind])
-            return float(value)
-        except (ValueError, TypeError, IndexError):
+            value = prop[index][element_ind]
+        except (TypeError, IndexError):
             # If there is no value, default to None
             return None
+        if type(value) is float:
+            return value
+        return _convert_item(args[0], func.__name__, prop[index],
+                             element_ind, _to_float, field=prop)
     return wrapper
 
 
@@ -247,10 +263,10 @@ class Player(AbstractPlayer):
         """
         url = self._build_url()
         try:
-            url_data = pq(url)
+            url_data = utils._pull_page(url)
         except HTTPError:
             return None
-        return pq(utils._remove_html_comment_tags(url_data))
+        return utils._expand_html_comments(url_data)
 
     def _parse_season(self, row):
         """
@@ -291,8 +307,8 @@ class Player(AbstractPlayer):
         all_stats_dict : dictionary
             A dictionary of all stats separated by season where each key is the
             season ``string``, such as '2017', and the value is a
-            ``dictionary`` with a ``string`` of 'data' and ``string``
-            containing all of the data.
+            ``dictionary`` with a ``string`` of 'data' and a ``list`` of the
+            row elements containing all of the data.
 
         Returns
         -------
@@ -311,17 +327,17 @@ class Player(AbstractPlayer):
                 continue
             season = self._parse_season(row)
             try:
-                all_stats_dict[season]['data'] += str(row)
+                all_stats_dict[season]['data'] += row
             except KeyError:
-                all_stats_dict[season] = {'data': str(row)}
+                all_stats_dict[season] = {'data': list(row)}
             most_recent_season = season
         self._most_recent_season = most_recent_season
         if not career_stats:
             return all_stats_dict
         try:
-            all_stats_dict['Career']['data'] += str(next(career_stats))
+            all_stats_dict['Career']['data'] += next(career_stats)
         except KeyError:
-            all_stats_dict['Career'] = {'data': str(next(career_stats))}
+            all_stats_dict['Career'] = {'data': list(next(career_stats))}
         return all_stats_dict
 
     def _combine_all_stats(self, player_info):
@@ -708,8 +724,10 @@ class Player(AbstractPlayer):
         temp_index = self._index
         rows = []
         indices = []
-        for season in self._season:
-            self._index = self._season.index(season)
+        # Every row is read from the first occurrence of its season.
+        for season, index in zip(self._season,
+                                 utils._first_indices(self._season)):
+            self._index = index
             rows.append(self._dataframe_fields())
             indices.append(season)
         self._index = temp_index
@@ -1426,7 +1444,7 @@ class Player(AbstractPlayer):
         return self._strikeouts_thrown_per_walk
 
 
-class Roster:
+class Roster(records._Record):
     """
     Get stats for all players on a roster.
 
@@ -1446,10 +1464,16 @@ class Roster:
         the name and player ID for each player as opposed to all of their
         respective stats which greatly reduces the time to return a response if
         just the names and IDs are desired. Defaults to False.
+    workers : int (optional)
+        Set to the number of threads to use to download and parse the pages
+        for every player on the roster concurrently. Players are still listed
+        in roster order. Has no effect when ``slim`` is True. Defaults to
+        downloading each player serially.
     """
-    def __init__(self, team, year=None, slim=False):
+    def __init__(self, team, year=None, slim=False, workers=None):
         self._team = team
         self._slim = slim
+        self._workers = workers
         self._coach = None
         if slim:
             self._players = {}
@@ -1489,7 +1513,7 @@ class Roster:
             Returns a PyQuery object of the team's HTML page.
         """
         try:
-            return pq(url)
+            return utils._pull_page(url)
         except HTTPError:
             return None
 
@@ -1595,20 +1619,18 @@ class Roster:
             from.
         """
         if not year:
-            year = utils._find_year_for_season('mlb')
             # If stats for the requested season do not exist yet (as is the
-            # case right before a new season begins), attempt to pull the
-            # previous year's stats. If it exists, use the previous year
-            # instead.
-            if not utils._url_exists(self._create_url(year)) and \
-               utils._url_exists(self._create_url(str(int(year) - 1))):
-                year = str(int(year) - 1)
+            # case right before a new season begins), the previous year's
+            # stats are used instead.
+            year = utils._find_default_season(
+                'mlb', lambda x: STANDINGS_URL % x, self._create_url)
         url = self._create_url(year)
         page = self._pull_team_page(url)
         if not page:
             output = ("Can't pull requested team page. Ensure the following "
                       "URL exists: %s" % url)
             raise ValueError(output)
+        player_ids = []
         players = page('table#team_batting tbody tr').items()
         players_parsed = []
         for player in players:
@@ -1619,8 +1641,7 @@ class Roster:
                 name = self._get_name(player)
                 self._players[player_id] = name
             else:
-                player_instance = Player(player_id)
-                self._players.append(player_instance)
+                player_ids.append(player_id)
             players_parsed.append(player_id)
         for player in page('table#team_pitching tbody tr').items():
             if 'class="thead"' in str(player):
@@ -1634,9 +1655,11 @@ class Roster:
                 name = self._get_name(player)
                 self._players[player_id] = name
             else:
-                player_instance = Player(player_id)
-                self._players.append(player_instance)
+                player_ids.append(player_id)
 
+        if not self._slim:
+            self._players = concurrency._run_concurrently(Player, player_ids,
+                                                          self._workers)
         self._coach = self._parse_coach(page)
 
     @property
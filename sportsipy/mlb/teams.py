@@ -1,11 +1,10 @@
-import pandas as pd
 import re
 from .constants import (ELEMENT_INDEX,
                         PARSING_SCHEME,
                         TEAM_ELEMENT,
                         TEAM_STATS_URL)
 from functools import wraps
-from .. import utils
+from .. import records, utils
 from ..decorators import float_property_decorator, int_property_decorator
 from .mlb_utils import _retrieve_all_teams
 from .roster import Roster
@@ -30,7 +29,7 @@ def mlb_int_property_decorator(func):
     return wrapper
 
 
-class Team:
+class Team(records._Record):
     """
     An object containing all of a team's season information.
 
@@ -64,9 +63,13 @@ class Team:
         Optionally specify the filename of a local file to use to pull data
         instead of downloading from sports-reference.com. This file should be
         of the League page for the designated year.
+    lazy : boolean (optional)
+        Set to True to only parse each stat the first time it is read instead
+        of parsing every stat as soon as the team is created. Defaults to
+        False.
     """
     def __init__(self, team_name=None, team_data=None, rank=None, year=None,
-                 standings_file=None, teams_file=None):
+                 standings_file=None, teams_file=None, lazy=False):
         self._year = year
         self._rank = rank
         self._abbreviation = None
@@ -154,7 +157,7 @@ class Team:
             team_data = self._retrieve_team_data(year, team_name,
                                                  standings_file, teams_file)
 
-        self._parse_team_data(team_data)
+        self._parse_team_data(team_data, lazy)
 
     def __str__(self):
         """
@@ -168,6 +171,12 @@ class Team:
         """
         return self.__str__()
 
+    def __getattr__(self, name):
+        """
+        Parse a field the first time it is read if parsing lazily.
+        """
+        return utils._parse_pending_field(self, name)
+
     def _retrieve_team_data(self, year, team_name, standings_file=None,
                             teams_file=None):
         """
@@ -229,7 +238,40 @@ class Team:
         name = re.sub(r'".*', '', name)
         setattr(self, '_name', name)
 
-    def _parse_team_data(self, team_data):
+    def _parse_team_field(self, field, row):
+        """
+        Parse the value of a single attribute.
+
+        Parameters
+        ----------
+        field : string
+            The name of the attribute to parse, such as '_points'.
+        row : _RowIndex
+            An index of all of the rows of stats for the team.
+
+        Returns
+        -------
+        string
+            The value of the attribute according to the parsing scheme.
+        """
+        if field == '_name':
+            self._parse_name(row.html)
+            return self._name
+        # The short field truncates the leading '_' in the attribute name.
+        short_field = str(field)[1:]
+        # Default to returning the first element returned unless a
+        # subsequent element is desired. For example, total runs and
+        # runs per game are two different fields, but they both share
+        # the same attribute of 'R' in the HTML tables.
+        index = 0
+        if short_field in ELEMENT_INDEX.keys():
+            index = ELEMENT_INDEX[short_field]
+        return utils._parse_field(PARSING_SCHEME,
+                                  row,
+                                  short_field,
+                                  index)
+
+    def _parse_team_data(self, team_data, lazy=False):
         """
         Parses a value for every attribute.
 
@@ -247,37 +289,27 @@ class Team:
             A string containing all of the rows of stats for a given team. If
             multiple tables are being referenced, this will be comprised of
             multiple rows in a single string.
+        lazy : boolean (optional)
+            Set to True to only parse each field the first time it is read.
         """
-        for field in self.__dict__:
-            # The short field truncates the leading '_' in the attribute name.
-            short_field = str(field)[1:]
-            # The rank attribute is passed directly to the class during
-            # instantiation.
-            if field == '_rank' or \
-               field == '_year':
-                continue
-            elif field == '_name':
-                self._parse_name(team_data)
-                continue
-            # Default to returning the first element returned unless a
-            # subsequent element is desired. For example, total runs and
-            # runs per game are two different fields, but they both share
-            # the same attribute of 'R' in the HTML tables.
-            index = 0
-            if short_field in ELEMENT_INDEX.keys():
-                index = ELEMENT_INDEX[short_field]
-            value = utils._parse_field(PARSING_SCHEME,
-                                       team_data,
-                                       short_field,
-                                       index)
-            setattr(self, field, value)
+        row = utils._RowIndex(team_data)
+        # The rank attribute is passed directly to the class during
+        # instantiation.
+        fields = [field for field in records._fields(self)
+                  if field != '_rank' and field != '_year']
+        utils._parse_fields(self, fields, self._parse_team_field, row,
+                            lazy=lazy)
 
-    @property
-    def dataframe(self):
+    def _dataframe_row(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the string abbreviation of the
-        team, such as 'HOU'.
+        Gather the values of every field included in the DataFrame.
+
+        Returns
+        -------
+        tuple
+            A ``tuple`` of the row's index and a ``dictionary`` of every
+            field's value keyed by column name, or None if the team has no
+            data.
         """
         fields_to_include = {
             'abbreviation': self.abbreviation,
@@ -394,7 +426,16 @@ class Team:
             'wins_vs_teams_over_500': self.wins_vs_teams_over_500,
             'wins_vs_teams_under_500': self.wins_vs_teams_under_500
         }
-        return pd.DataFrame([fields_to_include], index=[self._abbreviation])
+        return self._abbreviation, fields_to_include
+
+    @property
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the string abbreviation of the
+        team, such as 'HOU'.
+        """
+        return utils._build_dataframe([self._dataframe_row()])
 
     @int_property_decorator
     def rank(self):
@@ -1210,7 +1251,7 @@ class Team:
         return self._opposing_runners_left_on_base
 
 
-class Teams:
+class Teams(records._Record):
     """
     A list of all MLB teams and their stats in a given year.
 
@@ -1231,13 +1272,25 @@ class Teams:
         Optionally specify the filename of a local file to use to pull data
         instead of downloading from sports-reference.com. This file should be
         of the League page for the designated year.
+    stream : boolean (optional)
+        Set to True to stream the stats tables out of each season page instead
+        of parsing the pages in full. Only the rows of the tables used to build
+        every team are kept rather than the whole page being held in memory,
+        and parsing stops as soon as the last requested table ends. Defaults
+        to False.
+    lazy : boolean (optional)
+        Set to True to only parse each team's stats the first time they are
+        read instead of parsing every stat as soon as the teams are created,
+        which makes reading a few stats from every team much faster. Defaults
+        to False.
     """
-    def __init__(self, year=None, standings_file=None, teams_file=None):
+    def __init__(self, year=None, standings_file=None, teams_file=None,
+                 stream=False, lazy=False):
         self._teams = []
 
         team_data_dict, year = _retrieve_all_teams(year, standings_file,
-                                                   teams_file)
-        self._instantiate_teams(team_data_dict, year)
+                                                   teams_file, stream)
+        self._instantiate_teams(team_data_dict, year, lazy)
 
     def __str__(self):
         """
@@ -1276,10 +1329,11 @@ class Teams:
         ValueError
             If the requested team is not present within the Teams list.
         """
-        for team in self._teams:
-            if team.abbreviation.upper() == abbreviation.upper():
-                return team
-        raise ValueError('Team abbreviation %s not found' % abbreviation)
+        teams = utils._keyed(self, self._teams, 'abbreviation')
+        team = teams.get(utils._lookup_key(abbreviation))
+        if team is None:
+            raise ValueError('Team abbreviation %s not found' % abbreviation)
+        return team
 
     def __call__(self, abbreviation):
         """
@@ -1309,7 +1363,7 @@ class Teams:
         """Returns the number of MLB teams for a given season."""
         return len(self._teams)
 
-    def _instantiate_teams(self, team_data_dict, year):
+    def _instantiate_teams(self, team_data_dict, year, lazy=False):
         """
         Create a Team instance for all teams.
 
@@ -1324,14 +1378,20 @@ class Teams:
             well as team rankings, indexed by team abbreviation.
         year : string
             A ``string`` of the requested year to pull stats from.
+        lazy : boolean (optional)
+            Set to True to only parse each team's fields the first time they
+            are read.
         """
         if not team_data_dict:
             return
         for team_data in team_data_dict.values():
             team = Team(team_data=team_data['data'],
                         rank=team_data['rank'],
-                        year=year)
+                        year=year,
+                        lazy=lazy)
             self._teams.append(team)
+        # Index every team up front so looking one up is a single access.
+        utils._keyed(self, self._teams, 'abbreviation')
 
     @property
     def dataframes(self):
@@ -1339,7 +1399,5 @@ class Teams:
         Returns a pandas DataFrame where each row is a representation of the
         Team class. Rows are indexed by the team abbreviation.
         """
-        frames = []
-        for team in self.__iter__():
-            frames.append(team.dataframe)
-        return pd.concat(frames)
+        return utils._build_dataframe(utils._frame_row(team)
+                                      for team in self.__iter__())
@@ -1,7 +1,5 @@
 from .constants import PARSING_SCHEME, SEASON_PAGE_URL
-from pyquery import PyQuery as pq
 from sportsipy import utils
-from urllib.error import HTTPError
 
 
 def _add_stats_data(teams_list, team_data_dict):
@@ -39,7 +37,7 @@ def _add_stats_data(teams_list, team_data_dict):
     return team_data_dict
 
 
-def _retrieve_all_teams(year, season_file=None):
+def _retrieve_all_teams(year, season_file=None, stream=False):
     """
     Find and create Team instances for all teams in the given season.
 
@@ -54,6 +52,9 @@ def _retrieve_all_teams(year, season_file=None):
         The requested year to pull stats from.
     season_file : string (optional)
         Link with filename to the local season page.
+    stream : boolean (optional)
+        Set to True to stream the stats tables out of each page instead of
+        parsing the pages in full.
 
     Returns
     -------
@@ -67,21 +68,19 @@ def _retrieve_all_teams(year, season_file=None):
     if not year:
         year = utils._find_year_for_season('nba')
         # Given the delays to the NBA season in 2020, the default season
-        # selection logic is no longer valid after the original season should
-        # have concluded. In this case, the previous season should be pulled
-        # instead.
-        if year == 2021:
-            try:
-                doc = pq(SEASON_PAGE_URL % year)
-            except HTTPError:
-                year = str(int(year) - 1)
-        # If stats for the requested season do not exist yet (as is the case
-        # right before a new season begins), attempt to pull the previous
-        # year's stats. If it exists, use the previous year instead.
-        if not utils._url_exists(SEASON_PAGE_URL % year) and \
-           utils._url_exists(SEASON_PAGE_URL % str(int(year) - 1)):
+        # selection logic is no longer valid after the original season
+        # should have concluded. In this case, the previous season should
+        # be pulled instead. The page is downloaded in full, so it is
+        # reused below instead of being requested a second time.
+        if year == 2021 and \
+           not utils._url_exists(SEASON_PAGE_URL % year, download=True):
             year = str(int(year) - 1)
-    doc = utils._pull_page(SEASON_PAGE_URL % year, season_file)
+        # If stats for the requested season do not exist yet (as is the
+        # case right before a new season begins), the previous year's
+        # stats are used instead.
+        year = utils._find_default_season(
+            'nba', lambda x: SEASON_PAGE_URL % x, year=year)
+    doc = utils._pull_table_page(SEASON_PAGE_URL % year, season_file, stream)
     teams_list = utils._get_stats_table(doc, 'div#all_team-stats-base')
     opp_teams_list = utils._get_stats_table(doc, 'div#all_opponent-stats-base')
 
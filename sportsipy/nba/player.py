@@ -2,7 +2,8 @@ import pandas as pd
 import re
 from functools import wraps
 from pyquery import PyQuery as pq
-from .. import utils
+from .. import records, utils
+from ..decorators import _convert_item
 from .constants import PLAYER_SCHEME
 
 
@@ -18,6 +19,14 @@ def _cleanup(prop):
         return ''
 
 
+def _to_int(prop):
+    return int(_cleanup(prop))
+
+
+def _to_float(prop):
+    return float(_cleanup(prop))
+
+
 def _int_property_decorator(func):
     @property
     @wraps(func)
@@ -25,11 +34,13 @@ def _int_property_decorator(func):
         index = args[0]._index
         prop = func(*args)
         try:
-            value = _cleanup(prop[index])
-            return int(value)
-        except (TypeError, ValueError):
+            value = prop[index]
+        except TypeError:
             # If there is no value, default to None
             return None
+        if type(value) is int:
+            return value
+        return _convert_item(args[0], func.__name__, prop, index, _to_int)
     return wrapper
 
 
@@ -40,15 +51,17 @@ def _float_property_decorator(func):
         index = args[0]._index
         prop = func(*args)
         try:
-            value = _cleanup(prop[index])
-            return float(value)
-        except (TypeError, ValueError):
+            value = prop[index]
+        except TypeError:
             # If there is no value, default to None
             return None
+        if type(value) is float:
+            return value
+        return _convert_item(args[0], func.__name__, prop, index, _to_float)
     return wrapper
 
 
-class AbstractPlayer:
+class AbstractPlayer(records._SlotRecord):
     """
     Get player information and stats for all seasons.
 
@@ -75,11 +88,28 @@ class AbstractPlayer:
     player_name : string
         A string representing the player's first and last name, such as 'James
         Harden'.
-    player_data : string
-        A string representation of the player's HTML data from the Boxscore
-        page. If the player appears in multiple tables, all of their
-        information will appear in one single string concatenated together.
+    player_data : list
+        A list of the row elements containing the player's data from the
+        Boxscore page. If the player appears in multiple tables, the rows from
+        every table are included.
     """
+    __slots__ = ('_player_id', '_name', '_minutes_played', '_field_goals',
+                 '_field_goal_attempts', '_field_goal_percentage',
+                 '_three_pointers', '_three_point_attempts',
+                 '_three_point_percentage', '_two_pointers',
+                 '_two_point_attempts', '_two_point_percentage',
+                 '_effective_field_goal_percentage', '_free_throws',
+                 '_free_throw_attempts', '_free_throw_percentage',
+                 '_offensive_rebounds', '_defensive_rebounds',
+                 '_total_rebounds', '_assists', '_steals', '_blocks',
+                 '_turnovers', '_personal_fouls', '_points',
+                 '_true_shooting_percentage', '_three_point_attempt_rate',
+                 '_free_throw_attempt_rate', '_offensive_rebound_percentage',
+                 '_defensive_rebound_percentage', '_total_rebound_percentage',
+                 '_assist_percentage', '_steal_percentage',
+                 '_block_percentage', '_turnover_percentage',
+                 '_usage_percentage', '_box_plus_minus')
+
     def __init__(self, player_id, player_name, player_data):
         self._player_id = player_id
         self._name = player_name
@@ -134,9 +164,8 @@ class AbstractPlayer:
 
         Parameters
         ----------
-        stats : PyQuery object
-            A PyQuery object containing all stats in HTML format for a
-            particular player.
+        stats : _RowIndex
+            An index of all stats in HTML format for a particular player.
         field : string
             A string of the field to parse from the HTML.
 
@@ -156,15 +185,23 @@ class AbstractPlayer:
 
         Parameters
         ----------
-        player_data : dictionary or string
+        player_data : dictionary or list
             If this class is inherited from the ``Player`` class, player_data
             will be a dictionary where each key is a string representing the
-            season and each value contains the HTML data as a string. If this
-            class is inherited from the ``BoxscorePlayer`` class, player_data
-            will be a string representing the player's game statistics in HTML
-            format.
-        """
-        for field in self.__dict__:
+            season and each value contains a list of the row elements with the
+            player's stats. If this class is inherited from the
+            ``BoxscorePlayer`` class, player_data will be a list of the row
+            elements with the player's game statistics.
+        """
+        # Parse the HTML for every season once up front instead of once for
+        # every field.
+        if type(player_data) == dict:
+            seasons = [utils._RowIndex(pq(data['data']),
+                                       combined=True)
+                       for data in player_data.values()]
+        else:
+            seasons = [utils._RowIndex(pq(player_data), combined=True)]
+        for field in records._fields(self):
             short_field = str(field)[1:]
             if short_field == 'player_id' or \
                short_field == 'index' or \
@@ -176,18 +213,11 @@ class AbstractPlayer:
                short_field == 'birth_date' or \
                short_field == 'nationality':
                 continue
-            field_stats = []
-            if type(player_data) == dict:
-                for year, data in player_data.items():
-                    stats = pq(data['data'])
-                    value = self._parse_value(stats, short_field)
-                    field_stats.append(value)
-            else:
-                if short_field == 'box_plus_minus':
-                    short_field = 'boxscore_box_plus_minus'
-                stats = pq(player_data)
-                value = self._parse_value(stats, short_field)
-                field_stats.append(value)
+            if short_field == 'box_plus_minus' and \
+               type(player_data) != dict:
+                short_field = 'boxscore_box_plus_minus'
+            field_stats = [self._parse_value(stats, short_field)
+                           for stats in seasons]
             setattr(self, field, field_stats)
 
     @property
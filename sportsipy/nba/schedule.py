@@ -1,11 +1,13 @@
-import pandas as pd
 import re
-from ..decorators import float_property_decorator, int_property_decorator
-from .constants import (SCHEDULE_SCHEME,
-                        SCHEDULE_URL)
+from ..decorators import (cached_property_decorator,
+                          float_property_decorator,
+                          int_property_decorator)
+from .constants import (BOXSCORE_URL,
+                        SCHEDULE_SCHEME,
+                        SCHEDULE_URL,
+                        SEASON_PAGE_URL)
 from datetime import datetime
-from pyquery import PyQuery as pq
-from sportsipy import utils
+from sportsipy import concurrency, records, utils
 from sportsipy.constants import (WIN,
                                  LOSS,
                                  HOME,
@@ -14,10 +16,9 @@ from sportsipy.constants import (WIN,
                                  REGULAR_SEASON,
                                  CONFERENCE_TOURNAMENT)
 from sportsipy.nba.boxscore import Boxscore
-from urllib.error import HTTPError
 
 
-class Game:
+class Game(records._SlotRecord):
     """
     A representation of a matchup between two teams.
 
@@ -28,8 +29,17 @@ class Game:
     ----------
     game_data : string
         The row containing the specified game information.
+    lazy : boolean (optional)
+        Set to True to only parse each field the first time it is read instead
+        of parsing every field as soon as the game is created. Defaults to
+        False.
     """
-    def __init__(self, game_data, playoffs=False):
+    __slots__ = ('_game', '_date', '_time', '_datetime', '_boxscore',
+                 '_location', '_opponent_abbr', '_opponent_name', '_result',
+                 '_points_scored', '_points_allowed', '_wins', '_losses',
+                 '_streak', '_playoffs', '_pending_fields')
+
+    def __init__(self, game_data, playoffs=False, lazy=False):
         self._game = None
         self._date = None
         self._time = None
@@ -46,7 +56,7 @@ class Game:
         self._streak = None
         self._playoffs = playoffs
 
-        self._parse_game_data(game_data)
+        self._parse_game_data(game_data, lazy)
 
     def __str__(self):
         """
@@ -60,6 +70,12 @@ class Game:
         """
         return self.__str__()
 
+    def __getattr__(self, name):
+        """
+        Parse a field the first time it is read if parsing lazily.
+        """
+        return utils._parse_pending_field(self, name)
+
     def _parse_boxscore(self, game_data):
         """
         Parses the boxscore URI for the game.
@@ -94,7 +110,34 @@ class Game:
         opponent = re.sub(r'\/.*.html.*', '', opponent)
         setattr(self, '_opponent_abbr', opponent)
 
-    def _parse_game_data(self, game_data):
+    def _parse_game_field(self, field, row):
+        """
+        Parse the value of a single attribute.
+
+        Parameters
+        ----------
+        field : string
+            The name of the attribute to parse, such as '_date'.
+        row : _RowIndex
+            An index of the row containing the information specific to a
+            game.
+
+        Returns
+        -------
+        string
+            The value of the attribute according to the parsing scheme.
+        """
+        # Remove the leading '_' from the name
+        short_name = str(field)[1:]
+        if short_name == 'boxscore':
+            self._parse_boxscore(row.html)
+            return self._boxscore
+        if short_name == 'opponent_abbr':
+            self._parse_opponent_abbr(row.html)
+            return self._opponent_abbr
+        return utils._parse_field(SCHEDULE_SCHEME, row, short_name)
+
+    def _parse_game_data(self, game_data, lazy=False):
         """
         Parses a value for every attribute.
 
@@ -111,26 +154,25 @@ class Game:
         ----------
         game_data : string
             A string containing all of the rows of stats for a given game.
+        lazy : boolean (optional)
+            Set to True to only parse each field the first time it is read.
         """
-        for field in self.__dict__:
-            # Remove the leading '_' from the name
-            short_name = str(field)[1:]
-            if short_name == 'datetime' or short_name == 'playoffs':
-                continue
-            elif short_name == 'boxscore':
-                self._parse_boxscore(game_data)
-                continue
-            elif short_name == 'opponent_abbr':
-                self._parse_opponent_abbr(game_data)
-                continue
-            value = utils._parse_field(SCHEDULE_SCHEME, game_data, short_name)
-            setattr(self, field, value)
+        row = utils._RowIndex(game_data)
+        fields = [field for field in records._fields(self)
+                  if field != '_datetime' and field != '_playoffs']
+        utils._parse_fields(self, fields, self._parse_game_field, row,
+                            lazy=lazy)
 
-    @property
-    def dataframe(self):
+    def _dataframe_row(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the boxscore string.
+        Gather the values of every field included in the DataFrame.
+
+        Returns
+        -------
+        tuple
+            A ``tuple`` of the row's index and a ``dictionary`` of every
+            field's value keyed by column name, or None if the game has no
+            data.
         """
         if self._points_allowed is None and self._points_scored is None:
             return None
@@ -151,7 +193,35 @@ class Game:
             'time': self.time,
             'wins': self.wins
         }
-        return pd.DataFrame([fields_to_include], index=[self._boxscore])
+        return self._boxscore, fields_to_include
+
+    @property
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the boxscore string.
+        """
+        return utils._build_dataframe([self._dataframe_row()])
+
+    def _dataframe_extended_row(self, page=None):
+        """
+        Gather the values of every field included in the extended DataFrame.
+
+        Parameters
+        ----------
+        page : string (optional)
+            The contents of the game's boxscore page if it has already been
+            downloaded. Defaults to downloading the page.
+
+        Returns
+        -------
+        tuple or Pandas DataFrame
+            The row of the game's boxscore as returned by
+            ``utils._frame_row``, or None if the game has no data.
+        """
+        if page is None:
+            return utils._frame_row(self.boxscore)
+        return utils._frame_row(Boxscore(self._boxscore, page=page))
 
     @property
     def dataframe_extended(self):
@@ -161,7 +231,7 @@ class Game:
         but takes longer to process compared to the lighter 'dataframe'
         property. The index for the DataFrame is the boxscore string.
         """
-        return self.boxscore.dataframe
+        return utils._build_dataframe([self._dataframe_extended_row()])
 
     @int_property_decorator
     def game(self):
@@ -187,7 +257,7 @@ class Game:
         """
         return self._time
 
-    @property
+    @cached_property_decorator('_datetime')
     def datetime(self):
         """
         Returns a datetime object to indicate the month, day, and year the game
@@ -296,7 +366,7 @@ class Game:
         return self._playoffs
 
 
-class Schedule:
+class Schedule(records._Record):
     """
     An object of the given team's schedule.
 
@@ -309,10 +379,14 @@ class Schedule:
         A team's short name, such as 'PHO' for the Phoenix Suns.
     year : string (optional)
         The requested year to pull stats from.
+    lazy : boolean (optional)
+        Set to True to only parse each game's fields the first time they are
+        read instead of parsing every field as soon as the schedule is
+        created. Defaults to False.
     """
-    def __init__(self, abbreviation, year=None):
+    def __init__(self, abbreviation, year=None, lazy=False):
         self._games = []
-        self._pull_schedule(abbreviation, year)
+        self._pull_schedule(abbreviation, year, lazy)
 
     def __getitem__(self, index):
         """
@@ -359,12 +433,11 @@ class Schedule:
             If the requested date cannot be matched with a game in the
             schedule.
         """
-        for game in self._games:
-            if game.datetime.year == date.year and \
-               game.datetime.month == date.month and \
-               game.datetime.day == date.day:
-                return game
-        raise ValueError('No games found for requested date')
+        games = utils._dated(self, self._games)
+        try:
+            return games[(date.year, date.month, date.day)][0]
+        except KeyError:
+            raise ValueError('No games found for requested date')
 
     def __str__(self):
         """
@@ -390,7 +463,7 @@ class Schedule:
         """Returns the number of scheduled games for the given team."""
         return len(self._games)
 
-    def _add_games_to_schedule(self, schedule, playoff=False):
+    def _add_games_to_schedule(self, schedule, playoff=False, lazy=False):
         """
         Add game information to list of games.
 
@@ -403,15 +476,18 @@ class Schedule:
             A PyQuery object pertaining to a team's schedule table.
         playoff : boolean
             Evaluates to True if the game took place in the playoffs.
+        lazy : boolean (optional)
+            Set to True to only parse each game's fields the first time they
+            are read.
         """
         for item in schedule:
             if 'class="thead"' in str(item) or \
                'class="over_header thead"' in str(item):
                 continue  # pragma: no cover
-            game = Game(item, playoff)
+            game = Game(item, playoff, lazy=lazy)
             self._games.append(game)
 
-    def _pull_schedule(self, abbreviation, year):
+    def _pull_schedule(self, abbreviation, year, lazy=False):
         """
         Download and create objects for the team's schedule.
 
@@ -426,36 +502,36 @@ class Schedule:
             A team's short name, such as 'DET' for the Detroit Pistons.
         year : string
             The requested year to pull stats from.
+        lazy : boolean (optional)
+            Set to True to only parse each game's fields the first time they
+            are read.
         """
         if not year:
             year = utils._find_year_for_season('nba')
             # Given the delays to the NBA season in 2020, the default season
             # selection logic is no longer valid after the original season
             # should have concluded. In this case, the previous season should
-            # be pulled instead.
-            if year == 2021:
-                try:
-                    doc = pq(SCHEDULE_URL % (abbreviation.lower(), year))
-                except HTTPError:
-                    year = str(int(year) - 1)
-            # If stats for the requested season do not exist yet (as is the
-            # case right before a new season begins), attempt to pull the
-            # previous year's stats. If it exists, use the previous year
-            # instead.
-            if not utils._url_exists(SCHEDULE_URL % (abbreviation.lower(),
-                                                     year)) and \
-               utils._url_exists(SCHEDULE_URL % (abbreviation.lower(),
-                                                 str(int(year) - 1))):
+            # be pulled instead. The page is downloaded in full, so it is
+            # reused below instead of being requested a second time.
+            if year == 2021 and \
+               not utils._url_exists(SCHEDULE_URL % (abbreviation, year),
+                                     download=True):
                 year = str(int(year) - 1)
-        doc = pq(SCHEDULE_URL % (abbreviation, year))
+            # If stats for the requested season do not exist yet (as is the
+            # case right before a new season begins), the previous year's
+            # stats are used instead.
+            year = utils._find_default_season(
+                'nba', lambda x: SEASON_PAGE_URL % x,
+                lambda x: SCHEDULE_URL % (abbreviation, x), year)
+        doc = utils._pull_page(SCHEDULE_URL % (abbreviation, year))
         schedule = utils._get_stats_table(doc, 'table#games')
         if not schedule:
             utils._no_data_found()
             return
-        self._add_games_to_schedule(schedule)
+        self._add_games_to_schedule(schedule, lazy=lazy)
         if 'id="games_playoffs"' in str(doc):
             playoffs = utils._get_stats_table(doc, 'table#games_playoffs')
-            self._add_games_to_schedule(playoffs, True)
+            self._add_games_to_schedule(playoffs, True, lazy=lazy)
 
     @property
     def dataframe(self):
@@ -463,14 +539,8 @@ class Schedule:
         Returns a pandas DataFrame where each row is a representation of the
         Game class. Rows are indexed by the boxscore string.
         """
-        frames = []
-        for game in self.__iter__():
-            df = game.dataframe
-            if df is not None:
-                frames.append(df)
-        if frames == []:
-            return None
-        return pd.concat(frames)
+        return utils._build_dataframe(utils._frame_row(game)
+                                      for game in self.__iter__())
 
     @property
     def dataframe_extended(self):
@@ -481,11 +551,37 @@ class Schedule:
         selected game, but takes longer to process compared to the lighter
         'dataframe' property.
         """
-        frames = []
-        for game in self.__iter__():
-            df = game.dataframe_extended
-            if df is not None:
-                frames.append(df)
-        if frames == []:
-            return None
-        return pd.concat(frames)
+        return self.build_dataframe_extended()
+
+    def build_dataframe_extended(self, workers=None, processes=None,
+                                 progress=None):
+        """
+        Returns a pandas DataFrame where each row is a representation of the
+        Boxscore class for every game in the schedule, optionally downloading
+        and parsing the boxscores concurrently. Rows are indexed by the
+        boxscore string and are in schedule order.
+
+        Parameters
+        ----------
+        workers : int (optional)
+            Set to the number of threads to use to download and parse the
+            boxscore for every game concurrently. Defaults to processing each
+            game serially.
+        processes : int (optional)
+            Set to the number of processes to use to parse the boxscores.
+            Every boxscore is downloaded first, using ``workers`` threads,
+            before being parsed in parallel. Defaults to parsing boxscores in
+            the current process.
+        progress : function (optional)
+            A function which is called with the number of processed games and
+            the total number of games every time a game finishes processing.
+
+        Returns
+        -------
+        Pandas DataFrame
+            A DataFrame of every game's boxscore, or None if no games have
+            been played.
+        """
+        rows = concurrency._extended_rows(self._games, BOXSCORE_URL, workers,
+                                          processes, progress)
+        return utils._build_dataframe(rows)
@@ -1,9 +1,9 @@
 import pandas as pd
 import re
-from datetime import timedelta
 from pyquery import PyQuery as pq
 from urllib.error import HTTPError
-from .. import utils
+from .. import parsing, records, utils
+from ..concurrency import _fetch_boxscores
 from ..constants import AWAY, HOME
 from ..decorators import float_property_decorator, int_property_decorator
 from .constants import (BOXSCORE_ELEMENT_INDEX,
@@ -44,17 +44,23 @@ class BoxscorePlayer(AbstractPlayer):
     player_name : string
         A string representing the player's first and last name, such as 'Carsen
         Edwards'.
-    player_data : string
-        A string representation of the player's HTML data from the Boxscore
-        page. If the player appears in multiple tables, all of their
-        information will appear in one single string concatenated together.
+    player_data : list
+        A list of the row elements containing the player's data from the
+        Boxscore page. If the player appears in multiple tables, the rows from
+        every table are included.
+    compact : boolean (optional)
+        Set to False to keep the player's rows from the boxscore page once
+        their stats have been parsed. Defaults to True.
     """
-    def __init__(self, player_id, player_name, player_data):
+    __slots__ = ('_index', '_defensive_rating', '_offensive_rating')
+
+    def __init__(self, player_id, player_name, player_data, compact=True):
         self._index = 0
         self._player_id = player_id
         self._defensive_rating = None
         self._offensive_rating = None
         AbstractPlayer.__init__(self, player_id, player_name, player_data)
+        utils._release(self, '_player_data', compact=compact)
 
     @property
     def dataframe(self):
@@ -120,7 +126,7 @@ class BoxscorePlayer(AbstractPlayer):
         return self._defensive_rating
 
 
-class Boxscore:
+class Boxscore(records._SlotRecord):
     """
     Detailed information about the final statistics for a game.
 
@@ -133,8 +139,71 @@ class Boxscore:
     uri : string
         The relative link to the boxscore HTML page, such as
         '2017-11-10-21-kansas'.
+    lazy : boolean (optional)
+        Set to True to only parse each field the first time it is read instead
+        of parsing every field as soon as the boxscore is created. Defaults to
+        False.
+    compact : boolean (optional)
+        Set to False to keep references into the boxscore page, such as each
+        team's name tag and each player's table rows, instead of copying out
+        only the elements which are kept, which lets the page be released once
+        the boxscore has been parsed. Defaults to True.
+    page : string (optional)
+        The contents of the boxscore page if it has already been downloaded,
+        in which case the page isn't downloaded again.
     """
-    def __init__(self, uri):
+    __slots__ = ('_uri', '_date', '_location', '_home_name', '_away_name',
+                 '_winner', '_winning_name', '_winning_abbr', '_losing_name',
+                 '_losing_abbr', '_pace', '_summary', '_away_ranking',
+                 '_away_record', '_away_minutes_played', '_away_field_goals',
+                 '_away_field_goal_attempts', '_away_field_goal_percentage',
+                 '_away_two_point_field_goals',
+                 '_away_two_point_field_goal_attempts',
+                 '_away_two_point_field_goal_percentage',
+                 '_away_three_point_field_goals',
+                 '_away_three_point_field_goal_attempts',
+                 '_away_three_point_field_goal_percentage',
+                 '_away_free_throws', '_away_free_throw_attempts',
+                 '_away_free_throw_percentage', '_away_offensive_rebounds',
+                 '_away_defensive_rebounds', '_away_total_rebounds',
+                 '_away_assists', '_away_steals', '_away_blocks',
+                 '_away_turnovers', '_away_personal_fouls', '_away_points',
+                 '_away_true_shooting_percentage',
+                 '_away_effective_field_goal_percentage',
+                 '_away_three_point_attempt_rate',
+                 '_away_free_throw_attempt_rate',
+                 '_away_offensive_rebound_percentage',
+                 '_away_defensive_rebound_percentage',
+                 '_away_total_rebound_percentage', '_away_assist_percentage',
+                 '_away_steal_percentage', '_away_block_percentage',
+                 '_away_turnover_percentage', '_away_offensive_rating',
+                 '_away_defensive_rating', '_home_ranking', '_home_record',
+                 '_home_minutes_played', '_home_field_goals',
+                 '_home_field_goal_attempts', '_home_field_goal_percentage',
+                 '_home_two_point_field_goals',
+                 '_home_two_point_field_goal_attempts',
+                 '_home_two_point_field_goal_percentage',
+                 '_home_three_point_field_goals',
+                 '_home_three_point_field_goal_attempts',
+                 '_home_three_point_field_goal_percentage',
+                 '_home_free_throws', '_home_free_throw_attempts',
+                 '_home_free_throw_percentage', '_home_offensive_rebounds',
+                 '_home_defensive_rebounds', '_home_total_rebounds',
+                 '_home_assists', '_home_steals', '_home_blocks',
+                 '_home_turnovers', '_home_personal_fouls', '_home_points',
+                 '_home_true_shooting_percentage',
+                 '_home_effective_field_goal_percentage',
+                 '_home_three_point_attempt_rate',
+                 '_home_free_throw_attempt_rate',
+                 '_home_offensive_rebound_percentage',
+                 '_home_defensive_rebound_percentage',
+                 '_home_total_rebound_percentage', '_home_assist_percentage',
+                 '_home_steal_percentage', '_home_block_percentage',
+                 '_home_turnover_percentage', '_home_offensive_rating',
+                 '_home_defensive_rating', '_away_players', '_home_players',
+                 '_pending_fields')
+
+    def __init__(self, uri, lazy=False, compact=True, page=None):
         self._uri = uri
         self._date = None
         self._location = None
@@ -222,7 +291,7 @@ class Boxscore:
         self._home_offensive_rating = None
         self._home_defensive_rating = None
 
-        self._parse_game_data(uri)
+        self._parse_game_data(uri, lazy, compact, page=page)
 
     def __str__(self):
         """
@@ -237,7 +306,13 @@ class Boxscore:
         """
         return self.__str__()
 
-    def _retrieve_html_page(self, uri):
+    def __getattr__(self, name):
+        """
+        Parse a field the first time it is read if parsing lazily.
+        """
+        return utils._parse_pending_field(self, name)
+
+    def _retrieve_html_page(self, uri, page=None):
         """
         Download the requested HTML page.
 
@@ -250,6 +325,9 @@ class Boxscore:
         uri : string
             The relative link to the boxscore HTML page, such as
             '2017-11-10-21-kansas'.
+        page : string (optional)
+            The contents of the boxscore page if it has already been
+            downloaded.
 
         Returns
         -------
@@ -257,12 +335,14 @@ class Boxscore:
             The requested page is returned as a queriable PyQuery object with
             the comment tags removed.
         """
+        if page is not None:
+            return utils._expand_html_comments(pq(page))
         url = BOXSCORE_URL % uri
         try:
-            url_data = pq(url)
+            url_data = utils._pull_page(url)
         except HTTPError:
             return None
-        return pq(utils._remove_html_comment_tags(url_data))
+        return utils._expand_html_comments(url_data)
 
     def _parse_game_date_and_location(self, field, boxscore):
         """
@@ -293,7 +373,7 @@ class Boxscore:
             return None
         return game_info[BOXSCORE_ELEMENT_INDEX[field]]
 
-    def _parse_name(self, field, boxscore):
+    def _parse_name(self, field, boxscore, compact=True):
         """
         Retrieve the team's complete name tag.
 
@@ -307,6 +387,8 @@ class Boxscore:
             The name of the attribute to parse
         boxscore : PyQuery object
             A PyQuery object containing all of the HTML data from the boxscore.
+        compact : boolean (optional)
+            Set to False to keep references into the boxscore page.
 
         Returns
         -------
@@ -318,7 +400,8 @@ class Boxscore:
         if 'cbb/schools' not in str(name):
             name = re.sub(r'.*name">', '', str(name))
             name = re.sub(r'<.*', '', str(name))
-        return name
+            return name
+        return utils._detach(name, compact)
 
     def _parse_ranking(self, field, boxscore):
         """
@@ -410,7 +493,7 @@ class Boxscore:
         """
         tables = []
 
-        for table in boxscore('table').items():
+        for table in parsing.get_engine().find(boxscore, 'table').items():
             try:
                 if 'box-score-' in table.attr['id']:
                     tables.append(table)
@@ -466,9 +549,9 @@ class Boxscore:
 
         Since each player generally has a couple of rows worth of stats (one
         for basic stats and another for advanced stats) on the boxscore page,
-        both rows should be combined into a single string object to easily
-        query all fields from a single object instead of determining which row
-        to pull metrics from.
+        both rows should be combined into a single list of row elements to
+        easily query all fields from a single object instead of determining
+        which row to pull metrics from.
 
         Parameters
         ----------
@@ -499,16 +582,16 @@ class Boxscore:
                 continue
             name = self._find_player_name(row)
             try:
-                player_dict[player_id]['data'] += str(row).strip()
+                player_dict[player_id]['data'] += row
             except KeyError:
                 player_dict[player_id] = {
                     'name': name,
-                    'data': str(row).strip(),
+                    'data': list(row),
                     'team': home_or_away
                 }
         return player_dict
 
-    def _instantiate_players(self, player_dict):
+    def _instantiate_players(self, player_dict, compact=True):
         """
         Create a list of player instances for both the home and away teams.
 
@@ -522,8 +605,10 @@ class Boxscore:
             A dictionary containing information for every player on the
             boxscores page. Each key is a string containing the player's ID
             and each value is a dictionary with the player's full name, a
-            string representation of their HTML stats, and a string constant
-            denoting which team they play for as the values.
+            list of the row elements containing their stats, and a string
+            constant denoting which team they play for as the values.
+        compact : boolean (optional)
+            Set to False to keep references into the players' table rows.
 
         Returns
         -------
@@ -537,14 +622,14 @@ class Boxscore:
         for player_id, details in player_dict.items():
             player = BoxscorePlayer(player_id,
                                     details['name'],
-                                    details['data'])
+                                    details['data'], compact)
             if details['team'] == HOME:
                 home_players.append(player)
             else:
                 away_players.append(player)
         return away_players, home_players
 
-    def _find_players(self, boxscore):
+    def _find_players(self, boxscore, compact=True):
         """
         Find all players for each team.
 
@@ -557,6 +642,8 @@ class Boxscore:
         ----------
         boxscore : PyQuery object
             A PyQuery object containing all of the HTML data from the boxscore.
+        compact : boolean (optional)
+            Set to False to keep references into the players' table rows.
 
         Returns
         -------
@@ -579,7 +666,8 @@ class Boxscore:
                                                      player_dict,
                                                      home_or_away)
             table_count += 1
-        away_players, home_players = self._instantiate_players(player_dict)
+        away_players, home_players = self._instantiate_players(player_dict,
+                                                               compact)
         return away_players, home_players
 
     def _parse_summary(self, boxscore):
@@ -624,7 +712,51 @@ class Boxscore:
                     summary[team[ind]].append(None)
         return summary
 
-    def _parse_game_data(self, uri):
+    def _parse_boxscore_field(self, field, boxscore_index, compact=True):
+        """
+        Parse the value of a single attribute.
+
+        Parameters
+        ----------
+        field : string
+            The name of the attribute to parse, such as '_away_points'.
+        boxscore_index : _RowIndex
+            An index of every cell on the boxscore page.
+        compact : boolean (optional)
+            Set to False to keep references into the boxscore page.
+
+        Returns
+        -------
+        string
+            The value of the attribute according to the parsing scheme.
+        """
+        boxscore = boxscore_index.html
+        # Remove the '_' from the name
+        short_field = str(field)[1:]
+        if short_field == 'location' or \
+           short_field == 'date':
+            return self._parse_game_date_and_location(short_field,
+                                                      boxscore)
+        if short_field == 'away_name' or \
+           short_field == 'home_name':
+            return self._parse_name(short_field, boxscore, compact)
+        if short_field == 'away_ranking' or \
+           short_field == 'home_ranking':
+            return self._parse_ranking(short_field, boxscore)
+        if short_field == 'summary':
+            return self._parse_summary(boxscore)
+        index = 0
+        if short_field in BOXSCORE_ELEMENT_INDEX.keys():
+            index = BOXSCORE_ELEMENT_INDEX[short_field]
+        if short_field == 'away_record' or \
+           short_field == 'home_record':
+            return self._parse_record(short_field, boxscore, index)
+        return utils._parse_field(BOXSCORE_SCHEME,
+                                  boxscore_index,
+                                  short_field,
+                                  index)
+
+    def _parse_game_data(self, uri, lazy=False, compact=True, page=None):
         """
         Parses a value for every attribute.
 
@@ -641,61 +773,43 @@ class Boxscore:
         uri : string
             The relative link to the boxscore HTML page, such as
             '2017-11-10-21-kansas'.
-        """
-        boxscore = self._retrieve_html_page(uri)
+        lazy : boolean (optional)
+            Set to True to only parse each field the first time it is read.
+        compact : boolean (optional)
+            Set to False to keep references into the boxscore page.
+        page : string (optional)
+            The contents of the boxscore page if it has already been
+            downloaded.
+        """
+        boxscore = self._retrieve_html_page(uri, page)
         # If the boxscore is None, the game likely hasn't been played yet and
         # no information can be gathered. As there is nothing to grab, the
         # class instance should just be empty.
         if not boxscore:
             return
 
-        for field in self.__dict__:
-            # Remove the '_' from the name
-            short_field = str(field)[1:]
-            if short_field == 'winner' or \
-               short_field == 'uri':
-                continue
-            if short_field == 'location' or \
-               short_field == 'date':
-                value = self._parse_game_date_and_location(short_field,
-                                                           boxscore)
-                setattr(self, field, value)
-                continue
-            if short_field == 'away_name' or \
-               short_field == 'home_name':
-                value = self._parse_name(short_field, boxscore)
-                setattr(self, field, value)
-                continue
-            if short_field == 'away_ranking' or \
-               short_field == 'home_ranking':
-                value = self._parse_ranking(short_field, boxscore)
-                setattr(self, field, value)
-                continue
-            if short_field == 'summary':
-                value = self._parse_summary(boxscore)
-                setattr(self, field, value)
-                continue
-            index = 0
-            if short_field in BOXSCORE_ELEMENT_INDEX.keys():
-                index = BOXSCORE_ELEMENT_INDEX[short_field]
-            if short_field == 'away_record' or \
-               short_field == 'home_record':
-                value = self._parse_record(short_field, boxscore, index)
-                setattr(self, field, value)
-                continue
-            value = utils._parse_field(BOXSCORE_SCHEME,
-                                       boxscore,
-                                       short_field,
-                                       index)
-            setattr(self, field, value)
-        self._away_players, self._home_players = self._find_players(boxscore)
+        # Every cell on the page is indexed by its data-stat attribute once so
+        # the fields don't each search the entire page.
+        boxscore_index = utils._RowIndex(boxscore)
+        skipped_fields = ['winner', 'uri']
+        fields = [field for field in records._fields(self)
+                  if str(field)[1:] not in skipped_fields]
+        utils._parse_fields(self, fields, self._parse_boxscore_field,
+                            boxscore_index, compact, lazy=lazy)
+        utils._parse_fields(self, ['_away_players', '_home_players'],
+                            self._find_players, boxscore, compact,
+                            together=True, lazy=lazy)
 
-    @property
-    def dataframe(self):
+    def _dataframe_row(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the string URI that is used to
-        instantiate the class, such as '2017-11-10-21-kansas'.
+        Gather the values of every field included in the DataFrame.
+
+        Returns
+        -------
+        tuple
+            A ``tuple`` of the row's index and a ``dictionary`` of every
+            field's value keyed by column name, or None if the boxscore has no
+            data.
         """
         if self._away_points is None and self._home_points is None:
             return None
@@ -807,7 +921,16 @@ class Boxscore:
             'winning_abbr': self.winning_abbr,
             'winning_name': self.winning_name
         }
-        return pd.DataFrame([fields_to_include], index=[self._uri])
+        return self._uri, fields_to_include
+
+    @property
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the string URI that is used to
+        instantiate the class, such as '2017-11-10-21-kansas'.
+        """
+        return utils._build_dataframe([self._dataframe_row()])
 
     @property
     def date(self):
@@ -1663,6 +1786,37 @@ class Boxscores:
         """
         return self._boxscores
 
+    @classmethod
+    async def fetch(cls, date, end_date=None, concurrency=None):
+        """
+        Search for NCAAB games without blocking the event loop.
+
+        Behaves the same as creating a new instance of the class, except the
+        page for every day in the range is downloaded concurrently, which is
+        much faster when searching a large range of days.
+
+        Parameters
+        ----------
+        date : datetime object
+            The date to search for any matches. The month, day, and year are
+            required for the search, but time is not factored into the search.
+        end_date : datetime object (optional)
+            Optionally specify an end date to iterate until. If left empty, or
+            if 'end_date' is prior to 'date', only the games from the day
+            specified in the 'date' parameter will be saved.
+        concurrency : int (optional)
+            The maximum number of pages to download at once. Defaults to the
+            maximum number of connections kept open to a single host.
+
+        Returns
+        -------
+        Boxscores instance
+            A ``Boxscores`` instance containing every game in the range.
+        """
+        boxscores = cls.__new__(cls)
+        pages = utils._boxscore_days(date, end_date, boxscores._create_url)
+        return await _fetch_boxscores(boxscores, pages, concurrency)
+
     def _create_url(self, date):
         """
         Build the URL based on the passed datetime object.
@@ -1702,7 +1856,7 @@ class Boxscores:
             A PyQuery object containing the HTML contents of the requested
             page.
         """
-        return pq(url)
+        return utils._pull_page(url)
 
     def _get_boxscore_uri(self, url):
         """
@@ -1999,17 +2153,5 @@ class Boxscores:
             the games from the day specified in the 'date' parameter will be
             saved.
         """
-        # Set the end date to the start date if the end date is before the
-        # start date.
-        if not end_date or date > end_date:
-            end_date = date
-        date_step = date
-        while date_step <= end_date:
-            url = self._create_url(date_step)
-            page = self._get_requested_page(url)
-            games = page('table[class="teams"]').items()
-            boxscores = self._extract_game_info(games)
-            timestamp = '%s-%s-%s' % (date_step.month, date_step.day,
-                                      date_step.year)
-            self._boxscores[timestamp] = boxscores
-            date_step += timedelta(days=1)
+        pages = utils._boxscore_days(date, end_date, self._create_url)
+        utils._find_boxscore_games(self, pages)
@@ -42,7 +42,7 @@ def _add_stats_data(teams_list, team_data_dict):
 
 
 def _retrieve_all_teams(year, basic_stats=None, basic_opp_stats=None,
-                        adv_stats=None, adv_opp_stats=None):
+                        adv_stats=None, adv_opp_stats=None, stream=False):
     """
     Find and create Team instances for all teams in the given season.
 
@@ -66,6 +66,9 @@ def _retrieve_all_teams(year, basic_stats=None, basic_opp_stats=None,
         Link with filename to the local advanved stats page.
     adv_opp_stats : string (optional)
         Link with filename to the local advanced opponents stats page.
+    stream : boolean (optional)
+        Set to True to stream the stats tables out of each page instead of
+        parsing the pages in full.
 
     Returns
     -------
@@ -77,20 +80,20 @@ def _retrieve_all_teams(year, basic_stats=None, basic_opp_stats=None,
     team_data_dict = {}
 
     if not year:
-        year = utils._find_year_for_season('ncaab')
-        # If stats for the requested season do not exist yet (as is the case
-        # right before a new season begins), attempt to pull the previous
-        # year's stats. If it exists, use the previous year instead.
-        if not utils._url_exists(BASIC_STATS_URL % year) and \
-           utils._url_exists(BASIC_STATS_URL % str(int(year) - 1)):
-            year = str(int(year) - 1)
-    doc = utils._pull_page(BASIC_STATS_URL % year, basic_stats)
+        # If stats for the requested season do not exist yet (as is the
+        # case right before a new season begins), the previous year's
+        # stats are used instead.
+        year = utils._find_default_season(
+            'ncaab', lambda x: BASIC_STATS_URL % x)
+    doc = utils._pull_table_page(BASIC_STATS_URL % year, basic_stats, stream)
     teams_list = utils._get_stats_table(doc, 'table#basic_school_stats')
-    doc = utils._pull_page(BASIC_OPPONENT_STATS_URL % year, basic_opp_stats)
+    doc = utils._pull_table_page(BASIC_OPPONENT_STATS_URL % year,
+                                 basic_opp_stats, stream)
     opp_list = utils._get_stats_table(doc, 'table#basic_opp_stats')
-    doc = utils._pull_page(ADVANCED_STATS_URL % year, adv_stats)
+    doc = utils._pull_table_page(ADVANCED_STATS_URL % year, adv_stats, stream)
     adv_teams_list = utils._get_stats_table(doc, 'table#adv_school_stats')
-    doc = utils._pull_page(ADVANCED_OPPONENT_STATS_URL % year, adv_opp_stats)
+    doc = utils._pull_table_page(ADVANCED_OPPONENT_STATS_URL % year,
+                                 adv_opp_stats, stream)
     adv_opp_list = utils._get_stats_table(doc, 'table#adv_opp_stats')
     if not teams_list and not opp_list and not adv_teams_list \
        and not adv_opp_list:
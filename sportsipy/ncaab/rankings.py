@@ -1,11 +1,10 @@
 import re
-from pyquery import PyQuery as pq
 from urllib.error import HTTPError
-from .. import utils
-from .constants import RANKINGS_SCHEME, RANKINGS_URL
+from .. import records, utils
+from .constants import BASIC_STATS_URL, RANKINGS_SCHEME, RANKINGS_URL
 
 
-class Rankings:
+class Rankings(records._Record):
     """
     Get all Associated Press (AP) rankings on a week-by-week basis.
 
@@ -54,7 +53,7 @@ class Rankings:
             Returns a PyQuery object of the rankings HTML page.
         """
         try:
-            return pq(RANKINGS_URL % year)
+            return utils._pull_page(RANKINGS_URL % year)
         except HTTPError:
             return None
 
@@ -101,14 +100,12 @@ class Rankings:
             A string of the requested year to pull rankings from.
         """
         if not year:
-            year = utils._find_year_for_season('ncaab')
             # If stats for the requested season do not exist yet (as is the
-            # case right before a new season begins), attempt to pull the
-            # previous year's stats. If it exists, use the previous year
-            # instead.
-            if not utils._url_exists(RANKINGS_URL % year) and \
-               utils._url_exists(RANKINGS_URL % str(int(year) - 1)):
-                year = str(int(year) - 1)
+            # case right before a new season begins), the previous year's
+            # stats are used instead.
+            year = utils._find_default_season(
+                'ncaab', lambda x: BASIC_STATS_URL % x,
+                lambda x: RANKINGS_URL % x)
         page = self._pull_rankings_page(year)
         if not page:
             output = ("Can't pull rankings page. Ensure the following URL "
@@ -2,10 +2,10 @@ import pandas as pd
 import re
 from functools import wraps
 from lxml.etree import ParserError
-from pyquery import PyQuery as pq
 from urllib.error import HTTPError
-from .. import utils
-from .constants import PLAYER_SCHEME, PLAYER_URL, ROSTER_URL
+from .. import concurrency, records, utils
+from ..decorators import _convert_item
+from .constants import BASIC_STATS_URL, PLAYER_SCHEME, PLAYER_URL, ROSTER_URL
 from .player import AbstractPlayer
 
 
@@ -20,18 +20,25 @@ def _cleanup(prop):
         return ''
 
 
+def _to_int(prop):
+    return int(_cleanup(prop))
+
+
+def _to_float(prop):
+    return float(_cleanup(prop))
+
+
 def _int_property_decorator(func):
     @property
     @wraps(func)
     def wrapper(*args):
         index = args[0]._index
         prop = func(*args)
-        value = _cleanup(prop[index])
-        try:
-            return int(value)
-        except ValueError:
-            # If there is no value, default to None
-            return None
+        # If there is no value, default to None
+        value = prop[index]
+        if type(value) is int:
+            return value
+        return _convert_item(args[0], func.__name__, prop, index, _to_int)
     return wrapper
 
 
@@ -41,12 +48,11 @@ def _float_property_decorator(func):
     def wrapper(*args):
         index = args[0]._index
         prop = func(*args)
-        value = _cleanup(prop[index])
-        try:
-            return float(value)
-        except ValueError:
-            # If there is no value, default to None
-            return None
+        # If there is no value, default to None
+        value = prop[index]
+        if type(value) is float:
+            return value
+        return _convert_item(args[0], func.__name__, prop, index, _to_float)
     return wrapper
 
 
@@ -90,8 +96,11 @@ class Player(AbstractPlayer):
         lowercase, 'last' is the player's last name in lowercase, and 'N' is a
         number starting at '1' for the first time that player ID has been used
         and increments by 1 for every successive player.
+    compact : boolean (optional)
+        Set to True to drop the player's rows from their stats page once their
+        stats have been parsed. Defaults to False.
     """
-    def __init__(self, player_id):
+    def __init__(self, player_id, compact=False):
         self._most_recent_season = ''
         self._index = None
         self._player_id = player_id
@@ -117,6 +126,7 @@ class Player(AbstractPlayer):
         player_data = self._pull_player_data()
         self._find_initial_index()
         AbstractPlayer.__init__(self, player_id, self._name, player_data)
+        utils._release(self, '_player_data', compact=compact)
 
     def __str__(self):
         """
@@ -145,10 +155,10 @@ class Player(AbstractPlayer):
         """
         url = PLAYER_URL % self._player_id
         try:
-            url_data = pq(url)
+            url_data = utils._pull_page(url)
         except (HTTPError, ParserError):
             return None
-        return pq(utils._remove_html_comment_tags(url_data))
+        return utils._expand_html_comments(url_data)
 
     def _parse_season(self, row):
         """
@@ -189,8 +199,8 @@ class Player(AbstractPlayer):
         all_stats_dict : dictionary
             A dictionary of all stats separated by season where each key is the
             season ``string``, such as '2017-18', and the value is a
-            ``dictionary`` with a ``string`` of 'data' and ``string``
-            containing all of the data.
+            ``dictionary`` with a ``string`` of 'data' and a ``list`` of the
+            row elements containing all of the data.
 
         Returns
         -------
@@ -204,17 +214,17 @@ class Player(AbstractPlayer):
         for row in table_rows:
             season = self._parse_season(row)
             try:
-                all_stats_dict[season]['data'] += str(row)
+                all_stats_dict[season]['data'] += row
             except KeyError:
-                all_stats_dict[season] = {'data': str(row)}
+                all_stats_dict[season] = {'data': list(row)}
             most_recent_season = season
         self._most_recent_season = most_recent_season
         if not career_stats:
             return all_stats_dict
         try:
-            all_stats_dict['Career']['data'] += str(next(career_stats))
+            all_stats_dict['Career']['data'] += next(career_stats)
         except KeyError:
-            all_stats_dict['Career'] = {'data': str(next(career_stats))}
+            all_stats_dict['Career'] = {'data': list(next(career_stats))}
         return all_stats_dict
 
     def _combine_all_stats(self, player_info):
@@ -484,8 +494,10 @@ class Player(AbstractPlayer):
         temp_index = self._index
         rows = []
         indices = []
-        for season in self._season:
-            self._index = self._season.index(season)
+        # Every row is read from the first occurrence of its season.
+        for season, index in zip(self._season,
+                                 utils._first_indices(self._season)):
+            self._index = index
             rows.append(self._dataframe_fields())
             indices.append(season)
         self._index = temp_index
@@ -632,7 +644,7 @@ class Player(AbstractPlayer):
         return self._box_plus_minus
 
 
-class Roster:
+class Roster(records._Record):
     """
     Get stats for all players on a roster.
 
@@ -652,10 +664,16 @@ class Roster:
         the name and player ID for each player as opposed to all of their
         respective stats which greatly reduces the time to return a response if
         just the names and IDs are desired. Defaults to False.
+    workers : int (optional)
+        Set to the number of threads to use to download and parse the pages
+        for every player on the roster concurrently. Players are still listed
+        in roster order. Has no effect when ``slim`` is True. Defaults to
+        downloading each player serially.
     """
-    def __init__(self, team, year=None, slim=False):
+    def __init__(self, team, year=None, slim=False, workers=None):
         self._team = team
         self._slim = slim
+        self._workers = workers
         self._coach = None
         if slim:
             self._players = {}
@@ -695,7 +713,7 @@ class Roster:
             Returns a PyQuery object of the team's HTML page.
         """
         try:
-            return pq(url)
+            return utils._pull_page(url)
         except HTTPError:
             return None
 
@@ -801,20 +819,18 @@ class Roster:
             from.
         """
         if not year:
-            year = utils._find_year_for_season('ncaab')
             # If stats for the requested season do not exist yet (as is the
-            # case right before a new season begins), attempt to pull the
-            # previous year's stats. If it exists, use the previous year
-            # instead.
-            if not utils._url_exists(self._create_url(year)) and \
-               utils._url_exists(self._create_url(str(int(year) - 1))):
-                year = str(int(year) - 1)
+            # case right before a new season begins), the previous year's
+            # stats are used instead.
+            year = utils._find_default_season(
+                'ncaab', lambda x: BASIC_STATS_URL % x, self._create_url)
         url = self._create_url(year)
         page = self._pull_team_page(url)
         if not page:
             output = ("Can't pull requested team page. Ensure the following "
                       "URL exists: %s" % url)
             raise ValueError(output)
+        player_ids = []
         players = page('table#roster tbody tr').items()
         for player in players:
             player_id = self._get_id(player)
@@ -822,9 +838,11 @@ class Roster:
                 name = self._get_name(player)
                 self._players[player_id] = name
             else:
-                player_instance = Player(player_id)
-                self._players.append(player_instance)
+                player_ids.append(player_id)
 
+        if not self._slim:
+            self._players = concurrency._run_concurrently(Player, player_ids,
+                                                          self._workers)
         self._coach = self._parse_coach(page)
 
     @property
@@ -1,15 +1,15 @@
-import pandas as pd
 import re
-from ..decorators import int_property_decorator
-from .constants import (SCHEDULE_SCHEME,
+from ..decorators import cached_property_decorator, int_property_decorator
+from .constants import (BASIC_STATS_URL,
+                        BOXSCORE_URL,
+                        SCHEDULE_SCHEME,
                         SCHEDULE_URL,
                         NCAA_TOURNAMENT,
                         NIT_TOURNAMENT,
                         CBI_TOURNAMENT,
                         CIT_TOURNAMENT)
 from datetime import datetime
-from pyquery import PyQuery as pq
-from sportsipy import utils
+from sportsipy import concurrency, records, utils
 from sportsipy.constants import (WIN,
                                  LOSS,
                                  HOME,
@@ -21,7 +21,7 @@ from sportsipy.constants import (WIN,
 from sportsipy.ncaab.boxscore import Boxscore
 
 
-class Game:
+class Game(records._SlotRecord):
     """
     A representation of a matchup between two teams.
 
@@ -32,8 +32,19 @@ class Game:
     ----------
     game_data : string
         The row containing the specified game information.
+    lazy : boolean (optional)
+        Set to True to only parse each field the first time it is read instead
+        of parsing every field as soon as the game is created. Defaults to
+        False.
     """
-    def __init__(self, game_data):
+    __slots__ = ('_game', '_date', '_datetime', '_time', '_boxscore', '_type',
+                 '_location', '_opponent_abbr', '_opponent_name',
+                 '_opponent_rank', '_opponent_conference', '_result',
+                 '_points_for', '_points_against', '_overtimes',
+                 '_season_wins', '_season_losses', '_streak', '_arena',
+                 '_pending_fields')
+
+    def __init__(self, game_data, lazy=False):
         self._game = None
         self._date = None
         self._datetime = None
@@ -54,7 +65,7 @@ class Game:
         self._streak = None
         self._arena = None
 
-        self._parse_game_data(game_data)
+        self._parse_game_data(game_data, lazy)
 
     def __str__(self):
         """
@@ -68,6 +79,12 @@ class Game:
         """
         return self.__str__()
 
+    def __getattr__(self, name):
+        """
+        Parse a field the first time it is read if parsing lazily.
+        """
+        return utils._parse_pending_field(self, name)
+
     def _parse_abbreviation(self, game_data):
         """
         Parses the opponent's abbreviation from their name.
@@ -112,7 +129,34 @@ class Game:
         boxscore = re.sub(r'\.html.*', '', str(boxscore))
         setattr(self, '_boxscore', boxscore)
 
-    def _parse_game_data(self, game_data):
+    def _parse_game_field(self, field, row):
+        """
+        Parse the value of a single attribute.
+
+        Parameters
+        ----------
+        field : string
+            The name of the attribute to parse, such as '_date'.
+        row : _RowIndex
+            An index of the row containing the information specific to a
+            game.
+
+        Returns
+        -------
+        string
+            The value of the attribute according to the parsing scheme.
+        """
+        # Remove the leading '_' from the name
+        short_name = str(field)[1:]
+        if short_name == 'opponent_abbr':
+            self._parse_abbreviation(row.html)
+            return self._opponent_abbr
+        if short_name == 'boxscore':
+            self._parse_boxscore(row.html)
+            return self._boxscore
+        return utils._parse_field(SCHEDULE_SCHEME, row, short_name)
+
+    def _parse_game_data(self, game_data, lazy=False):
         """
         Parses a value for every attribute.
 
@@ -129,27 +173,25 @@ class Game:
         ----------
         game_data : string
             A string containing all of the rows of stats for a given game.
+        lazy : boolean (optional)
+            Set to True to only parse each field the first time it is read.
         """
-        for field in self.__dict__:
-            # Remove the leading '_' from the name
-            short_name = str(field)[1:]
-            if short_name == 'datetime' or \
-               short_name == 'opponent_rank':
-                continue
-            elif short_name == 'opponent_abbr':
-                self._parse_abbreviation(game_data)
-                continue
-            elif short_name == 'boxscore':
-                self._parse_boxscore(game_data)
-                continue
-            value = utils._parse_field(SCHEDULE_SCHEME, game_data, short_name)
-            setattr(self, field, value)
+        row = utils._RowIndex(game_data)
+        fields = [field for field in records._fields(self)
+                  if field != '_datetime' and field != '_opponent_rank']
+        utils._parse_fields(self, fields, self._parse_game_field, row,
+                            lazy=lazy)
 
-    @property
-    def dataframe(self):
+    def _dataframe_row(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the boxscore string.
+        Gather the values of every field included in the DataFrame.
+
+        Returns
+        -------
+        tuple
+            A ``tuple`` of the row's index and a ``dictionary`` of every
+            field's value keyed by column name, or None if the game has no
+            data.
         """
         if self._points_for is None and self._points_against is None:
             return None
@@ -174,7 +216,37 @@ class Game:
             'time': self.time,
             'type': self.type
         }
-        return pd.DataFrame([fields_to_include], index=[self._boxscore])
+        return self._boxscore, fields_to_include
+
+    @property
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the boxscore string.
+        """
+        return utils._build_dataframe([self._dataframe_row()])
+
+    def _dataframe_extended_row(self, page=None):
+        """
+        Gather the values of every field included in the extended DataFrame.
+
+        Parameters
+        ----------
+        page : string (optional)
+            The contents of the game's boxscore page if it has already been
+            downloaded. Defaults to downloading the page.
+
+        Returns
+        -------
+        tuple or Pandas DataFrame
+            The row of the game's boxscore as returned by
+            ``utils._frame_row``, or None if the game has no data.
+        """
+        if self._points_for is None and self._points_against is None:
+            return None
+        if page is None:
+            return utils._frame_row(self.boxscore)
+        return utils._frame_row(Boxscore(self._boxscore, page=page))
 
     @property
     def dataframe_extended(self):
@@ -184,9 +256,7 @@ class Game:
         but takes longer to process compared to the lighter 'dataframe'
         property. The index for the DataFrame is the boxscore string.
         """
-        if self._points_for is None and self._points_against is None:
-            return None
-        return self.boxscore.dataframe
+        return utils._build_dataframe([self._dataframe_extended_row()])
 
     @int_property_decorator
     def game(self):
@@ -203,7 +273,7 @@ class Game:
         """
         return self._date
 
-    @property
+    @cached_property_decorator('_datetime')
     def datetime(self):
         """
         Returns a datetime object to indicate the month, day, year, and time
@@ -400,7 +470,7 @@ class Game:
         return self._arena
 
 
-class Schedule:
+class Schedule(records._Record):
     """
     An object of the given team's schedule.
 
@@ -413,10 +483,14 @@ class Schedule:
         A team's short name, such as 'PURDUE' for the Purdue Boilermakers.
     year : string (optional)
         The requested year to pull stats from.
+    lazy : boolean (optional)
+        Set to True to only parse each game's fields the first time they are
+        read instead of parsing every field as soon as the schedule is
+        created. Defaults to False.
     """
-    def __init__(self, abbreviation, year=None):
+    def __init__(self, abbreviation, year=None, lazy=False):
         self._games = []
-        self._pull_schedule(abbreviation, year)
+        self._pull_schedule(abbreviation, year, lazy)
 
     def __getitem__(self, index):
         """
@@ -463,12 +537,11 @@ class Schedule:
             If the requested date cannot be matched with a game in the
             schedule.
         """
-        for game in self._games:
-            if game.datetime.year == date.year and \
-               game.datetime.month == date.month and \
-               game.datetime.day == date.day:
-                return game
-        raise ValueError('No games found for requested date')
+        games = utils._dated(self, self._games)
+        try:
+            return games[(date.year, date.month, date.day)][0]
+        except KeyError:
+            raise ValueError('No games found for requested date')
 
     def __str__(self):
         """
@@ -494,7 +567,7 @@ class Schedule:
         """Returns the number of scheduled games for the given team."""
         return len(self._games)
 
-    def _pull_schedule(self, abbreviation, year):
+    def _pull_schedule(self, abbreviation, year, lazy=False):
         """
         Download and create objects for the team's schedule.
 
@@ -509,19 +582,18 @@ class Schedule:
             A team's short name, such as 'PURDUE' for the Purdue Boilermakers.
         year : string
             The requested year to pull stats from.
+        lazy : boolean (optional)
+            Set to True to only parse each game's fields the first time they
+            are read.
         """
         if not year:
-            year = utils._find_year_for_season('ncaab')
             # If stats for the requested season do not exist yet (as is the
-            # case right before a new season begins), attempt to pull the
-            # previous year's stats. If it exists, use the previous year
-            # instead.
-            if not utils._url_exists(SCHEDULE_URL % (abbreviation.lower(),
-                                                     year)) and \
-               utils._url_exists(SCHEDULE_URL % (abbreviation.lower(),
-                                                 str(int(year) - 1))):
-                year = str(int(year) - 1)
-        doc = pq(SCHEDULE_URL % (abbreviation.lower(), year))
+            # case right before a new season begins), the previous year's
+            # stats are used instead.
+            year = utils._find_default_season(
+                'ncaab', lambda x: BASIC_STATS_URL % x,
+                lambda x: SCHEDULE_URL % (abbreviation.lower(), x))
+        doc = utils._pull_page(SCHEDULE_URL % (abbreviation.lower(), year))
         schedule = utils._get_stats_table(doc, 'table#schedule')
         if not schedule:
             utils._no_data_found()
@@ -530,7 +602,7 @@ class Schedule:
         for item in schedule:
             if 'class="thead"' in str(item):
                 continue
-            game = Game(item)
+            game = Game(item, lazy=lazy)
             self._games.append(game)
 
     @property
@@ -539,14 +611,8 @@ class Schedule:
         Returns a pandas DataFrame where each row is a representation of the
         Game class. Rows are indexed by the boxscore string.
         """
-        frames = []
-        for game in self.__iter__():
-            df = game.dataframe
-            if df is not None:
-                frames.append(df)
-        if frames == []:
-            return None
-        return pd.concat(frames)
+        return utils._build_dataframe(utils._frame_row(game)
+                                      for game in self.__iter__())
 
     @property
     def dataframe_extended(self):
@@ -557,11 +623,37 @@ class Schedule:
         selected game, but takes longer to process compared to the lighter
         'dataframe' property.
         """
-        frames = []
-        for game in self.__iter__():
-            df = game.dataframe_extended
-            if df is not None:
-                frames.append(df)
-        if frames == []:
-            return None
-        return pd.concat(frames)
+        return self.build_dataframe_extended()
+
+    def build_dataframe_extended(self, workers=None, processes=None,
+                                 progress=None):
+        """
+        Returns a pandas DataFrame where each row is a representation of the
+        Boxscore class for every game in the schedule, optionally downloading
+        and parsing the boxscores concurrently. Rows are indexed by the
+        boxscore string and are in schedule order.
+
+        Parameters
+        ----------
+        workers : int (optional)
+            Set to the number of threads to use to download and parse the
+            boxscore for every game concurrently. Defaults to processing each
+            game serially.
+        processes : int (optional)
+            Set to the number of processes to use to parse the boxscores.
+            Every boxscore is downloaded first, using ``workers`` threads,
+            before being parsed in parallel. Defaults to parsing boxscores in
+            the current process.
+        progress : function (optional)
+            A function which is called with the number of processed games and
+            the total number of games every time a game finishes processing.
+
+        Returns
+        -------
+        Pandas DataFrame
+            A DataFrame of every game's boxscore, or None if no games have
+            been played.
+        """
+        rows = concurrency._extended_rows(self._games, BOXSCORE_URL, workers,
+                                          processes, progress)
+        return utils._build_dataframe(rows)
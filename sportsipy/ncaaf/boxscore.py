@@ -1,9 +1,9 @@
 import pandas as pd
 import re
-from datetime import timedelta
 from pyquery import PyQuery as pq
 from urllib.error import HTTPError
-from .. import utils
+from .. import parsing, records, utils
+from ..concurrency import _fetch_boxscores
 from ..constants import AWAY, HOME
 from ..decorators import int_property_decorator
 from .constants import (BOXSCORE_ELEMENT_INDEX,
@@ -69,11 +69,17 @@ class BoxscorePlayer(AbstractPlayer):
     player_name : string
         A string representing the player's first and last name, such as 'David
         Blough'.
-    player_data : string
-        A string representation of the player's HTML data from the Boxscore
-        page. If the player appears in multiple tables, all of their
-        information will appear in one single string concatenated together.
+    player_data : list
+        A list of the row elements containing the player's data from the
+        Boxscore page. If the player appears in multiple tables, the rows from
+        every table are included.
     """
+    __slots__ = ('_index', '_pass_yards_per_attempt', '_kickoff_returns',
+                 '_kickoff_return_yards', '_average_kickoff_return_yards',
+                 '_punt_returns', '_punt_return_yards',
+                 '_average_punt_return_yards', '_points_kicking', '_punts',
+                 '_punting_yards', '_punting_yards_per_attempt')
+
     def __init__(self, player_id, player_name, player_data):
         self._index = 0
         self._player_id = player_id
@@ -284,7 +290,7 @@ class BoxscorePlayer(AbstractPlayer):
         return self._punting_yards_per_attempt
 
 
-class Boxscore:
+class Boxscore(records._SlotRecord):
     """
     Detailed information about the final statistics for a game.
 
@@ -297,8 +303,39 @@ class Boxscore:
     uri : string
         The relative link to the boxscore HTML page, such as
         '2018-01-08-georgia'.
+    lazy : boolean (optional)
+        Set to True to only parse each field the first time it is read instead
+        of parsing every field as soon as the boxscore is created. Defaults to
+        False.
+    compact : boolean (optional)
+        Set to False to keep references into the boxscore page, such as each
+        team's name tag, instead of copying out only the elements which are
+        kept, which lets the page be released once the boxscore has been
+        parsed. Defaults to True.
+    page : string (optional)
+        The contents of the boxscore page if it has already been downloaded,
+        in which case the page isn't downloaded again.
     """
-    def __init__(self, uri):
+    __slots__ = ('_uri', '_date', '_time', '_stadium', '_away_name',
+                 '_home_name', '_winner', '_winning_name', '_winning_abbr',
+                 '_losing_name', '_losing_abbr', '_summary', '_away_points',
+                 '_away_first_downs', '_away_rush_attempts',
+                 '_away_rush_yards', '_away_rush_touchdowns',
+                 '_away_pass_completions', '_away_pass_attempts',
+                 '_away_pass_yards', '_away_pass_touchdowns',
+                 '_away_interceptions', '_away_total_yards', '_away_fumbles',
+                 '_away_fumbles_lost', '_away_turnovers', '_away_penalties',
+                 '_away_yards_from_penalties', '_home_points',
+                 '_home_first_downs', '_home_rush_attempts',
+                 '_home_rush_yards', '_home_rush_touchdowns',
+                 '_home_pass_completions', '_home_pass_attempts',
+                 '_home_pass_yards', '_home_pass_touchdowns',
+                 '_home_interceptions', '_home_total_yards', '_home_fumbles',
+                 '_home_fumbles_lost', '_home_turnovers', '_home_penalties',
+                 '_home_yards_from_penalties', '_away_players',
+                 '_home_players', '_pending_fields')
+
+    def __init__(self, uri, lazy=False, compact=True, page=None):
         self._uri = uri
         self._date = None
         self._time = None
@@ -344,7 +381,7 @@ class Boxscore:
         self._home_penalties = None
         self._home_yards_from_penalties = None
 
-        self._parse_game_data(uri)
+        self._parse_game_data(uri, lazy, compact, page=page)
 
     def __str__(self):
         """
@@ -359,7 +396,13 @@ class Boxscore:
         """
         return self.__str__()
 
-    def _retrieve_html_page(self, uri):
+    def __getattr__(self, name):
+        """
+        Parse a field the first time it is read if parsing lazily.
+        """
+        return utils._parse_pending_field(self, name)
+
+    def _retrieve_html_page(self, uri, page=None):
         """
         Download the requested HTML page.
 
@@ -372,6 +415,9 @@ class Boxscore:
         uri : string
             The relative link to the boxscore HTML page, such as
             '2018-01-08-georgia'.
+        page : string (optional)
+            The contents of the boxscore page if it has already been
+            downloaded.
 
         Returns
         -------
@@ -379,12 +425,14 @@ class Boxscore:
             The requested page is returned as a queriable PyQuery object with
             the comment tags removed.
         """
+        if page is not None:
+            return utils._expand_html_comments(pq(page))
         url = BOXSCORE_URL % uri
         try:
-            url_data = pq(url)
+            url_data = utils._pull_page(url)
         except HTTPError:
             return None
-        return pq(utils._remove_html_comment_tags(url_data))
+        return utils._expand_html_comments(url_data)
 
     def _parse_game_date_and_location(self, boxscore):
         """
@@ -423,7 +471,7 @@ class Boxscore:
         setattr(self, '_date', date)
         setattr(self, '_stadium', stadium)
 
-    def _parse_name(self, field, boxscore):
+    def _parse_name(self, field, boxscore, compact=True):
         """
         Retrieve the team's complete name tag.
 
@@ -437,6 +485,8 @@ class Boxscore:
             The name of the attribute to parse
         boxscore : PyQuery object
             A PyQuery object containing all of the HTML data from the boxscore.
+        compact : boolean (optional)
+            Set to False to keep references into the boxscore page.
 
         Returns
         -------
@@ -444,7 +494,7 @@ class Boxscore:
             The complete text for the requested tag.
         """
         scheme = BOXSCORE_SCHEME[field]
-        return boxscore(scheme)
+        return utils._detach(boxscore(scheme), compact)
 
     def _parse_summary(self, boxscore):
         """
@@ -514,7 +564,7 @@ class Boxscore:
         valid_tables = ['passing', 'rushing_and_receiving', 'defense',
                         'returns', 'kicking_and_punting']
 
-        for table in boxscore('table').items():
+        for table in parsing.get_engine().find(boxscore, 'table').items():
             if table.attr['id'] in valid_tables:
                 tables.append(table)
         return tables
@@ -593,9 +643,9 @@ class Boxscore:
 
         Since each player generally has a couple of rows worth of stats
         (rushing, passing, defense, and more) on the boxscore page, both rows
-        should be combined into a single string object to easily query all
-        fields from a single object instead of determining which row to pull
-        metrics from.
+        should be combined into a single list of row elements to easily query
+        all fields from a single object instead of determining which row to
+        pull metrics from.
 
         Parameters
         ----------
@@ -624,11 +674,11 @@ class Boxscore:
             name = self._find_player_name(row)
             home_or_away = self._find_home_or_away(row)
             try:
-                player_dict[player_id]['data'] += str(row).strip()
+                player_dict[player_id]['data'] += row
             except KeyError:
                 player_dict[player_id] = {
                     'name': name,
-                    'data': str(row).strip(),
+                    'data': list(row),
                     'team': home_or_away
                 }
         return player_dict
@@ -647,8 +697,8 @@ class Boxscore:
             A dictionary containing information for every player on the
             boxscores page. Each key is a string containing the player's ID
             and each value is a dictionary with the player's full name, a
-            string representation of their HTML stats, and a string constant
-            denoting which team they play for as the values.
+            list of the row elements containing their stats, and a string
+            constant denoting which team they play for as the values.
 
         Returns
         -------
@@ -698,7 +748,41 @@ class Boxscore:
         away_players, home_players = self._instantiate_players(player_dict)
         return away_players, home_players
 
-    def _parse_game_data(self, uri):
+    def _parse_boxscore_field(self, field, boxscore_index, compact=True):
+        """
+        Parse the value of a single attribute.
+
+        Parameters
+        ----------
+        field : string
+            The name of the attribute to parse, such as '_away_points'.
+        boxscore_index : _RowIndex
+            An index of every cell on the boxscore page.
+        compact : boolean (optional)
+            Set to False to keep references into the boxscore page.
+
+        Returns
+        -------
+        string
+            The value of the attribute according to the parsing scheme.
+        """
+        boxscore = boxscore_index.html
+        # Remove the '_' from the name
+        short_field = str(field)[1:]
+        if short_field == 'away_name' or \
+           short_field == 'home_name':
+            return self._parse_name(short_field, boxscore, compact)
+        if short_field == 'summary':
+            return self._parse_summary(boxscore)
+        index = 0
+        if short_field in BOXSCORE_ELEMENT_INDEX.keys():
+            index = BOXSCORE_ELEMENT_INDEX[short_field]
+        return utils._parse_field(BOXSCORE_SCHEME,
+                                  boxscore_index,
+                                  short_field,
+                                  index)
+
+    def _parse_game_data(self, uri, lazy=False, compact=True, page=None):
         """
         Parses a value for every attribute.
 
@@ -715,53 +799,46 @@ class Boxscore:
         uri : string
             The relative link to the boxscore HTML page, such as
             '2018-01-08-georgia'.
-        """
-        boxscore = self._retrieve_html_page(uri)
+        lazy : boolean (optional)
+            Set to True to only parse each field the first time it is read.
+        compact : boolean (optional)
+            Set to False to keep references into the boxscore page.
+        page : string (optional)
+            The contents of the boxscore page if it has already been
+            downloaded.
+        """
+        boxscore = self._retrieve_html_page(uri, page)
         # If the boxscore is None, the game likely hasn't been played yet and
         # no information can be gathered. As there is nothing to grab, the
         # class instance should just be empty.
         if not boxscore:
             return
 
-        for field in self.__dict__:
-            # Remove the '_' from the name
-            short_field = str(field)[1:]
-            if short_field == 'winner' or \
-               short_field == 'winning_name' or \
-               short_field == 'winning_abbr' or \
-               short_field == 'losing_name' or \
-               short_field == 'losing_abbr' or \
-               short_field == 'uri' or \
-               short_field == 'date' or \
-               short_field == 'time' or \
-               short_field == 'stadium':
-                continue
-            if short_field == 'away_name' or \
-               short_field == 'home_name':
-                value = self._parse_name(short_field, boxscore)
-                setattr(self, field, value)
-                continue
-            if short_field == 'summary':
-                value = self._parse_summary(boxscore)
-                setattr(self, field, value)
-                continue
-            index = 0
-            if short_field in BOXSCORE_ELEMENT_INDEX.keys():
-                index = BOXSCORE_ELEMENT_INDEX[short_field]
-            value = utils._parse_field(BOXSCORE_SCHEME,
-                                       boxscore,
-                                       short_field,
-                                       index)
-            setattr(self, field, value)
+        # Every cell on the page is indexed by its data-stat attribute once so
+        # the fields don't each search the entire page.
+        boxscore_index = utils._RowIndex(boxscore)
+        skipped_fields = ['winner', 'winning_name', 'winning_abbr',
+                          'losing_name', 'losing_abbr', 'uri', 'date', 'time',
+                          'stadium']
+        fields = [field for field in records._fields(self)
+                  if str(field)[1:] not in skipped_fields]
+        utils._parse_fields(self, fields, self._parse_boxscore_field,
+                            boxscore_index, compact, lazy=lazy)
         self._parse_game_date_and_location(boxscore)
-        self._away_players, self._home_players = self._find_players(boxscore)
+        utils._parse_fields(self, ['_away_players', '_home_players'],
+                            self._find_players, boxscore, together=True,
+                            lazy=lazy)
 
-    @property
-    def dataframe(self):
+    def _dataframe_row(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the string URI that is used to
-        instantiate the class, such as '2018-01-08-georgia'.
+        Gather the values of every field included in the DataFrame.
+
+        Returns
+        -------
+        tuple
+            A ``tuple`` of the row's index and a ``dictionary`` of every
+            field's value keyed by column name, or None if the boxscore has no
+            data.
         """
         for points in [self._away_points, self._home_points]:
             if points is None or points == '':
@@ -808,7 +885,16 @@ class Boxscore:
             'winning_abbr': self.winning_abbr,
             'winning_name': self.winning_name
         }
-        return pd.DataFrame([fields_to_include], index=[self._uri])
+        return self._uri, fields_to_include
+
+    @property
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the string URI that is used to
+        instantiate the class, such as '2018-01-08-georgia'.
+        """
+        return utils._build_dataframe([self._dataframe_row()])
 
     @property
     def away_players(self):
@@ -1248,6 +1334,37 @@ class Boxscores:
         """
         return self._boxscores
 
+    @classmethod
+    async def fetch(cls, date, end_date=None, concurrency=None):
+        """
+        Search for NCAAF games without blocking the event loop.
+
+        Behaves the same as creating a new instance of the class, except the
+        page for every day in the range is downloaded concurrently, which is
+        much faster when searching a large range of days.
+
+        Parameters
+        ----------
+        date : datetime object
+            The date to search for any matches. The month, day, and year are
+            required for the search, but time is not factored into the search.
+        end_date : datetime object (optional)
+            Optionally specify an end date to iterate until. If left empty, or
+            if 'end_date' is prior to 'date', only the games from the day
+            specified in the 'date' parameter will be saved.
+        concurrency : int (optional)
+            The maximum number of pages to download at once. Defaults to the
+            maximum number of connections kept open to a single host.
+
+        Returns
+        -------
+        Boxscores instance
+            A ``Boxscores`` instance containing every game in the range.
+        """
+        boxscores = cls.__new__(cls)
+        pages = utils._boxscore_days(date, end_date, boxscores._create_url)
+        return await _fetch_boxscores(boxscores, pages, concurrency)
+
     def _create_url(self, date):
         """
         Build the URL based on the passed datetime object.
@@ -1287,7 +1404,7 @@ class Boxscores:
             A PyQuery object containing the HTML contents of the requested
             page.
         """
-        return pq(url)
+        return utils._pull_page(url)
 
     def _get_boxscore_uri(self, url):
         """
@@ -1589,17 +1706,5 @@ class Boxscores:
             the games from the day specified in the 'date' parameter will be
             saved.
         """
-        # Set the end date to the start date if the end date is before the
-        # start date.
-        if not end_date or date > end_date:
-            end_date = date
-        date_step = date
-        while date_step <= end_date:
-            url = self._create_url(date_step)
-            page = self._get_requested_page(url)
-            games = page('table[class="teams"]').items()
-            boxscores = self._extract_game_info(games)
-            timestamp = '%s-%s-%s' % (date_step.month, date_step.day,
-                                      date_step.year)
-            self._boxscores[timestamp] = boxscores
-            date_step += timedelta(days=1)
+        pages = utils._boxscore_days(date, end_date, self._create_url)
+        utils._find_boxscore_games(self, pages)
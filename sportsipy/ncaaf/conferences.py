@@ -1,13 +1,12 @@
 import re
 import warnings
 from lxml.etree import ParserError
-from pyquery import PyQuery as pq
 from urllib.error import HTTPError
-from .. import utils
-from .constants import CONFERENCE_URL, CONFERENCES_URL
+from .. import records, utils
+from .constants import CONFERENCE_URL, CONFERENCES_URL, SEASON_PAGE_URL
 
 
-class Conference:
+class Conference(records._Record):
     """
     Find teams that participated in a particular conference.
 
@@ -63,7 +62,8 @@ class Conference:
             A string of the requested year to pull conference information from.
         """
         try:
-            return pq(CONFERENCE_URL % (conference_abbreviation, year))
+            return utils._pull_page(CONFERENCE_URL %
+                                    (conference_abbreviation, year))
         except (HTTPError, ParserError):
             return None
 
@@ -108,14 +108,12 @@ class Conference:
             A string of the requested year to pull conference information from.
         """
         if not year:
-            year = utils._find_year_for_season('ncaaf')
             # If stats for the requested season do not exist yet (as is the
-            # case right before a new season begins), attempt to pull the
-            # previous year's stats. If it exists, use the previous year
-            # instead.
-            if not utils._url_exists(CONFERENCES_URL % year) and \
-               utils._url_exists(CONFERENCES_URL % str(int(year) - 1)):
-                year = str(int(year) - 1)
+            # case right before a new season begins), the previous year's
+            # stats are used instead.
+            year = utils._find_default_season(
+                'ncaaf', lambda x: SEASON_PAGE_URL % x,
+                lambda x: CONFERENCE_URL % (conference_abbreviation, x))
         page = self._pull_conference_page(conference_abbreviation, year)
         if not page:
             url = CONFERENCE_URL % (conference_abbreviation, year)
@@ -144,7 +142,7 @@ class Conference:
         return self._teams
 
 
-class Conferences:
+class Conferences(records._Record):
     """
     Get all conferences and teams for a season.
 
@@ -201,7 +199,7 @@ class Conferences:
             Returns a PyQuery object of the conference HTML page.
         """
         try:
-            return pq(CONFERENCES_URL % year)
+            return utils._pull_page(CONFERENCES_URL % year)
         except HTTPError:
             return None
 
@@ -245,14 +243,12 @@ class Conferences:
             A string of the requested year to pull conferences from.
         """
         if not year:
-            year = utils._find_year_for_season('ncaaf')
             # If stats for the requested season do not exist yet (as is the
-            # case right before a new season begins), attempt to pull the
-            # previous year's stats. If it exists, use the previous year
-            # instead.
-            if not utils._url_exists(CONFERENCES_URL % year) and \
-               utils._url_exists(CONFERENCES_URL % str(int(year) - 1)):
-                year = str(int(year) - 1)
+            # case right before a new season begins), the previous year's
+            # stats are used instead.
+            year = utils._find_default_season(
+                'ncaaf', lambda x: SEASON_PAGE_URL % x,
+                lambda x: CONFERENCES_URL % x)
         page = self._pull_conference_page(year)
         if not page:
             output = ("Can't pull requested conference page. Ensure the "
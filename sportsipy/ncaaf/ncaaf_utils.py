@@ -43,7 +43,8 @@ def _add_stats_data(teams_list, team_data_dict):
     return team_data_dict
 
 
-def _retrieve_all_teams(year, season_page, offensive_stats, defensive_stats):
+def _retrieve_all_teams(year, season_page, offensive_stats, defensive_stats,
+                        stream=False):
     """
     Find and create Team instances for all teams in the given season.
 
@@ -66,6 +67,9 @@ def _retrieve_all_teams(year, season_page, offensive_stats, defensive_stats):
         Link with filename to the local offensive stats page.
     defensive_stats : string (optional)
         Link with filename to the local defensive stats page.
+    stream : boolean (optional)
+        Set to True to stream the stats tables out of each page instead of
+        parsing the pages in full.
 
     Returns
     -------
@@ -77,18 +81,18 @@ def _retrieve_all_teams(year, season_page, offensive_stats, defensive_stats):
     team_data_dict = {}
 
     if not year:
-        year = utils._find_year_for_season('ncaaf')
-        # If stats for the requested season do not exist yet (as is the case
-        # right before a new season begins), attempt to pull the previous
-        # year's stats. If it exists, use the previous year instead.
-        if not utils._url_exists(SEASON_PAGE_URL % year) and \
-           utils._url_exists(SEASON_PAGE_URL % str(int(year) - 1)):
-            year = str(int(year) - 1)
-    doc = utils._pull_page(SEASON_PAGE_URL % year, season_page)
+        # If stats for the requested season do not exist yet (as is the
+        # case right before a new season begins), the previous year's
+        # stats are used instead.
+        year = utils._find_default_season(
+            'ncaaf', lambda x: SEASON_PAGE_URL % x)
+    doc = utils._pull_table_page(SEASON_PAGE_URL % year, season_page, stream)
     teams_list = utils._get_stats_table(doc, 'div#div_standings')
-    offense_doc = utils._pull_page(OFFENSIVE_STATS_URL % year, offensive_stats)
+    offense_doc = utils._pull_table_page(OFFENSIVE_STATS_URL % year,
+                                         offensive_stats, stream)
     offense_list = utils._get_stats_table(offense_doc, 'table#offense')
-    defense_doc = utils._pull_page(DEFENSIVE_STATS_URL % year, defensive_stats)
+    defense_doc = utils._pull_table_page(DEFENSIVE_STATS_URL % year,
+                                         defensive_stats, stream)
     defense_list = utils._get_stats_table(defense_doc, 'table#defense')
     if not teams_list and not offense_list and not defense_list:
         utils._no_data_found()
@@ -2,10 +2,13 @@ import pandas as pd
 import re
 from functools import wraps
 from lxml.etree import ParserError, XMLSyntaxError
-from pyquery import PyQuery as pq
 from urllib.error import HTTPError
-from .. import utils
-from .constants import PLAYER_SCHEME, PLAYER_URL, ROSTER_URL
+from .. import concurrency, records, utils
+from ..decorators import _convert_item
+from .constants import (PLAYER_SCHEME,
+                        PLAYER_URL,
+                        ROSTER_URL,
+                        SEASON_PAGE_URL)
 from .player import AbstractPlayer
 
 
@@ -16,10 +19,13 @@ def _int_property_decorator(func):
         index = args[0]._index
         prop = func(*args)
         try:
-            return int(prop[index])
-        except (ValueError, TypeError, IndexError):
+            value = prop[index]
+        except (TypeError, IndexError):
             # If there is no value, default to None
             return None
+        if type(value) is int:
+            return value
+        return _convert_item(args[0], func.__name__, prop, index, int)
     return wrapper
 
 
@@ -30,10 +36,13 @@ def _float_property_decorator(func):
         index = args[0]._index
         prop = func(*args)
         try:
-            return float(prop[index])
-        except (ValueError, TypeError, IndexError):
+            value = prop[index]
+        except (TypeError, IndexError):
             # If there is no value, default to None
             return None
+        if type(value) is float:
+            return value
+        return _convert_item(args[0], func.__name__, prop, index, float)
     return wrapper
 
 
@@ -170,10 +179,10 @@ class Player(AbstractPlayer):
         """
         url = self._build_url()
         try:
-            url_data = pq(url)
+            url_data = utils._pull_page(url)
         except HTTPError:
             return None
-        return pq(utils._remove_html_comment_tags(url_data))
+        return utils._expand_html_comments(url_data)
 
     def _parse_season(self, row):
         """
@@ -215,8 +224,8 @@ class Player(AbstractPlayer):
         all_stats_dict : dictionary
             A dictionary of all stats separated by season where each key is the
             season ``string``, such as '2017', and the value is a
-            ``dictionary`` with a ``string`` of 'data' and ``string``
-            containing all of the data.
+            ``dictionary`` with a ``string`` of 'data' and a ``list`` of the
+            row elements containing all of the data.
 
         Returns
         -------
@@ -230,17 +239,17 @@ class Player(AbstractPlayer):
         for row in table_rows:
             season = self._parse_season(row)
             try:
-                all_stats_dict[season]['data'] += str(row)
+                all_stats_dict[season]['data'] += row
             except KeyError:
-                all_stats_dict[season] = {'data': str(row)}
+                all_stats_dict[season] = {'data': list(row)}
             most_recent_season = season
         self._most_recent_season = most_recent_season
         if not career_stats:
             return all_stats_dict
         try:
-            all_stats_dict['Career']['data'] += str(next(career_stats))
+            all_stats_dict['Career']['data'] += next(career_stats)
         except KeyError:
-            all_stats_dict['Career'] = {'data': str(next(career_stats))}
+            all_stats_dict['Career'] = {'data': list(next(career_stats))}
         return all_stats_dict
 
     def _combine_all_stats(self, player_info):
@@ -457,8 +466,10 @@ class Player(AbstractPlayer):
         indices = []
         if not self._season:
             return None
-        for season in self._season:
-            self._index = self._season.index(season)
+        # Every row is read from the first occurrence of its season.
+        for season, index in zip(self._season,
+                                 utils._first_indices(self._season)):
+            self._index = index
             rows.append(self._dataframe_fields())
             indices.append(season)
         self._index = temp_index
@@ -859,7 +870,7 @@ class Player(AbstractPlayer):
         return self._points
 
 
-class Roster:
+class Roster(records._Record):
     """
     Get stats for all players on a roster.
 
@@ -879,10 +890,16 @@ class Roster:
         the name and player ID for each player as opposed to all of their
         respective stats which greatly reduces the time to return a response if
         just the names and IDs are desired. Defaults to False.
+    workers : int (optional)
+        Set to the number of threads to use to download and parse the pages
+        for every player on the roster concurrently. Players are still listed
+        in roster order. Has no effect when ``slim`` is True. Defaults to
+        downloading each player serially.
     """
-    def __init__(self, team, year=None, slim=False):
+    def __init__(self, team, year=None, slim=False, workers=None):
         self._team = team
         self._slim = slim
+        self._workers = workers
         self._coach = None
         if slim:
             self._players = {}
@@ -922,7 +939,7 @@ class Roster:
             Returns a PyQuery object of the team's HTML page.
         """
         try:
-            return pq(utils._remove_html_comment_tags(pq(url)))
+            return utils._expand_html_comments(utils._pull_page(url))
         except HTTPError:
             return None
 
@@ -1028,29 +1045,29 @@ class Roster:
             from.
         """
         if not year:
-            year = utils._find_year_for_season('ncaaf')
             # If stats for the requested season do not exist yet (as is the
-            # case right before a new season begins), attempt to pull the
-            # previous year's stats. If it exists, use the previous year
-            # instead.
-            if not utils._url_exists(self._create_url(year)) and \
-               utils._url_exists(self._create_url(str(int(year) - 1))):
-                year = str(int(year) - 1)
+            # case right before a new season begins), the previous year's
+            # stats are used instead.
+            year = utils._find_default_season(
+                'ncaaf', lambda x: SEASON_PAGE_URL % x, self._create_url)
         url = self._create_url(year)
         page = self._pull_team_page(url)
         if not page:
             output = ("Can't pull requested team page. Ensure the following "
                       "URL exists: %s" % url)
             raise ValueError(output)
+        player_ids = []
         for player in page('table#roster tbody tr').items():
             player_id = self._get_id(player)
             if self._slim:
                 name = self._get_name(player)
                 self._players[player_id] = name
             else:
-                player_instance = Player(player_id)
-                self._players.append(player_instance)
+                player_ids.append(player_id)
 
+        if not self._slim:
+            self._players = concurrency._run_concurrently(Player, player_ids,
+                                                          self._workers)
         self._coach = self._parse_coach(page)
 
     @property
@@ -1,15 +1,14 @@
-import pandas as pd
 import re
 from .constants import PARSING_SCHEME
 from ..decorators import float_property_decorator, int_property_decorator
-from .. import utils
+from .. import records, utils
 from .conferences import Conferences
 from .ncaaf_utils import _retrieve_all_teams
 from .roster import Roster
 from .schedule import Schedule
 
 
-class Team:
+class Team(records._Record):
     """
     An object containing all of a team's season information.
 
@@ -44,10 +43,14 @@ class Team:
         Optionally specify the filename of a local file to use to pull data
         instead of downloading from sports-reference.com. This file should be
         of the Defensive Stats page for the designated year.
+    lazy : boolean (optional)
+        Set to True to only parse each stat the first time it is read instead
+        of parsing every stat as soon as the team is created. Defaults to
+        False.
     """
     def __init__(self, team_name=None, team_data=None, team_conference=None,
                  year=None, season_page=None, offensive_stats=None,
-                 defensive_stats=None):
+                 defensive_stats=None, lazy=False):
         self._team_conference = team_conference
         self._year = year
         self._abbreviation = None
@@ -112,7 +115,7 @@ class Team:
                                                  defensive_stats)
             conferences_dict = Conferences(year).team_conference
             self._team_conference = conferences_dict[team_name.lower()]
-        self._parse_team_data(team_data)
+        self._parse_team_data(team_data, lazy)
 
     def __str__(self):
         """
@@ -126,6 +129,12 @@ class Team:
         """
         return self.__str__()
 
+    def __getattr__(self, name):
+        """
+        Parse a field the first time it is read if parsing lazily.
+        """
+        return utils._parse_pending_field(self, name)
+
     def _retrieve_team_data(self, year, team_name, season_page,
                             offensive_stats, defensive_stats):
         """
@@ -168,7 +177,26 @@ class Team:
         team_data = team_data_dict[team_name]['data']
         return team_data
 
-    def _parse_team_data(self, team_data):
+    def _parse_team_field(self, field, row):
+        """
+        Parse the value of a single attribute.
+
+        Parameters
+        ----------
+        field : string
+            The name of the attribute to parse, such as '_points'.
+        row : _RowIndex
+            An index of all of the rows of stats for the team.
+
+        Returns
+        -------
+        string
+            The value of the attribute according to the parsing scheme.
+        """
+        # Remove the '_' from the name
+        return utils._parse_field(PARSING_SCHEME, row, str(field)[1:])
+
+    def _parse_team_data(self, team_data, lazy=False):
         """
         Parses a value for every attribute.
 
@@ -186,22 +214,25 @@ class Team:
             A string containing all of the rows of stats for a given team. If
             multiple tables are being referenced, this will be comprised of
             multiple rows in a single string.
+        lazy : boolean (optional)
+            Set to True to only parse each field the first time it is read.
         """
-        for field in self.__dict__:
-            if field == '_year' or \
-               field == '_team_conference':
-                continue
-            value = utils._parse_field(PARSING_SCHEME,
-                                       team_data,
-                                       str(field)[1:])
-            setattr(self, field, value)
+        row = utils._RowIndex(team_data)
+        fields = [field for field in records._fields(self)
+                  if field != '_year' and field != '_team_conference']
+        utils._parse_fields(self, fields, self._parse_team_field, row,
+                            lazy=lazy)
 
-    @property
-    def dataframe(self):
+    def _dataframe_row(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the string abbreviation of the
-        team, such as 'PURDUE'.
+        Gather the values of every field included in the DataFrame.
+
+        Returns
+        -------
+        tuple
+            A ``tuple`` of the row's index and a ``dictionary`` of every
+            field's value keyed by column name, or None if the team has no
+            data.
         """
         fields_to_include = {
             'abbreviation': self.abbreviation,
@@ -265,7 +296,16 @@ class Team:
             'yards_per_play': self.yards_per_play,
             'opponents_yards_per_play': self.opponents_yards_per_play
         }
-        return pd.DataFrame([fields_to_include], index=[self._abbreviation])
+        return self._abbreviation, fields_to_include
+
+    @property
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the string abbreviation of the
+        team, such as 'PURDUE'.
+        """
+        return utils._build_dataframe([self._dataframe_row()])
 
     @property
     def conference(self):
@@ -729,7 +769,7 @@ class Team:
         return self._opponents_yards_from_penalties
 
 
-class Teams:
+class Teams(records._Record):
     """
     A list of all NCAA Men's Football teams and their stats in a given year.
 
@@ -754,16 +794,27 @@ class Teams:
         Optionally specify the filename of a local file to use to pull data
         instead of downloading from sports-reference.com. This file should be
         of the Defensive Stats page for the designated year.
+    stream : boolean (optional)
+        Set to True to stream the stats tables out of each season page instead
+        of parsing the pages in full. Only the rows of the tables used to build
+        every team are kept rather than the whole page being held in memory,
+        and parsing stops as soon as the last requested table ends. Defaults
+        to False.
+    lazy : boolean (optional)
+        Set to True to only parse each team's stats the first time they are
+        read instead of parsing every stat as soon as the teams are created,
+        which makes reading a few stats from every team much faster. Defaults
+        to False.
     """
     def __init__(self, year=None, season_page=None, offensive_stats=None,
-                 defensive_stats=None):
+                 defensive_stats=None, stream=False, lazy=False):
         self._teams = []
         self._conferences_dict = Conferences(year, True).team_conference
 
         team_data_dict, year = _retrieve_all_teams(year, season_page,
                                                    offensive_stats,
-                                                   defensive_stats)
-        self._instantiate_teams(team_data_dict, year)
+                                                   defensive_stats, stream)
+        self._instantiate_teams(team_data_dict, year, lazy)
 
     def __getitem__(self, abbreviation):
         """
@@ -788,10 +839,11 @@ class Teams:
         ValueError
             If the requested team is not present within the Teams list.
         """
-        for team in self._teams:
-            if team.abbreviation.upper() == abbreviation.upper():
-                return team
-        raise ValueError('Team abbreviation %s not found' % abbreviation)
+        teams = utils._keyed(self, self._teams, 'abbreviation')
+        team = teams.get(utils._lookup_key(abbreviation))
+        if team is None:
+            raise ValueError('Team abbreviation %s not found' % abbreviation)
+        return team
 
     def __call__(self, abbreviation):
         """
@@ -835,7 +887,7 @@ class Teams:
         """Returns the number of NCAAF teams for a given season."""
         return len(self._teams)
 
-    def _instantiate_teams(self, team_data_dict, year):
+    def _instantiate_teams(self, team_data_dict, year, lazy=False):
         """
         Create a Team instance for all teams.
 
@@ -850,6 +902,9 @@ class Teams:
             well as team rankings, indexed by team abbreviation.
         year : string
             A ``string`` of the requested year to pull stats from.
+        lazy : boolean (optional)
+            Set to True to only parse each team's fields the first time they
+            are read.
         """
         if not team_data_dict:
             return
@@ -860,8 +915,11 @@ class Teams:
                 conference = self._conferences_dict[team_name.lower()]
             team = Team(team_data=team_data['data'],
                         team_conference=conference,
-                        year=year)
+                        year=year,
+                        lazy=lazy)
             self._teams.append(team)
+        # Index every team up front so looking one up is a single access.
+        utils._keyed(self, self._teams, 'abbreviation')
 
     @property
     def dataframes(self):
@@ -869,7 +927,5 @@ class Teams:
         Returns a pandas DataFrame where each row is a representation of the
         Team class. Rows are indexed by the team abbreviation.
         """
-        frames = []
-        for team in self.__iter__():
-            frames.append(team.dataframe)
-        return pd.concat(frames)
+        return utils._build_dataframe(utils._frame_row(team)
+                                      for team in self.__iter__())
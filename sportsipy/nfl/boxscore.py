@@ -3,7 +3,8 @@ import re
 from datetime import datetime
 from pyquery import PyQuery as pq
 from urllib.error import HTTPError
-from .. import utils
+from .. import parsing, records, utils
+from ..concurrency import _fetch_boxscores
 from ..constants import AWAY, HOME
 from ..decorators import int_property_decorator
 from .constants import (BOXSCORE_ELEMENT_INDEX,
@@ -70,11 +71,15 @@ class BoxscorePlayer(AbstractPlayer):
     player_name : string
         A string representing the player's first and last name, such as 'David
         Blough'.
-    player_data : string
-        A string representation of the player's HTML data from the Boxscore
-        page. If the player appears in multiple tables, all of their
-        information will appear in one single string concatenated together.
+    player_data : list
+        A list of the row elements containing the player's data from the
+        Boxscore page. If the player appears in multiple tables, the rows from
+        every table are included.
     """
+    __slots__ = ('_index', '_yards_lost_from_sacks', '_fumbles_lost',
+                 '_combined_tackles', '_solo_tackles', '_tackles_for_loss',
+                 '_quarterback_hits', '_average_kickoff_return_yards')
+
     def __init__(self, player_id, player_name, player_data):
         self._index = 0
         self._yards_lost_from_sacks = None
@@ -209,7 +214,7 @@ class BoxscorePlayer(AbstractPlayer):
         return self._average_kickoff_return_yards
 
 
-class Boxscore:
+class Boxscore(records._SlotRecord):
     """
     Detailed information about the final statistics for a game.
 
@@ -222,8 +227,45 @@ class Boxscore:
     uri : string
         The relative link to the boxscore HTML page, such as
         '201802040nwe'.
+    lazy : boolean (optional)
+        Set to True to only parse each field the first time it is read instead
+        of parsing every field as soon as the boxscore is created. Defaults to
+        False.
+    page : string (optional)
+        The contents of the boxscore page if it has already been downloaded,
+        in which case the page isn't downloaded again.
     """
-    def __init__(self, uri):
+    __slots__ = ('_uri', '_date', '_time', '_stadium', '_attendance',
+                 '_duration', '_away_name', '_home_name', '_winner',
+                 '_winning_name', '_winning_abbr', '_losing_name',
+                 '_losing_abbr', '_summary', '_won_toss', '_roof', '_surface',
+                 '_weather', '_vegas_line', '_over_under', '_away_points',
+                 '_away_first_downs', '_away_rush_attempts',
+                 '_away_rush_yards', '_away_rush_touchdowns',
+                 '_away_pass_completions', '_away_pass_attempts',
+                 '_away_pass_yards', '_away_pass_touchdowns',
+                 '_away_interceptions', '_away_times_sacked',
+                 '_away_yards_lost_from_sacks', '_away_net_pass_yards',
+                 '_away_total_yards', '_away_fumbles', '_away_fumbles_lost',
+                 '_away_turnovers', '_away_penalties',
+                 '_away_yards_from_penalties', '_away_third_down_conversions',
+                 '_away_third_down_attempts', '_away_fourth_down_conversions',
+                 '_away_fourth_down_attempts', '_away_time_of_possession',
+                 '_home_points', '_home_first_downs', '_home_rush_attempts',
+                 '_home_rush_yards', '_home_rush_touchdowns',
+                 '_home_pass_completions', '_home_pass_attempts',
+                 '_home_pass_yards', '_home_pass_touchdowns',
+                 '_home_interceptions', '_home_times_sacked',
+                 '_home_yards_lost_from_sacks', '_home_net_pass_yards',
+                 '_home_total_yards', '_home_fumbles', '_home_fumbles_lost',
+                 '_home_turnovers', '_home_penalties',
+                 '_home_yards_from_penalties', '_home_third_down_conversions',
+                 '_home_third_down_attempts', '_home_fourth_down_conversions',
+                 '_home_fourth_down_attempts', '_home_time_of_possession',
+                 '_away_abbr', '_home_abbr', '_away_players', '_home_players',
+                 '_pending_fields')
+
+    def __init__(self, uri, lazy=False, page=None):
         self._uri = uri
         self._date = None
         self._time = None
@@ -293,7 +335,7 @@ class Boxscore:
         self._home_fourth_down_attempts = None
         self._home_time_of_possession = None
 
-        self._parse_game_data(uri)
+        self._parse_game_data(uri, lazy, page=page)
 
     def __str__(self):
         """
@@ -308,7 +350,13 @@ class Boxscore:
         """
         return self.__str__()
 
-    def _retrieve_html_page(self, uri):
+    def __getattr__(self, name):
+        """
+        Parse a field the first time it is read if parsing lazily.
+        """
+        return utils._parse_pending_field(self, name)
+
+    def _retrieve_html_page(self, uri, page=None):
         """
         Download the requested HTML page.
 
@@ -321,6 +369,9 @@ class Boxscore:
         uri : string
             The relative link to the boxscore HTML page, such as
             '201802040nwe'.
+        page : string (optional)
+            The contents of the boxscore page if it has already been
+            downloaded.
 
         Returns
         -------
@@ -328,16 +379,18 @@ class Boxscore:
             The requested page is returned as a queriable PyQuery object with
             the comment tags removed.
         """
+        if page is not None:
+            return utils._expand_html_comments(pq(page))
         url = BOXSCORE_URL % uri
         try:
-            url_data = pq(url)
+            url_data = utils._pull_page(url)
         except HTTPError:
             return None
         # For NFL, a 404 page doesn't actually raise a 404 error, so it needs
         # to be manually checked.
         if '404 error' in str(url_data):
             return None
-        return pq(utils._remove_html_comment_tags(url_data))
+        return utils._expand_html_comments(url_data)
 
     def _parse_game_details(self, boxscore):
         """
@@ -514,7 +567,7 @@ class Boxscore:
         valid_tables = ['player_offense', 'player_defense', 'returns',
                         'kicking']
 
-        for table in boxscore('table').items():
+        for table in parsing.get_engine().find(boxscore, 'table').items():
             if table.attr['id'] in valid_tables:
                 tables.append(table)
         return tables
@@ -597,9 +650,9 @@ class Boxscore:
 
         Since each player generally has a couple of rows worth of stats
         (rushing, passing, defense, and more) on the boxscore page, both rows
-        should be combined into a single string object to easily query all
-        fields from a single object instead of determining which row to pull
-        metrics from.
+        should be combined into a single list of row elements to easily query
+        all fields from a single object instead of determining which row to
+        pull metrics from.
 
         Parameters
         ----------
@@ -628,11 +681,11 @@ class Boxscore:
             name = self._find_player_name(row)
             home_or_away = self._find_home_or_away(row)
             try:
-                player_dict[player_id]['data'] += str(row).strip()
+                player_dict[player_id]['data'] += row
             except KeyError:
                 player_dict[player_id] = {
                     'name': name,
-                    'data': str(row).strip(),
+                    'data': list(row),
                     'team': home_or_away
                 }
         return player_dict
@@ -651,8 +704,8 @@ class Boxscore:
             A dictionary containing information for every player on the
             boxscores page. Each key is a string containing the player's ID
             and each value is a dictionary with the player's full name, a
-            string representation of their HTML stats, and a string constant
-            denoting which team they play for as the values.
+            list of the row elements containing their stats, and a string
+            constant denoting which team they play for as the values.
 
         Returns
         -------
@@ -733,7 +786,39 @@ class Boxscore:
             return None, None
         return abbreviations
 
-    def _parse_game_data(self, uri):
+    def _parse_boxscore_field(self, field, boxscore_index):
+        """
+        Parse the value of a single attribute.
+
+        Parameters
+        ----------
+        field : string
+            The name of the attribute to parse, such as '_away_points'.
+        boxscore_index : _RowIndex
+            An index of every cell on the boxscore page.
+
+        Returns
+        -------
+        string
+            The value of the attribute according to the parsing scheme.
+        """
+        boxscore = boxscore_index.html
+        # Remove the '_' from the name
+        short_field = str(field)[1:]
+        if short_field == 'away_name' or \
+           short_field == 'home_name':
+            return self._parse_name(short_field, boxscore)
+        if short_field == 'summary':
+            return self._parse_summary(boxscore)
+        index = 0
+        if short_field in BOXSCORE_ELEMENT_INDEX.keys():
+            index = BOXSCORE_ELEMENT_INDEX[short_field]
+        return utils._parse_field(BOXSCORE_SCHEME,
+                                  boxscore_index,
+                                  short_field,
+                                  index)
+
+    def _parse_game_data(self, uri, lazy=False, page=None):
         """
         Parses a value for every attribute.
 
@@ -750,63 +835,48 @@ class Boxscore:
         uri : string
             The relative link to the boxscore HTML page, such as
             '201802040nwe'.
+        lazy : boolean (optional)
+            Set to True to only parse each field the first time it is read.
+        page : string (optional)
+            The contents of the boxscore page if it has already been
+            downloaded.
         """
-        boxscore = self._retrieve_html_page(uri)
+        boxscore = self._retrieve_html_page(uri, page)
         # If the boxscore is None, the game likely hasn't been played yet and
         # no information can be gathered. As there is nothing to grab, the
         # class instance should just be empty.
         if not boxscore:
             return
 
-        for field in self.__dict__:
-            # Remove the '_' from the name
-            short_field = str(field)[1:]
-            if short_field == 'winner' or \
-               short_field == 'winning_name' or \
-               short_field == 'winning_abbr' or \
-               short_field == 'losing_name' or \
-               short_field == 'losing_abbr' or \
-               short_field == 'uri' or \
-               short_field == 'date' or \
-               short_field == 'time' or \
-               short_field == 'stadium' or \
-               short_field == 'attendance' or \
-               short_field == 'duration' or \
-               short_field == 'won_toss' or \
-               short_field == 'roof' or \
-               short_field == 'surface' or \
-               short_field == 'weather' or \
-               short_field == 'vegas_line' or \
-               short_field == 'over_under':
-                continue
-            if short_field == 'away_name' or \
-               short_field == 'home_name':
-                value = self._parse_name(short_field, boxscore)
-                setattr(self, field, value)
-                continue
-            if short_field == 'summary':
-                value = self._parse_summary(boxscore)
-                setattr(self, field, value)
-                continue
-            index = 0
-            if short_field in BOXSCORE_ELEMENT_INDEX.keys():
-                index = BOXSCORE_ELEMENT_INDEX[short_field]
-            value = utils._parse_field(BOXSCORE_SCHEME,
-                                       boxscore,
-                                       short_field,
-                                       index)
-            setattr(self, field, value)
+        # Every cell on the page is indexed by its data-stat attribute once so
+        # the fields don't each search the entire page.
+        boxscore_index = utils._RowIndex(boxscore)
+        skipped_fields = ['winner', 'winning_name', 'winning_abbr',
+                          'losing_name', 'losing_abbr', 'uri', 'date', 'time',
+                          'stadium', 'attendance', 'duration', 'won_toss',
+                          'roof', 'surface', 'weather', 'vegas_line',
+                          'over_under']
+        fields = [field for field in records._fields(self)
+                  if str(field)[1:] not in skipped_fields]
+        utils._parse_fields(self, fields, self._parse_boxscore_field,
+                            boxscore_index, lazy=lazy)
         self._parse_game_date_and_location(boxscore)
         self._parse_game_details(boxscore)
         self._away_abbr, self._home_abbr = self._alt_abbreviations(boxscore)
-        self._away_players, self._home_players = self._find_players(boxscore)
+        utils._parse_fields(self, ['_away_players', '_home_players'],
+                            self._find_players, boxscore, together=True,
+                            lazy=lazy)
 
-    @property
-    def dataframe(self):
+    def _dataframe_row(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the string URI that is used to
-        instantiate the class, such as '201802040nwe'.
+        Gather the values of every field included in the DataFrame.
+
+        Returns
+        -------
+        tuple
+            A ``tuple`` of the row's index and a ``dictionary`` of every
+            field's value keyed by column name, or None if the boxscore has no
+            data.
         """
         for points in [self._away_points, self._home_points]:
             if points is None or points == '':
@@ -878,7 +948,16 @@ class Boxscore:
             'winning_name': self.winning_name,
             'won_toss': self.won_toss
         }
-        return pd.DataFrame([fields_to_include], index=[self._uri])
+        return self._uri, fields_to_include
+
+    @property
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the string URI that is used to
+        instantiate the class, such as '201802040nwe'.
+        """
+        return utils._build_dataframe([self._dataframe_row()])
 
     @property
     def away_players(self):
@@ -1518,6 +1597,38 @@ class Boxscores:
         """
         return self._boxscores
 
+    @classmethod
+    async def fetch(cls, week, year, end_week=None, concurrency=None):
+        """
+        Search for NFL games without blocking the event loop.
+
+        Behaves the same as creating a new instance of the class, except the
+        page for every week in the range is downloaded concurrently, which is
+        much faster when searching a large range of weeks.
+
+        Parameters
+        ----------
+        week : int
+            The week number to pull games from.
+        year : int
+            The 4-digit year to pull games from.
+        end_week : int (optional)
+            Optionally specify an end week to iterate until. If left empty, or
+            if 'end_week' is prior to 'week', only the games from the week
+            specified in the 'week' parameter will be saved.
+        concurrency : int (optional)
+            The maximum number of pages to download at once. Defaults to the
+            maximum number of connections kept open to a single host.
+
+        Returns
+        -------
+        Boxscores instance
+            A ``Boxscores`` instance containing every game in the range.
+        """
+        boxscores = cls.__new__(cls)
+        pages = boxscores._find_pages(week, year, end_week)
+        return await _fetch_boxscores(boxscores, pages, concurrency)
+
     def _create_url(self, week, year):
         """
         Build the URL based on the passed week number.
@@ -1558,7 +1669,7 @@ class Boxscores:
             A PyQuery object containing the HTML contents of the requested
             page.
         """
-        return pq(url)
+        return utils._pull_page(url)
 
     def _get_boxscore_uri(self, url):
         """
@@ -1779,6 +1890,37 @@ class Boxscores:
             all_boxscores.append(game_info)
         return all_boxscores
 
+    def _find_pages(self, week, year, end_week):
+        """
+        Determine which pages need to be downloaded for a range of weeks.
+
+        Parameters
+        ----------
+        week : int
+            The first week number to pull games from.
+        year : int
+            The 4-digit year to pull games from.
+        end_week : int
+            The last week number to pull games from. If left empty, or if
+            'end_week' is prior to 'week', only the page for 'week' is
+            included.
+
+        Returns
+        -------
+        list
+            A ``list`` of tuples of the string week in format 'W-YYYY' and the
+            URL of the page listing the games played during that week, for
+            each week in the range.
+        """
+        if not end_week or week > end_week:
+            end_week = week
+        pages = []
+        while week <= end_week:
+            timestamp = '%s-%s' % (week, year)
+            pages.append((timestamp, self._create_url(week, year)))
+            week += 1
+        return pages
+
     def _find_games(self, week, year, end_week):
         """
         Retrieve all major games played for a given week.
@@ -1803,13 +1945,5 @@ class Boxscores:
             the games from the day specified in the 'date' parameter will be
             saved.
         """
-        if not end_week or week > end_week:
-            end_week = week
-        while week <= end_week:
-            url = self._create_url(week, year)
-            page = self._get_requested_page(url)
-            games = page('table[class="teams"]').items()
-            boxscores = self._extract_game_info(games)
-            timestamp = '%s-%s' % (week, year)
-            self._boxscores[timestamp] = boxscores
-            week += 1
+        pages = self._find_pages(week, year, end_week)
+        utils._find_boxscore_games(self, pages)
@@ -4,7 +4,8 @@ from functools import wraps
 from lxml.etree import ParserError, XMLSyntaxError
 from pyquery import PyQuery as pq
 from urllib.error import HTTPError
-from .. import utils
+from .. import records, utils
+from ..decorators import _convert_item
 from .constants import PLAYER_SCHEME, PLAYER_URL, ROSTER_URL
 
 
@@ -20,18 +21,25 @@ def _cleanup(prop):
         return ''
 
 
+def _to_int(prop):
+    return int(_cleanup(prop))
+
+
+def _to_float(prop):
+    return float(_cleanup(prop))
+
+
 def _int_property_decorator(func):
     @property
     @wraps(func)
     def wrapper(*args):
         index = args[0]._index
         prop = func(*args)
-        value = _cleanup(prop[index])
-        try:
-            return int(value)
-        except (ValueError, TypeError, IndexError):
-            # If there is no value, default to None
-            return None
+        # If there is no value, default to None
+        value = prop[index]
+        if type(value) is int:
+            return value
+        return _convert_item(args[0], func.__name__, prop, index, _to_int)
     return wrapper
 
 
@@ -41,16 +49,15 @@ def _float_property_decorator(func):
     def wrapper(*args):
         index = args[0]._index
         prop = func(*args)
-        value = _cleanup(prop[index])
-        try:
-            return float(value)
-        except (ValueError, TypeError, IndexError):
-            # If there is no value, default to None
-            return None
+        # If there is no value, default to None
+        value = prop[index]
+        if type(value) is float:
+            return value
+        return _convert_item(args[0], func.__name__, prop, index, _to_float)
     return wrapper
 
 
-class AbstractPlayer:
+class AbstractPlayer(records._SlotRecord):
     """
     Get player information and stats for all seasons.
 
@@ -77,11 +84,34 @@ class AbstractPlayer:
     player_name : string
         A string representing the player's first and last name, such as 'Drew
         Brees'.
-    player_data : string
-        A string representation of the player's HTML data from the Boxscore
-        page. If the player appears in multiple tables, all of their
-        information will appear in one single string concatenated together.
+    player_data : list
+        A list of the row elements containing the player's data from the
+        Boxscore page. If the player appears in multiple tables, the rows from
+        every table are included.
     """
+    __slots__ = ('_player_id', '_name', '_completed_passes',
+                 '_attempted_passes', '_passing_yards', '_passing_touchdowns',
+                 '_interceptions_thrown', '_longest_pass',
+                 '_quarterback_rating', '_times_sacked', '_rush_attempts',
+                 '_rush_yards', '_rush_touchdowns', '_longest_rush',
+                 '_times_pass_target', '_receptions', '_receiving_yards',
+                 '_receiving_yards_per_reception', '_receiving_touchdowns',
+                 '_longest_reception', '_fumbles', '_punt_returns',
+                 '_punt_return_yards', '_punt_return_touchdown',
+                 '_longest_punt_return', '_yards_per_punt_return',
+                 '_kickoff_returns', '_kickoff_return_yards',
+                 '_kickoff_return_touchdown', '_longest_kickoff_return',
+                 '_field_goals_attempted', '_field_goals_made',
+                 '_extra_points_attempted', '_extra_points_made', '_punts',
+                 '_total_punt_yards', '_longest_punt', '_yards_per_punt',
+                 '_interceptions', '_yards_returned_from_interception',
+                 '_interceptions_returned_for_touchdown',
+                 '_longest_interception_return', '_passes_defended',
+                 '_fumbles_forced', '_fumbles_recovered',
+                 '_yards_recovered_from_fumble',
+                 '_fumbles_recovered_for_touchdown', '_sacks',
+                 '_assists_on_tackles')
+
     def __init__(self, player_id, player_name, player_data):
         self._player_id = player_id
         self._name = player_name
@@ -152,9 +182,8 @@ class AbstractPlayer:
 
         Parameters
         ----------
-        stats : PyQuery object
-            A PyQuery object containing all stats in HTML format for a
-            particular player.
+        stats : _RowIndex
+            An index of all stats in HTML format for a particular player.
         field : string
             A string of the field to parse from the HTML.
 
@@ -174,15 +203,23 @@ class AbstractPlayer:
 
         Parameters
         ----------
-        player_data : dictionary or string
+        player_data : dictionary or list
             If this class is inherited from the ``Player`` class, player_data
             will be a dictionary where each key is a string representing the
-            season and each value contains the HTML data as a string. If this
-            class is inherited from the ``BoxscorePlayer`` class, player_data
-            will be a string representing the player's game statistics in HTML
-            format.
-        """
-        for field in self.__dict__:
+            season and each value contains a list of the row elements with the
+            player's stats. If this class is inherited from the
+            ``BoxscorePlayer`` class, player_data will be a list of the row
+            elements with the player's game statistics.
+        """
+        # Parse the HTML for every season once up front instead of once for
+        # every field.
+        if type(player_data) == dict:
+            seasons = [utils._RowIndex(pq(data['data']),
+                                       combined=True)
+                       for data in player_data.values()]
+        else:
+            seasons = [utils._RowIndex(pq(player_data), combined=True)]
+        for field in records._fields(self):
             short_field = str(field)[1:]
             if short_field == 'player_id' or \
                short_field == 'index' or \
@@ -195,16 +232,8 @@ class AbstractPlayer:
                short_field == 'detailed_stats_seasons' or \
                short_field == 'detailed_stats_index':
                 continue
-            field_stats = []
-            if type(player_data) == dict:
-                for year, data in player_data.items():
-                    stats = pq(data['data'])
-                    value = self._parse_value(stats, short_field)
-                    field_stats.append(value)
-            else:
-                stats = pq(player_data)
-                value = self._parse_value(stats, short_field)
-                field_stats.append(value)
+            field_stats = [self._parse_value(stats, short_field)
+                           for stats in seasons]
             setattr(self, field, field_stats)
 
     @property
@@ -2,10 +2,14 @@ import pandas as pd
 import re
 from functools import wraps
 from lxml.etree import ParserError, XMLSyntaxError
-from pyquery import PyQuery as pq
 from urllib.error import HTTPError
-from .. import utils
-from .constants import PLAYER_SCHEME, PLAYER_URL, ROSTER_URL, DETAILED_STATS
+from .. import concurrency, records, utils
+from ..decorators import _convert_item
+from .constants import (PLAYER_SCHEME,
+                        PLAYER_URL,
+                        ROSTER_URL,
+                        DETAILED_STATS,
+                        SEASON_PAGE_URL)
 from .player import AbstractPlayer
 
 
@@ -21,6 +25,14 @@ def _cleanup(prop):
         return ''
 
 
+def _to_int(prop):
+    return int(_cleanup(prop))
+
+
+def _to_float(prop):
+    return float(_cleanup(prop))
+
+
 def _int_property_decorator(func):
     @property
     @wraps(func)
@@ -31,11 +43,13 @@ def _int_property_decorator(func):
             index = args[0]._index
         prop = func(*args)
         try:
-            value = _cleanup(prop[index])
-            return int(value)
-        except (ValueError, TypeError, IndexError):
+            value = prop[index]
+        except (TypeError, IndexError):
             # If there is no value, default to None
             return None
+        if type(value) is int:
+            return value
+        return _convert_item(args[0], func.__name__, prop, index, _to_int)
     return wrapper
 
 
@@ -49,11 +63,13 @@ def _float_property_decorator(func):
             index = args[0]._index
         prop = func(*args)
         try:
-            value = _cleanup(prop[index])
-            return float(value)
-        except (ValueError, TypeError, IndexError):
+            value = prop[index]
+        except (TypeError, IndexError):
             # If there is no value, default to None
             return None
+        if type(value) is float:
+            return value
+        return _convert_item(args[0], func.__name__, prop, index, _to_float)
     return wrapper
 
 
@@ -275,14 +291,14 @@ class Player(AbstractPlayer):
         """
         url = self._build_url()
         try:
-            url_data = pq(url)
+            url_data = utils._pull_page(url)
         except (HTTPError, ParserError):
             return None
         # For NFL, a 404 page doesn't actually raise a 404 error, so it needs
         # to be manually checked.
         if 'Page Not Found (404 error)' in str(url_data):
             return None
-        return pq(utils._remove_html_comment_tags(url_data))
+        return utils._expand_html_comments(url_data)
 
     def _parse_season(self, row):
         """
@@ -325,8 +341,8 @@ class Player(AbstractPlayer):
         all_stats_dict : dictionary
             A dictionary of all stats separated by season where each key is the
             season ``string``, such as '2017', and the value is a
-            ``dictionary`` with a ``string`` of 'data' and ``string``
-            containing all of the data.
+            ``dictionary`` with a ``string`` of 'data' and a ``list`` of the
+            row elements containing all of the data.
         detailed : boolean
             A boolean which evaluates to True if the passed table is one of the
             advanced stats tables which is labeled as 'detailed' on the site.
@@ -344,9 +360,9 @@ class Player(AbstractPlayer):
         for row in table_rows:
             season = self._parse_season(row)
             try:
-                all_stats_dict[season]['data'] += str(row)
+                all_stats_dict[season]['data'] += row
             except KeyError:
-                all_stats_dict[season] = {'data': str(row)}
+                all_stats_dict[season] = {'data': list(row)}
             # Create a list of detailed stats which aren't populated for all
             # seasons a player has been active.
             if detailed:
@@ -361,10 +377,10 @@ class Player(AbstractPlayer):
         if not career_stats:
             return all_stats_dict
         try:
-            all_stats_dict['Career']['data'] += str(next(career_stats))
+            all_stats_dict['Career']['data'] += next(career_stats)
         except KeyError:
             try:
-                all_stats_dict['Career'] = {'data': str(next(career_stats))}
+                all_stats_dict['Career'] = {'data': list(next(career_stats))}
             # Occurs when the player doesn't have any career stats listed on
             # their page in error.
             except StopIteration:
@@ -705,8 +721,10 @@ class Player(AbstractPlayer):
         indices = []
         if not self._season:
             return None
-        for season in self._season:
-            self._index = self._season.index(season)
+        # Every row is read from the first occurrence of its season.
+        for season, index in zip(self._season,
+                                 utils._first_indices(self._season)):
+            self._index = index
             rows.append(self._dataframe_fields())
             indices.append(season)
         self._index = temp_index
@@ -1684,7 +1702,7 @@ class Player(AbstractPlayer):
         return self._safeties
 
 
-class Roster:
+class Roster(records._Record):
     """
     Get stats for all players on a roster.
 
@@ -1704,10 +1722,16 @@ class Roster:
         the name and player ID for each player as opposed to all of their
         respective stats which greatly reduces the time to return a response if
         just the names and IDs are desired. Defaults to False.
+    workers : int (optional)
+        Set to the number of threads to use to download and parse the pages
+        for every player on the roster concurrently. Players are still listed
+        in roster order. Has no effect when ``slim`` is True. Defaults to
+        downloading each player serially.
     """
-    def __init__(self, team, year=None, slim=False):
+    def __init__(self, team, year=None, slim=False, workers=None):
         self._team = team
         self._slim = slim
+        self._workers = workers
         self._coach = None
         if slim:
             self._players = {}
@@ -1747,7 +1771,7 @@ class Roster:
             Returns a PyQuery object of the team's HTML page.
         """
         try:
-            return pq(utils._remove_html_comment_tags(pq(url)))
+            return utils._expand_html_comments(utils._pull_page(url))
         except HTTPError:
             return None
 
@@ -1853,29 +1877,29 @@ class Roster:
             from.
         """
         if not year:
-            year = utils._find_year_for_season('nfl')
             # If stats for the requested season do not exist yet (as is the
-            # case right before a new season begins), attempt to pull the
-            # previous year's stats. If it exists, use the previous year
-            # instead.
-            if not utils._url_exists(self._create_url(year)) and \
-               utils._url_exists(self._create_url(str(int(year) - 1))):
-                year = str(int(year) - 1)
+            # case right before a new season begins), the previous year's
+            # stats are used instead.
+            year = utils._find_default_season(
+                'nfl', lambda x: SEASON_PAGE_URL % x, self._create_url)
         url = self._create_url(year)
         page = self._pull_team_page(url)
         if not page:
             output = ("Can't pull requested team page. Ensure the following "
                       "URL exists: %s" % url)
             raise ValueError(output)
+        player_ids = []
         for player in page('table#games_played_team tbody tr').items():
             player_id = self._get_id(player)
             if self._slim:
                 name = self._get_name(player)
                 self._players[player_id] = name
             else:
-                player_instance = Player(player_id)
-                self._players.append(player_instance)
+                player_ids.append(player_id)
 
+        if not self._slim:
+            self._players = concurrency._run_concurrently(Player, player_ids,
+                                                          self._workers)
         self._coach = self._parse_coach(page)
 
     @property
@@ -1,11 +1,13 @@
-import pandas as pd
 import re
-from ..decorators import float_property_decorator, int_property_decorator
-from .constants import (SCHEDULE_SCHEME,
-                        SCHEDULE_URL)
+from ..decorators import (cached_property_decorator,
+                          float_property_decorator,
+                          int_property_decorator)
+from .constants import (BOXSCORE_URL,
+                        SCHEDULE_SCHEME,
+                        SCHEDULE_URL,
+                        SEASON_PAGE_URL)
 from datetime import datetime
-from pyquery import PyQuery as pq
-from sportsipy import utils
+from sportsipy import concurrency, records, utils
 from sportsipy.constants import (WIN,
                                  LOSS,
                                  TIE,
@@ -22,7 +24,7 @@ from sportsipy.nfl.constants import (CONF_CHAMPIONSHIP,
                                      WILD_CARD)
 
 
-class Game:
+class Game(records._SlotRecord):
     """
     A representation of a matchup between two teams.
 
@@ -41,8 +43,28 @@ class Game:
         bulk of the season took place. For example the Super Bowl for the
         2017 season took place in early Feburary 2018, but 2017 should be
         passed as that was the year the bulk of the season was played in.
+    lazy : boolean (optional)
+        Set to True to only parse each field the first time it is read instead
+        of parsing every field as soon as the game is created. Defaults to
+        False.
     """
-    def __init__(self, game_data, game_type, year):
+    __slots__ = ('_year', '_week', '_day', '_date', '_boxscore', '_type',
+                 '_datetime', '_result', '_overtime', '_location',
+                 '_opponent_abbr', '_opponent_name', '_points_scored',
+                 '_points_allowed', '_pass_completions', '_pass_attempts',
+                 '_pass_yards', '_pass_touchdowns', '_interceptions',
+                 '_times_sacked', '_yards_lost_from_sacks',
+                 '_pass_yards_per_attempt', '_pass_completion_rate',
+                 '_quarterback_rating', '_rush_attempts', '_rush_yards',
+                 '_rush_yards_per_attempt', '_rush_touchdowns',
+                 '_field_goals_made', '_field_goals_attempted',
+                 '_extra_points_made', '_extra_points_attempted', '_punts',
+                 '_punt_yards', '_third_down_conversions',
+                 '_third_down_attempts', '_fourth_down_conversions',
+                 '_fourth_down_attempts', '_time_of_possession',
+                 '_pending_fields')
+
+    def __init__(self, game_data, game_type, year, lazy=False):
         self._year = year
         self._week = None
         self._day = None
@@ -83,7 +105,7 @@ class Game:
         self._fourth_down_attempts = None
         self._time_of_possession = None
 
-        self._parse_game_data(game_data)
+        self._parse_game_data(game_data, lazy)
 
     def __str__(self):
         """
@@ -97,6 +119,12 @@ class Game:
         """
         return self.__str__()
 
+    def __getattr__(self, name):
+        """
+        Parse a field the first time it is read if parsing lazily.
+        """
+        return utils._parse_pending_field(self, name)
+
     def _parse_abbreviation(self, game_data):
         """
         Parses the opponent's abbreviation from their name.
@@ -131,7 +159,34 @@ class Game:
         boxscore = re.sub(r'\.htm.*', '', str(boxscore))
         setattr(self, '_boxscore', boxscore)
 
-    def _parse_game_data(self, game_data):
+    def _parse_game_field(self, field, row):
+        """
+        Parse the value of a single attribute.
+
+        Parameters
+        ----------
+        field : string
+            The name of the attribute to parse, such as '_date'.
+        row : _RowIndex
+            An index of the row containing the information specific to a
+            game.
+
+        Returns
+        -------
+        string
+            The value of the attribute according to the parsing scheme.
+        """
+        # Remove the leading '_' from the name
+        short_name = str(field)[1:]
+        if short_name == 'opponent_abbr':
+            self._parse_abbreviation(row.html)
+            return self._opponent_abbr
+        if short_name == 'boxscore':
+            self._parse_boxscore(row.html)
+            return self._boxscore
+        return utils._parse_field(SCHEDULE_SCHEME, row, short_name)
+
+    def _parse_game_data(self, game_data, lazy=False):
         """
         Parses a value for every attribute.
 
@@ -148,28 +203,25 @@ class Game:
         ----------
         game_data : string
             A string containing all of the rows of stats for a given game.
+        lazy : boolean (optional)
+            Set to True to only parse each field the first time it is read.
         """
-        for field in self.__dict__:
-            # Remove the leading '_' from the name
-            short_name = str(field)[1:]
-            if short_name == 'datetime' or \
-               short_name == 'type' or \
-               short_name == 'year':
-                continue
-            if short_name == 'opponent_abbr':
-                self._parse_abbreviation(game_data)
-                continue
-            elif short_name == 'boxscore':
-                self._parse_boxscore(game_data)
-                continue
-            value = utils._parse_field(SCHEDULE_SCHEME, game_data, short_name)
-            setattr(self, field, value)
+        row = utils._RowIndex(game_data)
+        fields = [field for field in records._fields(self)
+                  if field not in ('_datetime', '_type', '_year')]
+        utils._parse_fields(self, fields, self._parse_game_field, row,
+                            lazy=lazy)
 
-    @property
-    def dataframe(self):
+    def _dataframe_row(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the boxscore string.
+        Gather the values of every field included in the DataFrame.
+
+        Returns
+        -------
+        tuple
+            A ``tuple`` of the row's index and a ``dictionary`` of every
+            field's value keyed by column name, or None if the game has no
+            data.
         """
         if self._points_scored is None and self._points_allowed is None:
             return None
@@ -213,7 +265,35 @@ class Game:
             'week': self.week,
             'yards_lost_from_sacks': self.yards_lost_from_sacks
         }
-        return pd.DataFrame([fields_to_include], index=[self._boxscore])
+        return self._boxscore, fields_to_include
+
+    @property
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the boxscore string.
+        """
+        return utils._build_dataframe([self._dataframe_row()])
+
+    def _dataframe_extended_row(self, page=None):
+        """
+        Gather the values of every field included in the extended DataFrame.
+
+        Parameters
+        ----------
+        page : string (optional)
+            The contents of the game's boxscore page if it has already been
+            downloaded. Defaults to downloading the page.
+
+        Returns
+        -------
+        tuple or Pandas DataFrame
+            The row of the game's boxscore as returned by
+            ``utils._frame_row``, or None if the game has no data.
+        """
+        if page is None:
+            return utils._frame_row(self.boxscore)
+        return utils._frame_row(Boxscore(self._boxscore, page=page))
 
     @property
     def dataframe_extended(self):
@@ -223,7 +303,7 @@ class Game:
         but takes longer to process compared to the lighter 'dataframe'
         property. The index for the DataFrame is the boxscore string.
         """
-        return self.boxscore.dataframe
+        return utils._build_dataframe([self._dataframe_extended_row()])
 
     @int_property_decorator
     def week(self):
@@ -281,7 +361,7 @@ class Game:
         """
         return self._type
 
-    @property
+    @cached_property_decorator('_datetime')
     def datetime(self):
         """
         Returns a datetime object representing the date the game was played.
@@ -561,7 +641,7 @@ class Game:
         return self._time_of_possession
 
 
-class Schedule:
+class Schedule(records._Record):
     """
     An object of the given team's schedule.
 
@@ -574,10 +654,14 @@ class Schedule:
         A team's short name, such as 'NWE' for the New England Patriots.
     year : string (optional)
         The requested year to pull stats from.
+    lazy : boolean (optional)
+        Set to True to only parse each game's fields the first time they are
+        read instead of parsing every field as soon as the schedule is
+        created. Defaults to False.
     """
-    def __init__(self, abbreviation, year=None):
+    def __init__(self, abbreviation, year=None, lazy=False):
         self._games = []
-        self._pull_schedule(abbreviation, year)
+        self._pull_schedule(abbreviation, year, lazy)
 
     def __getitem__(self, index):
         """
@@ -624,12 +708,11 @@ class Schedule:
             If the requested date cannot be matched with a game in the
             schedule.
         """
-        for game in self._games:
-            if game.datetime.year == date.year and \
-               game.datetime.month == date.month and \
-               game.datetime.day == date.day:
-                return game
-        raise ValueError('No games found for requested date')
+        games = utils._dated(self, self._games)
+        try:
+            return games[(date.year, date.month, date.day)][0]
+        except KeyError:
+            raise ValueError('No games found for requested date')
 
     def __str__(self):
         """
@@ -655,7 +738,7 @@ class Schedule:
         """Returns the number of scheduled games for the given team."""
         return len(self._games)
 
-    def _add_games_to_schedule(self, schedule, game_type, year):
+    def _add_games_to_schedule(self, schedule, game_type, year, lazy=False):
         """
         Add games instances to schedule.
 
@@ -671,12 +754,15 @@ class Schedule:
             of the regular season or the playoffs.
         year : string
             The requested year to pull stats from.
+        lazy : boolean (optional)
+            Set to True to only parse each game's fields the first time they
+            are read.
         """
         for item in schedule:
-            game = Game(item, game_type, year)
+            game = Game(item, game_type, year, lazy=lazy)
             self._games.append(game)
 
-    def _pull_schedule(self, abbreviation, year):
+    def _pull_schedule(self, abbreviation, year, lazy=False):
         """
         Download and create objects for the team's schedule.
 
@@ -691,28 +777,27 @@ class Schedule:
             A team's short name, such as 'NWE' for the New England Patriots.
         year : string
             The requested year to pull stats from.
+        lazy : boolean (optional)
+            Set to True to only parse each game's fields the first time they
+            are read.
         """
         if not year:
-            year = utils._find_year_for_season('nfl')
             # If stats for the requested season do not exist yet (as is the
-            # case right before a new season begins), attempt to pull the
-            # previous year's stats. If it exists, use the previous year
-            # instead.
-            if not utils._url_exists(SCHEDULE_URL % (abbreviation.lower(),
-                                                     year)) and \
-               utils._url_exists(SCHEDULE_URL % (abbreviation.lower(),
-                                                 str(int(year) - 1))):
-                year = str(int(year) - 1)
-        doc = pq(SCHEDULE_URL % (abbreviation.lower(), year))
+            # case right before a new season begins), the previous year's
+            # stats are used instead.
+            year = utils._find_default_season(
+                'nfl', lambda x: SEASON_PAGE_URL % x,
+                lambda x: SCHEDULE_URL % (abbreviation.lower(), x))
+        doc = utils._pull_page(SCHEDULE_URL % (abbreviation.lower(), year))
         schedule = utils._get_stats_table(doc, 'table#gamelog%s' % year)
         if not schedule:
             utils._no_data_found()
             return
-        self._add_games_to_schedule(schedule, REGULAR_SEASON, year)
+        self._add_games_to_schedule(schedule, REGULAR_SEASON, year, lazy=lazy)
         if 'playoff_gamelog%s' % year in str(doc):
             playoffs = utils._get_stats_table(doc,
                                               'table#playoff_gamelog%s' % year)
-            self._add_games_to_schedule(playoffs, POST_SEASON, year)
+            self._add_games_to_schedule(playoffs, POST_SEASON, year, lazy=lazy)
 
     @property
     def dataframe(self):
@@ -720,14 +805,8 @@ class Schedule:
         Returns a pandas DataFrame where each row is a representation of the
         Game class. Rows are indexed by the boxscore string.
         """
-        frames = []
-        for game in self.__iter__():
-            df = game.dataframe
-            if df is not None:
-                frames.append(df)
-        if frames == []:
-            return None
-        return pd.concat(frames)
+        return utils._build_dataframe(utils._frame_row(game)
+                                      for game in self.__iter__())
 
     @property
     def dataframe_extended(self):
@@ -738,11 +817,37 @@ class Schedule:
         selected game, but takes longer to process compared to the lighter
         'dataframe' property.
         """
-        frames = []
-        for game in self.__iter__():
-            df = game.dataframe_extended
-            if df is not None:
-                frames.append(df)
-        if frames == []:
-            return None
-        return pd.concat(frames)
+        return self.build_dataframe_extended()
+
+    def build_dataframe_extended(self, workers=None, processes=None,
+                                 progress=None):
+        """
+        Returns a pandas DataFrame where each row is a representation of the
+        Boxscore class for every game in the schedule, optionally downloading
+        and parsing the boxscores concurrently. Rows are indexed by the
+        boxscore string and are in schedule order.
+
+        Parameters
+        ----------
+        workers : int (optional)
+            Set to the number of threads to use to download and parse the
+            boxscore for every game concurrently. Defaults to processing each
+            game serially.
+        processes : int (optional)
+            Set to the number of processes to use to parse the boxscores.
+            Every boxscore is downloaded first, using ``workers`` threads,
+            before being parsed in parallel. Defaults to parsing boxscores in
+            the current process.
+        progress : function (optional)
+            A function which is called with the number of processed games and
+            the total number of games every time a game finishes processing.
+
+        Returns
+        -------
+        Pandas DataFrame
+            A DataFrame of every game's boxscore, or None if no games have
+            been played.
+        """
+        rows = concurrency._extended_rows(self._games, BOXSCORE_URL, workers,
+                                          processes, progress)
+        return utils._build_dataframe(rows)
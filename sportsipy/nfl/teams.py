@@ -1,4 +1,3 @@
-import pandas as pd
 import re
 from .constants import (CONF_CHAMPIONSHIP,
                         DIVISION,
@@ -12,13 +11,13 @@ from .constants import (CONF_CHAMPIONSHIP,
                         WON_SUPER_BOWL)
 from ..constants import LOSS, WIN
 from ..decorators import float_property_decorator, int_property_decorator
-from .. import utils
+from .. import records, utils
 from .nfl_utils import _retrieve_all_teams
 from .roster import Roster
 from .schedule import Schedule
 
 
-class Team:
+class Team(records._Record):
     """
     An object containing all of a team's season information.
 
@@ -46,9 +45,13 @@ class Team:
         Optionally specify the filename of a local file to use to pull data
         instead of downloading from sports-reference.com. This file should be
         of the Season page for the designated year.
+    lazy : boolean (optional)
+        Set to True to only parse each stat the first time it is read instead
+        of parsing every stat as soon as the team is created. Defaults to
+        False.
     """
     def __init__(self, team_name=None, team_data=None, rank=None, year=None,
-                 season_page=None):
+                 season_page=None, lazy=False):
         self._year = year
         self._rank = rank
         self._abbreviation = None
@@ -92,7 +95,7 @@ class Team:
 
         if team_name:
             team_data = self._retrieve_team_data(year, team_name, season_page)
-        self._parse_team_data(team_data)
+        self._parse_team_data(team_data, lazy)
 
     def __str__(self):
         """
@@ -106,6 +109,12 @@ class Team:
         """
         return self.__str__()
 
+    def __getattr__(self, name):
+        """
+        Parse a field the first time it is read if parsing lazily.
+        """
+        return utils._parse_pending_field(self, name)
+
     def _retrieve_team_data(self, year, team_name, season_page):
         """
         Pull all stats for a specific team.
@@ -138,7 +147,25 @@ class Team:
         self._rank = team_data_dict[team_name]['rank']
         return team_data
 
-    def _parse_team_data(self, team_data):
+    def _parse_team_field(self, field, row):
+        """
+        Parse the value of a single attribute.
+
+        Parameters
+        ----------
+        field : string
+            The name of the attribute to parse, such as '_points'.
+        row : _RowIndex
+            An index of all of the rows of stats for the team.
+
+        Returns
+        -------
+        string
+            The value of the attribute according to the parsing scheme.
+        """
+        return utils._parse_field(PARSING_SCHEME, row, str(field)[1:])
+
+    def _parse_team_data(self, team_data, lazy=False):
         """
         Parses a value for every attribute.
 
@@ -156,24 +183,27 @@ class Team:
             A string containing all of the rows of stats for a given team. If
             multiple tables are being referenced, this will be comprised of
             multiple rows in a single string.
+        lazy : boolean (optional)
+            Set to True to only parse each field the first time it is read.
         """
-        for field in self.__dict__:
-            # The rank attribute is passed directly to the class during
-            # instantiation.
-            if field == '_rank' or \
-               field == '_year':
-                continue
-            value = utils._parse_field(PARSING_SCHEME,
-                                       team_data,
-                                       str(field)[1:])
-            setattr(self, field, value)
+        row = utils._RowIndex(team_data)
+        # The rank attribute is passed directly to the class during
+        # instantiation.
+        fields = [field for field in records._fields(self)
+                  if field != '_rank' and field != '_year']
+        utils._parse_fields(self, fields, self._parse_team_field, row,
+                            lazy=lazy)
 
-    @property
-    def dataframe(self):
+    def _dataframe_row(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the string abbreviation of the
-        team, such as 'KAN'.
+        Gather the values of every field included in the DataFrame.
+
+        Returns
+        -------
+        tuple
+            A ``tuple`` of the row's index and a ``dictionary`` of every
+            field's value keyed by column name, or None if the team has no
+            data.
         """
         fields_to_include = {
             'abbreviation': self.abbreviation,
@@ -221,7 +251,16 @@ class Team:
             'yards_from_penalties': self.yards_from_penalties,
             'yards_per_play': self.yards_per_play
         }
-        return pd.DataFrame([fields_to_include], index=[self._abbreviation])
+        return self._abbreviation, fields_to_include
+
+    @property
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the string abbreviation of the
+        team, such as 'KAN'.
+        """
+        return utils._build_dataframe([self._dataframe_row()])
 
     @int_property_decorator
     def rank(self):
@@ -574,7 +613,7 @@ class Team:
         return self._points_contributed_by_offense
 
 
-class Teams:
+class Teams(records._Record):
     """
     A list of all NFL teams and their stats in a given year.
 
@@ -591,12 +630,24 @@ class Teams:
         Optionally specify the filename of a local file to use to pull data
         instead of downloading from sports-reference.com. This file should be
         of the Season page for the designated year.
+    stream : boolean (optional)
+        Set to True to stream the stats tables out of each season page instead
+        of parsing the pages in full. Only the rows of the tables used to build
+        every team are kept rather than the whole page being held in memory,
+        and parsing stops as soon as the last requested table ends. Defaults
+        to False.
+    lazy : boolean (optional)
+        Set to True to only parse each team's stats the first time they are
+        read instead of parsing every stat as soon as the teams are created,
+        which makes reading a few stats from every team much faster. Defaults
+        to False.
     """
-    def __init__(self, year=None, season_page=None):
+    def __init__(self, year=None, season_page=None, stream=False, lazy=False):
         self._teams = []
 
-        team_data_dict, year = _retrieve_all_teams(year, season_page)
-        self._instantiate_teams(team_data_dict, year)
+        team_data_dict, year = _retrieve_all_teams(year, season_page,
+                                                   stream)
+        self._instantiate_teams(team_data_dict, year, lazy)
 
     def __getitem__(self, abbreviation):
         """
@@ -621,10 +672,11 @@ class Teams:
         ValueError
             If the requested team is not present within the Teams list.
         """
-        for team in self._teams:
-            if team.abbreviation.upper() == abbreviation.upper():
-                return team
-        raise ValueError('Team abbreviation %s not found' % abbreviation)
+        teams = utils._keyed(self, self._teams, 'abbreviation')
+        team = teams.get(utils._lookup_key(abbreviation))
+        if team is None:
+            raise ValueError('Team abbreviation %s not found' % abbreviation)
+        return team
 
     def __call__(self, abbreviation):
         """
@@ -668,7 +720,7 @@ class Teams:
         """Returns the number of NFL teams for a given season."""
         return len(self._teams)
 
-    def _instantiate_teams(self, team_data_dict, year):
+    def _instantiate_teams(self, team_data_dict, year, lazy=False):
         """
         Create a Team instance for all teams.
 
@@ -683,14 +735,20 @@ class Teams:
             well as team rankings, indexed by team abbreviation.
         year : string
             A ``string`` of the requested year to pull stats from.
+        lazy : boolean (optional)
+            Set to True to only parse each team's fields the first time they
+            are read.
         """
         if not team_data_dict:
             return
         for team_data in team_data_dict.values():
             team = Team(team_data=team_data['data'],
                         rank=team_data['rank'],
-                        year=year)
+                        year=year,
+                        lazy=lazy)
             self._teams.append(team)
+        # Index every team up front so looking one up is a single access.
+        utils._keyed(self, self._teams, 'abbreviation')
 
     @property
     def dataframes(self):
@@ -698,7 +756,5 @@ class Teams:
         Returns a pandas DataFrame where each row is a representation of the
         Team class. Rows are indexed by the team abbreviation.
         """
-        frames = []
-        for team in self.__iter__():
-            frames.append(team.dataframe)
-        return pd.concat(frames)
+        return utils._build_dataframe(utils._frame_row(team)
+                                      for team in self.__iter__())
@@ -3,7 +3,7 @@ from sportsipy import utils
 from .constants import SEASON_PAGE_URL
 
 
-def _retrieve_all_teams(year, season_page=None):
+def _retrieve_all_teams(year, season_page=None, stream=False):
     """
     Find and create Team instances for all teams in the given season.
 
@@ -21,6 +21,9 @@ def _retrieve_all_teams(year, season_page=None):
         The requested year to pull stats from.
     teams_file : string (optional)
         Link with filename to the local season page.
+    stream : boolean (optional)
+        Set to True to stream the stats tables out of each page instead of
+        parsing the pages in full.
 
     Returns
     -------
@@ -30,14 +33,11 @@ def _retrieve_all_teams(year, season_page=None):
         the year is the request year for the season.
     """
     if not year:
-        year = utils._find_year_for_season('nhl')
-        # If stats for the requested season do not exist yet (as is the case
-        # right before a new season begins), attempt to pull the previous
-        # year's stats. If it exists, use the previous year instead.
-        if not utils._url_exists(SEASON_PAGE_URL % year) and \
-           utils._url_exists(SEASON_PAGE_URL % str(int(year) - 1)):
-            year = str(int(year) - 1)
-    doc = utils._pull_page(SEASON_PAGE_URL % year, season_page)
+        # If stats for the requested season do not exist yet (as is the
+        # case right before a new season begins), the previous year's
+        # stats are used instead.
+        year = utils._find_default_season('nhl', lambda x: SEASON_PAGE_URL % x)
+    doc = utils._pull_table_page(SEASON_PAGE_URL % year, season_page, stream)
     teams_list = utils._get_stats_table(doc, 'div#all_stats')
     if not teams_list:
         utils._no_data_found()
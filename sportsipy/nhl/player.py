@@ -3,7 +3,8 @@ from functools import wraps
 from lxml.etree import ParserError, XMLSyntaxError
 from pyquery import PyQuery as pq
 from urllib.error import HTTPError
-from .. import utils
+from .. import records, utils
+from ..decorators import _convert_item
 from .constants import BOXSCORE_RETRY, PLAYER_SCHEME
 
 
@@ -14,10 +15,13 @@ def _int_property_decorator(func):
         index = args[0]._index
         prop = func(*args)
         try:
-            return int(prop[index])
-        except (ValueError, TypeError, IndexError):
+            value = prop[index]
+        except (TypeError, IndexError):
             # If there is no value, default to None
             return None
+        if type(value) is int:
+            return value
+        return _convert_item(args[0], func.__name__, prop, index, int)
     return wrapper
 
 
@@ -28,14 +32,17 @@ def _float_property_decorator(func):
         index = args[0]._index
         prop = func(*args)
         try:
-            return float(prop[index])
-        except (ValueError, TypeError, IndexError):
+            value = prop[index]
+        except (TypeError, IndexError):
             # If there is no value, default to None
             return None
+        if type(value) is float:
+            return value
+        return _convert_item(args[0], func.__name__, prop, index, float)
     return wrapper
 
 
-class AbstractPlayer:
+class AbstractPlayer(records._SlotRecord):
     """
     Get player information and stats for all seasons.
 
@@ -61,11 +68,23 @@ class AbstractPlayer:
     player_name : string
         A string representing the player's first and last name, such as 'Henrik
         Zetterberg'.
-    player_data : string
-        A string representation of the player's HTML data from the Boxscore
-        page. If the player appears in multiple tables, all of their
-        information will appear in one single string concatenated together.
+    player_data : list
+        A list of the row elements containing the player's data from the
+        Boxscore page. If the player appears in multiple tables, the rows from
+        every table are included.
     """
+    __slots__ = ('_player_id', '_name', '_goals', '_assists', '_points',
+                 '_plus_minus', '_penalties_in_minutes',
+                 '_even_strength_goals', '_power_play_goals',
+                 '_short_handed_goals', '_game_winning_goals',
+                 '_even_strength_assists', '_power_play_assists',
+                 '_short_handed_assists', '_shots_on_goal',
+                 '_shooting_percentage', '_time_on_ice',
+                 '_blocks_at_even_strength', '_hits_at_even_strength',
+                 '_corsi_for_percentage', '_relative_corsi_for_percentage',
+                 '_offensive_zone_start_percentage', '_goals_against',
+                 '_shots_against', '_saves', '_save_percentage', '_shutouts')
+
     def __init__(self, player_id, player_name, player_data):
         self._player_id = player_id
         self._name = player_name
@@ -108,9 +127,8 @@ class AbstractPlayer:
 
         Parameters
         ----------
-        stats : PyQuery object
-            A PyQuery object containing all stats in HTML format for a
-            particular player.
+        stats : _RowIndex
+            An index of all stats in HTML format for a particular player.
         field : string
             A string of the field to parse from the HTML.
 
@@ -133,15 +151,23 @@ class AbstractPlayer:
 
         Parameters
         ----------
-        player_data : dictionary or string
+        player_data : dictionary or list
             If this class is inherited from the ``Player`` class, player_data
             will be a dictionary where each key is a string representing the
-            season and each value contains the HTML data as a string. If this
-            class is inherited from the ``BoxscorePlayer`` class, player_data
-            will be a string representing the player's game statistics in HTML
-            format.
-        """
-        for field in self.__dict__:
+            season and each value contains a list of the row elements with the
+            player's stats. If this class is inherited from the
+            ``BoxscorePlayer`` class, player_data will be a list of the row
+            elements with the player's game statistics.
+        """
+        # Parse the HTML for every season once up front instead of once for
+        # every field.
+        if type(player_data) == dict:
+            seasons = [utils._RowIndex(pq(data['data']),
+                                       combined=True)
+                       for data in player_data.values()]
+        else:
+            seasons = [utils._RowIndex(pq(player_data), combined=True)]
+        for field in records._fields(self):
             short_field = str(field)[1:]
             if short_field == 'player_id' or \
                short_field == 'index' or \
@@ -151,16 +177,8 @@ class AbstractPlayer:
                short_field == 'height' or \
                short_field == 'season':
                 continue
-            field_stats = []
-            if type(player_data) == dict:
-                for year, data in player_data.items():
-                    stats = pq(data['data'])
-                    value = self._parse_value(stats, short_field)
-                    field_stats.append(value)
-            else:
-                stats = pq(player_data)
-                value = self._parse_value(stats, short_field)
-                field_stats.append(value)
+            field_stats = [self._parse_value(stats, short_field)
+                           for stats in seasons]
             setattr(self, field, field_stats)
 
     @property
@@ -1,14 +1,13 @@
-import pandas as pd
 import re
 from .constants import PARSING_SCHEME, SEASON_PAGE_URL
 from ..decorators import float_property_decorator, int_property_decorator
-from .. import utils
+from .. import records, utils
 from .nhl_utils import _retrieve_all_teams
 from .roster import Roster
 from .schedule import Schedule
 
 
-class Team:
+class Team(records._Record):
     """
     An object containing all of a team's season information.
 
@@ -39,9 +38,13 @@ class Team:
         Optionally specify the filename of a local file to use to pull data
         instead of downloading from sports-reference.com. This file should be
         of the Season page for the designated year.
+    lazy : boolean (optional)
+        Set to True to only parse each stat the first time it is read instead
+        of parsing every stat as soon as the team is created. Defaults to
+        False.
     """
     def __init__(self, team_name=None, team_data=None, rank=None, year=None,
-                 season_page=None):
+                 season_page=None, lazy=False):
         self._year = year
         self._rank = rank
         self._abbreviation = None
@@ -74,7 +77,7 @@ class Team:
 
         if team_name:
             team_data = self._retrieve_team_data(year, team_name, season_page)
-        self._parse_team_data(team_data)
+        self._parse_team_data(team_data, lazy)
 
     def __str__(self):
         """
@@ -88,6 +91,12 @@ class Team:
         """
         return self.__str__()
 
+    def __getattr__(self, name):
+        """
+        Parse a field the first time it is read if parsing lazily.
+        """
+        return utils._parse_pending_field(self, name)
+
     def _retrieve_team_data(self, year, team_name, season_page):
         """
         Pull all stats for a specific team.
@@ -121,7 +130,25 @@ class Team:
                 return team_data
             rank += 1
 
-    def _parse_team_data(self, team_data):
+    def _parse_team_field(self, field, row):
+        """
+        Parse the value of a single attribute.
+
+        Parameters
+        ----------
+        field : string
+            The name of the attribute to parse, such as '_points'.
+        row : _RowIndex
+            An index of all of the rows of stats for the team.
+
+        Returns
+        -------
+        string
+            The value of the attribute according to the parsing scheme.
+        """
+        return utils._parse_field(PARSING_SCHEME, row, str(field)[1:])
+
+    def _parse_team_data(self, team_data, lazy=False):
         """
         Parses a value for every attribute.
 
@@ -139,24 +166,27 @@ class Team:
             A string containing all of the rows of stats for a given team. If
             multiple tables are being referenced, this will be comprised of
             multiple rows in a single string.
+        lazy : boolean (optional)
+            Set to True to only parse each field the first time it is read.
         """
-        for field in self.__dict__:
-            # The rank attribute is passed directly to the class during
-            # instantiation.
-            if field == '_rank' or \
-               field == '_year':
-                continue
-            value = utils._parse_field(PARSING_SCHEME,
-                                       team_data,
-                                       str(field)[1:])
-            setattr(self, field, value)
+        row = utils._RowIndex(team_data)
+        # The rank attribute is passed directly to the class during
+        # instantiation.
+        fields = [field for field in records._fields(self)
+                  if field != '_rank' and field != '_year']
+        utils._parse_fields(self, fields, self._parse_team_field, row,
+                            lazy=lazy)
 
-    @property
-    def dataframe(self):
+    def _dataframe_row(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the string abbreviation of the
-        team, such as 'DET'.
+        Gather the values of every field included in the DataFrame.
+
+        Returns
+        -------
+        tuple
+            A ``tuple`` of the row's index and a ``dictionary`` of every
+            field's value keyed by column name, or None if the team has no
+            data.
         """
         fields_to_include = {
             'abbreviation': self.abbreviation,
@@ -189,7 +219,16 @@ class Team:
             'total_goals_per_game': self.total_goals_per_game,
             'wins': self.wins
         }
-        return pd.DataFrame([fields_to_include], index=[self._abbreviation])
+        return self._abbreviation, fields_to_include
+
+    @property
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the string abbreviation of the
+        team, such as 'DET'.
+        """
+        return utils._build_dataframe([self._dataframe_row()])
 
     @int_property_decorator
     def rank(self):
@@ -434,7 +473,7 @@ class Team:
         return self._pdo_at_even_strength
 
 
-class Teams:
+class Teams(records._Record):
     """
     A list of all NHL teams and their stats in a given year.
 
@@ -451,12 +490,23 @@ class Teams:
         Optionally specify the filename of a local file to use to pull data
         instead of downloading from sports-reference.com. This file should be
         of the Season page for the designated year.
+    stream : boolean (optional)
+        Set to True to stream the stats tables out of each season page instead
+        of parsing the pages in full. Only the rows of the tables used to build
+        every team are kept rather than the whole page being held in memory,
+        and parsing stops as soon as the last requested table ends. Defaults
+        to False.
+    lazy : boolean (optional)
+        Set to True to only parse each team's stats the first time they are
+        read instead of parsing every stat as soon as the teams are created,
+        which makes reading a few stats from every team much faster. Defaults
+        to False.
     """
-    def __init__(self, year=None, season_page=None):
+    def __init__(self, year=None, season_page=None, stream=False, lazy=False):
         self._teams = []
 
-        teams_list, year = _retrieve_all_teams(year, season_page)
-        self._instantiate_teams(teams_list, year)
+        teams_list, year = _retrieve_all_teams(year, season_page, stream)
+        self._instantiate_teams(teams_list, year, lazy)
 
     def __getitem__(self, abbreviation):
         """
@@ -481,10 +531,11 @@ class Teams:
         ValueError
             If the requested team is not present within the Teams list.
         """
-        for team in self._teams:
-            if team.abbreviation.upper() == abbreviation.upper():
-                return team
-        raise ValueError('Team abbreviation %s not found' % abbreviation)
+        teams = utils._keyed(self, self._teams, 'abbreviation')
+        team = teams.get(utils._lookup_key(abbreviation))
+        if team is None:
+            raise ValueError('Team abbreviation %s not found' % abbreviation)
+        return team
 
     def __call__(self, abbreviation):
         """
@@ -528,7 +579,7 @@ class Teams:
         """Returns the number of NHL teams for a given season."""
         return len(self._teams)
 
-    def _instantiate_teams(self, teams_list, year):
+    def _instantiate_teams(self, teams_list, year, lazy=False):
         """
         Create a Team instance for all teams.
         Once all team information has been pulled from the various webpages,
@@ -541,6 +592,9 @@ class Teams:
             NHL teams.
         year : string
             A ``string`` of the requested year to pull stats from.
+        lazy : boolean (optional)
+            Set to True to only parse each team's fields the first time they
+            are read.
         """
         # Teams are listed in terms of rank with the first team being #1
         rank = 1
@@ -549,9 +603,12 @@ class Teams:
         for team_data in teams_list:
             team = Team(team_data=team_data,
                         rank=rank,
-                        year=year)
+                        year=year,
+                        lazy=lazy)
             self._teams.append(team)
             rank += 1
+        # Index every team up front so looking one up is a single access.
+        utils._keyed(self, self._teams, 'abbreviation')
 
     @property
     def dataframes(self):
@@ -559,7 +616,5 @@ class Teams:
         Returns a pandas DataFrame where each row is a representation of the
         Team class. Rows are indexed by the team abbreviation.
         """
-        frames = []
-        for team in self.__iter__():
-            frames.append(team.dataframe)
-        return pd.concat(frames)
+        return utils._build_dataframe(utils._frame_row(team)
+                                      for team in self.__iter__())
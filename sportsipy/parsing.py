@@ -0,0 +1,321 @@
+import os
+import threading
+from contextlib import contextmanager
+from importlib import import_module
+from lxml.etree import XPath
+from pyquery import PyQuery as pq
+from pyquery.cssselectpatch import JQueryTranslator
+from pyquery.text import extract_text
+
+
+# Setting this environment variable to the name of an engine selects it when
+# sportsipy is imported.
+PARSER_ENGINE_ENV = 'SPORTSIPY_PARSER'
+DEFAULT_ENGINE = 'pyquery'
+# The leagues whose constants modules define parsing schemes.
+LEAGUES = ['fb', 'mlb', 'nba', 'ncaab', 'ncaaf', 'nfl', 'nhl']
+
+_translator = JQueryTranslator(xhtml=False)
+_compiled = {}
+_lock = threading.Lock()
+
+
+def compile_selector(selector):
+    """
+    Return the compiled XPath expression for a selector.
+
+    Selectors are translated with PyQuery's own translator, so jQuery
+    extensions such as ':first' behave exactly as they do in PyQuery. Each
+    selector is only translated and compiled the first time it is requested,
+    after which the same expression is shared by every engine and thread.
+
+    Parameters
+    ----------
+    selector : string
+        A PyQuery-readable selector, such as 'td[data-stat="wins"]:first'.
+
+    Returns
+    -------
+    lxml XPath
+        The compiled expression, which matches the selector against an
+        element and all of its descendants.
+    """
+    compiled = _compiled.get(selector)
+    if compiled is None:
+        with _lock:
+            compiled = _compiled.get(selector)
+            if compiled is None:
+                expression = _translator.css_to_xpath(
+                    selector.replace('[@', '['), 'descendant-or-self::')
+                compiled = XPath(expression)
+                _compiled[selector] = compiled
+    return compiled
+
+
+def _league_schemes():
+    """
+    Find every parsing scheme defined by the leagues.
+
+    Returns
+    -------
+    list
+        A ``list`` of every dictionary in the leagues' constants modules whose
+        name ends in 'SCHEME', such as PARSING_SCHEME and BOXSCORE_SCHEME.
+    """
+    schemes = []
+    for league in LEAGUES:
+        constants = import_module('sportsipy.%s.constants' % league)
+        for name, value in sorted(vars(constants).items()):
+            if name.endswith('SCHEME') and isinstance(value, dict):
+                schemes.append(value)
+    return schemes
+
+
+def precompile(schemes=None):
+    """
+    Compile every selector in the given parsing schemes ahead of time.
+
+    Selectors are otherwise compiled lazily the first time they are used, so
+    this is only needed to avoid paying the cost while parsing, such as before
+    starting a pool of worker processes.
+
+    Parameters
+    ----------
+    schemes : list (optional)
+        A ``list`` of parsing scheme dictionaries mapping field names to
+        selectors. Defaults to every scheme defined by the leagues.
+
+    Returns
+    -------
+    int
+        The number of distinct selectors which have been compiled.
+    """
+    if schemes is None:
+        schemes = _league_schemes()
+    for scheme in schemes:
+        for selector in scheme.values():
+            if selector:
+                compile_selector(selector)
+    return len(_compiled)
+
+
+class PyQueryEngine:
+    """
+    Evaluate selectors with PyQuery.
+
+    This is the default engine. Selectors are compiled with
+    ``compile_selector`` and the matching elements are read with PyQuery, and
+    tables are serialized and parsed again with their comment tags removed
+    before their rows are read.
+    """
+    name = 'pyquery'
+    # Tables are copied into a new document before their rows are read.
+    in_place = False
+
+    def _elements(self, html, selector):
+        """
+        Return every element matching a selector.
+
+        Parameters
+        ----------
+        html : PyQuery object
+            A PyQuery object of the elements to search within.
+        selector : string
+            A PyQuery-readable selector.
+
+        Returns
+        -------
+        list
+            A ``list`` of every matching lxml element in document order.
+        """
+        # Like PyQuery, an empty selector doesn't match anything.
+        if not selector:
+            return []
+        xpath = compile_selector(selector)
+        elements = []
+        for root in html:
+            elements.extend(xpath(root))
+        return elements
+
+    def find(self, html, selector):
+        """
+        Find every element matching a selector.
+
+        Parameters
+        ----------
+        html : PyQuery object
+            A PyQuery object of the elements to search within.
+        selector : string
+            A PyQuery-readable selector, such as 'table#team_stats'.
+
+        Returns
+        -------
+        PyQuery object
+            A PyQuery object of every matching element in document order.
+        """
+        # Other objects which can be searched like PyQuery, by calling them
+        # with the selector, are searched the same way.
+        if not isinstance(html, pq):
+            return html(selector)
+        return pq(self._elements(html, selector))
+
+    def texts(self, html, selector):
+        """
+        Find the text of every element matching a selector.
+
+        Parameters
+        ----------
+        html : PyQuery object
+            A PyQuery object of the elements to search within.
+        selector : string
+            A PyQuery-readable selector, such as 'td[data-stat="wins"]'.
+
+        Returns
+        -------
+        list
+            A ``list`` of the text of every matching element in document
+            order.
+        """
+        return [i.text() for i in self.find(html, selector).items()]
+
+
+class LxmlEngine(PyQueryEngine):
+    """
+    Evaluate selectors with lxml.
+
+    Selectors are compiled with ``compile_selector`` just like the default
+    engine, but the text of every element is extracted directly instead of
+    through PyQuery. Tables are read directly from the parsed document instead
+    of being serialized and parsed again.
+    """
+    name = 'lxml'
+    # Tables are read straight from the parsed document.
+    in_place = True
+
+    def texts(self, html, selector):
+        return [extract_text(element)
+                for element in self._elements(html, selector)]
+
+
+ENGINES = {
+    PyQueryEngine.name: PyQueryEngine,
+    LxmlEngine.name: LxmlEngine
+}
+
+_engine = PyQueryEngine()
+# The engine selected by ``using_engine`` for the current thread, if any.
+_local = threading.local()
+
+
+def _create_engine(name):
+    """
+    Create the engine with the given name.
+
+    Parameters
+    ----------
+    name : string
+        The name of the engine, such as 'lxml'.
+
+    Returns
+    -------
+    PyQueryEngine
+        A new instance of the engine.
+
+    Raises
+    ------
+    ValueError
+        If the requested engine doesn't exist.
+    """
+    try:
+        return ENGINES[name]()
+    except KeyError:
+        raise ValueError('Unknown parser engine "%s". Choose one of: %s' %
+                         (name, ', '.join(sorted(ENGINES))))
+
+
+def set_engine(name=DEFAULT_ENGINE):
+    """
+    Select the default engine used to parse every page.
+
+    Objects use the engine which is selected when they are built, including
+    for any fields which are parsed lazily afterwards. To choose the engine
+    for a single block of code without affecting other threads, use
+    ``using_engine`` instead.
+
+    Parameters
+    ----------
+    name : string (optional)
+        The name of the engine to use. Both engines evaluate selectors with
+        precompiled lxml XPath expressions. 'pyquery' reads every element
+        with PyQuery and is the default. 'lxml' reads elements directly and
+        avoids re-parsing tables, which is considerably faster while
+        returning the same values.
+
+    Returns
+    -------
+    PyQueryEngine
+        The selected engine.
+
+    Raises
+    ------
+    ValueError
+        If the requested engine doesn't exist.
+    """
+    global _engine
+
+    _engine = _create_engine(name)
+    return _engine
+
+
+def get_engine():
+    """
+    Return the engine used to parse pages in the current thread.
+
+    Returns
+    -------
+    PyQueryEngine
+        The engine selected by ``using_engine`` in the current thread, or the
+        default engine selected by ``set_engine`` otherwise.
+    """
+    engine = getattr(_local, 'engine', None)
+    if engine is None:
+        return _engine
+    return engine
+
+
+@contextmanager
+def using_engine(engine):
+    """
+    Parse pages with the given engine within a block of code.
+
+    Only the current thread is affected, so different engines can be used at
+    the same time from different threads. The previous engine is restored
+    when the block exits.
+
+    Parameters
+    ----------
+    engine : string or PyQueryEngine
+        The name of the engine to use, such as 'lxml', or an engine instance.
+
+    Yields
+    ------
+    PyQueryEngine
+        The selected engine.
+
+    Raises
+    ------
+    ValueError
+        If the requested engine doesn't exist.
+    """
+    if isinstance(engine, str):
+        engine = _create_engine(engine)
+    previous = getattr(_local, 'engine', None)
+    _local.engine = engine
+    try:
+        yield engine
+    finally:
+        _local.engine = previous
+
+
+if os.environ.get(PARSER_ENGINE_ENV):
+    set_engine(os.environ[PARSER_ENGINE_ENV])
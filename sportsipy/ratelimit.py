@@ -0,0 +1,349 @@
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+
+# The number of requests which can be sent to a host at once after it has been
+# idle when a rate limit is set.
+DEFAULT_BURST = 1
+# Status codes returned by the website when a client is sending requests too
+# quickly.
+THROTTLE_CODES = (429, 503)
+# The number of seconds to stop sending requests to a host after being
+# throttled if the response didn't include a Retry-After header.
+DEFAULT_BACKOFF = 5
+# The longest the limiter will wait before retrying a host, in seconds.
+MAX_BACKOFF = 300
+# The rate, in requests per second, a host without a configured rate limit is
+# slowed to after it throttles requests for the first time.
+THROTTLED_RATE = 1.0
+# The slowest rate, in requests per second, a host is ever slowed to.
+MIN_RATE = 1.0 / 60
+# The number of consecutive successful requests required before a slowed host
+# is allowed to double its rate again.
+RECOVERY_REQUESTS = 20
+
+
+def _parse_retry_after(value):
+    """
+    Parse the value of a Retry-After header.
+
+    Parameters
+    ----------
+    value : string
+        A ``string`` of either the number of seconds to wait, or an HTTP date
+        after which the request can be retried.
+
+    Returns
+    -------
+    float
+        Returns a ``float`` of the number of seconds to wait, capped at
+        ``MAX_BACKOFF``, or None if the value can't be parsed.
+    """
+    if value is None:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_time = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_time.tzinfo is None:
+            retry_time = retry_time.replace(tzinfo=timezone.utc)
+        seconds = (retry_time - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0), MAX_BACKOFF)
+
+
+class TokenBucket:
+    """
+    Limit the rate of requests sent to a single host.
+
+    Every request takes a token from the bucket, which refills at ``rate``
+    tokens per second up to ``burst`` tokens. Requests which find the bucket
+    empty reserve the next token and wait until it becomes available, so
+    waiting threads are served in the order they arrived. When the host
+    throttles requests, the bucket stops handing out tokens for the requested
+    amount of time and halves its rate, which is gradually restored once
+    requests succeed again.
+
+    Parameters
+    ----------
+    rate : float
+        The maximum number of requests per second. If None, requests are only
+        limited once the host starts throttling them.
+    burst : int (optional)
+        The number of requests which can be sent at once after the host has
+        been idle.
+    """
+    def __init__(self, rate, burst=DEFAULT_BURST):
+        self._configured_rate = rate
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._successes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self):
+        """
+        Returns a ``float`` of the current maximum number of requests per
+        second, or None if requests aren't being limited.
+        """
+        return self._rate
+
+    @property
+    def burst(self):
+        """
+        Returns an ``int`` of the number of requests which can be sent at once
+        after the host has been idle.
+        """
+        return self._burst
+
+    def _refill(self, now):
+        """
+        Add the tokens earned since the bucket was last updated.
+
+        Parameters
+        ----------
+        now : float
+            A ``float`` of the current monotonic time.
+        """
+        if self._rate:
+            self._tokens = min(self._burst, self._tokens +
+                               (now - self._updated) * self._rate)
+        self._updated = now
+
+    def _set_rate(self, rate, now):
+        """
+        Change the rate of the bucket without losing earned tokens.
+
+        Parameters
+        ----------
+        rate : float
+            A ``float`` of the new rate, or None to stop limiting requests.
+        now : float
+            A ``float`` of the current monotonic time.
+        """
+        self._refill(now)
+        if rate is None:
+            self._tokens = float(self._burst)
+        self._rate = rate
+
+    def reserve(self):
+        """
+        Take a token from the bucket.
+
+        Returns
+        -------
+        float
+            Returns a ``float`` of the number of seconds the caller needs to
+            wait before sending its request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = max(self._paused_until - now, 0)
+            if self._rate:
+                self._refill(now)
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self._rate)
+            return wait
+
+    def acquire(self):
+        """
+        Block until a request can be sent to the host.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def throttle(self, retry_after=None):
+        """
+        Slow down requests after the host throttled one of them.
+
+        Parameters
+        ----------
+        retry_after : float (optional)
+            A ``float`` of the number of seconds the host asked to wait before
+            retrying. Defaults to ``DEFAULT_BACKOFF`` seconds.
+        """
+        if retry_after is None:
+            retry_after = DEFAULT_BACKOFF
+        with self._lock:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + retry_after)
+            if self._rate:
+                rate = max(self._rate / 2, MIN_RATE)
+            else:
+                rate = THROTTLED_RATE
+            self._set_rate(rate, now)
+            self._successes = 0
+
+    def succeed(self):
+        """
+        Record a successful request, restoring the rate of the bucket once
+        enough requests in a row have succeeded.
+        """
+        with self._lock:
+            if self._rate == self._configured_rate:
+                return
+            self._successes += 1
+            if self._successes < RECOVERY_REQUESTS:
+                return
+            self._successes = 0
+            rate = self._rate * 2
+            if self._configured_rate is None:
+                if rate > THROTTLED_RATE:
+                    rate = None
+            elif rate >= self._configured_rate:
+                rate = self._configured_rate
+            self._set_rate(rate, time.monotonic())
+
+
+class RateLimiter:
+    """
+    Limit the rate of requests sent to every host.
+
+    Each host is given its own ``TokenBucket`` the first time a request is
+    sent to it, so throttling from one website doesn't slow down requests to
+    another.
+
+    Parameters
+    ----------
+    rate : float (optional)
+        The maximum number of requests per second sent to any single host. If
+        None, requests are only limited once a host starts throttling them.
+    burst : int (optional)
+        The number of requests which can be sent to a host at once after it
+        has been idle.
+    """
+    def __init__(self, rate=None, burst=DEFAULT_BURST):
+        self._rate = rate
+        self._burst = burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self):
+        """
+        Returns a ``float`` of the configured maximum number of requests per
+        second sent to any single host, or None if requests aren't limited.
+        """
+        return self._rate
+
+    @property
+    def burst(self):
+        """
+        Returns an ``int`` of the number of requests which can be sent to a
+        host at once after it has been idle.
+        """
+        return self._burst
+
+    def bucket(self, url):
+        """
+        Return the bucket limiting requests to the host of the given URL.
+
+        Parameters
+        ----------
+        url : string
+            A ``string`` of the URL being requested.
+
+        Returns
+        -------
+        TokenBucket
+            The ``TokenBucket`` for the URL's host.
+        """
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self._rate, self._burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url):
+        """
+        Block until a request can be sent to the given URL.
+
+        Parameters
+        ----------
+        url : string
+            A ``string`` of the URL about to be requested.
+        """
+        self.bucket(url).acquire()
+
+    def report(self, url, response):
+        """
+        Update the limiter with the response to a request.
+
+        Parameters
+        ----------
+        url : string
+            A ``string`` of the URL which was requested.
+        response : requests.Response
+            The response from the server.
+
+        Returns
+        -------
+        boolean
+            Returns True if the host throttled the request and it should be
+            retried.
+        """
+        bucket = self.bucket(url)
+        if response.status_code in THROTTLE_CODES:
+            retry_after = _parse_retry_after(
+                response.headers.get('Retry-After'))
+            bucket.throttle(retry_after)
+            return True
+        bucket.succeed()
+        return False
+
+
+_limiter = RateLimiter()
+
+
+def set_rate_limit(rate=None, burst=DEFAULT_BURST):
+    """
+    Limit the rate of requests sent to every sports-reference website.
+
+    The limit applies to every request made by sportsipy across all threads,
+    tracked separately for each host. Regardless of the limit, any host which
+    responds with a 429 or 503 status code is backed off for the time given
+    in its Retry-After header and its rate is halved, then gradually restored
+    once requests succeed again.
+
+    Parameters
+    ----------
+    rate : float (optional)
+        The maximum number of requests per second sent to any single host. If
+        unset, requests are only limited once a host starts throttling them.
+    burst : int (optional)
+        The number of requests which can be sent to a host at once after it
+        has been idle.
+
+    Returns
+    -------
+    RateLimiter
+        The process-wide ``RateLimiter`` instance.
+    """
+    global _limiter
+
+    _limiter = RateLimiter(rate, burst)
+    return _limiter
+
+
+def get_rate_limiter():
+    """
+    Return the process-wide rate limiter.
+
+    Returns
+    -------
+    RateLimiter
+        The ``RateLimiter`` used for every request.
+    """
+    return _limiter
@@ -0,0 +1,227 @@
+from lxml.etree import tostring
+from pyquery import PyQuery as pq
+from types import GetSetDescriptorType, MemberDescriptorType
+
+
+# Attributes which track how an object's fields are parsed rather than holding
+# a field themselves.
+STATE_ATTRIBUTES = ('_pending_fields',)
+
+_class_slots = {}
+
+
+def _slots(cls):
+    """
+    Find every slot declared by a class and its base classes.
+
+    Parameters
+    ----------
+    cls : class
+        The class to inspect.
+
+    Returns
+    -------
+    list
+        A ``list`` of ``tuples`` of each slot's name and descriptor, starting
+        with the slots of the furthest base class. Slots which only track
+        parsing, such as '_pending_fields', aren't included.
+    """
+    slots = _class_slots.get(cls)
+    if slots is None:
+        slots = []
+        for base in reversed(cls.__mro__):
+            for name in base.__dict__.get('__slots__', ()):
+                if name not in STATE_ATTRIBUTES:
+                    slots.append((name, base.__dict__[name]))
+        _class_slots[cls] = slots
+    return slots
+
+
+def _slot_values(instance):
+    """
+    Find the value of every slot which has been set on an object.
+
+    Parameters
+    ----------
+    instance : object
+        The object to inspect.
+
+    Returns
+    -------
+    dictionary
+        A ``dictionary`` of the value of every slot which has been set, keyed
+        by the slot's name, in the order the slots are declared.
+    """
+    values = {}
+    for name, descriptor in _slots(type(instance)):
+        # Slots replaced on the class, such as by a property, aren't stored
+        # on the instance.
+        if not isinstance(descriptor, MemberDescriptorType):
+            continue
+        try:
+            values[name] = descriptor.__get__(instance)
+        except AttributeError:
+            continue
+    return values
+
+
+def _has_instance_dict(cls):
+    """
+    Determine whether instances of a class store attributes in a dictionary.
+
+    Parameters
+    ----------
+    cls : class
+        The class to inspect.
+
+    Returns
+    -------
+    boolean
+        True if instances have a real ``__dict__``, rather than only slots.
+    """
+    for base in cls.__mro__:
+        if '__dict__' in base.__dict__:
+            return isinstance(base.__dict__['__dict__'], GetSetDescriptorType)
+    return False
+
+
+def _fields(instance):
+    """
+    Find every field which has been set on an object.
+
+    Fields are the attributes which are set while an object is created, such
+    as '_points', whether they are stored in slots or in the object's
+    dictionary. Slots which haven't been set yet are skipped, just like
+    attributes which haven't been added to the dictionary.
+
+    Parameters
+    ----------
+    instance : object
+        The object whose fields are being parsed.
+
+    Returns
+    -------
+    list
+        A ``list`` of the name of every field in the order they are declared.
+    """
+    fields = list(_slot_values(instance))
+    if _has_instance_dict(type(instance)):
+        fields.extend(name for name in vars(instance)
+                      if name not in STATE_ATTRIBUTES)
+    return fields
+
+
+class _HtmlState:
+    """
+    The HTML of a PyQuery object kept in a pickled object's state.
+
+    PyQuery objects can't be pickled, so they are stored as the HTML of each
+    of their elements and parsed again when the object is unpickled.
+
+    Parameters
+    ----------
+    html : PyQuery object
+        The PyQuery object to store.
+    """
+    __slots__ = ('elements',)
+
+    def __init__(self, html):
+        self.elements = [tostring(element, encoding='unicode',
+                                  with_tail=False)
+                         for element in html]
+
+    def restore(self):
+        """
+        Parse the stored HTML again.
+
+        Returns
+        -------
+        PyQuery object
+            A PyQuery object of a copy of every stored element.
+        """
+        return pq([pq(element)[0] for element in self.elements])
+
+
+def _getstate(instance):
+    """
+    Return a picklable state containing only an object's parsed values.
+
+    Any fields which are still waiting to be parsed lazily are parsed first so
+    the state doesn't need the page they were parsed from. Attributes listed
+    in the class's ``_transient_fields``, such as a cached page, are dropped,
+    and any PyQuery objects are replaced by their HTML.
+
+    Parameters
+    ----------
+    instance : object
+        The object being pickled.
+
+    Returns
+    -------
+    dictionary
+        A ``dictionary`` of the value of every field, keyed by the field's
+        name.
+    """
+    pending = getattr(instance, '_pending_fields', None)
+    while pending:
+        getattr(instance, next(iter(pending)))
+    transient = getattr(type(instance), '_transient_fields', ())
+    state = {}
+    for name in _fields(instance):
+        value = getattr(instance, name)
+        if name in transient:
+            value = None
+        elif isinstance(value, pq):
+            value = _HtmlState(value)
+        state[name] = value
+    return state
+
+
+def _setstate(instance, state):
+    """
+    Restore an object from a state created by ``_getstate``.
+
+    Parameters
+    ----------
+    instance : object
+        The object being unpickled.
+    state : dictionary
+        A ``dictionary`` of the value of every field, keyed by the field's
+        name.
+    """
+    for name, value in state.items():
+        if isinstance(value, _HtmlState):
+            value = value.restore()
+        setattr(instance, name, value)
+
+
+class _Record:
+    """
+    Base class for objects which are pickled as their parsed values.
+
+    Pickling an object stores the value of every field rather than any part of
+    the page it was parsed from, so objects can be built in worker processes
+    and sent back cheaply.
+    """
+    __slots__ = ()
+    # Attributes which are dropped when the object is pickled.
+    _transient_fields = ()
+
+    def __getstate__(self):
+        return _getstate(self)
+
+    def __setstate__(self, state):
+        _setstate(self, state)
+
+
+class _SlotRecord(_Record):
+    """
+    Base class for objects which store their fields in slots.
+
+    Subclasses declare every field in ``__slots__``, so instances don't carry
+    a dictionary of their attributes, which considerably reduces their memory
+    use when many are held at once. Since there is no dictionary, the fields
+    which have been set are found with ``_fields`` and assigning any other
+    attribute raises an ``AttributeError``.
+    """
+    __slots__ = ()
@@ -1,27 +1,39 @@
+import pandas as pd
 import re
-import requests
-from datetime import datetime
-from lxml.etree import ParserError, XMLSyntaxError
+import threading
+import time
+from . import fetch, parsing, seasons
+from .seasons import SEASON_START_MONTH
+from copy import deepcopy
+from datetime import datetime, timedelta
+from lxml.etree import (Comment,
+                        HTMLPullParser,
+                        ParserError,
+                        XMLSyntaxError)
+from lxml.html import fragments_fromstring
 from pyquery import PyQuery as pq
+from pyquery.text import extract_text
+from types import MemberDescriptorType
 
 
-# {
-#   league name: {
-#     start month - integer referring to the month that a season typically
-#                   begins. Months are 1-based, so January would be 1.
-#     wrap - boolean is True when a season spans multiple calendar years, such
-#            as the NBA. False when a season is contained in a single calendar
-#            year, such as the MLB.
-#   }
-# }
-SEASON_START_MONTH = {
-    'mlb': {'start': 4, 'wrap': False},
-    'nba': {'start': 10, 'wrap': True},
-    'ncaab': {'start': 11, 'wrap': True},
-    'ncaaf': {'start': 8, 'wrap': False},
-    'nfl': {'start': 9, 'wrap': False},
-    'nhl': {'start': 10, 'wrap': True}
-}
+# Matches the parsing schemes which select table cells by their data-stat
+# attribute alone, such as 'td[data-stat="wins"]:first', optionally limited
+# to one section of a table, such as 'tfoot td[data-stat="pts"]'. These can be
+# answered from a row's index without evaluating the selector.
+DATA_STAT_SELECTOR = re.compile(r'^(?:(thead|tbody|tfoot) )?(td|th)'
+                                r'\[data-stat="([^"]*)"\](:first)?$')
+# Matches the "<tag>#<id name>" strings used to request a stats table, which
+# can be found while streaming a page.
+TABLE_SELECTOR = re.compile(r'^([\w-]+)#([\w-]+)$')
+# The number of characters fed to the parser at a time when streaming a page.
+STREAM_CHUNK_SIZE = 65536
+# The number of seconds the default season which was resolved for a league is
+# reused before the site is probed again.
+SEASON_RESOLUTION_TTL = 60 * 60
+
+_resolved_seasons = {}
+_MISSING = object()
+_resolved_seasons_lock = threading.Lock()
 
 
 def _todays_date():
@@ -39,7 +51,7 @@ def _todays_date():
     return datetime.now()
 
 
-def _url_exists(url):
+def _url_exists(url, download=False):
     """
     Determine if a URL is valid and exists.
 
@@ -52,6 +64,12 @@ def _url_exists(url):
     ----------
     url : string
         A string representation of the url to check.
+    download : boolean (optional)
+        Check the URL by downloading the full page instead of only requesting
+        the headers. Whenever a page is downloaded, either because it was
+        requested or because the server doesn't support checking the headers
+        alone, the page is held in memory and reused by the next call to
+        ``_pull_page`` for the same URL.
 
     Returns
     -------
@@ -59,41 +77,24 @@ def _url_exists(url):
         Evaluates to True when the URL exists and is valid, otherwise returns
         False.
     """
+    if fetch._is_kept_page(url):
+        return True
     try:
-        response = requests.head(url)
-        if response.status_code == 301:
-            response = requests.get(url)
-            if response.status_code < 400:
-                return True
-            else:
-                return False
-        elif response.status_code < 400:
-            return True
-        else:
-            return False
+        result = fetch._probe(url, download)
     except Exception:
         return False
+    # If the page had to be downloaded to determine whether it exists, keep it
+    # so the subsequent parse doesn't need to download it again.
+    if result.contents is not None and result.ok:
+        fetch._keep_page(result)
+    return result.exists
 
 
 def _find_year_for_season(league):
     """
     Return the necessary seaons's year based on the current date.
 
-    Since all sports start and end at different times throughout the year,
-    simply using the current year is not sufficient to describe a season. For
-    example, the NCAA Men's Basketball season begins in November every year.
-    However, for the November and December months, the following year is used
-    to denote the season (ie. November 2017 marks the start of the '2018'
-    season) on sports-reference.com. This rule does not apply to all sports.
-    Baseball begins and ends in one single calendar year, so the year never
-    needs to be incremented.
-
-    Additionally, since information for future seasons is generally not
-    finalized until a month before the season begins, the year will default to
-    the most recent season until the month prior to the season start date. For
-    example, the 2018 MLB season begins in April. In January 2018, however, not
-    all of the season's information is present in the system, so the default
-    year will be '2017'.
+    See ``seasons._find_year_for_season`` for how the season is determined.
 
     Parameters
     ----------
@@ -112,19 +113,81 @@ def _find_year_for_season(league):
     ValueError
         If the passed 'league' is not a key in SEASON_START_MONTH.
     """
-    today = _todays_date()
-    if league not in SEASON_START_MONTH:
-        raise ValueError('"%s" league cannot be found!')
-    start = SEASON_START_MONTH[league]['start']
-    wrap = SEASON_START_MONTH[league]['wrap']
-    if wrap and start - 1 <= today.month <= 12:
-        return today.year + 1
-    elif not wrap and start == 1 and today.month == 12:
-        return today.year + 1
-    elif not wrap and not start - 1 <= today.month <= 12:
-        return today.year - 1
+    return seasons._find_year_for_season(league, _todays_date())
+
+
+def _find_default_season(league, season_url_for, url_for=None, year=None):
+    """
+    Determine the season to pull when no year was requested.
+
+    The default season is the one returned by ``_find_year_for_season``.
+    However, if the league's season page doesn't exist for that season yet (as
+    is the case right before a new season begins) while the previous season's
+    does, the previous season is used instead. Determining this requires
+    probing the site, so the resolved season is remembered per league and
+    season for ``SEASON_RESOLUTION_TTL`` seconds and reused for every other
+    page in the league. For example, creating ``Teams`` followed by every
+    team's schedule or roster only probes the season page once.
+
+    If another page is requested, such as a team's schedule, it is downloaded
+    for the resolved season and kept for the caller to parse, so it isn't
+    requested a second time. Only if that page doesn't exist is the page for
+    the previous season checked instead.
+
+    Parameters
+    ----------
+    league : string
+        A string pertaining to the league start information as listed in
+        SEASON_START_MONTH (ie. 'mlb', 'nba', 'nfl', etc.).
+    season_url_for : function
+        A function which accepts a season's year and returns the URL of the
+        league's season page for that season.
+    url_for : function (optional)
+        A function which accepts a season's year and returns the URL of the
+        requested page for that season, if it isn't the league's season page.
+    year : int (optional)
+        The season to check first. Defaults to the season returned by
+        ``_find_year_for_season``.
+
+    Returns
+    -------
+    int or string
+        The requested season if its page exists, otherwise a string of the
+        previous season's year if that page exists instead.
+    """
+    if not year:
+        year = _find_year_for_season(league)
+    previous = str(int(year) - 1)
+    key = (league, str(year))
+    now = time.time()
+    with _resolved_seasons_lock:
+        resolved = _resolved_seasons.get(key)
+    if resolved and now - resolved[1] < SEASON_RESOLUTION_TTL:
+        season = resolved[0]
     else:
-        return today.year
+        season = year
+        if not _url_exists(season_url_for(year)) and \
+           _url_exists(season_url_for(previous)):
+            season = previous
+        with _resolved_seasons_lock:
+            _resolved_seasons[key] = (season, now)
+    if url_for is None or season == previous:
+        return season
+    if not _url_exists(url_for(season), download=True) and \
+       _url_exists(url_for(previous), download=True):
+        return previous
+    return season
+
+
+def _clear_resolved_seasons():
+    """
+    Forget every default season which has been resolved.
+
+    Forces the next request for a default season to probe the site again, such
+    as after a new season has been published.
+    """
+    with _resolved_seasons_lock:
+        _resolved_seasons.clear()
 
 
 def _parse_abbreviation(uri_link):
@@ -154,6 +217,160 @@ def _parse_abbreviation(uri_link):
     return abbr.upper()
 
 
+def _has_ancestor(element, tag, root):
+    """
+    Determine whether an element is nested within another element of a tag.
+
+    Parameters
+    ----------
+    element : lxml Element
+        The element to check.
+    tag : string
+        A ``string`` of the tag name to look for, such as 'tfoot'.
+    root : lxml Element
+        The outermost element to check. Ancestors above it are ignored.
+
+    Returns
+    -------
+    boolean
+        True if one of the element's ancestors up to and including the root
+        has the given tag.
+    """
+    if element is root:
+        return False
+    for ancestor in element.iterancestors():
+        if ancestor.tag == tag:
+            return True
+        if ancestor is root:
+            return False
+    return False
+
+
+class _RowIndex:
+    """
+    An index of every table cell in a row, keyed by its data-stat attribute.
+
+    Parsing a row by evaluating a CSS selector for every field walks the whole
+    row once per field. Instead, the row is walked a single time to group
+    every ``td`` and ``th`` cell by its tag and data-stat attribute, and any
+    parsing scheme which selects cells by data-stat alone is answered from
+    the index. Cells within a table section, such as 'tfoot', are indexed
+    separately the first time a scheme asks for them. Other parsing schemes
+    fall back to evaluating the selector against the original row. An entire
+    page, such as a boxscore, can be indexed the same way.
+
+    Parameters
+    ----------
+    html_data : PyQuery object
+        A PyQuery object containing one or more rows of stats, or a page.
+    combined : boolean (optional)
+        Treat every row as part of a single block of rows, such as all of the
+        rows for one season of a player's stats, so a ':first' selector
+        matches the first cell across all rows instead of within each row.
+    """
+    def __init__(self, html_data, combined=False):
+        self.html = html_data
+        self._combined = combined
+        self._sections = {}
+        self._texts = {}
+        self._cells = self._index_cells(html_data)
+
+    def _index_cells(self, roots, section=None):
+        """
+        Group every cell by its tag and data-stat attribute.
+
+        Parameters
+        ----------
+        roots : list
+            A ``list`` of the elements to index the cells of.
+        section : string (optional)
+            Only index cells within a table section of each element, such as
+            'tfoot'.
+
+        Returns
+        -------
+        dictionary
+            A dictionary where every key is a tuple of a cell's tag and
+            data-stat attribute, and every value is a ``list`` of tuples of
+            the position of the element the cell was found in and the cell,
+            in document order.
+        """
+        cells = {}
+        for position, root in enumerate(roots):
+            if self._combined:
+                position = 0
+            if section is None:
+                containers = [root]
+            else:
+                containers = [element for element in root.iter(section)
+                              if not _has_ancestor(element, section, root)]
+            for container in containers:
+                for cell in container.iter('td', 'th'):
+                    key = (cell.tag, cell.get('data-stat'))
+                    cells.setdefault(key, []).append((position, cell))
+        return cells
+
+    def __call__(self, selector):
+        """
+        Evaluate a selector against the original rows.
+
+        Parameters
+        ----------
+        selector : string
+            A PyQuery-readable selector.
+
+        Returns
+        -------
+        PyQuery object
+            The elements matching the selector, allowing the index to be used
+            anywhere the rows themselves are queried.
+        """
+        return self.html(selector)
+
+    def texts(self, selector):
+        """
+        Return the text of every cell matching the selector.
+
+        Parameters
+        ----------
+        selector : string
+            A PyQuery-readable selector from a parsing scheme, such as
+            'td[data-stat="wins"]'.
+
+        Returns
+        -------
+        list
+            A ``list`` of the text of every matching cell in the order they
+            appear in the row, matching the output of evaluating the selector
+            with PyQuery.
+        """
+        texts = self._texts.get(selector)
+        if texts is not None:
+            return texts
+        match = DATA_STAT_SELECTOR.match(selector)
+        if match:
+            section, tag, stat, first = match.groups()
+            if section:
+                if section not in self._sections:
+                    self._sections[section] = self._index_cells(self.html,
+                                                                section)
+                cells = self._sections[section].get((tag, stat), [])
+            else:
+                cells = self._cells.get((tag, stat), [])
+            if first:
+                # Like PyQuery, ':first' selects the first matching cell
+                # within each of the rows rather than across all of them.
+                firsts = {}
+                for position, cell in cells:
+                    firsts.setdefault(position, cell)
+                cells = list(firsts.items())
+            texts = [extract_text(cell) for _, cell in cells]
+        else:
+            texts = parsing.get_engine().texts(self.html, selector)
+        self._texts[selector] = texts
+        return texts
+
+
 def _parse_field(parsing_scheme, html_data, field, index=0, strip=False,
                  secondary_index=None):
     """
@@ -171,10 +388,11 @@ def _parse_field(parsing_scheme, html_data, field, index=0, strip=False,
         field. The key corresponds to the attribute name to parse, and the
         value is a PyQuery-readable parsing scheme as a string (such as
         'td[data-stat="wins"]').
-    html_data : string
-        A string containing all of the rows of stats for a given team. If
-        multiple tables are being referenced, this will be comprised of
-        multiple rows in a single string.
+    html_data : PyQuery object or _RowIndex
+        A PyQuery object containing all of the rows of stats for a given team.
+        If multiple tables are being referenced, this will be comprised of
+        multiple rows. When parsing many fields from the same rows, pass a
+        ``_RowIndex`` of the rows instead so they are only walked once.
     field : string
         The name of the attribute to match. Field must be a key in
         parsing_scheme.
@@ -202,13 +420,20 @@ def _parse_field(parsing_scheme, html_data, field, index=0, strip=False,
         The value at the specified index for the requested field. If no value
         could be found, returns None.
     """
+    if isinstance(html_data, _RowIndex):
+        row = html_data
+        html_data = row.html
+    else:
+        row = None
     if field == 'abbreviation':
         return _parse_abbreviation(html_data)
     scheme = parsing_scheme[field]
-    if strip:
-        items = [i.text() for i in html_data(scheme).items() if i.text()]
+    if row is not None:
+        items = row.texts(scheme)
     else:
-        items = [i.text() for i in html_data(scheme).items()]
+        items = parsing.get_engine().texts(html_data, scheme)
+    if strip:
+        items = [i for i in items if i]
     # Stats can be added and removed on a yearly basis. If not stats are found,
     # return None and have the be the value.
     if len(items) == 0:
@@ -226,6 +451,182 @@ def _parse_field(parsing_scheme, html_data, field, index=0, strip=False,
         return None
 
 
+def _detach(html, compact=True):
+    """
+    Copy elements out of the page they were found in.
+
+    A PyQuery object of a few elements keeps their entire page alive. For
+    compact objects, the elements are copied into a standalone PyQuery object
+    so the page can be released while the elements still behave the same.
+
+    Parameters
+    ----------
+    html : PyQuery object
+        A PyQuery object of the elements to keep, such as a team's name tag.
+    compact : boolean (optional)
+        True if the object keeping the elements should be compact.
+
+    Returns
+    -------
+    PyQuery object
+        A copy of the elements if the object should be compact, otherwise the
+        passed elements.
+    """
+    if not compact:
+        return html
+    return pq([deepcopy(element) for element in html])
+
+
+def _release(instance, *names, compact=True):
+    """
+    Drop an object's references to the page it was built from.
+
+    Parameters
+    ----------
+    instance : object
+        The object whose values have already been parsed.
+    *names : string
+        The name of every attribute holding HTML from the page, such as
+        '_player_data'.
+    compact : boolean (optional)
+        True if the object should be compact. Nothing is dropped otherwise.
+    """
+    if compact:
+        for name in names:
+            setattr(instance, name, None)
+
+
+def _is_shadowed(cls, field):
+    """
+    Determine whether a class attribute hides a field from ``__getattr__``.
+
+    Parameters
+    ----------
+    cls : class
+        The class of the object whose fields are being parsed.
+    field : string
+        A ``string`` of the name of the field.
+
+    Returns
+    -------
+    boolean
+        True if the class has an attribute with the same name which isn't the
+        field's own slot.
+    """
+    attribute = getattr(cls, field, _MISSING)
+    return attribute is not _MISSING and \
+        not isinstance(attribute, MemberDescriptorType)
+
+
+def _parse_fields(instance, fields, parse, *args, together=False,
+                  lazy=False):
+    """
+    Set the value of every field, parsing them lazily if requested.
+
+    Unless ``lazy`` is set, every field is parsed and set immediately.
+    Otherwise, the fields are removed from the instance and recorded as
+    pending, along with the current parser engine, to be parsed by
+    ``_parse_pending_field`` with that engine the first time they are read.
+
+    Parameters
+    ----------
+    instance : object
+        The object whose fields are being set.
+    fields : list
+        A ``list`` of the names of the attributes to set, such as '_points'.
+    parse : function
+        The function which parses the fields. Unless ``together`` is True, it
+        is called with the name of a single field followed by ``args`` and
+        returns that field's value.
+    args : list (optional)
+        Any additional arguments to pass to ``parse``, such as the HTML data
+        being parsed.
+    together : boolean (optional)
+        True if every field is parsed by a single call to ``parse`` with only
+        ``args``, which returns a ``tuple`` of the values in the same order as
+        ``fields``.
+    lazy : boolean (optional)
+        True to defer parsing each field until it is first read.
+    """
+    if not lazy:
+        if together:
+            for field, value in zip(fields, parse(*args)):
+                setattr(instance, field, value)
+        else:
+            for field in fields:
+                setattr(instance, field, parse(field, *args))
+        return
+    pending = getattr(instance, '_pending_fields', None)
+    if pending is None:
+        pending = {}
+        instance._pending_fields = pending
+    group = tuple(fields) if together else None
+    engine = parsing.get_engine()
+    # A class attribute of the same name would be found before
+    # ``__getattr__`` is ever called, so those fields are parsed right away.
+    shadowed = [field for field in fields
+                if _is_shadowed(type(instance), field)]
+    if shadowed:
+        if together:
+            for field, value in zip(fields, parse(*args)):
+                setattr(instance, field, value)
+            return
+        for field in shadowed:
+            setattr(instance, field, parse(field, *args))
+        fields = [field for field in fields if field not in shadowed]
+    for field in fields:
+        pending[field] = (parse, args, group, engine)
+        try:
+            delattr(instance, field)
+        except AttributeError:
+            pass
+
+
+def _parse_pending_field(instance, name):
+    """
+    Parse a field whose parsing was deferred by ``_parse_fields``.
+
+    This is called by the ``__getattr__`` method of classes which support
+    lazy parsing, so it only runs when the attribute isn't already set.
+
+    Parameters
+    ----------
+    instance : object
+        The object the attribute was requested from.
+    name : string
+        A ``string`` of the name of the requested attribute.
+
+    Returns
+    -------
+    string
+        The parsed value of the field, which is also set on the instance so
+        it is only parsed once.
+
+    Raises
+    ------
+    AttributeError
+        If the attribute isn't a field which is waiting to be parsed.
+    """
+    if name == '_pending_fields':
+        raise AttributeError(name)
+    pending = getattr(instance, '_pending_fields', None)
+    if not pending or name not in pending:
+        raise AttributeError("'%s' object has no attribute '%s'" %
+                             (type(instance).__name__, name))
+    parse, args, group, engine = pending.pop(name)
+    if group is None:
+        with parsing.using_engine(engine):
+            value = parse(name, *args)
+        setattr(instance, name, value)
+        return value
+    with parsing.using_engine(engine):
+        values = parse(*args)
+    for field, value in zip(group, values):
+        pending.pop(field, None)
+        setattr(instance, field, value)
+    return getattr(instance, name)
+
+
 def _remove_html_comment_tags(html):
     """
     Returns the passed HTML contents with all comment tags removed while
@@ -248,6 +649,74 @@ def _remove_html_comment_tags(html):
     return str(html).replace('<!--', '').replace('-->', '')
 
 
+def _append_text(parent, previous, text):
+    """
+    Add text to a document directly after an element's position.
+
+    Parameters
+    ----------
+    parent : lxml Element
+        The element the text belongs to.
+    previous : lxml Element
+        The element directly preceding the text, or None if the text comes
+        before every child of ``parent``.
+    text : string
+        A ``string`` of the text to add.
+    """
+    if not text:
+        return
+    if previous is not None:
+        previous.tail = (previous.tail or '') + text
+    else:
+        parent.text = (parent.text or '') + text
+
+
+def _expand_html_comments(html_page):
+    """
+    Replace every comment containing HTML with the parsed contents.
+
+    Sports-reference hides many of the tables on a page inside comments which
+    are only displayed by the browser after the page loads. Rather than
+    serializing the whole document, removing every comment tag, and parsing
+    the result again, only the contents of comments which contain markup are
+    parsed, and the resulting elements take the comment's place in the
+    document. Comments which only contain text are left untouched.
+
+    Parameters
+    ----------
+    html_page : PyQuery object
+        A PyQuery object of the requested page. The document is modified in
+        place.
+
+    Returns
+    -------
+    PyQuery object
+        The same PyQuery object with every commented-out table included in
+        the document.
+    """
+    for root in html_page:
+        for comment in list(root.iter(Comment)):
+            contents = comment.text
+            parent = comment.getparent()
+            if not contents or '<' not in contents or parent is None:
+                continue
+            try:
+                fragments = fragments_fromstring(contents)
+            except (ParserError, XMLSyntaxError):
+                continue
+            previous = comment.getprevious()
+            index = parent.index(comment)
+            tail = comment.tail
+            parent.remove(comment)
+            if fragments and isinstance(fragments[0], str):
+                _append_text(parent, previous, fragments.pop(0))
+            for offset, element in enumerate(fragments):
+                parent.insert(index + offset, element)
+                previous = element
+            _append_text(parent, previous, tail)
+    return html_page
+
+
 def _get_stats_table(html_page, div, footer=False):
     """
     Returns a generator of all rows in a requested table.
@@ -259,8 +728,9 @@ def _get_stats_table(html_page, div, footer=False):
 
     Parameters
     ----------
-    html_page : PyQuery object
-        A PyQuery object which contains the requested HTML page contents.
+    html_page : PyQuery object or _StreamedPage
+        A PyQuery object which contains the requested HTML page contents, or
+        a ``_StreamedPage`` of the page to scan for the table.
     div : string
         The requested tag type and id string in the format "<tag>#<id name>"
         which aligns to the desired table in the passed HTML page. For example,
@@ -273,18 +743,204 @@ def _get_stats_table(html_page, div, footer=False):
     generator
         A generator of all row items in a given table.
     """
-    stats_html = html_page(div)
-    try:
-        stats_table = pq(_remove_html_comment_tags(stats_html))
-    except (ParserError, XMLSyntaxError):
-        return None
+    if isinstance(html_page, _StreamedPage):
+        return html_page.rows(div, footer)
+    engine = parsing.get_engine()
+    stats_html = engine.find(html_page, div)
+    if engine.in_place:
+        if not stats_html:
+            return None
+        stats_table = _expand_html_comments(stats_html)
+    else:
+        try:
+            stats_table = pq(_remove_html_comment_tags(stats_html))
+        except (ParserError, XMLSyntaxError):
+            return None
     if footer:
-        teams_list = stats_table('tfoot tr').items()
+        teams_list = engine.find(stats_table, 'tfoot tr').items()
     else:
-        teams_list = stats_table('tbody tr').items()
+        teams_list = engine.find(stats_table, 'tbody tr').items()
     return teams_list
 
 
+def _discard(element):
+    """
+    Free an element which has been completely parsed and isn't needed.
+
+    Parameters
+    ----------
+    element : lxml Element
+        The element whose end tag was just parsed. It is emptied and every
+        element preceding it under the same parent is removed.
+    """
+    element.clear(keep_tail=True)
+    parent = element.getparent()
+    if parent is not None:
+        while element.getprevious() is not None:
+            del parent[0]
+
+
+class _StreamedPage:
+    """
+    A page which is scanned for its stats tables instead of being parsed.
+
+    Rather than building a document of the entire page, the page is fed to
+    an incremental parser which discards every element as soon as it has been
+    parsed, until the requested table is found. Only the rows of that table
+    are kept, and parsing stops once the table ends, so memory use stays flat
+    no matter how large the rest of the page is.
+
+    Parameters
+    ----------
+    contents : string (optional)
+        A ``string`` of the page's HTML contents.
+    local_file : string (optional)
+        A link to a local file which has been pre-downloaded from the website,
+        which is read a piece at a time.
+    """
+    def __init__(self, contents=None, local_file=None):
+        self._contents = contents
+        self._local_file = local_file
+
+    def __str__(self):
+        if self._local_file:
+            with open(self._local_file, 'r', encoding='utf8') as filehandle:
+                return filehandle.read()
+        return self._contents
+
+    def _chunks(self):
+        """
+        Read the page a piece at a time.
+
+        Returns
+        -------
+        generator
+            A generator of strings of at most ``STREAM_CHUNK_SIZE`` characters
+            which make up the page.
+        """
+        if self._local_file:
+            with open(self._local_file, 'r', encoding='utf8') as filehandle:
+                for chunk in iter(lambda: filehandle.read(STREAM_CHUNK_SIZE),
+                                  ''):
+                    yield chunk
+            return
+        for start in range(0, len(self._contents), STREAM_CHUNK_SIZE):
+            yield self._contents[start:start + STREAM_CHUNK_SIZE]
+
+    def _events(self, tags):
+        """
+        Parse the page incrementally.
+
+        Parameters
+        ----------
+        tags : list
+            A ``list`` of the tag names to emit 'start' and 'end' events for.
+            Every other element is still parsed, but without the overhead of
+            reporting it.
+
+        Returns
+        -------
+        generator
+            A generator of the (event, element) tuples emitted while parsing
+            the page, where the event is 'start', 'end', or 'comment'.
+        """
+        parser = HTMLPullParser(events=('start', 'end', 'comment'), tag=tags)
+        for chunk in self._chunks():
+            parser.feed(chunk)
+            for event in parser.read_events():
+                yield event
+        parser.close()
+        for event in parser.read_events():
+            yield event
+
+    def rows(self, div, footer=False):
+        """
+        Returns a generator of all rows in a requested table.
+
+        Parameters
+        ----------
+        div : string
+            The requested tag type and id string in the format
+            "<tag>#<id name>", such as "table#basic_school_stats".
+        footer : boolean (optional)
+            Optionally return the table footer rows instead of the table body.
+
+        Returns
+        -------
+        generator
+            A generator of PyQuery objects of every row in the table in the
+            same order as ``_get_stats_table``, or None if the page doesn't
+            contain the table.
+        """
+        match = TABLE_SELECTOR.match(div)
+        if not match:
+            try:
+                html_page = pq(str(self))
+            except (ParserError, XMLSyntaxError):
+                return None
+            return _get_stats_table(html_page, div, footer)
+        tag, table_id = match.groups()
+        # Tables make up the bulk of every page, so they are freed as soon as
+        # they have been parsed if they weren't requested.
+        events = self._events([tag, 'table', 'tr'])
+        for event, element in events:
+            if event == 'start' and element.tag == tag and \
+               element.get('id') == table_id:
+                section = 'tfoot' if footer else 'tbody'
+                return self._table_rows(events, element, section)
+            if event == 'end':
+                _discard(element)
+        return None
+
+    def _table_rows(self, events, table, section):
+        """
+        Find the rows of a table as the rest of it is parsed.
+
+        Parameters
+        ----------
+        events : generator
+            The generator of parser events, positioned directly after the
+            start of the table.
+        table : lxml Element
+            The element which was requested.
+        section : string
+            A ``string`` of the section to return the rows of, either 'tbody'
+            or 'tfoot'.
+
+        Returns
+        -------
+        generator
+            A generator of PyQuery objects of every row in the section,
+            including the rows of tables which are commented out.
+        """
+        commented_rows = parsing.compile_selector('%s tr' % section)
+        for event, element in events:
+            if event == 'comment':
+                contents = element.text
+                if not contents or '<' not in contents:
+                    continue
+                try:
+                    fragments = fragments_fromstring(contents)
+                except (ParserError, XMLSyntaxError):
+                    continue
+                for fragment in fragments:
+                    if isinstance(fragment, str):
+                        continue
+                    for row in commented_rows(fragment):
+                        yield pq(row)
+            elif event == 'end':
+                if element is table:
+                    return
+                if element.tag != 'tr':
+                    continue
+                for ancestor in element.iterancestors():
+                    if ancestor is table:
+                        break
+                    if ancestor.tag == section:
+                        yield pq(element)
+                        break
+
+
 def _pull_page(url=None, local_file=None):
     """
     Pull data from a local file if exists, or download data from the website.
@@ -292,7 +948,10 @@ def _pull_page(url=None, local_file=None):
     If local_file is passed, users can pull data directly from a local file
     which has already been downloaded instead of downloading from
     sports-reference.com using the package. This reduces server load on their
-    end, and allows package users to work offline.
+    end, and allows package users to work offline. Pages which are downloaded
+    go through the shared, pooled session in ``sportsipy.fetch`` and are read
+    from the on-disk response cache when it has been enabled with
+    ``sportsipy.cache.enable_cache``.
 
     Parameters
     ----------
@@ -312,15 +971,357 @@ def _pull_page(url=None, local_file=None):
     ValueError
         Raises a ``ValueError`` if neither the URL nor the local_file
         parameters were specified.
+    HTTPError
+        Raises an ``HTTPError`` if the requested URL could not be downloaded.
     """
     if local_file:
         with open(local_file, 'r', encoding='utf8') as filehandle:
             return pq(filehandle.read())
     if url:
-        return pq(url)
+        return pq(fetch._fetch(url))
     raise ValueError('Expected either a URL or a local data file!')
 
 
+def _pull_table_page(url=None, local_file=None, stream=False):
+    """
+    Pull a page which is only read for its stats tables.
+
+    Unless ``stream`` is set, this is the same as ``_pull_page``. Otherwise,
+    the page is returned unparsed so ``_get_stats_table`` can stream each
+    requested table out of it.
+
+    Parameters
+    ----------
+    url : string (optional)
+        A ``string`` of the URL to pull data from.
+    local_file : string (optional)
+        A link to a local file which has been pre-downloaded from the website.
+    stream : boolean (optional)
+        Set to True to stream the requested tables out of the page instead of
+        parsing the page in full. Defaults to False.
+
+    Returns
+    -------
+    PyQuery object or _StreamedPage
+        Returns a ``PyQuery`` object of the page, or a ``_StreamedPage`` if
+        streaming is enabled.
+
+    Raises
+    ------
+    ValueError
+        Raises a ``ValueError`` if neither the URL nor the local_file
+        parameters were specified.
+    HTTPError
+        Raises an ``HTTPError`` if the requested URL could not be downloaded.
+    """
+    if not stream:
+        return _pull_page(url, local_file)
+    if local_file:
+        return _StreamedPage(local_file=local_file)
+    if url:
+        return _StreamedPage(fetch._fetch(url))
+    raise ValueError('Expected either a URL or a local data file!')
+
+
+def _boxscore_days(date, end_date, create_url):
+    """
+    Determine which pages need to be downloaded for a range of days.
+
+    Parameters
+    ----------
+    date : datetime object
+        The first date to search for any matches.
+    end_date : datetime object
+        The last date to search for any matches. If left empty, or if
+        'end_date' is prior to 'date', only the page for 'date' is included.
+    create_url : function
+        The function which accepts a date and returns the URL of the page
+        listing the games played on that day.
+
+    Returns
+    -------
+    list
+        A ``list`` of tuples of the string date in format 'MM-DD-YYYY' and the
+        URL of the page listing the games played on that day, for each day in
+        the range.
+    """
+    # Set the end date to the start date if the end date is before the start
+    # date.
+    if not end_date or date > end_date:
+        end_date = date
+    pages = []
+    date_step = date
+    while date_step <= end_date:
+        timestamp = '%s-%s-%s' % (date_step.month, date_step.day,
+                                  date_step.year)
+        pages.append((timestamp, create_url(date_step)))
+        date_step += timedelta(days=1)
+    return pages
+
+
+def _add_boxscore_games(boxscores, timestamp, page):
+    """
+    Add every game listed on a page to a ``Boxscores`` dictionary.
+
+    Parameters
+    ----------
+    boxscores : Boxscores instance
+        The ``Boxscores`` instance of any league to add the games to.
+    timestamp : string
+        A ``string`` of the key to store the games under.
+    page : PyQuery object
+        A PyQuery object of the page listing the games.
+    """
+    games = page('table[class="teams"]').items()
+    boxscores._boxscores[timestamp] = boxscores._extract_game_info(games)
+
+
+def _find_boxscore_games(boxscores, pages):
+    """
+    Download every page one at a time and add the games it lists.
+
+    Parameters
+    ----------
+    boxscores : Boxscores instance
+        The ``Boxscores`` instance of any league to add the games to.
+    pages : list
+        A ``list`` of tuples of the key to store each page's games under and
+        the URL of the page.
+    """
+    for timestamp, url in pages:
+        page = boxscores._get_requested_page(url)
+        _add_boxscore_games(boxscores, timestamp, page)
+
+
+def _frame_row(instance, name='dataframe'):
+    """
+    Find the row an object adds to a collection's DataFrame.
+
+    Objects whose DataFrame is built from a single row define a method named
+    after the DataFrame property, such as ``_dataframe_row`` for
+    ``dataframe``, which returns the row without creating the DataFrame.
+    Otherwise, the DataFrame returned by the property is used.
+
+    Parameters
+    ----------
+    instance : object
+        The object, such as a Game or Team, whose row is requested.
+    name : string (optional)
+        A ``string`` of the name of the object's DataFrame property, such as
+        'dataframe_extended'.
+
+    Returns
+    -------
+    tuple or Pandas DataFrame
+        A ``tuple`` of the row's index and a ``dictionary`` of its values
+        keyed by column name, or the DataFrame returned by the property. Either
+        one is None if the object has no data.
+    """
+    row = getattr(instance, '_%s_row' % name, None)
+    if row is not None:
+        return row()
+    return getattr(instance, name)
+
+
+def _row_items(rows):
+    """
+    Iterate over the index and values of every row, expanding DataFrames.
+
+    Parameters
+    ----------
+    rows : iterable
+        An iterable of rows as returned by ``_frame_row``.
+
+    Returns
+    -------
+    generator
+        A generator of ``tuples`` of each row's index and a ``dictionary`` of
+        its values keyed by column name, skipping rows which are None.
+    """
+    for row in rows:
+        if row is None:
+            continue
+        if isinstance(row, pd.DataFrame):
+            for item in zip(row.index, row.to_dict('records')):
+                yield item
+        else:
+            yield row
+
+
+def _build_dataframe(rows):
+    """
+    Build a single DataFrame from the rows of several objects.
+
+    The values of every row are gathered into one list per column and the
+    DataFrame is created once, instead of creating a DataFrame for every row
+    and concatenating them. Columns where every row has a value are given the
+    type inferred from the values, while columns with missing values keep
+    each value as-is, matching the result of concatenating one DataFrame per
+    row.
+
+    Parameters
+    ----------
+    rows : iterable
+        An iterable of ``tuples`` of each row's index and a ``dictionary`` of
+        its values keyed by column name, as returned by the ``_dataframe_row``
+        methods, or of DataFrames whose rows are all included. Rows which are
+        None are skipped.
+
+    Returns
+    -------
+    Pandas DataFrame
+        A DataFrame with a row for every row which isn't None, in the same
+        order, or None if there are no rows.
+    """
+    index = []
+    columns = {}
+    for row_index, fields in _row_items(rows):
+        for name, value in fields.items():
+            values = columns.get(name)
+            if values is None:
+                # Rows which don't have this column are left empty.
+                values = [None] * len(index)
+                columns[name] = values
+            values.append(value)
+        index.append(row_index)
+        if len(fields) < len(columns):
+            for values in columns.values():
+                if len(values) < len(index):
+                    values.append(None)
+    if not index:
+        return None
+    data = {}
+    for name, values in columns.items():
+        column = pd.Series(values, dtype=object)
+        if None not in values:
+            column = column.infer_objects()
+        data[name] = column
+    frame = pd.DataFrame(data)
+    frame.index = index
+    return frame
+
+
+def _first_indices(values):
+    """
+    Find the index of the first occurrence of each value in a list.
+
+    Parameters
+    ----------
+    values : list
+        A ``list`` of values, such as a player's seasons, which may contain
+        duplicates.
+
+    Returns
+    -------
+    list
+        A ``list`` of the same length as ``values``, where each element is the
+        index of the first occurrence of the value at that position.
+    """
+    first = {}
+    for index, value in enumerate(values):
+        first.setdefault(value, index)
+    return [first[value] for value in values]
+
+
+def _lookup_key(value):
+    """
+    Normalize a value used to look up an item in a collection.
+
+    Values are only compared case-insensitively, so surrounding whitespace
+    still has to match.
+
+    Parameters
+    ----------
+    value : string
+        A ``string`` of the requested value, such as a team's abbreviation.
+
+    Returns
+    -------
+    string
+        The lowercase value.
+    """
+    return value.lower()
+
+
+def _keyed(instance, items, *attributes):
+    """
+    Return an index of the items in a collection by their attributes.
+
+    Every item is indexed under the normalized value of each of the given
+    attributes, with the first item in the collection's order kept for any
+    value shared by multiple items, matching a scan through the collection.
+    The index is built once and kept on the instance for as long as the same
+    list of items is passed. The list must not be modified once it has been
+    indexed, as changes to it aren't detected; replace it with a new list
+    instead.
+
+    Parameters
+    ----------
+    instance : object
+        The collection, such as ``Teams``, which keeps the index.
+    items : list
+        A ``list`` of every item in the collection in iteration order.
+    *attributes : string
+        The name of every attribute to index the items by, such as
+        'abbreviation'. Items missing an attribute aren't indexed by it.
+
+    Returns
+    -------
+    dictionary
+        A ``dictionary`` of each item keyed by the normalized value of each of
+        its attributes.
+    """
+    keys = getattr(instance, '_keys', None)
+    if keys is None or keys[0] is not items:
+        index = {}
+        for item in items:
+            for attribute in attributes:
+                value = getattr(item, attribute)
+                if value:
+                    index.setdefault(_lookup_key(value), item)
+        keys = (items, index)
+        instance._keys = keys
+    return keys[1]
+
+
+def _dated(instance, games):
+    """
+    Return an index of a schedule's games by the day they are played.
+
+    The index is built once and kept on the instance for as long as the same
+    list of games is passed. The list must not be modified once it has been
+    indexed, as changes to it aren't detected; replace it with a new list
+    instead. Games whose date can't be determined aren't indexed.
+
+    Parameters
+    ----------
+    instance : object
+        The schedule which keeps the index.
+    games : list
+        A ``list`` of every game in the schedule in order.
+
+    Returns
+    -------
+    dictionary
+        A ``dictionary`` where each key is a ``tuple`` of the year, month, and
+        day, and each value is a ``list`` of every game played that day in
+        schedule order, such as both games of a doubleheader.
+    """
+    dates = getattr(instance, '_dates', None)
+    if dates is None or dates[0] is not games:
+        index = {}
+        for game in games:
+            try:
+                played = game.datetime
+                day = (played.year, played.month, played.day)
+            except (AttributeError, TypeError, ValueError):
+                continue
+            index.setdefault(day, []).append(game)
+        dates = (games, index)
+        instance._dates = dates
+    return dates[1]
+
+
 def _no_data_found():
     """
     Print a message that no data could be found on the page.
@@ -0,0 +1,58 @@
+"""
+Time building Player instances from the roster fixtures.
+
+Every page request is answered with the player's fixture from
+tests/integration/roster, so the timings only reflect parsing. Run the module
+from the root of the repository, optionally passing the number of times to
+build each player:
+
+    python -m tests.benchmarks.player_parsing 10
+
+Set SPORTSIPY_PARSER to time a different parser engine, such as 'lxml'.
+"""
+import mock
+import os
+import sys
+import timeit
+from importlib import import_module
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        os.pardir, 'integration', 'roster')
+ROSTER_PAGES = ('2017', '2018', '2018-roster', '2018_roster')
+LEAGUES = ['mlb', 'nba', 'ncaab', 'ncaaf', 'nfl', 'nhl']
+
+
+class MockResponse:
+    def __init__(self, contents):
+        self.status_code = 200
+        self.headers = {}
+        self.text = contents
+
+
+def player_fixtures(league):
+    directory = os.path.join(FIXTURES, league)
+    for filename in sorted(os.listdir(directory)):
+        player_id, _ = os.path.splitext(filename)
+        if player_id in ROSTER_PAGES:
+            continue
+        with open(os.path.join(directory, filename), encoding='utf8') as page:
+            yield player_id, page.read()
+
+
+def benchmark(league, repeat):
+    player_class = import_module('sportsipy.%s.roster' % league).Player
+    total = 0
+    for player_id, contents in player_fixtures(league):
+        with mock.patch('requests.Session.get',
+                        return_value=MockResponse(contents)):
+            seconds = timeit.timeit(lambda: player_class(player_id),
+                                    number=repeat) / repeat
+        total += seconds
+        print('%-6s %-20s %8.1f ms' % (league, player_id, seconds * 1000))
+    return total
+
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    total = sum(benchmark(league, repeat) for league in LEAGUES)
+    print('%-27s %8.1f ms' % ('total', total * 1000))
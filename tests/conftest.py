@@ -0,0 +1,11 @@
+import pytest
+from sportsipy import utils
+
+
+@pytest.fixture(autouse=True)
+def clear_resolved_seasons():
+    # Resolved default seasons are remembered for the life of the process, so
+    # they need to be forgotten between tests which mock different seasons.
+    utils._clear_resolved_seasons()
+    yield
+    utils._clear_resolved_seasons()
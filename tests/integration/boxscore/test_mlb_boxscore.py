@@ -3,10 +3,11 @@ import os
 import pandas as pd
 from datetime import datetime
 from flexmock import flexmock
-from sportsipy import utils
+from sportsipy import records, utils
 from sportsipy.constants import AWAY
 from sportsipy.mlb.constants import BOXSCORE_URL, BOXSCORES_URL, NIGHT
 from sportsipy.mlb.boxscore import Boxscore, Boxscores
+from types import MemberDescriptorType
 
 
 MONTH = 10
@@ -43,7 +44,7 @@ class MockDateTime:
 
 
 class TestMLBBoxscore:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'date': 'Thursday, June 7, 2018',
@@ -151,10 +152,10 @@ class TestMLBBoxscore:
 
         boxscore = Boxscore(BOXSCORE)
 
-        for key, value in boxscore.__dict__.items():
+        for key in records._fields(boxscore):
             if key == '_uri':
                 continue
-            assert value is None
+            assert getattr(boxscore, key) is None
 
     def test_mlb_boxscore_dataframe_returns_dataframe_of_all_values(self):
         df = pd.DataFrame([self.results], index=[BOXSCORE])
@@ -189,6 +190,24 @@ class TestMLBBoxscore:
 
         assert boxscore.__repr__() == expected
 
+    def test_mlb_boxscore_fields_include_every_slot(self):
+        fields = records._fields(self.boxscore)
+
+        for name, descriptor in records._slots(Boxscore):
+            if isinstance(descriptor, MemberDescriptorType):
+                assert name in fields
+
+    def test_mlb_boxscore_player_fields_include_every_slot(self):
+        players = self.boxscore.away_players + self.boxscore.home_players
+
+        assert len(players) > 0
+        for player in players:
+            fields = records._fields(player)
+
+            for name, descriptor in records._slots(type(player)):
+                if isinstance(descriptor, MemberDescriptorType):
+                    assert name in fields
+
 
 class TestMLBBoxscores:
     def setup_method(self):
@@ -340,19 +359,19 @@ class TestMLBBoxscores:
             ]
         }
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search(self, *args, **kwargs):
         result = Boxscores(datetime(2017, 7, 17)).games
 
         assert result == self.expected
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search_invalid_end(self, *args, **kwargs):
         result = Boxscores(datetime(2017, 7, 17), datetime(2017, 7, 16)).games
 
         assert result == self.expected
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search_multiple_days(self, *args, **kwargs):
         expected = {
             '7-17-2017': [
@@ -672,7 +691,7 @@ class TestMLBBoxscores:
 
         assert result == expected
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search_string_representation(self, *args, **kwargs):
         result = Boxscores(datetime(2017, 7, 17))
 
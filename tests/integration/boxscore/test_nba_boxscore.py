@@ -1,12 +1,16 @@
+import asyncio
 import mock
 import os
 import pandas as pd
 from datetime import datetime
 from flexmock import flexmock
-from sportsipy import utils
+from pyquery import PyQuery as pq
+from sportsipy import concurrency, parsing, records, utils
 from sportsipy.constants import HOME
 from sportsipy.nba.constants import BOXSCORE_URL, BOXSCORES_URL
 from sportsipy.nba.boxscore import Boxscore, Boxscores
+from sportsipy.nba.schedule import Game
+from types import MemberDescriptorType
 
 
 MONTH = 10
@@ -42,7 +46,7 @@ class MockDateTime:
 
 
 class TestNBABoxscore:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'date': '10:30 PM, October 31, 2017',
@@ -149,10 +153,10 @@ class TestNBABoxscore:
 
         boxscore = Boxscore(BOXSCORE)
 
-        for key, value in boxscore.__dict__.items():
+        for key in records._fields(boxscore):
             if key == '_uri':
                 continue
-            assert value is None
+            assert getattr(boxscore, key) is None
 
     def test_nba_boxscore_dataframe_returns_dataframe_of_all_values(self):
         df = pd.DataFrame([self.results], index=[BOXSCORE])
@@ -185,6 +189,49 @@ class TestNBABoxscore:
 
         assert boxscore.__repr__() == expected
 
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_nba_boxscores_are_parsed_in_other_processes(self, *args,
+                                                         **kwargs):
+        filepath = os.path.join(os.path.dirname(__file__), os.pardir,
+                                'schedule', 'nba', '2017_games.html')
+        with open(filepath, 'r', encoding='utf8') as schedule:
+            rows = utils._get_stats_table(pq(schedule.read()), 'table#games')
+        games = [Game(next(rows)), Game(next(rows)), Game(next(rows))]
+        for game in games[:2]:
+            game._boxscore = BOXSCORE
+        games[2]._boxscore = None
+        updates = []
+
+        with parsing.using_engine('lxml'):
+            rows = concurrency._extended_rows(
+                games, BOXSCORE_URL, workers=2, processes=2,
+                progress=lambda done, total: updates.append(done))
+
+        assert rows[2] is None
+        for index, fields in rows[:2]:
+            assert index == BOXSCORE
+            for attribute, value in self.results.items():
+                assert fields[attribute] == value
+        assert sorted(updates) == [1, 2, 3]
+
+    def test_nba_boxscore_fields_include_every_slot(self):
+        fields = records._fields(self.boxscore)
+
+        for name, descriptor in records._slots(Boxscore):
+            if isinstance(descriptor, MemberDescriptorType):
+                assert name in fields
+
+    def test_nba_boxscore_player_fields_include_every_slot(self):
+        players = self.boxscore.away_players + self.boxscore.home_players
+
+        assert len(players) > 0
+        for player in players:
+            fields = records._fields(player)
+
+            for name, descriptor in records._slots(type(player)):
+                if isinstance(descriptor, MemberDescriptorType):
+                    assert name in fields
+
 
 class TestNBABoxscores:
     def setup_method(self):
@@ -303,19 +350,19 @@ class TestNBABoxscores:
             ]
         }
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search(self, *args, **kwargs):
         result = Boxscores(datetime(2017, 2, 4)).games
 
         assert result == self.expected
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search_invalid_end(self, *args, **kwargs):
         result = Boxscores(datetime(2017, 2, 4), datetime(2017, 2, 3)).games
 
         assert result == self.expected
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search_multiple_days(self, *args, **kwargs):
         expected = {
             '2-4-2017': [
@@ -470,7 +517,22 @@ class TestNBABoxscores:
 
         assert result == expected
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_boxscores_fetch_matches_search(self, *args, **kwargs):
+        start = datetime(2017, 2, 4)
+        end = datetime(2017, 2, 5)
+
+        loop = asyncio.new_event_loop()
+        try:
+            result = loop.run_until_complete(Boxscores.fetch(start, end,
+                                                             concurrency=2))
+        finally:
+            loop.close()
+
+        assert result.games == Boxscores(start, end).games
+        assert list(result.games.keys()) == ['2-4-2017', '2-5-2017']
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search_string_representation(self, *args, **kwargs):
         result = Boxscores(datetime(2017, 2, 4))
 
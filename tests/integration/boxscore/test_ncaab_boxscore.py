@@ -3,10 +3,11 @@ import os
 import pandas as pd
 from datetime import datetime
 from flexmock import flexmock
-from sportsipy import utils
+from sportsipy import records, utils
 from sportsipy.constants import HOME
 from sportsipy.ncaab.constants import BOXSCORES_URL, SCHEDULE_URL
 from sportsipy.ncaab.boxscore import Boxscore, Boxscores
+from types import MemberDescriptorType
 
 
 MONTH = 11
@@ -45,7 +46,7 @@ class MockDateTime:
 
 
 class TestNCAABBoxscore:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'date': 'November 24, 2017',
@@ -156,10 +157,10 @@ class TestNCAABBoxscore:
 
         boxscore = Boxscore(BOXSCORE)
 
-        for key, value in boxscore.__dict__.items():
+        for key in records._fields(boxscore):
             if key == '_uri':
                 continue
-            assert value is None
+            assert getattr(boxscore, key) is None
 
     def test_ncaab_boxscore_dataframe_returns_dataframe_of_all_values(self):
         df = pd.DataFrame([self.results], index=[BOXSCORE])
@@ -186,6 +187,19 @@ class TestNCAABBoxscore:
         for player in boxscore.away_players:
             assert not player.dataframe.empty
 
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_ncaab_boxscore_keeps_page_when_not_compact(self, *args,
+                                                        **kwargs):
+        boxscore = Boxscore(BOXSCORE, compact=False)
+
+        for player in boxscore.home_players:
+            assert player._player_data is not None
+        for player in self.boxscore.home_players:
+            assert player._player_data is None
+        for kept, compact in zip(boxscore.home_players,
+                                 self.boxscore.home_players):
+            assert kept.dataframe.equals(compact.dataframe)
+
     def test_ncaab_boxscore_string_representation(self):
         expected = ('Boxscore for Arizona at Purdue (November 24, 2017)')
 
@@ -193,6 +207,24 @@ class TestNCAABBoxscore:
 
         assert boxscore.__repr__() == expected
 
+    def test_ncaab_boxscore_fields_include_every_slot(self):
+        fields = records._fields(self.boxscore)
+
+        for name, descriptor in records._slots(Boxscore):
+            if isinstance(descriptor, MemberDescriptorType):
+                assert name in fields
+
+    def test_ncaab_boxscore_player_fields_include_every_slot(self):
+        players = self.boxscore.away_players + self.boxscore.home_players
+
+        assert len(players) > 0
+        for player in players:
+            fields = records._fields(player)
+
+            for name, descriptor in records._slots(type(player)):
+                if isinstance(descriptor, MemberDescriptorType):
+                    assert name in fields
+
 
 class TestNCAABBoxscores:
     def setup_method(self):
@@ -741,20 +773,20 @@ class TestNCAABBoxscores:
             ]
         }
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search(self, *args, **kwargs):
         result = Boxscores(datetime(2017, 11, 11)).games
 
         assert result == self.expected
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search_invalid_end(self, *args, **kwargs):
         result = Boxscores(datetime(2017, 11, 11),
                            datetime(2017, 11, 10)).games
 
         assert result == self.expected
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search_multiple_days(self, *args, **kwargs):
         expected = {
             '11-11-2017': [
@@ -2143,7 +2175,7 @@ class TestNCAABBoxscores:
                 ]
             }
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search_string_representation(self, *args, **kwargs):
         result = Boxscores(datetime(2017, 11, 11))
 
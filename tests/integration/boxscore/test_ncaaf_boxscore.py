@@ -3,10 +3,11 @@ import os
 import pandas as pd
 from datetime import datetime
 from flexmock import flexmock
-from sportsipy import utils
+from sportsipy import records, utils
 from sportsipy.constants import AWAY
 from sportsipy.ncaaf.constants import BOXSCORE_URL, BOXSCORES_URL
 from sportsipy.ncaaf.boxscore import Boxscore, Boxscores
+from types import MemberDescriptorType
 
 
 MONTH = 10
@@ -42,7 +43,7 @@ class MockDateTime:
 
 
 class TestNCAAFBoxscore:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'date': 'Monday Jan 8, 2018',
@@ -107,10 +108,10 @@ class TestNCAAFBoxscore:
 
         boxscore = Boxscore(BOXSCORE)
 
-        for key, value in boxscore.__dict__.items():
+        for key in records._fields(boxscore):
             if key == '_uri':
                 continue
-            assert value is None
+            assert getattr(boxscore, key) is None
 
     def test_ncaaf_boxscore_dataframe_returns_dataframe_of_all_values(self):
         df = pd.DataFrame([self.results], index=[BOXSCORE])
@@ -144,6 +145,24 @@ class TestNCAAFBoxscore:
 
         assert boxscore.__repr__() == expected
 
+    def test_ncaaf_boxscore_fields_include_every_slot(self):
+        fields = records._fields(self.boxscore)
+
+        for name, descriptor in records._slots(Boxscore):
+            if isinstance(descriptor, MemberDescriptorType):
+                assert name in fields
+
+    def test_ncaaf_boxscore_player_fields_include_every_slot(self):
+        players = self.boxscore.away_players + self.boxscore.home_players
+
+        assert len(players) > 0
+        for player in players:
+            fields = records._fields(player)
+
+            for name, descriptor in records._slots(type(player)):
+                if isinstance(descriptor, MemberDescriptorType):
+                    assert name in fields
+
 
 class TestNCAAFBoxscores:
     def setup_method(self):
@@ -1442,19 +1461,19 @@ class TestNCAAFBoxscores:
             ]
         }
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search(self, *args, **kwargs):
         result = Boxscores(datetime(2017, 8, 30)).games
 
         assert result == self.expected
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search_invalid_end(self, *args, **kwargs):
         result = Boxscores(datetime(2017, 8, 30), datetime(2017, 8, 29)).games
 
         assert result == self.expected
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search_multiple_days(self, *args, **kwargs):
         expected = {
             '8-30-2017': [
@@ -4046,7 +4065,7 @@ class TestNCAAFBoxscores:
 
         assert result == expected
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search_string_representation(self, *args, **kwargs):
         result = Boxscores(datetime(2017, 8, 30))
 
@@ -3,10 +3,11 @@ import os
 import pandas as pd
 from datetime import datetime
 from flexmock import flexmock
-from sportsipy import utils
+from sportsipy import records, utils
 from sportsipy.constants import AWAY
 from sportsipy.nfl.constants import BOXSCORE_URL, BOXSCORES_URL
 from sportsipy.nfl.boxscore import Boxscore, Boxscores
+from types import MemberDescriptorType
 
 
 MONTH = 10
@@ -42,7 +43,7 @@ class MockDateTime:
 
 
 class TestNFLBoxscore:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'date': 'Sunday Feb 4, 2018',
@@ -132,10 +133,10 @@ class TestNFLBoxscore:
 
         boxscore = Boxscore(BOXSCORE)
 
-        for key, value in boxscore.__dict__.items():
+        for key in records._fields(boxscore):
             if key == '_uri':
                 continue
-            assert value is None
+            assert getattr(boxscore, key) is None
 
     def test_nfl_boxscore_dataframe_returns_dataframe_of_all_values(self):
         df = pd.DataFrame([self.results], index=[BOXSCORE])
@@ -170,6 +171,24 @@ class TestNFLBoxscore:
 
         assert boxscore.__repr__() == expected
 
+    def test_nfl_boxscore_fields_include_every_slot(self):
+        fields = records._fields(self.boxscore)
+
+        for name, descriptor in records._slots(Boxscore):
+            if isinstance(descriptor, MemberDescriptorType):
+                assert name in fields
+
+    def test_nfl_boxscore_player_fields_include_every_slot(self):
+        players = self.boxscore.away_players + self.boxscore.home_players
+
+        assert len(players) > 0
+        for player in players:
+            fields = records._fields(player)
+
+            for name, descriptor in records._slots(type(player)):
+                if isinstance(descriptor, MemberDescriptorType):
+                    assert name in fields
+
 
 class TestNFLBoxscores:
     def setup_method(self):
@@ -343,19 +362,19 @@ class TestNFLBoxscores:
             ]
         }
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search(self, *args, **kwargs):
         result = Boxscores(7, 2017).games
 
         assert result == self.expected
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search_invalid_end(self, *args, **kwargs):
         result = Boxscores(7, 2017, 5).games
 
         assert result == self.expected
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search_multiple_weeks(self, *args, **kwargs):
         expected = {
             '7-2017': [
@@ -675,13 +694,13 @@ class TestNFLBoxscores:
 
         assert result == expected
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search_string_representation(self, *args, **kwargs):
         result = Boxscores(7, 2017)
 
         assert result.__repr__() == 'NFL games for week 7'
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search_string_representation_multi_week(self, *args,
                                                                **kwargs):
         result = Boxscores(7, 2017, 8)
@@ -1,9 +1,12 @@
 import mock
 import pandas as pd
+import pytest
 from flexmock import flexmock
 from os import path
 from pyquery import PyQuery as pq
+from sportsipy import records
 from sportsipy.fb.roster import Roster
+from types import MemberDescriptorType
 
 
 EXPECTED_NUM_PLAYERS = 34
@@ -25,7 +28,7 @@ def mock_pyquery(url):
 
 
 class TestFBRoster:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'name': 'Harry Kane',
@@ -321,6 +324,13 @@ class TestFBRoster:
         for attribute, value in self.results.items():
             assert getattr(harry_kane, attribute) == value
 
+    def test_player_name_is_found_ignoring_case_and_whitespace(self):
+        assert self.roster(' harry kane ') is self.roster('Harry Kane')
+
+    def test_padded_player_id_is_not_found(self):
+        with pytest.raises(ValueError):
+            self.roster(' 21a66f6a ')
+
     def test_number_of_players_returns_expected(self):
         for count, player in enumerate(self.roster):
             pass
@@ -345,7 +355,7 @@ class TestFBRoster:
 
         assert df1.empty
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_fb_invalid_tables_returns_nothing(self, *args, **kwargs):
         roster = Roster('Tottenham Hotspur')
         stats = roster._pull_stats(pq('<div></div>'))
@@ -394,3 +404,12 @@ Dennis Cirken (307ea3b6)"""
         player = self.roster('Harry Kane')
 
         assert player.__repr__() == 'Harry Kane (21a66f6a)'
+
+    def test_squad_player_fields_include_every_slot(self):
+        assert len(self.roster) > 0
+        for player in self.roster:
+            fields = records._fields(player)
+
+            for name, descriptor in records._slots(type(player)):
+                if isinstance(descriptor, MemberDescriptorType):
+                    assert name in fields
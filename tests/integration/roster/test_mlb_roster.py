@@ -50,7 +50,7 @@ def mock_request(url):
 
 
 class TestMLBPlayer:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results_career = {
             'assists': 2763,
@@ -583,7 +583,7 @@ class TestMLBPlayer:
 
 
 class TestMLBPitcher:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results_career = {
             'assists': 278,
@@ -1174,7 +1174,7 @@ class TestMLBPitcher:
 
 
 class TestMLBRoster:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_pulls_all_player_stats(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -1187,12 +1187,12 @@ class TestMLBRoster:
             assert player.name in [u'José Altuve', 'Justin Verlander',
                                    'Charlie Morton']
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_bad_url_raises_value_error(self, *args, **kwargs):
         with pytest.raises(ValueError):
             roster = Roster('bad')
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_from_team_class(self, *args, **kwargs):
         flexmock(Team) \
             .should_receive('_parse_team_data') \
@@ -1208,7 +1208,7 @@ class TestMLBRoster:
                                    'Charlie Morton']
         type(team)._abbreviation = None
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_with_slim_parameter(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -1222,8 +1222,8 @@ class TestMLBRoster:
             'mortoch02': 'Charlie Morton'
         }
 
-    @mock.patch('requests.head', side_effect=mock_request)
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.head', side_effect=mock_request)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_mlb_invalid_default_year_reverts_to_previous_year(self,
                                                                *args,
                                                                **kwargs):
@@ -1239,7 +1239,7 @@ class TestMLBRoster:
             assert player.name in [u'José Altuve', 'Justin Verlander',
                                    'Charlie Morton']
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_string_representation(self, *args, **kwargs):
         expected = """José Altuve (altuvjo01)
 Justin Verlander (verlaju01)
@@ -51,7 +51,7 @@ def mock_request(url):
 
 
 class TestNCAAFPlayer:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results_career = {
             'adjusted_yards_per_attempt': 6.1,
@@ -456,7 +456,7 @@ class TestNCAAFPlayer:
         frames = [df, player.dataframe]
         df1 = pd.concat(frames).drop_duplicates(keep=False)
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_ncaaf_tight_end_skips_passing_without_errors(self, *args,
                                                           **kwargs):
         player = Player('brycen-hopkins-1')
@@ -464,7 +464,7 @@ class TestNCAAFPlayer:
         assert player.name == 'Brycen Hopkins'
         assert player.dataframe is not None
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_ncaaf_kicker_returns_expected_kicking_stats(self, *args,
                                                          **kwargs):
         stats = {
@@ -503,7 +503,7 @@ class TestNCAAFPlayer:
 
 
 class TestNCAAFRoster:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_pulls_all_player_stats(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -515,12 +515,12 @@ class TestNCAAFRoster:
         for player in roster.players:
             assert player.name in ['David Blough', 'Rondale Moore']
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_bad_url_raises_value_error(self, *args, **kwargs):
         with pytest.raises(ValueError):
             roster = Roster('BAD')
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_from_team_class(self, *args, **kwargs):
         flexmock(Team) \
             .should_receive('_parse_team_data') \
@@ -535,7 +535,7 @@ class TestNCAAFRoster:
             assert player.name in ['David Blough', 'Rondale Moore']
         type(team)._abbreviation = None
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_with_slim_parameter(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -548,8 +548,8 @@ class TestNCAAFRoster:
             'rondale-moore-1': 'Rondale Moore'
         }
 
-    @mock.patch('requests.head', side_effect=mock_request)
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.head', side_effect=mock_request)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_invalid_default_year_reverts_to_previous_year(self,
                                                            *args,
                                                            **kwargs):
@@ -563,7 +563,7 @@ class TestNCAAFRoster:
         for player in roster.players:
             assert player.name in ['David Blough', 'Rondale Moore']
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_string_representation(self, *args, **kwargs):
         expected = """David Blough (david-blough-1)
 David Blough (rondale-moore-1)"""
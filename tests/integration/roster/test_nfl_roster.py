@@ -963,7 +963,7 @@ class TestNFLPlayer:
             'yards_returned_from_interception': None
         }
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nfl_qb_returns_requested_career_stats(self, *args, **kwargs):
         # Request the career stats
         player = Player('BreeDr00')
@@ -972,7 +972,7 @@ class TestNFLPlayer:
         for attribute, value in self.qb_results_career.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nfl_qb_returns_requested_player_season_stats(self,
                                                           *args,
                                                           **kwargs):
@@ -983,7 +983,7 @@ class TestNFLPlayer:
         for attribute, value in self.qb_results_2017.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nfl_olb_returns_requested_career_stats(self, *args, **kwargs):
         # Request the career stats
         player = Player('DaviDe00')
@@ -992,7 +992,7 @@ class TestNFLPlayer:
         for attribute, value in self.olb_results_career.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nfl_kicker_returns_requested_career_stats(self, *args, **kwargs):
         # Request the career stats
         player = Player('LutzWi00')
@@ -1001,7 +1001,7 @@ class TestNFLPlayer:
         for attribute, value in self.kicker_results_career.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nfl_punter_returns_requested_career_stats(self, *args, **kwargs):
         # Request the career stats
         player = Player('MorsTh00')
@@ -1010,7 +1010,7 @@ class TestNFLPlayer:
         for attribute, value in self.punter_results_career.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nfl_receiver_requested_career_stats(self, *args, **kwargs):
         # Request the career stats
         player = Player('LewiTo00')
@@ -1019,7 +1019,7 @@ class TestNFLPlayer:
         for attribute, value in self.receiver_results_career.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nfl_receiver_season_stats(self, *args, **kwargs):
         # Request the 2017 stats
         player = Player('LewiTo00')
@@ -1028,7 +1028,7 @@ class TestNFLPlayer:
         for attribute, value in self.receiver_results_2017.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_dataframe_returns_dataframe(self, *args, **kwargs):
         dataframe = [
             {'adjusted_net_yards_per_attempt_index': 116,
@@ -1377,7 +1377,7 @@ class TestNFLPlayer:
         frames = [df, player.dataframe]
         df1 = pd.concat(frames).drop_duplicates(keep=False)
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nfl_fake_404_page_returns_none_with_no_errors(self,
                                                            *args,
                                                            **kwargs):
@@ -1386,7 +1386,7 @@ class TestNFLPlayer:
         assert player.name is None
         assert player.dataframe is None
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nfl_fake_404_page_returns_none_for_different_season(self,
                                                                  *args,
                                                                  **kwargs):
@@ -1396,7 +1396,7 @@ class TestNFLPlayer:
         assert player.name is None
         assert player.dataframe is None
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nfl_player_with_no_career_stats_handled_properly(self,
                                                               *args,
                                                               **kwargs):
@@ -1404,7 +1404,7 @@ class TestNFLPlayer:
 
         assert player.name == 'Dominique Hatfield'
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nfl_player_string_representation(self, *args, **kwargs):
         player = Player('BreeDr00')
 
@@ -1412,7 +1412,7 @@ class TestNFLPlayer:
 
 
 class TestNFLRoster:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_pulls_all_player_stats(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -1426,12 +1426,12 @@ class TestNFLRoster:
                                    'Tommylee Lewis', 'Wil Lutz',
                                    'Thomas Morstead']
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_bad_url_raises_value_error(self, *args, **kwargs):
         with pytest.raises(ValueError):
             roster = Roster('BAD')
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_from_team_class(self, *args, **kwargs):
         flexmock(Team) \
             .should_receive('_parse_team_data') \
@@ -1448,7 +1448,7 @@ class TestNFLRoster:
                                    'Thomas Morstead']
         type(team)._abbreviation = None
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_with_slim_parameter(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -1464,8 +1464,8 @@ class TestNFLRoster:
             'MorsTh00': 'Thomas Morstead'
         }
 
-    @mock.patch('requests.head', side_effect=mock_request)
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.head', side_effect=mock_request)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_invalid_default_year_reverts_to_previous_year(self,
                                                            *args,
                                                            **kwargs):
@@ -1482,7 +1482,7 @@ class TestNFLRoster:
                                    'Tommylee Lewis', 'Wil Lutz',
                                    'Thomas Morstead']
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_string_representation(self, *args, **kwargs):
         expected = """Drew Brees (BreeDr00)
 Demario Davis (DaviDe00)
@@ -426,7 +426,7 @@ class TestNHLPlayer:
             'wins': 22
         }
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nhl_skater_returns_requested_career_stats(self, *args, **kwargs):
         # Request the career stats
         player = Player('zettehe01')
@@ -435,7 +435,7 @@ class TestNHLPlayer:
         for attribute, value in self.skater_results_career.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nhl_skater_returns_player_season_stats(self, *args, **kwargs):
         # Request the 2017 stats
         player = Player('zettehe01')
@@ -444,7 +444,7 @@ class TestNHLPlayer:
         for attribute, value in self.skater_results_2017.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nhl_goalie_returns_requested_career_stats(self, *args, **kwargs):
         # Request the career stats
         player = Player('howarja02')
@@ -453,7 +453,7 @@ class TestNHLPlayer:
         for attribute, value in self.goalie_results_career.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nhl_goalie_returns_player_season_stats(self, *args, **kwargs):
         # Request the 2017 stats
         player = Player('howarja02')
@@ -462,7 +462,7 @@ class TestNHLPlayer:
         for attribute, value in self.goalie_results_2017.items():
             assert getattr(player, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_dataframe_returns_dataframe(self, *args, **kwargs):
         dataframe = [
             {'adjusted_assists': 46,
@@ -662,21 +662,21 @@ class TestNHLPlayer:
         frames = [df, player.dataframe]
         df1 = pd.concat(frames).drop_duplicates(keep=False)
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nhl_404_returns_none_with_no_errors(self, *args, **kwargs):
         player = Player('bad')
 
         assert player.name is None
         assert player.dataframe is None
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nhl_404_returns_none_for_different_season(self, *args, **kwargs):
         player = Player('bad')
 
         assert player.name is None
         assert player.dataframe is None
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nhl_player_string_representation(self, *args, **kwargs):
         player = Player('zettehe01')
 
@@ -684,7 +684,7 @@ class TestNHLPlayer:
 
 
 class TestNHLRoster:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_pulls_all_player_stats(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -696,12 +696,12 @@ class TestNHLRoster:
         for player in roster.players:
             assert player.name in ['Jimmy Howard', 'Henrik Zetterberg']
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_bad_url_raises_value_error(self, *args, **kwargs):
         with pytest.raises(ValueError):
             roster = Roster('bad')
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_from_team_class(self, *args, **kwargs):
         flexmock(Team) \
             .should_receive('_parse_team_data') \
@@ -716,7 +716,7 @@ class TestNHLRoster:
             assert player.name in ['Jimmy Howard', 'Henrik Zetterberg']
         type(team)._abbreviation = None
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_with_slim_parameter(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -729,8 +729,8 @@ class TestNHLRoster:
             'zettehe01': 'Henrik Zetterberg'
         }
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
-    @mock.patch('requests.head', side_effect=mock_request)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.head', side_effect=mock_request)
     def test_invalid_default_year_reverts_to_previous_year(self,
                                                            *args,
                                                            **kwargs):
@@ -745,7 +745,7 @@ class TestNHLRoster:
         for player in roster.players:
             assert player.name in ['Jimmy Howard', 'Henrik Zetterberg']
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_string_representation(self, *args, **kwargs):
         expected = """Jimmy Howard (howarja02)
 Henrik Zetterberg (zettehe01)"""
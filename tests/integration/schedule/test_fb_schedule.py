@@ -5,9 +5,10 @@ from flexmock import flexmock
 from mock import patch
 from os import path
 from pyquery import PyQuery as pq
-from sportsipy import utils
+from sportsipy import records, utils
 from sportsipy.constants import AWAY, DRAW
 from sportsipy.fb.schedule import Schedule
+from types import MemberDescriptorType
 
 
 NUM_GAMES_IN_SCHEDULE = 52
@@ -30,7 +31,7 @@ def mock_pyquery(url):
 
 
 class TestFBSchedule:
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'competition': 'Premier League',
@@ -186,3 +187,14 @@ class TestFBSchedule:
         game = self.schedule[0]
 
         assert game.__repr__() == '2019-08-10 - Aston Villa'
+
+    def test_fb_schedule_game_fields_include_every_slot(self):
+        games = self.schedule._games
+
+        assert len(games) > 0
+        for game in games:
+            fields = records._fields(game)
+
+            for name, descriptor in records._slots(type(game)):
+                if isinstance(descriptor, MemberDescriptorType):
+                    assert name in fields
@@ -4,11 +4,12 @@ import pandas as pd
 import pytest
 from datetime import datetime
 from flexmock import flexmock
-from sportsipy import utils
+from sportsipy import records, utils
 from sportsipy.constants import AWAY, HOME, LOSS, WIN
 from sportsipy.mlb.boxscore import Boxscore
 from sportsipy.mlb.constants import DAY, NIGHT, SCHEDULE_URL
 from sportsipy.mlb.schedule import Schedule
+from types import MemberDescriptorType
 
 
 MONTH = 4
@@ -56,7 +57,7 @@ class MockDateTime:
 
 
 class TestMLBSchedule:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'game': 2,
@@ -85,8 +86,8 @@ class TestMLBSchedule:
             .should_receive('_parse_game_data') \
             .and_return(None)
         flexmock(Boxscore) \
-            .should_receive('dataframe') \
-            .and_return(pd.DataFrame([{'key': 'value'}]))
+            .should_receive('_dataframe_row') \
+            .and_return((0, {'key': 'value'}))
         flexmock(utils) \
             .should_receive('_todays_date') \
             .and_return(MockDateTime(YEAR, MONTH))
@@ -359,10 +360,21 @@ Sunday, Oct 1 - TOR"""
 
         assert self.schedule.__repr__() == expected
 
+    def test_mlb_schedule_game_fields_include_every_slot(self):
+        games = self.schedule._games
+
+        assert len(games) > 0
+        for game in games:
+            fields = records._fields(game)
+
+            for name, descriptor in records._slots(type(game)):
+                if isinstance(descriptor, MemberDescriptorType):
+                    assert name in fields
+
 
 class TestMLBScheduleInvalidYear:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
-    @mock.patch('requests.head', side_effect=mock_request)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.head', side_effect=mock_request)
     def test_mlb_invalid_default_year_reverts_to_previous_year(self,
                                                                *args,
                                                                **kwargs):
@@ -393,8 +405,8 @@ class TestMLBScheduleInvalidYear:
             .should_receive('_parse_game_data') \
             .and_return(None)
         flexmock(Boxscore) \
-            .should_receive('dataframe') \
-            .and_return(pd.DataFrame([{'key': 'value'}]))
+            .should_receive('_dataframe_row') \
+            .and_return((0, {'key': 'value'}))
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
             .and_return(2018)
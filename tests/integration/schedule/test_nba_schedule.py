@@ -4,11 +4,12 @@ import pandas as pd
 import pytest
 from datetime import datetime
 from flexmock import flexmock
-from sportsipy import utils
+from sportsipy import records, utils
 from sportsipy.constants import AWAY, WIN
 from sportsipy.nba.boxscore import Boxscore
 from sportsipy.nba.constants import SCHEDULE_URL
 from sportsipy.nba.schedule import Schedule
+from types import MemberDescriptorType
 
 
 MONTH = 1
@@ -66,7 +67,7 @@ class MockDateTime:
 
 
 class TestNBASchedule:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'game': 2,
@@ -89,8 +90,8 @@ class TestNBASchedule:
             .should_receive('_parse_game_data') \
             .and_return(None)
         flexmock(Boxscore) \
-            .should_receive('dataframe') \
-            .and_return(pd.DataFrame([{'key': 'value'}]))
+            .should_receive('_dataframe_row') \
+            .and_return((0, {'key': 'value'}))
         flexmock(utils) \
             .should_receive('_todays_date') \
             .and_return(MockDateTime(YEAR, MONTH))
@@ -148,6 +149,15 @@ class TestNBASchedule:
 
         assert len(result) == NUM_GAMES_IN_SCHEDULE
 
+    def test_nba_schedule_dataframe_extended_with_workers(self):
+        updates = []
+
+        result = self.schedule.build_dataframe_extended(
+            workers=4, progress=lambda done, total: updates.append(done))
+
+        assert len(result) == NUM_GAMES_IN_SCHEDULE
+        assert sorted(updates) == list(range(1, NUM_GAMES_IN_SCHEDULE + 1))
+
     def test_no_games_for_date_raises_value_error(self):
         with pytest.raises(ValueError):
             self.schedule(datetime.now())
@@ -272,10 +282,21 @@ Mon, Jun 12, 2017 - CLE"""
 
         assert self.schedule.__repr__() == expected
 
+    def test_nba_schedule_game_fields_include_every_slot(self):
+        games = self.schedule._games
+
+        assert len(games) > 0
+        for game in games:
+            fields = records._fields(game)
+
+            for name, descriptor in records._slots(type(game)):
+                if isinstance(descriptor, MemberDescriptorType):
+                    assert name in fields
+
 
 class TestNBAScheduleInvalidError:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
-    @mock.patch('requests.head', side_effect=mock_request)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.head', side_effect=mock_request)
     def test_invalid_default_year_reverts_to_previous_year(self,
                                                            *args,
                                                            **kwargs):
@@ -299,8 +320,8 @@ class TestNBAScheduleInvalidError:
             .should_receive('_parse_game_data') \
             .and_return(None)
         flexmock(Boxscore) \
-            .should_receive('dataframe') \
-            .and_return(pd.DataFrame([{'key': 'value'}]))
+            .should_receive('_dataframe_row') \
+            .and_return((0, {'key': 'value'}))
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
             .and_return(2018)
@@ -310,8 +331,8 @@ class TestNBAScheduleInvalidError:
         for attribute, value in results.items():
             assert getattr(schedule[1], attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
-    @mock.patch('requests.head', side_effect=mock_request)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.head', side_effect=mock_request)
     def test_invalid_2020_default_reverts_to_previous_year(self,
                                                            *args,
                                                            **kwargs):
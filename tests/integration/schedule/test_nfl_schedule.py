@@ -4,11 +4,12 @@ import pandas as pd
 import pytest
 from datetime import datetime
 from flexmock import flexmock
-from sportsipy import utils
+from sportsipy import records, utils
 from sportsipy.constants import AWAY, REGULAR_SEASON, WIN
 from sportsipy.nfl.boxscore import Boxscore
 from sportsipy.nfl.constants import SCHEDULE_URL
 from sportsipy.nfl.schedule import Schedule
+from types import MemberDescriptorType
 
 
 MONTH = 9
@@ -58,7 +59,7 @@ class MockDateTime:
 
 
 class TestNFLSchedule:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'week': 2,
@@ -107,8 +108,8 @@ class TestNFLSchedule:
             .should_receive('_parse_game_data') \
             .and_return(None)
         flexmock(Boxscore) \
-            .should_receive('dataframe') \
-            .and_return(pd.DataFrame([{'key': 'value'}]))
+            .should_receive('_dataframe_row') \
+            .and_return((0, {'key': 'value'}))
 
         self.schedule = Schedule('NWE')
 
@@ -207,10 +208,21 @@ February 4 - PHI"""
 
         assert self.schedule.__repr__() == expected
 
+    def test_nfl_schedule_game_fields_include_every_slot(self):
+        games = self.schedule._games
+
+        assert len(games) > 0
+        for game in games:
+            fields = records._fields(game)
+
+            for name, descriptor in records._slots(type(game)):
+                if isinstance(descriptor, MemberDescriptorType):
+                    assert name in fields
+
 
 class TestNFLScheduleInvalidYear:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
-    @mock.patch('requests.head', side_effect=mock_request)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.head', side_effect=mock_request)
     def test_invalid_default_year_reverts_to_previous_year(self,
                                                            *args,
                                                            **kwargs):
@@ -261,8 +273,8 @@ class TestNFLScheduleInvalidYear:
             .should_receive('_parse_game_data') \
             .and_return(None)
         flexmock(Boxscore) \
-            .should_receive('dataframe') \
-            .and_return(pd.DataFrame([{'key': 'value'}]))
+            .should_receive('_dataframe_row') \
+            .and_return((0, {'key': 'value'}))
 
         schedule = Schedule('NWE')
 
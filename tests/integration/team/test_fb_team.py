@@ -51,14 +51,14 @@ class TestFBTeam:
             'gender': 'Male'
         }
 
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def test_fb_team_returns_correct_attributes(self, *args, **kwargs):
         tottenham = Team('Tottenham Hotspur')
 
         for attribute, value in self.results.items():
             assert getattr(tottenham, attribute) == value
 
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def test_team_name(self, *args, **kwargs):
         team = Team('Tottenham Hotspur')
 
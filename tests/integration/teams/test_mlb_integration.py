@@ -61,7 +61,7 @@ class MockDateTime:
 
 
 class TestMLBIntegration:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'rank': 3,
@@ -179,14 +179,14 @@ class TestMLBIntegration:
             .should_receive('_todays_date') \
             .and_return(MockDateTime(YEAR, MONTH))
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_mlb_integration_returns_correct_number_of_teams(self, *args,
                                                              **kwargs):
         teams = Teams()
 
         assert len(teams) == len(self.abbreviations)
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_mlb_integration_returns_correct_attributes_for_team(self,
                                                                  *args,
                                                                  **kwargs):
@@ -197,7 +197,7 @@ class TestMLBIntegration:
         for attribute, value in self.results.items():
             assert getattr(houston, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_mlb_integration_returns_correct_team_abbreviations(self,
                                                                 *args,
                                                                 **kwargs):
@@ -206,7 +206,7 @@ class TestMLBIntegration:
         for team in teams:
             assert team.abbreviation in self.abbreviations
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_mlb_integration_dataframe_returns_dataframe(self, *args,
                                                          **kwargs):
         teams = Teams()
@@ -224,7 +224,7 @@ class TestMLBIntegration:
 
         assert df1.empty
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_mlb_integration_all_teams_dataframe_returns_dataframe(self,
                                                                    *args,
                                                                    **kwargs):
@@ -234,22 +234,22 @@ class TestMLBIntegration:
         assert len(result) == len(self.abbreviations)
         assert set(result.columns.values) == set(self.results.keys())
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_pulling_team_directly(self, *args, **kwargs):
         hou = Team('HOU')
 
         for attribute, value in self.results.items():
             assert getattr(hou, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_mlb_invalid_team_name_raises_value_error(self, *args, **kwargs):
         teams = Teams()
 
         with pytest.raises(ValueError):
             teams('INVALID_NAME')
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
-    @mock.patch('requests.head', side_effect=mock_request)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.head', side_effect=mock_request)
     def test_mlb_invalid_default_year_reverts_to_previous_year(self,
                                                                *args,
                                                                **kwargs):
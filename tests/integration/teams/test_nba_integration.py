@@ -54,7 +54,7 @@ class MockDateTime:
 
 
 class TestNBAIntegration:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'rank': 26,
@@ -126,6 +126,18 @@ class TestNBAIntegration:
         for attribute, value in self.results.items():
             assert getattr(detroit, attribute) == value
 
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_nba_integration_lazy_teams_parse_fields_when_read(self,
+                                                               *args,
+                                                               **kwargs):
+        teams = Teams(lazy=True)
+
+        assert len(teams) == len(self.teams)
+        for lazy_team, team in zip(teams, self.teams):
+            assert '_points' in lazy_team._pending_fields
+            assert lazy_team.dataframe.equals(team.dataframe)
+            assert not lazy_team._pending_fields
+
     def test_nba_integration_returns_correct_team_abbreviations(self):
         for team in self.teams:
             assert team.abbreviation in self.abbreviations
@@ -216,8 +228,8 @@ Dallas Mavericks (DAL)"""
 
 
 class TestNBAIntegrationInvalidDate:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
-    @mock.patch('requests.head', side_effect=mock_request)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.head', side_effect=mock_request)
     def test_invalid_default_year_reverts_to_previous_year(self,
                                                            *args,
                                                            **kwargs):
@@ -73,7 +73,7 @@ class MockDateTime:
 
 
 class TestNCAABIntegration:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'conference': 'big-ten',
@@ -686,20 +686,20 @@ class TestNCAABIntegration:
 
         assert len(teams) == 0
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_pulling_team_directly(self, *args, **kwargs):
         purdue = Team('PURDUE')
 
         for attribute, value in self.results.items():
             assert getattr(purdue, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_team_string_representation(self, *args, **kwargs):
         purdue = Team('PURDUE')
 
         assert purdue.__repr__() == 'Purdue (PURDUE) - 2018'
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_teams_string_representation(self, *args, **kwargs):
         expected = """Abilene Christian (ABILENE-CHRISTIAN)
 Air Force (AIR-FORCE)
@@ -1059,8 +1059,8 @@ Youngstown State (YOUNGSTOWN-STATE)"""
 
 
 class TestNCAABIntegrationInvalidYear:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
-    @mock.patch('requests.head', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.head', side_effect=mock_pyquery)
     def test_invalid_default_year_reverts_to_previous_year(self,
                                                            *args,
                                                            **kwargs):
@@ -66,7 +66,7 @@ class MockDateTime:
 
 
 class TestNCAAFIntegration:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'conference': 'big-ten',
@@ -358,20 +358,20 @@ class TestNCAAFIntegration:
 
         assert len(teams) == 0
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_pulling_team_directly(self, *args, **kwargs):
         purdue = Team('PURDUE')
 
         for attribute, value in self.results.items():
             assert getattr(purdue, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_team_string_representation(self, *args, **kwargs):
         purdue = Team('PURDUE')
 
         assert purdue.__repr__() == 'Purdue (PURDUE) - 2017'
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_teams_string_representation(self, *args, **kwargs):
         expected = """Clemson (CLEMSON)
 North Carolina State (NORTH-CAROLINA-STATE)
@@ -510,8 +510,8 @@ Texas State (TEXAS-STATE)"""
 
 
 class TestNCAAFIntegrationInvalidYear:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
-    @mock.patch('requests.head', side_effect=mock_request)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.head', side_effect=mock_request)
     def test_invalid_default_year_reverts_to_previous_year(self,
                                                            *args,
                                                            **kwargs):
@@ -664,8 +664,8 @@ class TestNCAAFIntegrationInvalidYear:
 
 
 class TestNCAAFIntegrationInvalidConference:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
-    @mock.patch('requests.head', side_effect=mock_request)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.head', side_effect=mock_request)
     def test_invalid_conference_returns_none(self, *args, **kwargs):
         team_conference = {'florida-state': 'acc',
                            'boston-college': 'acc',
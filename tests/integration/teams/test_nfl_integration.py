@@ -66,7 +66,7 @@ class MockSchedule:
 
 
 class TestNFLIntegration:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'rank': 6,
@@ -172,7 +172,7 @@ class TestNFLIntegration:
 
         assert len(teams) == 0
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_pulling_team_directly(self, *args, **kwargs):
         schedule = MockSchedule(None, None)
 
@@ -185,13 +185,13 @@ class TestNFLIntegration:
         for attribute, value in self.results.items():
             assert getattr(kansas, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_team_string_representation(self, *args, **kwargs):
         kansas = Team('KAN')
 
         assert kansas.__repr__() == 'Kansas City Chiefs (KAN) - 2017'
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_teams_string_representation(self, *args, **kwargs):
         expected = """Los Angeles Rams (RAM)
 New England Patriots (NWE)
@@ -232,8 +232,8 @@ Cleveland Browns (CLE)"""
 
 
 class TestNFLIntegrationInvalidYear:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
-    @mock.patch('requests.head', side_effect=mock_request)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.head', side_effect=mock_request)
     def test_invalid_default_year_reverts_to_previous_year(self,
                                                            *args,
                                                            **kwargs):
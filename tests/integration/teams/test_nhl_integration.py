@@ -51,7 +51,7 @@ class MockDateTime:
 
 
 class TestNHLIntegration:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'rank': 25,
@@ -131,6 +131,15 @@ class TestNHLIntegration:
         assert len(result) == len(self.abbreviations)
         assert set(result.columns.values) == set(self.results.keys())
 
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_nhl_integration_streamed_teams_match_parsed_teams(self, *args,
+                                                               **kwargs):
+        teams = Teams(stream=True)
+
+        assert [team.abbreviation for team in teams] == \
+            [team.abbreviation for team in self.teams]
+        assert teams.dataframes.equals(self.teams.dataframes)
+
     def test_nhl_invalid_team_name_raises_value_error(self):
         with pytest.raises(ValueError):
             self.teams('INVALID_NAME')
@@ -147,20 +156,20 @@ class TestNHLIntegration:
 
         assert len(teams) == 0
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_pulling_team_directly(self, *args, **kwargs):
         detroit = Team('DET')
 
         for attribute, value in self.results.items():
             assert getattr(detroit, attribute) == value
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_team_string_representation(self, *args, **kwargs):
         detroit = Team('DET')
 
         assert detroit.__repr__() == 'Detroit Red Wings (DET) - 2017'
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_teams_string_representation(self, *args, **kwargs):
         expected = """Washington Capitals (WSH)
 Pittsburgh Penguins (PIT)
@@ -199,8 +208,8 @@ Colorado Avalanche (COL)"""
 
 
 class TestNHLIntegrationInvalidYear:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
-    @mock.patch('requests.head', side_effect=mock_request)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.head', side_effect=mock_request)
     def test_invalid_default_year_reverts_to_previous_year(self,
                                                            *args,
                                                            **kwargs):
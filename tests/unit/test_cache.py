@@ -0,0 +1,174 @@
+import os
+import time
+from sportsipy import cache
+
+
+class MockDateTime:
+    def __init__(self, year, month, day=1):
+        self.year = year
+        self.month = month
+        self.day = day
+
+
+class TestResponseCache:
+    def setup_method(self):
+        self.url = 'https://www.sports-reference.com/cbb/seasons/2018.html'
+
+    def test_missing_page_returns_none(self, tmp_path):
+        response_cache = cache.ResponseCache(str(tmp_path))
+
+        assert response_cache.get(self.url) is None
+        assert self.url not in response_cache
+
+    def test_stored_page_is_returned(self, tmp_path):
+        response_cache = cache.ResponseCache(str(tmp_path))
+
+        response_cache.set(self.url, '<html>Stored</html>')
+
+        assert self.url in response_cache
+        assert response_cache.get(self.url) == '<html>Stored</html>'
+        assert response_cache.stored_time(self.url)
+
+    def test_cache_persists_between_instances(self, tmp_path):
+        cache.ResponseCache(str(tmp_path)).set(self.url, '<html>Kept</html>')
+
+        response_cache = cache.ResponseCache(str(tmp_path))
+
+        assert len(response_cache) == 1
+        assert response_cache.size > 0
+        assert response_cache.get(self.url) == '<html>Kept</html>'
+
+    def test_least_recently_used_page_is_evicted(self, tmp_path):
+        response_cache = cache.ResponseCache(str(tmp_path))
+        response_cache.set('first', 'a' * 1024)
+        response_cache.set('second', 'b' * 1024)
+        response_cache._max_size = response_cache.size
+        response_cache.get('first')
+
+        response_cache.set('third', 'c' * 1024)
+
+        assert 'first' in response_cache
+        assert 'second' not in response_cache
+        assert 'third' in response_cache
+        assert response_cache.size <= response_cache.max_size
+
+    def test_delete_and_clear_remove_pages(self, tmp_path):
+        response_cache = cache.ResponseCache(str(tmp_path))
+        response_cache.set('first', 'one')
+        response_cache.set('second', 'two')
+
+        response_cache.delete('first')
+
+        assert 'first' not in response_cache
+        assert len(response_cache) == 1
+
+        response_cache.clear()
+
+        assert len(response_cache) == 0
+        assert response_cache.size == 0
+        assert not [x for x in os.listdir(str(tmp_path))
+                    if x.endswith(cache.CACHE_EXTENSION)]
+
+    def test_enable_and_disable_cache(self, tmp_path):
+        response_cache = cache.enable_cache(str(tmp_path), max_size=100)
+
+        assert cache.get_cache() is response_cache
+        assert response_cache.directory == str(tmp_path)
+        assert response_cache.max_size == 100
+
+        cache.disable_cache()
+
+        assert cache.get_cache() is None
+
+    def test_environment_enables_cache_on_first_use(self, tmp_path,
+                                                    monkeypatch):
+        monkeypatch.setattr(cache, '_cache', None)
+        monkeypatch.setattr(cache, '_configured', False)
+        monkeypatch.setenv(cache.CACHE_DIRECTORY_ENV, str(tmp_path))
+
+        response_cache = cache.get_cache()
+
+        assert response_cache.directory == str(tmp_path)
+        assert cache.get_cache() is response_cache
+
+    def test_disable_cache_overrides_environment(self, tmp_path,
+                                                 monkeypatch):
+        monkeypatch.setattr(cache, '_cache', None)
+        monkeypatch.setattr(cache, '_configured', False)
+        monkeypatch.setenv(cache.CACHE_DIRECTORY_ENV, str(tmp_path))
+
+        cache.disable_cache()
+
+        assert cache.get_cache() is None
+
+
+class TestSeasonPolicy:
+    def setup_method(self):
+        self.policy = cache.SeasonPolicy(
+            ttl=60, today=lambda: MockDateTime(2018, 1, 15))
+
+    def test_past_boxscores_are_immutable(self):
+        urls = [
+            'https://www.basketball-reference.com/boxscores/201710310LAL.html',
+            'https://www.baseball-reference.com/boxes/NYA/NYA201709010.shtml',
+            'https://www.sports-reference.com/cbb/boxscores/'
+            '2018-01-08-21-bucknell.html',
+            'https://www.basketball-reference.com/boxscores/'
+            '?month=1&day=14&year=2018'
+        ]
+
+        for url in urls:
+            assert self.policy.is_immutable(url)
+
+    def test_todays_boxscores_are_not_immutable(self):
+        urls = [
+            'https://www.basketball-reference.com/boxscores/201801150LAL.html',
+            'https://www.hockey-reference.com/boxscores/index.fcgi'
+            '?month=1&day=15&year=2018'
+        ]
+
+        for url in urls:
+            assert not self.policy.is_immutable(url)
+
+    def test_previous_seasons_are_immutable(self):
+        urls = [
+            'http://www.basketball-reference.com/leagues/NBA_2017.html',
+            'https://www.sports-reference.com/cfb/years/2016-standings.html',
+            'https://www.baseball-reference.com/teams/NYY/'
+            '2016-schedule-scores.shtml'
+        ]
+
+        for url in urls:
+            assert self.policy.is_immutable(url)
+
+    def test_current_season_and_player_pages_are_not_immutable(self):
+        urls = [
+            'http://www.basketball-reference.com/leagues/NBA_2018.html',
+            'https://www.sports-reference.com/cfb/years/2017-standings.html',
+            'https://www.basketball-reference.com/players/h/hardeja01.html',
+            'https://fbref.com/en/squads/361ca564'
+        ]
+
+        for url in urls:
+            assert not self.policy.is_immutable(url)
+
+    def test_mutable_pages_expire_after_ttl(self):
+        url = 'http://www.basketball-reference.com/leagues/NBA_2018.html'
+
+        assert self.policy.is_fresh(url, time.time() - 30)
+        assert not self.policy.is_fresh(url, time.time() - 90)
+
+    def test_immutable_pages_never_expire(self):
+        url = 'http://www.basketball-reference.com/leagues/NBA_2017.html'
+
+        assert self.policy.is_fresh(url, 0)
+
+    def test_cache_ignores_expired_pages(self, tmp_path):
+        url = 'http://www.basketball-reference.com/leagues/NBA_2018.html'
+        response_cache = cache.ResponseCache(str(tmp_path), policy=self.policy)
+        response_cache.set(url, '<html>Standings</html>')
+        filename = response_cache._path(response_cache._filename(url))
+        os.utime(filename, (time.time(), time.time() - 90))
+
+        assert response_cache.get(url) is None
+        assert url in response_cache
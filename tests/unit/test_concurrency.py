@@ -0,0 +1,27 @@
+from sportsipy import concurrency
+
+
+class TestConcurrency:
+    def test_run_concurrently_preserves_order(self):
+        result = concurrency._run_concurrently(lambda x: x * 2, range(10), 4)
+
+        assert result == [x * 2 for x in range(10)]
+
+    def test_run_concurrently_without_workers_is_serial(self):
+        result = concurrency._run_concurrently(lambda x: x * 2, [1, 2, 3])
+
+        assert result == [2, 4, 6]
+
+    def test_run_concurrently_reports_progress(self):
+        updates = []
+
+        concurrency._run_concurrently(lambda x: x, range(3), 2,
+                                      lambda done, total: updates.append(
+                                          (done, total)))
+
+        assert sorted(updates) == [(1, 3), (2, 3), (3, 3)]
+
+    def test_run_in_processes_preserves_order(self):
+        result = concurrency._run_in_processes(abs, [-3, 2, -1], 2)
+
+        assert result == [3, 2, 1]
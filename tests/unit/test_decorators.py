@@ -0,0 +1,107 @@
+from datetime import datetime
+from sportsipy import decorators
+from sportsipy.decorators import (cached_property_decorator,
+                                  float_property_decorator,
+                                  int_property_decorator)
+
+
+class MockStats:
+    def __init__(self, points, rating):
+        self._points = points
+        self._rating = rating
+
+    @int_property_decorator
+    def points(self):
+        return self._points
+
+    @float_property_decorator
+    def rating(self):
+        return self._rating
+
+
+class MockPlayer:
+    def __init__(self, points, rebounds):
+        self._points = points
+        self._rebounds = rebounds
+
+
+class MockGame:
+    def __init__(self, date):
+        self._date = date
+        self._datetime = None
+        self.calls = 0
+
+    @cached_property_decorator('_datetime')
+    def datetime(self):
+        self.calls += 1
+        try:
+            return datetime.strptime(self._date, '%Y-%m-%d')
+        except ValueError:
+            return None
+
+
+class TestTypedValues:
+    def test_values_are_converted(self):
+        stats = MockStats('25', '101.5')
+
+        assert stats.points == 25
+        assert stats.rating == 101.5
+
+    def test_invalid_values_default_to_none(self):
+        stats = MockStats('', None)
+
+        assert stats.points is None
+        assert stats.rating is None
+
+    def test_converted_item_is_kept_in_field(self):
+        player = MockPlayer(['25', '30'], None)
+
+        result = decorators._convert_item(player, 'points', player._points, 1,
+                                          int)
+
+        assert result == 30
+        assert player._points == ['25', 30]
+
+    def test_invalid_item_uses_default_and_is_kept_parsed(self):
+        player = MockPlayer(['25', ''], None)
+
+        result = decorators._convert_item(player, 'points', player._points, 1,
+                                          int, default=0)
+
+        assert result == 0
+        assert player._points == ['25', '']
+
+    def test_item_from_another_field_is_not_changed(self):
+        player = MockPlayer(['25'], ['7'])
+
+        result = decorators._convert_item(player, 'points', player._rebounds,
+                                          0, int)
+
+        assert result == 7
+        assert player._rebounds == ['7']
+
+    def test_nested_item_is_kept_in_field(self):
+        player = MockPlayer([['25', '3']], None)
+
+        result = decorators._convert_item(player, 'points', player._points[0],
+                                          1, int, field=player._points)
+
+        assert result == 3
+        assert player._points == [['25', 3]]
+
+
+class TestCachedProperties:
+    def test_value_is_only_computed_once(self):
+        game = MockGame('2020-01-05')
+
+        assert game.datetime == datetime(2020, 1, 5)
+        assert game.datetime == datetime(2020, 1, 5)
+        assert game.calls == 1
+        assert game._datetime == datetime(2020, 1, 5)
+
+    def test_missing_value_is_computed_again(self):
+        game = MockGame('')
+        game.datetime
+
+        assert game.datetime is None
+        assert game.calls == 2
@@ -60,7 +60,7 @@ class TestFBRoster:
 
         assert result == {}
 
-    @mock.patch('requests.get', side_effect=mock_httperror)
+    @mock.patch('requests.Session.get', side_effect=mock_httperror)
     def test_invalid_http_page_error(self, *args, **kwargs):
         flexmock(Roster) \
             .should_receive('__init__') \
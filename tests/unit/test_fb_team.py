@@ -201,7 +201,7 @@ class TestFBTeam:
 
 
 class TestFBTeamInvalidPage:
-    @mock.patch('requests.get', side_effect=mock_httperror)
+    @mock.patch('requests.Session.get', side_effect=mock_httperror)
     def test_invalid_http_page_error(self, *args, **kwargs):
         flexmock(Team) \
             .should_receive('__init__') \
@@ -0,0 +1,191 @@
+import os
+import pytest
+import requests
+from mock import patch
+from sportsipy import cache, fetch
+from urllib.error import HTTPError
+
+
+UTF8_PAGE = os.path.join(os.path.dirname(__file__), os.pardir, 'integration',
+                         'roster', 'fb', 'tottenham-hotspur-2019-2020.html')
+
+
+def mock_request(url):
+    class MockRequest:
+        def __init__(self, html_contents, status_code=200):
+            self.status_code = status_code
+            self.html_contents = html_contents
+            self.text = html_contents
+
+    if '404' in url:
+        return MockRequest('This is bad', 404)
+    return MockRequest('<html><body>This is good</body></html>')
+
+
+def mock_send(request, **kwargs):
+    response = requests.Response()
+    response.status_code = 200
+    response.url = request.url
+    response.request = request
+    if 'declared' in request.url:
+        response.headers['Content-Type'] = 'text/html; charset=ISO-8859-1'
+        response._content = 'Hugo Lloris Sánchez'.encode('latin-1')
+    else:
+        response.headers['Content-Type'] = 'text/html'
+        with open(UTF8_PAGE, 'rb') as page:
+            response._content = page.read()
+    response.encoding = requests.utils.get_encoding_from_headers(
+        response.headers)
+    return response
+
+
+class TestFetch:
+    def setup_method(self):
+        fetch.configure()
+
+    def teardown_method(self):
+        fetch.configure(timeout=fetch.DEFAULT_TIMEOUT,
+                        pool_connections=fetch.DEFAULT_POOL_CONNECTIONS,
+                        pool_maxsize=fetch.DEFAULT_POOL_MAXSIZE)
+
+    def test_session_is_shared_between_calls(self):
+        session = fetch.get_session()
+
+        assert fetch.get_session() is session
+
+    def test_session_negotiates_compression(self):
+        session = fetch.get_session()
+
+        assert 'gzip' in session.headers['Accept-Encoding']
+
+    def test_configure_rebuilds_session_with_new_settings(self):
+        session = fetch.get_session()
+
+        fetch.configure(timeout=5, pool_maxsize=2)
+        new_session = fetch.get_session()
+        adapter = new_session.get_adapter('https://www.example.com')
+
+        assert new_session is not session
+        assert adapter.timeout == 5
+        assert adapter._pool_maxsize == 2
+
+    @patch('requests.Session.get', side_effect=mock_request)
+    def test_fetch_returns_page_contents(self, *args, **kwargs):
+        result = fetch._fetch('http://www.good_url.com')
+
+        assert result == '<html><body>This is good</body></html>'
+
+    @patch('requests.Session.get', side_effect=mock_request)
+    def test_fetch_raises_http_error_on_bad_status(self, *args, **kwargs):
+        with pytest.raises(HTTPError):
+            fetch._fetch('http://www.404.com')
+
+    @patch('requests.Session.get', side_effect=mock_request)
+    def test_fetch_reads_from_enabled_cache(self, mock_get, tmp_path):
+        cache.enable_cache(str(tmp_path))
+
+        try:
+            first = fetch._fetch('http://www.good_url.com')
+            second = fetch._fetch('http://www.good_url.com')
+        finally:
+            cache.disable_cache()
+
+        assert first == second
+        assert mock_get.call_count == 1
+
+    @patch('requests.Session.get', side_effect=mock_request)
+    def test_fetch_doesnt_cache_bad_status(self, mock_get, tmp_path):
+        response_cache = cache.enable_cache(str(tmp_path))
+
+        try:
+            with pytest.raises(HTTPError):
+                fetch._fetch('http://www.404.com')
+        finally:
+            cache.disable_cache()
+
+        assert len(response_cache) == 0
+
+    @patch.object(fetch._TimeoutHTTPAdapter, 'send', side_effect=mock_send)
+    def test_fetch_decodes_page_with_meta_charset(self, *args, **kwargs):
+        result = fetch._fetch('http://www.good_url.com/squad.html')
+
+        assert 'Davinson Sánchez' in result
+        assert 'Kévin' in result
+        assert 'SÃ¡nchez' not in result
+
+    @patch.object(fetch._TimeoutHTTPAdapter, 'send', side_effect=mock_send)
+    def test_fetch_honors_declared_charset(self, *args, **kwargs):
+        result = fetch._fetch('http://www.good_url.com/declared.html')
+
+        assert result == 'Hugo Lloris Sánchez'
+
+
+def mock_head(url):
+    class MockResponse:
+        def __init__(self, status_code, headers=None):
+            self.status_code = status_code
+            self.headers = headers or {}
+
+    if 'redirect' in url:
+        return MockResponse(301, {'Location': '/moved/page.html'})
+    if 'refused' in url:
+        return MockResponse(405)
+    return MockResponse(200)
+
+
+class TestProbe:
+    @patch('requests.Session.get', side_effect=mock_request)
+    @patch('requests.Session.head', side_effect=mock_head)
+    def test_probe_follows_redirects_without_downloading(self, mock_head,
+                                                         mock_get):
+        result = fetch._probe('http://www.good_url.com/redirect')
+
+        assert result.exists
+        assert result.contents is None
+        assert mock_head.call_count == 2
+        mock_head.assert_called_with('http://www.good_url.com/moved/page.html')
+        assert mock_get.call_count == 0
+
+    @patch('requests.Session.get', side_effect=mock_request)
+    @patch('requests.Session.head', side_effect=mock_head)
+    def test_probe_downloads_page_when_head_is_refused(self, mock_head,
+                                                       mock_get):
+        result = fetch._probe('http://www.good_url.com/refused')
+
+        assert result.ok
+        assert result.contents == '<html><body>This is good</body></html>'
+        assert mock_get.call_count == 1
+
+    @patch('requests.Session.get', side_effect=mock_request)
+    def test_probe_reports_missing_page(self, *args, **kwargs):
+        result = fetch._probe('http://www.404.com', download=True)
+
+        assert not result.exists
+        assert not result.ok
+
+    @patch('requests.Session.get', side_effect=mock_request)
+    @patch('requests.Session.head', side_effect=mock_head)
+    def test_downloaded_probe_is_reused_by_fetch(self, mock_head, mock_get):
+        url = 'http://www.good_url.com/refused'
+        fetch._keep_page(fetch._probe(url))
+
+        assert fetch._is_kept_page(url)
+        assert fetch._fetch(url) == '<html><body>This is good</body></html>'
+        assert not fetch._is_kept_page(url)
+        assert mock_get.call_count == 1
+
+    @patch('requests.Session.get', side_effect=mock_request)
+    @patch('requests.Session.head', side_effect=mock_head)
+    def test_probe_uses_cached_page(self, mock_head, mock_get, tmp_path):
+        url = 'http://www.good_url.com/cached'
+        response_cache = cache.enable_cache(str(tmp_path))
+        response_cache.set(url, '<html>Cached</html>')
+
+        try:
+            result = fetch._probe(url)
+        finally:
+            cache.disable_cache()
+
+        assert result.exists
+        assert mock_head.call_count == 0
+        assert mock_get.call_count == 0
@@ -115,6 +115,11 @@ class TestMLBSchedule:
         assert self.game._runs_scored is None
         assert self.game.dataframe is None
 
+    def test_empty_game_class_returns_row_of_none(self):
+        assert self.game._runs_allowed is None
+        assert self.game._runs_scored is None
+        assert self.game._dataframe_row() is None
+
     def test_empty_boxscore_class_returns_dataframe_of_none(self):
         assert self.game._runs_allowed is None
         assert self.game._runs_scored is None
@@ -62,7 +62,7 @@ class TestNBAPlayer:
 
         assert result is None
 
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def test_invalid_url_returns_none(self, *args, **kwargs):
         mock_id = PropertyMock(return_value='BAD')
         player = Player(None)
@@ -103,7 +103,7 @@ class TestNBAPlayer:
 
         assert player._contract is None
 
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def test_missing_weight_returns_none(self, *args, **kwargs):
         mock_weight = PropertyMock(return_value=None)
         player = Player(None)
@@ -44,6 +44,11 @@ class TestNBASchedule:
         assert self.game._points_scored is None
         assert self.game.dataframe is None
 
+    def test_empty_game_class_returns_row_of_none(self):
+        assert self.game._points_allowed is None
+        assert self.game._points_scored is None
+        assert self.game._dataframe_row() is None
+
     def test_no_dataframes_returns_none(self):
         flexmock(Schedule) \
             .should_receive('_pull_schedule') \
@@ -25,7 +25,7 @@ def mock_pyquery(url):
 
 
 class TestNBAUtils:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_nba_2020_season_default_to_previous(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -30,7 +30,7 @@ class TestNCAAFPlayer:
             .should_receive('_find_initial_index') \
             .and_return(None)
 
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def test_invalid_url_returns_none(self, *args, **kwargs):
         mock_id = PropertyMock(return_value='BAD')
         player = Player(None)
@@ -40,7 +40,7 @@ class TestNCAAFPlayer:
 
         assert result is None
 
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def test_missing_weight_returns_none(self, *args, **kwargs):
         mock_weight = PropertyMock(return_value=None)
         player = Player(None)
@@ -89,6 +89,11 @@ class TestNCAAFSchedule:
         assert self.game._points_against is None
         assert self.game.dataframe is None
 
+    def test_empty_game_class_returns_row_of_none(self):
+        assert self.game._points_for is None
+        assert self.game._points_against is None
+        assert self.game._dataframe_row() is None
+
     def test_no_dataframes_returns_none(self):
         flexmock(Schedule) \
             .should_receive('_pull_schedule') \
@@ -29,7 +29,7 @@ class TestNFLPlayer:
             .should_receive('_find_initial_index') \
             .and_return(None)
 
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def test_invalid_url_returns_none(self, *args, **kwargs):
         mock_id = PropertyMock(return_value='BAD')
         player = Player(None)
@@ -39,7 +39,7 @@ class TestNFLPlayer:
 
         assert result is None
 
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def test_missing_weight_returns_none(self, *args, **kwargs):
         mock_weight = PropertyMock(return_value=None)
         player = Player(None)
@@ -47,7 +47,7 @@ class TestNFLPlayer:
 
         assert not player.weight
 
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def test_requesting_detailed_season_returns_proper_index(self,
                                                              *args,
                                                              **kwargs):
@@ -235,6 +235,11 @@ class TestNHLSchedule:
         assert self.game._goals_allowed is None
         assert self.game.dataframe is None
 
+    def test_empty_game_class_returns_row_of_none(self):
+        assert self.game._goals_scored is None
+        assert self.game._goals_allowed is None
+        assert self.game._dataframe_row() is None
+
     def test_no_dataframes_returns_none(self):
         flexmock(Schedule) \
             .should_receive('_pull_schedule') \
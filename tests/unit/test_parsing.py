@@ -0,0 +1,336 @@
+import os
+import pytest
+import threading
+from pyquery import PyQuery as pq
+from sportsipy import concurrency, parsing, utils
+
+
+HTML = """<div id="page">
+<table id="stats">
+<tbody>
+<tr><th data-stat="name">First</th><td data-stat="wins">10</td>
+<td data-stat="wins">11</td></tr>
+<tr><th data-stat="name">Second <b>Team</b></th><td data-stat="wins">5</td>
+<td data-stat="wins">6</td></tr>
+</tbody>
+<tfoot><tr><td data-stat="wins">15</td></tr></tfoot>
+</table>
+<div id="all_hidden"><!--
+<table id="hidden"><tbody>
+<tr><td data-stat="losses">3</td></tr>
+<tr><td data-stat="losses">4</td></tr>
+</tbody></table>
+--></div>
+</div>"""
+
+TEAMS_STATS = os.path.join(os.path.dirname(__file__), os.pardir,
+                           'integration', 'teams')
+# The tables every league reads from the season pages saved for the teams
+# integration tests, most of which are embedded in HTML comments.
+SEASON_TABLES = [
+    ('mlb_stats/2017-standings.html', 'div#all_expanded_standings_overall'),
+    ('mlb_stats/2017.html', 'div#all_teams_standard_batting'),
+    ('mlb_stats/2017.html', 'div#all_teams_standard_pitching'),
+    ('nba_stats/NBA_2017.html', 'div#all_team-stats-base'),
+    ('nba_stats/NBA_2017.html', 'div#all_opponent-stats-base'),
+    ('ncaab_stats/2018-school-stats.html', 'table#basic_school_stats'),
+    ('ncaab_stats/2018-opponent-stats.html', 'table#basic_opp_stats'),
+    ('ncaab_stats/2018-advanced-school-stats.html',
+     'table#adv_school_stats'),
+    ('ncaab_stats/2018-advanced-opponent-stats.html',
+     'table#adv_opp_stats'),
+    ('ncaaf_stats/2017-standings.html', 'div#div_standings'),
+    ('ncaaf_stats/2017-team-offense.html', 'table#offense'),
+    ('ncaaf_stats/2017-team-defense.html', 'table#defense'),
+    ('nfl_stats/2017.html', 'div#all_team_stats'),
+    ('nfl_stats/2017.html', 'table#AFC'),
+    ('nfl_stats/2017.html', 'table#NFC'),
+    ('nhl_stats/NHL_2017.html', 'div#all_stats')
+]
+
+SELECTORS = ['td[data-stat="wins"]', 'td[data-stat="wins"]:first',
+             'th[data-stat="name"]', 'tbody tr', 'table#stats tfoot td',
+             'td[data-stat="missing"]', '']
+
+
+class TestParserEngines:
+    def teardown_method(self):
+        parsing.set_engine()
+
+    def test_default_engine_is_pyquery(self):
+        assert parsing.get_engine().name == 'pyquery'
+
+    def test_set_engine_returns_selected_engine(self):
+        engine = parsing.set_engine('lxml')
+
+        assert parsing.get_engine() is engine
+        assert engine.name == 'lxml'
+
+    def test_set_engine_rejects_unknown_engine(self):
+        with pytest.raises(ValueError):
+            parsing.set_engine('unknown')
+
+    @pytest.mark.parametrize('selector', SELECTORS)
+    def test_engines_return_same_texts(self, selector):
+        html = pq(HTML)
+        expected = parsing.PyQueryEngine().texts(html, selector)
+
+        result = parsing.LxmlEngine().texts(html, selector)
+
+        assert result == expected
+
+    def test_first_applies_to_each_root(self):
+        rows = pq(HTML)('tbody tr')
+
+        result = parsing.LxmlEngine().texts(rows,
+                                            'td[data-stat="wins"]:first')
+
+        assert result == ['10', '5']
+
+    def test_engines_find_same_elements(self):
+        html = pq(HTML)
+
+        expected = parsing.PyQueryEngine().find(html, 'table')
+        result = parsing.LxmlEngine().find(html, 'table')
+
+        assert [table.attr['id'] for table in result.items()] == \
+            [table.attr['id'] for table in expected.items()]
+
+    @pytest.mark.parametrize('div,footer', [('table#stats', False),
+                                            ('table#stats', True),
+                                            ('div#all_hidden', False)])
+    def test_engines_return_same_stats_table(self, div, footer):
+        expected = [str(row) for row in
+                    utils._get_stats_table(pq(HTML), div, footer)]
+
+        parsing.set_engine('lxml')
+        result = [str(row) for row in
+                  utils._get_stats_table(pq(HTML), div, footer)]
+
+        assert result == expected
+
+    def test_missing_stats_table_returns_none(self):
+        parsing.set_engine('lxml')
+
+        assert utils._get_stats_table(pq(HTML), 'table#missing') is None
+
+    def test_engine_is_only_used_within_block(self):
+        with parsing.using_engine('lxml') as engine:
+            assert parsing.get_engine() is engine
+            assert engine.name == 'lxml'
+
+        assert parsing.get_engine().name == 'pyquery'
+
+    def test_engine_block_only_affects_current_thread(self):
+        names = []
+
+        with parsing.using_engine('lxml'):
+            thread = threading.Thread(
+                target=lambda: names.append(parsing.get_engine().name))
+            thread.start()
+            thread.join()
+
+        assert names == ['pyquery']
+
+    def test_engine_block_rejects_unknown_engine(self):
+        with pytest.raises(ValueError):
+            with parsing.using_engine('unknown'):
+                pass
+
+    def test_workers_use_engine_of_calling_thread(self):
+        with parsing.using_engine('lxml'):
+            result = concurrency._run_concurrently(
+                lambda _: parsing.get_engine().name, range(4), workers=2)
+
+        assert result == ['lxml'] * 4
+
+
+class TestCompiledSelectors:
+    def test_selectors_are_compiled_once(self):
+        first = parsing.compile_selector('td[data-stat="wins"]:first')
+        second = parsing.compile_selector('td[data-stat="wins"]:first')
+
+        assert first is second
+
+    def test_precompile_compiles_given_schemes(self):
+        scheme = {'wins': 'td[data-stat="wins"]', 'name': ''}
+
+        parsing.precompile([scheme])
+
+        assert 'td[data-stat="wins"]' in parsing._compiled
+        assert '' not in parsing._compiled
+
+    def test_every_league_scheme_compiles(self):
+        schemes = parsing._league_schemes()
+
+        parsing.precompile()
+
+        assert len(schemes) > 0
+        for scheme in schemes:
+            for selector in scheme.values():
+                assert not selector or selector in parsing._compiled
+
+
+class TestStreamedPages:
+    @pytest.mark.parametrize('div,footer', [('table#stats', False),
+                                            ('table#stats', True),
+                                            ('div#all_hidden', False),
+                                            ('div#page', False)])
+    def test_streamed_rows_match_stats_table(self, div, footer):
+        expected = [str(row) for row in
+                    utils._get_stats_table(pq(HTML), div, footer)]
+
+        page = utils._StreamedPage(HTML)
+        result = [str(row) for row in
+                  utils._get_stats_table(page, div, footer)]
+
+        assert result == expected
+
+    @pytest.mark.parametrize('filename,div', SEASON_TABLES)
+    def test_streamed_season_pages_match_stats_table(self, filename, div):
+        local_file = os.path.join(TEAMS_STATS, filename)
+        parsed = utils._pull_table_page(local_file=local_file)
+        expected = [str(row) for row in
+                    utils._get_stats_table(parsed, div)]
+
+        streamed = utils._pull_table_page(local_file=local_file, stream=True)
+        result = [str(row) for row in
+                  utils._get_stats_table(streamed, div)]
+
+        assert len(expected) > 0
+        assert result == expected
+
+    def test_streamed_missing_table_returns_none(self):
+        page = utils._StreamedPage(HTML)
+
+        assert utils._get_stats_table(page, 'table#missing') is None
+
+    def test_streamed_page_falls_back_for_other_selectors(self):
+        page = utils._StreamedPage(HTML)
+
+        result = utils._get_stats_table(page, 'div#page table#stats')
+
+        assert len(list(result)) == 2
+
+    def test_local_file_is_streamed_in_chunks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(utils, 'STREAM_CHUNK_SIZE', 16)
+        local_file = tmp_path / 'page.html'
+        local_file.write_text(HTML, encoding='utf8')
+
+        page = utils._StreamedPage(local_file=str(local_file))
+        result = [row('th').text() for row in
+                  utils._get_stats_table(page, 'table#stats')]
+
+        assert result == ['First', 'Second Team']
+
+    def test_pull_table_page_streams_when_requested(self, tmp_path):
+        local_file = tmp_path / 'page.html'
+        local_file.write_text(HTML, encoding='utf8')
+
+        parsed = utils._pull_table_page(local_file=str(local_file))
+        streamed = utils._pull_table_page(local_file=str(local_file),
+                                          stream=True)
+
+        assert not isinstance(parsed, utils._StreamedPage)
+        assert isinstance(streamed, utils._StreamedPage)
+
+
+class LazyObject:
+    def __init__(self, fields, together=False, lazy=False):
+        self.calls = []
+        self.engines = []
+        self._points = None
+        self._wins = None
+        if together:
+            utils._parse_fields(self, fields, self._parse_all, 'row',
+                                together=True, lazy=lazy)
+        else:
+            utils._parse_fields(self, fields, self._parse_field, 'row',
+                                lazy=lazy)
+
+    def __getattr__(self, name):
+        return utils._parse_pending_field(self, name)
+
+    def _parse_field(self, field, row):
+        self.calls.append(field)
+        self.engines.append(parsing.get_engine().name)
+        return '%s from %s' % (field, row)
+
+    def _parse_all(self, row):
+        self.calls.append(row)
+        return 1, 2
+
+
+class TestLazyFields:
+    def test_fields_are_parsed_immediately_by_default(self):
+        obj = LazyObject(['_points', '_wins'])
+
+        assert obj.calls == ['_points', '_wins']
+        assert obj._points == '_points from row'
+
+    def test_lazy_fields_are_parsed_once_when_read(self):
+        obj = LazyObject(['_points', '_wins'], lazy=True)
+
+        assert obj.calls == []
+        assert obj._points == '_points from row'
+        assert obj._points == '_points from row'
+        assert obj.calls == ['_points']
+
+    def test_lazy_fields_parsed_together(self):
+        obj = LazyObject(['_points', '_wins'], together=True, lazy=True)
+
+        assert obj._wins == 2
+        assert obj._points == 1
+        assert obj.calls == ['row']
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        obj = LazyObject(['_points'], lazy=True)
+
+        with pytest.raises(AttributeError):
+            obj._missing
+        assert not hasattr(obj, '_missing')
+
+    def test_lazy_fields_are_parsed_with_engine_used_to_build(self):
+        with parsing.using_engine('lxml'):
+            obj = LazyObject(['_points'], lazy=True)
+
+        obj._points
+
+        assert obj.engines == ['lxml']
+
+    def test_fields_shadowed_by_class_are_parsed_immediately(self):
+        LazyObject._wins = None
+        try:
+            obj = LazyObject(['_points', '_wins'], lazy=True)
+        finally:
+            del LazyObject._wins
+
+        assert obj.calls == ['_wins']
+        assert obj._wins == '_wins from row'
+
+
+class TestCompactObjects:
+    def test_detached_elements_match_page_elements(self):
+        page = pq(HTML)
+        name = page('th[data-stat="name"]:last')
+
+        result = utils._detach(name)
+
+        assert result.text() == name.text() == 'Second Team'
+        assert result[0] is not name[0]
+        assert result[0].getparent() is None
+
+    def test_elements_are_kept_when_not_compact(self):
+        name = pq(HTML)('th[data-stat="name"]')
+
+        assert utils._detach(name, compact=False) is name
+
+    def test_release_drops_references_from_compact_objects(self):
+        obj = LazyObject([])
+        obj._points = pq(HTML)
+
+        utils._release(obj, '_points', compact=False)
+        assert obj._points is not None
+
+        utils._release(obj, '_points')
+        assert obj._points is None
@@ -0,0 +1,168 @@
+import pytest
+from mock import patch
+from sportsipy import fetch, ratelimit
+from urllib.error import HTTPError
+
+
+class MockResponse:
+    def __init__(self, status_code, headers=None, text=''):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = text
+
+
+class TestRetryAfter:
+    def test_parse_retry_after_seconds(self):
+        assert ratelimit._parse_retry_after('120') == 120
+
+    def test_parse_retry_after_is_capped(self):
+        result = ratelimit._parse_retry_after('100000')
+
+        assert result == ratelimit.MAX_BACKOFF
+
+    def test_parse_retry_after_past_date(self):
+        result = ratelimit._parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT')
+
+        assert result == 0
+
+    def test_parse_retry_after_invalid_value(self):
+        assert ratelimit._parse_retry_after('soon') is None
+        assert ratelimit._parse_retry_after(None) is None
+
+
+@patch('time.monotonic', return_value=100.0)
+class TestTokenBucket:
+    def test_burst_is_available_immediately(self, *args, **kwargs):
+        bucket = ratelimit.TokenBucket(2, burst=2)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+
+    def test_requests_beyond_burst_wait_in_order(self, *args, **kwargs):
+        bucket = ratelimit.TokenBucket(2)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0.5
+        assert bucket.reserve() == 1.0
+
+    def test_tokens_refill_over_time(self, mock_monotonic):
+        bucket = ratelimit.TokenBucket(2)
+        bucket.reserve()
+
+        mock_monotonic.return_value = 100.5
+
+        assert bucket.reserve() == 0
+
+    def test_unlimited_bucket_never_waits(self, *args, **kwargs):
+        bucket = ratelimit.TokenBucket(None)
+
+        for _ in range(10):
+            assert bucket.reserve() == 0
+
+    def test_throttle_pauses_and_halves_rate(self, *args, **kwargs):
+        bucket = ratelimit.TokenBucket(2)
+
+        bucket.throttle(30)
+
+        assert bucket.rate == 1
+        assert bucket.reserve() == 30
+
+    def test_throttle_slows_unlimited_bucket(self, *args, **kwargs):
+        bucket = ratelimit.TokenBucket(None)
+
+        bucket.throttle()
+
+        assert bucket.rate == ratelimit.THROTTLED_RATE
+        assert bucket.reserve() == ratelimit.DEFAULT_BACKOFF
+
+    def test_rate_never_drops_below_minimum(self, *args, **kwargs):
+        bucket = ratelimit.TokenBucket(ratelimit.MIN_RATE)
+
+        bucket.throttle()
+
+        assert bucket.rate == ratelimit.MIN_RATE
+
+    def test_rate_recovers_after_successes(self, *args, **kwargs):
+        bucket = ratelimit.TokenBucket(2)
+        bucket.throttle()
+        bucket.throttle()
+
+        for _ in range(ratelimit.RECOVERY_REQUESTS):
+            bucket.succeed()
+        assert bucket.rate == 1
+
+        for _ in range(ratelimit.RECOVERY_REQUESTS):
+            bucket.succeed()
+        assert bucket.rate == 2
+
+    def test_unlimited_bucket_recovers_to_unlimited(self, *args, **kwargs):
+        bucket = ratelimit.TokenBucket(None)
+        bucket.throttle()
+
+        for _ in range(ratelimit.RECOVERY_REQUESTS):
+            bucket.succeed()
+
+        assert bucket.rate is None
+
+
+class TestRateLimiter:
+    def teardown_method(self):
+        ratelimit.set_rate_limit()
+
+    def test_hosts_are_limited_separately(self):
+        limiter = ratelimit.RateLimiter(1)
+
+        first = limiter.bucket('https://www.baseball-reference.com/a.html')
+        second = limiter.bucket('https://www.baseball-reference.com/b.html')
+        other = limiter.bucket('https://www.hockey-reference.com/a.html')
+
+        assert first is second
+        assert first is not other
+
+    def test_report_throttles_host(self):
+        limiter = ratelimit.RateLimiter(2)
+        url = 'https://www.baseball-reference.com/a.html'
+
+        throttled = limiter.report(url, MockResponse(429,
+                                                     {'Retry-After': '10'}))
+
+        assert throttled
+        assert limiter.bucket(url).rate == 1
+
+    def test_report_accepts_successful_response(self):
+        limiter = ratelimit.RateLimiter(2)
+
+        assert not limiter.report('https://www.example.com',
+                                  MockResponse(200))
+
+    def test_set_rate_limit_replaces_limiter(self):
+        limiter = ratelimit.set_rate_limit(5, burst=3)
+
+        assert ratelimit.get_rate_limiter() is limiter
+        assert limiter.rate == 5
+        assert limiter.burst == 3
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_fetch_retries_throttled_request(self, mock_get, mock_sleep):
+        ratelimit.set_rate_limit()
+        mock_get.side_effect = [MockResponse(429, {'Retry-After': '2'}),
+                                MockResponse(200, text='<html></html>')]
+
+        result = fetch._fetch('https://www.example.com/throttled.html')
+
+        assert result == '<html></html>'
+        assert mock_get.call_count == 2
+        assert mock_sleep.call_count == 1
+        assert 0 < mock_sleep.call_args[0][0] <= 2
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_fetch_gives_up_after_retries(self, mock_get, mock_sleep):
+        ratelimit.set_rate_limit()
+        mock_get.return_value = MockResponse(503)
+
+        with pytest.raises(HTTPError):
+            fetch._fetch('https://www.example.com/unavailable.html')
+
+        assert mock_get.call_count == fetch.MAX_RETRIES + 1
@@ -0,0 +1,78 @@
+import pickle
+import pytest
+from pyquery import PyQuery as pq
+from sportsipy import records, utils
+
+
+class SlottedRecord(records._SlotRecord):
+    __slots__ = ('_name', '_wins', '_pending_fields')
+
+    def __init__(self, name):
+        self._name = name
+
+
+class DictRecord(SlottedRecord):
+    pass
+
+
+class PageRecord(records._Record):
+    _transient_fields = ('_doc',)
+
+    def __init__(self, html):
+        self._doc = pq(html)
+        self._name = self._doc('a')
+        utils._parse_fields(self, ['_wins'], self._parse_field, lazy=True)
+
+    def __getattr__(self, name):
+        return utils._parse_pending_field(self, name)
+
+    def _parse_field(self, field):
+        return self._doc('td').text()
+
+
+class TestRecords:
+    def test_fields_include_only_set_slots(self):
+        record = SlottedRecord('Detroit')
+        record._pending_fields = {}
+
+        assert records._fields(record) == ['_name']
+        assert records._slot_values(record) == {'_name': 'Detroit'}
+
+    def test_slotted_record_rejects_unknown_attributes(self):
+        record = SlottedRecord('Detroit')
+
+        with pytest.raises(AttributeError):
+            record._losses = 4
+
+    def test_slotted_record_has_no_instance_dict(self):
+        record = SlottedRecord('Detroit')
+
+        with pytest.raises(TypeError):
+            vars(record)
+
+    def test_fields_include_slots_and_instance_dict(self):
+        record = DictRecord('Detroit')
+        record._losses = 4
+
+        assert records._fields(record) == ['_name', '_losses']
+
+    def test_pickled_record_keeps_parsed_values_only(self):
+        record = PageRecord('<div><a href="/teams/DET/2020.htm">Detroit</a>'
+                            '<table><tr><td>10</td></tr></table></div>')
+
+        result = pickle.loads(pickle.dumps(record))
+
+        assert result._wins == '10'
+        assert result._doc is None
+        assert result._name.text() == 'Detroit'
+        assert utils._parse_abbreviation(result._name) == 'DET'
+        assert '_pending_fields' not in vars(result)
+
+    def test_pickled_slotted_record_restores_fields(self):
+        record = SlottedRecord('Detroit')
+        record._pending_fields = {}
+
+        result = pickle.loads(pickle.dumps(record))
+
+        assert records._slot_values(result) == {'_name': 'Detroit'}
+        assert not hasattr(result, '_wins')
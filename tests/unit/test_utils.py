@@ -1,6 +1,9 @@
+import pandas as pd
 import pytest
+from datetime import datetime
 from mock import patch
 from flexmock import flexmock
+from pyquery import PyQuery as pq
 from sportsipy import utils
 
 
@@ -11,6 +14,30 @@ class SeasonStarts:
         self.expected_year = expected_year
 
 
+class RowTeam:
+    def __init__(self):
+        self.dataframe_built = False
+
+    def _dataframe_row(self):
+        return 'DET', {'wins': 10}
+
+    @property
+    def dataframe(self):
+        self.dataframe_built = True
+        return utils._build_dataframe([self._dataframe_row()])
+
+
+class MockTeam:
+    def __init__(self, abbreviation, name=None):
+        self.abbreviation = abbreviation
+        self.name = name
+
+
+class MockGame:
+    def __init__(self, played):
+        self.datetime = played
+
+
 class MockDateTime:
     def __init__(self, month, year):
         self.month = month
@@ -270,19 +297,19 @@ class TestUtils:
 
         assert i == 2
 
-    @patch('requests.head', side_effect=mock_pyquery)
+    @patch('requests.Session.head', side_effect=mock_pyquery)
     def test_valid_url_returns_true(self, *args, **kwargs):
         response = utils._url_exists('http://www.good_url.com/this/is/valid')
 
         assert response
 
-    @patch('requests.head', side_effect=mock_pyquery)
+    @patch('requests.Session.head', side_effect=mock_pyquery)
     def test_404_url_returns_false(self, *args, **kwargs):
         response = utils._url_exists('http://www.404.com/doesnt/exist')
 
         assert not response
 
-    @patch('requests.head', side_effect=mock_pyquery)
+    @patch('requests.Session.head', side_effect=mock_pyquery)
     def test_invalid_url_exception_returns_false(self, *args, **kwargs):
         response = utils._url_exists('http://www.exception.com')
 
@@ -334,3 +361,323 @@ class TestUtils:
                                     index=3,
                                     secondary_index=4)
         assert not result
+
+    def test_default_season_uses_current_year_when_page_exists(self):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return(2018)
+        flexmock(utils) \
+            .should_receive('_url_exists') \
+            .with_args('http://www.good_url.com/2018') \
+            .and_return(True) \
+            .once()
+
+        year = utils._find_default_season('nba',
+                                          lambda x: 'http://www.good_url.com/'
+                                                    '%s' % x)
+
+        assert year == 2018
+
+    def test_default_season_reverts_to_previous_year(self):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return(2018)
+        flexmock(utils) \
+            .should_receive('_url_exists') \
+            .with_args('http://www.good_url.com/2018') \
+            .and_return(False)
+        flexmock(utils) \
+            .should_receive('_url_exists') \
+            .with_args('http://www.good_url.com/2017') \
+            .and_return(True)
+
+        year = utils._find_default_season('nba',
+                                          lambda x: 'http://www.good_url.com/'
+                                                    '%s' % x)
+
+        assert year == '2017'
+
+    def test_default_season_is_only_probed_once(self):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return(2018)
+        flexmock(utils) \
+            .should_receive('_url_exists') \
+            .and_return(True) \
+            .once()
+
+        for _ in range(3):
+            year = utils._find_default_season(
+                'nba', lambda x: 'http://www.good_url.com/%s' % x)
+
+            assert year == 2018
+
+    def test_default_season_is_resolved_once_for_every_team(self):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return(2018)
+        flexmock(utils) \
+            .should_receive('_url_exists') \
+            .with_args('http://www.good_url.com/2018') \
+            .and_return(False) \
+            .once()
+        flexmock(utils) \
+            .should_receive('_url_exists') \
+            .with_args('http://www.good_url.com/2017') \
+            .and_return(True) \
+            .once()
+
+        for team in ['DET', 'BOS', 'CHI']:
+            year = utils._find_default_season(
+                'nba', lambda x: 'http://www.good_url.com/%s' % x,
+                lambda x: 'http://www.good_url.com/%s/%s' % (team, x))
+
+            assert year == '2017'
+
+    def test_team_page_is_downloaded_for_resolved_season(self):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return(2018)
+        flexmock(utils) \
+            .should_receive('_url_exists') \
+            .with_args('http://www.good_url.com/2018') \
+            .and_return(True) \
+            .once()
+        flexmock(utils) \
+            .should_receive('_url_exists') \
+            .with_args('http://www.good_url.com/DET/2018', download=True) \
+            .and_return(True) \
+            .once()
+
+        year = utils._find_default_season(
+            'nba', lambda x: 'http://www.good_url.com/%s' % x,
+            lambda x: 'http://www.good_url.com/DET/%s' % x)
+
+        assert year == 2018
+
+    def test_missing_team_page_reverts_to_previous_year(self):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return(2018)
+        flexmock(utils) \
+            .should_receive('_url_exists') \
+            .with_args('http://www.good_url.com/2018') \
+            .and_return(True) \
+            .once()
+        flexmock(utils) \
+            .should_receive('_url_exists') \
+            .with_args('http://www.good_url.com/DET/2018', download=True) \
+            .and_return(True) \
+            .once()
+        flexmock(utils) \
+            .should_receive('_url_exists') \
+            .with_args('http://www.good_url.com/BOS/2018', download=True) \
+            .and_return(False) \
+            .once()
+        flexmock(utils) \
+            .should_receive('_url_exists') \
+            .with_args('http://www.good_url.com/BOS/2017', download=True) \
+            .and_return(True) \
+            .once()
+
+        for team, expected in [('DET', 2018), ('BOS', '2017')]:
+            year = utils._find_default_season(
+                'nba', lambda x: 'http://www.good_url.com/%s' % x,
+                lambda x: 'http://www.good_url.com/%s/%s' % (team, x))
+
+            assert year == expected
+
+    @patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_downloaded_page_is_reused_after_checking_url(self, mock_get):
+        url = 'http://www.good_url.com/this/is/valid'
+
+        assert utils._url_exists(url, download=True)
+        assert utils._url_exists(url)
+        assert utils._pull_page(url).text() == 'This is good'
+        assert mock_get.call_count == 1
+
+    def test_build_dataframe_matches_concatenated_rows(self):
+        rows = [('DET', {'wins': 10, 'name': 'Detroit', 'rank': None}),
+                None,
+                ('HOU', {'wins': 12, 'name': 'Houston', 'rank': 1})]
+        expected = pd.concat([pd.DataFrame([row[1]], index=[row[0]])
+                              for row in rows if row])
+
+        result = utils._build_dataframe(rows)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_build_dataframe_includes_rows_of_dataframes(self):
+        frame = pd.DataFrame([{'wins': 10}, {'wins': 4}], index=['DET', 'BOS'])
+
+        result = utils._build_dataframe([('CHI', {'wins': 7}), None, frame])
+
+        expected = pd.DataFrame({'wins': [7, 10, 4]},
+                                index=['CHI', 'DET', 'BOS'])
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_frame_row_uses_row_method(self):
+        team = RowTeam()
+
+        assert utils._frame_row(team) == ('DET', {'wins': 10})
+        assert not team.dataframe_built
+
+    def test_frame_row_uses_dataframe_without_row_method(self):
+        frame = pd.DataFrame([{'key': 'value'}])
+        team = flexmock(dataframe=frame)
+
+        assert utils._frame_row(team) is frame
+
+    def test_build_dataframe_without_rows_returns_none(self):
+        assert utils._build_dataframe([None, None]) is None
+
+    def test_first_indices_finds_first_occurrence(self):
+        result = utils._first_indices(['2017', '2018', '2018', 'Career'])
+
+        assert result == [0, 1, 1, 3]
+
+    def test_keyed_finds_items_case_insensitively(self):
+        collection = flexmock()
+        teams = [MockTeam('DET', 'Detroit'), MockTeam('HOU', 'Houston')]
+
+        result = utils._keyed(collection, teams, 'abbreviation', 'name')
+
+        assert result[utils._lookup_key('det')] is teams[0]
+        assert result[utils._lookup_key('HOUSTON')] is teams[1]
+
+    def test_lookup_key_keeps_surrounding_whitespace(self):
+        assert utils._lookup_key(' DET ') == ' det '
+
+    def test_keyed_keeps_first_item_for_shared_values(self):
+        collection = flexmock()
+        teams = [MockTeam('DET', 'HOU'), MockTeam('HOU'), MockTeam(None)]
+
+        result = utils._keyed(collection, teams, 'abbreviation', 'name')
+
+        assert result == {'det': teams[0], 'hou': teams[0]}
+
+    def test_keyed_is_rebuilt_when_items_are_replaced(self):
+        collection = flexmock()
+        teams = [MockTeam('DET')]
+        first = utils._keyed(collection, teams, 'abbreviation')
+
+        assert utils._keyed(collection, teams, 'abbreviation') is first
+
+        teams = teams + [MockTeam('HOU')]
+
+        assert 'hou' in utils._keyed(collection, teams, 'abbreviation')
+
+    def test_dated_groups_games_played_on_the_same_day(self):
+        schedule = flexmock()
+        games = [MockGame(datetime(2017, 5, 14, 13)),
+                 MockGame(datetime(2017, 5, 14, 19)),
+                 MockGame(datetime(2017, 5, 15)),
+                 MockGame(None)]
+
+        result = utils._dated(schedule, games)
+
+        assert result == {(2017, 5, 14): games[:2], (2017, 5, 15): [games[2]]}
+
+    def test_dated_is_rebuilt_when_games_are_replaced(self):
+        schedule = flexmock()
+        games = [MockGame(datetime(2017, 5, 14))]
+        utils._dated(schedule, games)
+
+        games = games + [MockGame(datetime(2017, 5, 15))]
+
+        assert (2017, 5, 15) in utils._dated(schedule, games)
+
+    def test_row_index_matches_pyquery_selectors(self):
+        first = pq('<tr><th data-stat="team">Team <a href="/a">A</a></th>'
+                   '<td data-stat="wins">10</td><td data-stat="wins">4</td>'
+                   '<td data-stat="losses"></td></tr>')[0]
+        second = pq('<tr><td data-stat="wins">7</td></tr>')[0]
+        html = pq([first, second])
+        row = utils._RowIndex(html)
+        selectors = ['td[data-stat="wins"]', 'td[data-stat="wins"]:first',
+                     'th[data-stat="team"]', 'td[data-stat="team"]',
+                     'td[data-stat="losses"]', 'th[data-stat="team"] a']
+
+        for selector in selectors:
+            expected = [i.text() for i in html(selector).items()]
+
+            assert row.texts(selector) == expected
+
+    def test_parse_field_accepts_row_index(self):
+        html = pq('<tr><td data-stat="wins">10</td><td data-stat="wins">'
+                  '</td><td data-stat="wins">4</td></tr>')
+        parsing_scheme = {'wins': 'td[data-stat="wins"]'}
+        row = utils._RowIndex(html)
+
+        assert utils._parse_field(parsing_scheme, row, 'wins', 1) == ''
+        assert utils._parse_field(parsing_scheme, row, 'wins', 1,
+                                  strip=True) == '4'
+        assert utils._parse_field(parsing_scheme, row, 'wins', 5, False,
+                                  2) == '4'
+
+    def test_combined_row_index_selects_first_cell_across_rows(self):
+        first = pq('<tr><td data-stat="season">2017</td></tr>')[0]
+        second = pq('<tr><td data-stat="season">2018</td></tr>')[0]
+        row = utils._RowIndex(pq([first, second]), combined=True)
+
+        assert row.texts('td[data-stat="season"]:first') == ['2017']
+        assert row.texts('td[data-stat="season"]') == ['2017', '2018']
+
+    def test_page_index_matches_section_selectors(self):
+        html = pq('<html><body><table><tbody><tr><td data-stat="pts">10'
+                  '</td></tr></tbody><tfoot><tr><td data-stat="pts">25</td>'
+                  '</tr></tfoot></table><table><tfoot><tr><td data-stat='
+                  '"pts">30</td></tr></tfoot></table></body></html>')
+        page = utils._RowIndex(html)
+        selectors = ['td[data-stat="pts"]', 'tfoot td[data-stat="pts"]',
+                     'tbody td[data-stat="pts"]:first',
+                     'thead td[data-stat="pts"]']
+
+        for selector in selectors:
+            expected = [i.text() for i in html(selector).items()]
+
+            assert page.texts(selector) == expected
+
+    def test_section_selectors_ignore_sections_above_rows(self):
+        html = pq('<table><tfoot><tr><td data-stat="pts">25</td></tr>'
+                  '</tfoot></table>')
+        rows = html('tr')
+        row = utils._RowIndex(rows)
+
+        assert row.texts('tfoot td[data-stat="pts"]') == \
+            [i.text() for i in rows('tfoot td[data-stat="pts"]').items()]
+
+    def test_expand_html_comments_includes_commented_tables(self):
+        html = pq('<html><body><div id="all_stats">before<!--\n<table '
+                  'id="stats"><tr><td>1</td></tr></table>\n-->after</div>'
+                  '<!-- plain note --></body></html>')
+
+        result = utils._expand_html_comments(html)
+
+        assert result is html
+        assert result('table#stats td').text() == '1'
+        assert result('div#all_stats').text() == 'before\n1\nafter'
+        assert 'plain note' in str(result)
+
+    def test_expand_html_comments_without_comments_doesnt_change(self):
+        html = pq('<html><body><table><tr><td>1</td></tr></table></body>'
+                  '</html>')
+        expected = str(html)
+
+        assert str(utils._expand_html_comments(html)) == expected
+
+    def test_boxscore_days_includes_each_day_in_range(self):
+        pages = utils._boxscore_days(datetime(2020, 2, 28),
+                                     datetime(2020, 3, 1),
+                                     lambda x: x.strftime('%Y%m%d'))
+
+        assert pages == [('2-28-2020', '20200228'),
+                         ('2-29-2020', '20200229'),
+                         ('3-1-2020', '20200301')]
+
+    def test_boxscore_days_before_start_only_includes_start(self):
+        pages = utils._boxscore_days(datetime(2020, 2, 28),
+                                     datetime(2020, 2, 1),
+                                     lambda x: x.strftime('%Y%m%d'))
+
+        assert pages == [('2-28-2020', '20200228')]